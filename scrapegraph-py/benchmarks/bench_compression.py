@@ -0,0 +1,164 @@
+"""
+Benchmark of request body compression against a local stand-in server.
+
+Sends smartscraper requests carrying ~2 MB of ``website_html`` to a local
+HTTP server that plays the API: it reads the body through an emulated uplink
+of ``--bandwidth`` Mbit/s, decompresses it and answers with a small JSON
+result. Every available compression setting is measured with the
+synchronous client and reported as bytes on the wire and wall time per call.
+
+Usage:
+    python benchmarks/bench_compression.py [--requests 10] [--bandwidth 50] [--json]
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.compression import ZSTD_AVAILABLE
+
+if ZSTD_AVAILABLE:
+    import zstandard
+
+READ_CHUNK = 64 * 1024
+API_KEY = "sgai-00000000-0000-0000-0000-000000000000"
+
+
+def build_payload():
+    row = "<tr><td class='name'>Product {i}</td><td class='price'>€{i}.99</td></tr>\n"
+    html = (
+        "<html><body><table>"
+        + "".join(row.format(i=i) for i in range(24000))
+        + "</table></body></html>"
+    )
+    return {"user_prompt": "Extract all products with prices", "website_html": html}
+
+
+def start_server(bandwidth_mbit):
+    """Start the stand-in API and return (server, url, wire byte counter)"""
+    wire = {"request_bytes": 0, "response_bytes": 0}
+    lock = threading.Lock()
+    bytes_per_second = bandwidth_mbit * 1e6 / 8
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            remaining = int(self.headers["Content-Length"])
+            chunks = []
+            while remaining:
+                chunk = self.rfile.read(min(READ_CHUNK, remaining))
+                remaining -= len(chunk)
+                chunks.append(chunk)
+                if bytes_per_second:
+                    time.sleep(len(chunk) / bytes_per_second)
+            body = b"".join(chunks)
+            encoding = self.headers.get("Content-Encoding")
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "zstd":
+                body = zstandard.ZstdDecompressor().decompress(body)
+            payload = json.loads(body)
+
+            response = json.dumps(
+                {
+                    "request_id": "bench",
+                    "status": "completed",
+                    "html_chars": len(payload["website_html"]),
+                }
+            ).encode()
+            # Count before answering so the client never sees a stale total
+            with lock:
+                wire["request_bytes"] += int(self.headers["Content-Length"])
+                wire["response_bytes"] += len(response)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/smartscraper", wire
+
+
+def run(requests, bandwidth):
+    payload = build_payload()
+    server, url, wire = start_server(bandwidth)
+    settings = [None, "gzip"] + (["zstd"] if ZSTD_AVAILABLE else [])
+    results = {
+        "json_bytes": len(json.dumps(payload).encode()),
+        "bandwidth_mbit": bandwidth,
+        "settings": {},
+    }
+    try:
+        for algorithm in settings:
+            client = Client(
+                api_key=API_KEY, request_compression=algorithm, max_retries=0
+            )
+            client._make_request("POST", url, json=payload)  # warm up the connection
+            wire["request_bytes"] = wire["response_bytes"] = 0
+            timings = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                client._make_request("POST", url, json=payload)
+                timings.append(time.perf_counter() - start)
+            client.close()
+            results["settings"][algorithm or "none"] = {
+                "request_bytes": wire["request_bytes"] // requests,
+                "response_bytes": wire["response_bytes"] // requests,
+                "median_ms": statistics.median(timings) * 1000,
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=10, help="Requests per setting")
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=50.0,
+        help="Emulated uplink in Mbit/s (0 = unthrottled)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.requests, args.bandwidth)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    baseline = results["settings"]["none"]
+    print(
+        f"request body: {results['json_bytes'] / 1e6:.2f} MB of JSON, "
+        f"uplink: {args.bandwidth:g} Mbit/s, {args.requests} requests per setting"
+    )
+    print(
+        f"{'setting':<10}{'bytes sent':>14}{'ratio':>8}{'median ms':>12}{'speedup':>10}"
+    )
+    for name, result in results["settings"].items():
+        print(
+            f"{name:<10}{result['request_bytes']:>14,}"
+            f"{baseline['request_bytes'] / result['request_bytes']:>7.1f}x"
+            f"{result['median_ms']:>12.1f}{baseline['median_ms'] / result['median_ms']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark of the HTML validation modes of SmartScraperRequest.
+
+Builds SmartScraperRequest objects for uploaded documents of increasing size
+with every available ``html_validation`` mode and reports the best time of
+each against the strict BeautifulSoup mode.
+
+Usage:
+    python benchmarks/bench_html_validation.py [--repeat 5] [--json]
+"""
+
+import argparse
+import json
+import time
+
+from scrapegraph_py.models.smartscraper import SmartScraperRequest
+from scrapegraph_py.utils.content_validation import HAS_BS4, HAS_LXML
+
+SIZES_KB = (16, 256, 1024, 1900)
+
+
+def build_html(size_kb):
+    row = "<tr><td class='name'>Produit {i}</td><td class='price'>{i},99 €</td></tr>\n"
+    rows = []
+    size = 0
+    i = 0
+    while size < size_kb * 1024:
+        rows.append(row.format(i=i))
+        size += len(rows[-1].encode("utf-8"))
+        i += 1
+    return "<html><body><table>" + "".join(rows) + "</table></body></html>"
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(repeat):
+    modes = ["fast"] + (["lxml"] if HAS_LXML else []) + (["strict"] if HAS_BS4 else [])
+    results = {}
+    for size_kb in SIZES_KB:
+        html = build_html(size_kb)
+        results[f"{size_kb}KB"] = {
+            mode: best_of(
+                lambda: SmartScraperRequest(
+                    user_prompt="Extract all products",
+                    website_html=html,
+                    html_validation=mode,
+                ),
+                repeat,
+            )
+            * 1000
+            for mode in modes
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"request construction time in ms, best of {args.repeat}")
+    for size, timings in results.items():
+        baseline = timings.get("strict")
+        cells = []
+        for mode, ms in timings.items():
+            speedup = (
+                f" ({baseline / ms:.0f}x)" if baseline and mode != "strict" else ""
+            )
+            cells.append(f"{mode}: {ms:.2f}{speedup}")
+        print(f"{size:>7}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Import-time regression benchmark for scrapegraph_py.
+
+Runs each import statement in a fresh interpreter with ``python -X importtime``
+and sums the cumulative time of the modules it imported, ignoring interpreter
+startup. Each scenario has a time budget and a list of modules it must not
+load; the script exits with status 1 when any scenario breaks either, so it
+can run in CI.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--scale 1.0] [--json]
+
+``--scale`` multiplies every budget, for slow CI machines.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# (statement, budget in ms, modules that must not be imported)
+SCENARIOS = [
+    ("import scrapegraph_py", 15, ("requests", "aiohttp", "pydantic", "bs4", "toon")),
+    (
+        "from scrapegraph_py.models import SmartScraperRequest",
+        250,
+        ("requests", "aiohttp", "bs4"),
+    ),
+    ("from scrapegraph_py import Client", 450, ("aiohttp", "bs4", "lxml", "toon")),
+    (
+        "from scrapegraph_py import AsyncClient",
+        550,
+        ("requests", "bs4", "lxml", "toon"),
+    ),
+]
+
+
+def measure(statement):
+    """Return (import time in ms, names of the imported modules) for one run"""
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])
+        ),
+    )
+    probe = f"{statement}; import sys; print(' '.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total_us = 0
+    after_startup = False
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not after_startup:
+            # Everything up to and including ``site`` is interpreter startup
+            after_startup = name.strip() == "site" and not name.startswith("  ")
+            continue
+        if not name[1:].startswith(" "):  # top-level import of the statement
+            total_us += int(cumulative)
+    return total_us / 1000, set(completed.stdout.split())
+
+
+def run(runs, scale):
+    results = []
+    for statement, budget, forbidden in SCENARIOS:
+        timings = []
+        loaded = set()
+        for _ in range(runs):
+            elapsed, modules = measure(statement)
+            timings.append(elapsed)
+            loaded |= modules
+        median = statistics.median(timings)
+        leaked = sorted(name for name in forbidden if name in loaded)
+        results.append(
+            {
+                "statement": statement,
+                "median_ms": round(median, 1),
+                "budget_ms": budget * scale,
+                "forbidden_loaded": leaked,
+                "ok": median <= budget * scale and not leaked,
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Fresh interpreters per scenario (median is kept)",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplier applied to every budget"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.runs, args.scale)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'statement':<55}{'median ms':>11}{'budget ms':>11}  status")
+        for result in results:
+            status = "ok" if result["ok"] else "OVER BUDGET"
+            if result["forbidden_loaded"]:
+                status = "LOADED " + ", ".join(result["forbidden_loaded"])
+            print(
+                f"{result['statement']:<55}{result['median_ms']:>11.1f}"
+                f"{result['budget_ms']:>11.0f}  {status}"
+            )
+    sys.exit(0 if all(result["ok"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark of the JSON codecs used for request bodies and responses.
+
+Encodes a smartscraper request carrying ~2 MB of ``website_html`` and decodes
+a crawl result with 100 markdown pages using every installed codec, and
+reports the best time of each against the standard library.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--repeat 20] [--json]
+"""
+
+import argparse
+import json
+import time
+
+from scrapegraph_py.models.smartscraper import SmartScraperRequest
+from scrapegraph_py.utils.codec import CODECS, get_codec
+
+
+def build_payloads():
+    row = "<tr><td class='name'>Product {i}</td><td class='price'>€{i}.99</td></tr>\n"
+    html = (
+        "<html><body><table>"
+        + "".join(row.format(i=i) for i in range(24000))
+        + "</table></body></html>"
+    )
+    request = SmartScraperRequest(
+        user_prompt="Extract all products with prices", website_html=html
+    )
+    crawl_result = {
+        "status": "success",
+        "result": {
+            "pages": [
+                {
+                    "url": f"https://example.com/page/{i}",
+                    "markdown": "# Heading\n\nSome paragraph with *markdown* and a [link](https://example.com).\n"
+                    * 300,
+                    "metadata": {
+                        "title": f"Page {i}",
+                        "depth": i % 3,
+                        "links": [f"/p/{j}" for j in range(20)],
+                    },
+                }
+                for i in range(100)
+            ]
+        },
+    }
+    return request.model_dump(), json.dumps(crawl_result).encode("utf-8")
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(repeat):
+    body, response = build_payloads()
+    results = {
+        "request_bytes": len(json.dumps(body)),
+        "response_bytes": len(response),
+        "codecs": {},
+    }
+    for name, (_, available) in CODECS.items():
+        if not available:
+            continue
+        codec = get_codec(name)
+        results["codecs"][name] = {
+            "encode_ms": best_of(lambda: codec.dumps(body), repeat) * 1000,
+            "decode_ms": best_of(lambda: codec.loads(response), repeat) * 1000,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    baseline = results["codecs"]["json"]
+    print(
+        f"request body: {results['request_bytes'] / 1e6:.1f} MB, "
+        f"response body: {results['response_bytes'] / 1e6:.1f} MB, best of {args.repeat}"
+    )
+    print(
+        f"{'codec':<10}{'encode ms':>12}{'speedup':>10}{'decode ms':>12}{'speedup':>10}"
+    )
+    for name, timing in results["codecs"].items():
+        print(
+            f"{name:<10}{timing['encode_ms']:>12.2f}{baseline['encode_ms'] / timing['encode_ms']:>9.1f}x"
+            f"{timing['decode_ms']:>12.2f}{baseline['decode_ms'] / timing['decode_ms']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
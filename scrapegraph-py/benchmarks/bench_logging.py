@@ -0,0 +1,137 @@
+"""
+Benchmark of the SDK's per-request logging overhead.
+
+Replays the log statements that a ``smartscraper`` call with ~2 MB of
+``website_html`` goes through, written both the old way (f-strings that
+stringify the request parameters) and the current way (lazy %-style
+arguments, ``is_enabled_for`` guards and truncated payloads), with logging
+disabled and enabled at INFO and DEBUG. Emitted records are formatted and
+written to ``os.devnull``.
+
+Usage:
+    python benchmarks/bench_logging.py [--repeat 50] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+
+from scrapegraph_py.logger import LazyPayload
+from scrapegraph_py.logger import sgai_logger as logger
+from scrapegraph_py.models.smartscraper import SmartScraperRequest
+
+METHOD = "POST"
+URL = "https://api.scrapegraphai.com/v1/smartscraper"
+
+
+def build_kwargs():
+    row = "<tr><td class='name'>Product {i}</td><td class='price'>€{i}.99</td></tr>\n"
+    html = (
+        "<html><body><table>"
+        + "".join(row.format(i=i) for i in range(24000))
+        + "</table></body></html>"
+    )
+    request = SmartScraperRequest(
+        user_prompt="Extract all products with prices", website_html=html
+    )
+    return {"json": request.model_dump(), "headers": {"Idempotency-Key": "bench"}}
+
+
+def eager(kwargs):
+    """Log statements of one request as they were written before"""
+    params = kwargs["json"]
+    logger.info("🔍 Starting smartscraper request")
+    if params.get("website_html"):
+        logger.debug("📄 Using provided HTML content")
+    logger.debug(f"📝 Prompt: {params['user_prompt']}")
+    logger.debug("✅ Request validation passed")
+    logger.info(f"🚀 Making {METHOD} request to {URL} (Attempt {1}/{4})")
+    logger.debug(f"🔍 Request parameters: {kwargs}")
+    logger.debug(f"📥 Response status: {200}")
+    logger.info(f"✅ Request completed successfully: {METHOD} {URL}")
+    logger.info("✨ Smartscraper request completed successfully")
+
+
+def lazy(kwargs):
+    """Log statements of one request as they are written now"""
+    params = kwargs["json"]
+    logger.info("🔍 Starting smartscraper request")
+    if logger.is_enabled_for("DEBUG"):
+        if params.get("website_html"):
+            logger.debug("📄 Using provided HTML content")
+        logger.debug("📝 Prompt: %s", params["user_prompt"])
+    logger.debug("✅ Request validation passed")
+    logged_params = LazyPayload(kwargs)
+    logger.info("🚀 Making %s request to %s (Attempt %s/%s)", METHOD, URL, 1, 4)
+    logger.debug("🔍 Request parameters: %s", logged_params)
+    logger.debug("📥 Response status: %s", 200)
+    logger.info("✅ Request completed successfully: %s %s", METHOD, URL)
+    logger.info("✨ Smartscraper request completed successfully")
+
+
+def configure(level, sink):
+    logger.disable()
+    if level is None:
+        return
+    logger.enabled = True
+    logger.logger.setLevel(level)
+    logger.logger.addHandler(logging.StreamHandler(sink))
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(repeat):
+    kwargs = build_kwargs()
+    results = {}
+    with open(os.devnull, "w") as sink:
+        for name, level in (
+            ("off", None),
+            ("info", logging.INFO),
+            ("debug", logging.DEBUG),
+        ):
+            configure(level, sink)
+            results[name] = {
+                style: best_of(lambda: func(kwargs), repeat) * 1e6
+                for style, func in (("eager", eager), ("lazy", lazy))
+            }
+    logger.disable()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=50, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"logging overhead per request in µs, best of {args.repeat}")
+    print(f"{'logging':<8}{'eager':>14}{'lazy':>12}{'speedup':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<8}{timings['eager']:>14.1f}{timings['lazy']:>12.1f}"
+            f"{timings['eager'] / timings['lazy']:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark of local include/exclude path filtering over sitemap URLs.
+
+Generates a synthetic sitemap and filters it with crawl-style patterns in
+two ways: parsing every URL with ``urllib.parse.urlsplit`` and matching its
+path against separate include and exclude regexes (the straightforward
+approach), and with :class:`PathFilter`, which compiles all patterns into
+one regex applied to the raw URL. A dry-run preview with per-pattern hit
+counts is timed as well. Both filters must keep the same URLs.
+
+Usage:
+    python benchmarks/bench_path_filter.py [--urls 1000000] [--repeat 3] [--json]
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from urllib.parse import urlsplit
+
+from scrapegraph_py.utils.path_filter import PathFilter
+
+INCLUDE = ["/blog/**", "/products/*/*", "/docs/**/index.html"]
+EXCLUDE = ["/blog/drafts/**", "/products/archived/*", "/**/print"]
+SECTIONS = ["blog", "products", "docs", "about", "admin", "search"]
+WORDS = ["drafts", "archived", "2024", "guide", "red-shoe", "index.html", "print", "v2"]
+
+
+def build_sitemap(count, seed=0):
+    rng = random.Random(seed)
+    urls = []
+    for i in range(count):
+        path = "/".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3)))
+        query = f"?page={i % 7}" if i % 5 == 0 else ""
+        urls.append(
+            f"https://www.example.com/{rng.choice(SECTIONS)}/{path}{query}".rstrip("/")
+        )
+    return urls
+
+
+def naive_filter(include, exclude):
+    """urlsplit every URL and match its path against per-side regexes"""
+
+    def translate(pattern):
+        regex = "".join(
+            (
+                "(?:/.*)?"
+                if token == "/**"
+                else (
+                    ".*"
+                    if token == "**"
+                    else "[^/]*" if token == "*" else re.escape(token)
+                )
+            )
+            for token in re.findall(r"/\*\*(?=/|$)|\*\*|\*|[^*]", pattern)
+        )
+        return f"(?:{regex})"
+
+    include_re = re.compile("|".join(map(translate, include)))
+    exclude_re = re.compile("|".join(map(translate, exclude)))
+
+    def keep(url):
+        path = urlsplit(url).path or "/"
+        return not exclude_re.fullmatch(path) and include_re.fullmatch(path) is not None
+
+    return lambda urls: [url for url in urls if keep(url)]
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run(count, repeat):
+    urls = build_sitemap(count)
+    naive = naive_filter(INCLUDE, EXCLUDE)
+    compiled = PathFilter(INCLUDE, EXCLUDE)
+
+    naive_time, expected = best_of(lambda: naive(urls), repeat)
+    compiled_time, kept = best_of(lambda: list(compiled.filter(urls)), repeat)
+    preview_time, preview = best_of(lambda: compiled.preview(urls), repeat)
+    if kept != expected or preview.kept != expected:
+        raise AssertionError("compiled filter disagrees with the reference filter")
+
+    return {
+        "urls": count,
+        "kept": len(kept),
+        "naive_urls_per_s": round(count / naive_time),
+        "compiled_urls_per_s": round(count / compiled_time),
+        "preview_urls_per_s": round(count / preview_time),
+        "unused_patterns": preview.unused_patterns,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--urls", type=int, default=1_000_000, help="Sitemap URLs to filter"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    args = parser.parse_args()
+
+    results = run(args.urls, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['urls']} URLs, {results['kept']} kept, best of {args.repeat}")
+    print(f"{'urlsplit + regex':<18}{results['naive_urls_per_s'] / 1e6:>8.2f} M URLs/s")
+    print(f"{'PathFilter':<18}{results['compiled_urls_per_s'] / 1e6:>8.2f} M URLs/s")
+    print(f"{'preview':<18}{results['preview_urls_per_s'] / 1e6:>8.2f} M URLs/s")
+
+
+if __name__ == "__main__":
+    main()
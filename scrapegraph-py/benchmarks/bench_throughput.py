@@ -0,0 +1,335 @@
+"""
+End-to-end throughput and latency benchmark against a local stand-in API.
+
+Starts an aiohttp server playing the smartscraper endpoint: every request
+waits for a latency drawn from ``--latency`` and is answered with a result
+whose size is drawn from the body-size distribution of the scenario. The
+real ``Client.smartscraper`` and ``AsyncClient.smartscraper`` methods are
+then driven at each concurrency level (a thread pool for Client, tasks for
+AsyncClient), so request building, the transport, the connection pool and
+response decoding are all exercised. Mock mode skips the transport and so
+cannot measure any of this.
+
+Each scenario runs in a fresh interpreter, so its peak RSS is its own; the
+stand-in API runs in the parent process. For every client, concurrency level
+and body size the benchmark reports requests/s, p50/p95/p99 latency and peak
+RSS.
+
+Distributions are written ``fixed:X``, ``uniform:LOW,HIGH``,
+``lognormal:MEDIAN,SIGMA`` or ``exp:MEAN``; latencies are in milliseconds
+and body sizes in KiB.
+
+Usage:
+    python benchmarks/bench_throughput.py [--requests 200] [--concurrency 1 8 32]
+        [--latency lognormal:20,0.5] [--body-sizes fixed:1 lognormal:64,1 fixed:1024]
+        [--clients sync async] [--json] [--output results.jsonl]
+
+``--output`` appends one JSON record per run (results plus environment), so
+a file can collect a history to track over time.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+API_KEY = "sgai-00000000-0000-0000-0000-000000000000"
+MAX_BODY_BYTES = 16 * 1024 * 1024
+WARMUP_REQUESTS = 5
+
+
+def parse_distribution(spec):
+    """Parse a distribution spec into a sampling function"""
+    kind, _, args = spec.partition(":")
+    try:
+        values = [float(value) for value in args.split(",")] if args else []
+        if kind == "fixed":
+            (value,) = values
+            return lambda: value
+        if kind == "uniform":
+            low, high = values
+            return lambda: random.uniform(low, high)
+        if kind == "lognormal":
+            median, sigma = values
+            return lambda: random.lognormvariate(0, sigma) * median
+        if kind == "exp":
+            (mean,) = values
+            return lambda: random.expovariate(1 / mean)
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"invalid distribution {spec!r}")
+
+
+def distribution(spec):
+    parse_distribution(spec)
+    return spec
+
+
+def build_app(latency_spec):
+    """Stand-in API; the body size spec of a request comes in its prompt"""
+    from aiohttp import web
+
+    latency = parse_distribution(latency_spec)
+    body_samplers = {}
+    blob = b"x" * MAX_BODY_BYTES
+
+    async def smartscraper(request):
+        payload = await request.json()
+        spec = payload["user_prompt"]
+        sampler = body_samplers.get(spec) or body_samplers.setdefault(
+            spec, parse_distribution(spec)
+        )
+        await asyncio.sleep(max(0.0, latency()) / 1000)
+        size = min(max(0, int(sampler() * 1024)), MAX_BODY_BYTES)
+        body = (
+            b'{"request_id":"bench","status":"completed","result":{"content":"'
+            + blob[:size]
+            + b'"}}'
+        )
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application(client_max_size=MAX_BODY_BYTES)
+    app.router.add_post("/v1/smartscraper", smartscraper)
+    return app
+
+
+def start_server(latency_spec):
+    """Run the stand-in API on its own event loop thread; return (url, stop)"""
+    from aiohttp import web
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(build_app(latency_spec), access_log=None)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+    loop.run_until_complete(site.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    return f"http://127.0.0.1:{runner.addresses[0][1]}/v1", stop
+
+
+def point_clients_at(base_url):
+    """Send the SDK's requests to the stand-in API"""
+    from scrapegraph_py import async_client, client
+
+    client.API_BASE_URL = base_url
+    async_client.API_BASE_URL = base_url
+
+
+def peak_rss_mb():
+    # VmHWM belongs to this process image, while ru_maxrss can start from
+    # the parent's peak when the interpreter was spawned by fork + exec
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_sync(body_spec, requests, concurrency):
+    from scrapegraph_py.client import Client
+
+    latencies, errors = [], 0
+    with Client(api_key=API_KEY, max_retries=0, pool_size=max(concurrency, 10)) as sdk:
+
+        def call(_):
+            start = time.perf_counter()
+            sdk.smartscraper(user_prompt=body_spec, website_url="https://example.com")
+            return time.perf_counter() - start
+
+        for _ in range(WARMUP_REQUESTS):
+            call(None)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            started = time.perf_counter()
+            futures = [pool.submit(call, index) for index in range(requests)]
+            for future in futures:
+                try:
+                    latencies.append(future.result())
+                except Exception:
+                    errors += 1
+            elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+async def run_async(body_spec, requests, concurrency):
+    from scrapegraph_py.async_client import AsyncClient
+
+    latencies, errors = [], 0
+    async with AsyncClient(
+        api_key=API_KEY, max_retries=0, pool_size=max(concurrency, 10)
+    ) as sdk:
+        remaining = iter(range(requests))
+
+        async def call():
+            start = time.perf_counter()
+            await sdk.smartscraper(
+                user_prompt=body_spec, website_url="https://example.com"
+            )
+            return time.perf_counter() - start
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                try:
+                    latencies.append(await call())
+                except Exception:
+                    errors += 1
+
+        for _ in range(WARMUP_REQUESTS):
+            await call()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def run_scenario(scenario):
+    """Run one scenario; called in a fresh interpreter"""
+    point_clients_at(scenario["base_url"])
+    args = (scenario["body_size_kib"], scenario["requests"], scenario["concurrency"])
+    if scenario["client"] == "sync":
+        latencies, errors, elapsed = run_sync(*args)
+    else:
+        latencies, errors, elapsed = asyncio.run(run_async(*args))
+
+    result = {key: value for key, value in scenario.items() if key != "base_url"}
+    result.update(
+        errors=errors, duration_s=round(elapsed, 3), peak_rss_mb=round(peak_rss_mb(), 1)
+    )
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        result.update(
+            requests_per_s=round(len(latencies) / elapsed, 1),
+            p50_ms=round(cuts[49] * 1000, 2),
+            p95_ms=round(cuts[94] * 1000, 2),
+            p99_ms=round(cuts[98] * 1000, 2),
+            mean_ms=round(statistics.fmean(latencies) * 1000, 2),
+        )
+    return result
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run(args):
+    base_url, stop = start_server(args.latency)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    try:
+        for client in args.clients:
+            for body_spec in args.body_sizes:
+                for concurrency in args.concurrency:
+                    scenario = {
+                        "client": client,
+                        "concurrency": concurrency,
+                        "body_size_kib": body_spec,
+                        "latency_ms": args.latency,
+                        "requests": args.requests,
+                        "base_url": base_url,
+                    }
+                    with context.Pool(1) as pool:
+                        results.append(pool.apply(run_scenario, (scenario,)))
+    finally:
+        stop()
+    return {"environment": environment(), "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Measured requests per scenario"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="Requests in flight",
+    )
+    parser.add_argument(
+        "--latency",
+        type=distribution,
+        default="lognormal:20,0.5",
+        help="Server latency distribution in ms",
+    )
+    parser.add_argument(
+        "--body-sizes",
+        type=distribution,
+        nargs="+",
+        default=["fixed:1", "lognormal:64,1", "fixed:1024"],
+        help="Response body size distributions in KiB, one scenario each",
+    )
+    parser.add_argument(
+        "--clients", nargs="+", choices=["sync", "async"], default=["sync", "async"]
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print machine-readable results"
+    )
+    parser.add_argument(
+        "--output", help="Append the results as one JSON line to this file"
+    )
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.output:
+        with open(args.output, "a") as output:
+            output.write(json.dumps(report) + "\n")
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"server latency: {args.latency} ms, {args.requests} requests per scenario")
+    print(
+        f"{'client':<7}{'body KiB':<18}{'conc':>5}{'req/s':>9}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'RSS MB':>8}{'errors':>8}"
+    )
+    for result in report["results"]:
+        print(
+            f"{result['client']:<7}{result['body_size_kib']:<18}{result['concurrency']:>5}"
+            f"{result.get('requests_per_s', 0):>9.1f}{result.get('p50_ms', 0):>9.1f}"
+            f"{result.get('p95_ms', 0):>9.1f}{result.get('p99_ms', 0):>9.1f}"
+            f"{result['peak_rss_mb']:>8.1f}{result['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
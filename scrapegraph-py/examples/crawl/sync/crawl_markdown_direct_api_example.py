@@ -7,8 +7,13 @@ This example shows how to use the crawler in markdown conversion mode:
 - 2 credits per page (80% savings compared to AI mode)
 - Clean HTML to markdown conversion with metadata extraction
 
+The job is submitted with a plain HTTP request; the SDK client is only used
+to wait for the result with Client.wait_for, which polls with jittered
+exponential backoff and honours Retry-After on rate limits.
+
 Requirements:
-- Python 3.7+
+- Python 3.10+
+- scrapegraph-py
 - requests
 - python-dotenv
 - A .env file with your API_KEY
@@ -19,18 +24,21 @@ API_KEY=your_api_key_here
 
 import json
 import os
-import time
 from typing import Any, Dict
 
 import requests
 from dotenv import load_dotenv
 
+from scrapegraph_py import Client
+from scrapegraph_py.config import API_BASE_URL
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Configuration - API key from environment or fallback
 API_KEY = os.getenv("TEST_API_KEY", "sgai-xxx")  # Load from .env file
-BASE_URL = os.getenv("BASE_URL", "http://localhost:8001")  # Can be overridden via env
+# Client.wait_for polls the public API, so jobs are submitted there as well
+BASE_URL = API_BASE_URL
 
 
 def make_request(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -41,81 +49,6 @@ def make_request(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
     return response.json()
 
 
-def poll_result(task_id: str) -> Dict[str, Any]:
-    """Poll for the result of a crawl job with rate limit handling."""
-    headers = {"SGAI-APIKEY": API_KEY}
-    url = f"{BASE_URL}/v1/crawl/{task_id}"
-
-    response = requests.get(url, headers=headers)
-
-    if response.status_code == 429:
-        # Rate limited - return special status to handle in polling loop
-        return {"status": "rate_limited", "retry_after": 60}
-
-    return response.json()
-
-
-def poll_with_backoff(task_id: str, max_attempts: int = 20) -> Dict[str, Any]:
-    """
-    Poll for crawl results with intelligent backoff to avoid rate limits.
-
-    Args:
-        task_id: The task ID to poll for
-        max_attempts: Maximum number of polling attempts
-
-    Returns:
-        The final result or raises an exception on timeout/failure
-    """
-    print("⏳ Starting to poll for results with rate-limit protection...")
-
-    # Initial wait to give the job time to start processing
-    time.sleep(15)
-
-    for attempt in range(max_attempts):
-        try:
-            result = poll_result(task_id)
-            status = result.get("status")
-
-            if status == "rate_limited":
-                wait_time = min(
-                    90, 30 + (attempt * 10)
-                )  # Exponential backoff for rate limits
-                print(f"⚠️ Rate limited! Waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
-                continue
-
-            elif status == "success":
-                return result
-
-            elif status == "failed":
-                raise Exception(f"Crawl failed: {result.get('error', 'Unknown error')}")
-
-            else:
-                # Calculate progressive wait time: start at 15s, increase gradually
-                base_wait = 15
-                progressive_wait = min(60, base_wait + (attempt * 3))  # Cap at 60s
-
-                print(
-                    f"⏳ Status: {status} (attempt {attempt + 1}/{max_attempts}) - waiting {progressive_wait}s..."
-                )
-                time.sleep(progressive_wait)
-
-        except Exception as e:
-            if "rate" in str(e).lower() or "429" in str(e):
-                wait_time = min(90, 45 + (attempt * 10))
-                print(f"⚠️ Rate limit detected in error, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                continue
-            else:
-                print(f"❌ Error polling for results: {e}")
-                if attempt < max_attempts - 1:
-                    time.sleep(20)  # Wait before retry
-                    continue
-                raise
-
-    raise Exception(f"⏰ Timeout: Job did not complete after {max_attempts} attempts")
-
-
 def markdown_crawling_example():
     """
     Markdown Conversion Mode (NO AI/LLM Used)
@@ -153,7 +86,7 @@ def markdown_crawling_example():
 
     # Start the markdown conversion job
     print("🚀 Starting markdown conversion job...")
-    response = make_request(f"{BASE_URL}/v1/crawl", request_data)
+    response = make_request(f"{BASE_URL}/crawl", request_data)
     task_id = response.get("task_id")
 
     if not task_id:
@@ -164,9 +97,14 @@ def markdown_crawling_example():
     print("⏳ Polling for results...")
     print()
 
-    # Poll for results with rate-limit protection
+    # Poll for results with jittered exponential backoff
     try:
-        result = poll_with_backoff(task_id, max_attempts=20)
+        with Client(api_key=API_KEY) as client:
+            result = client.wait_for(
+                task_id, service="crawl", timeout=600, initial_interval=5
+            )
+        if result.get("status") == "failed":
+            raise Exception(f"Crawl failed: {result.get('error', 'Unknown error')}")
 
         print("✅ Markdown conversion completed successfully!")
         print()
@@ -231,7 +169,6 @@ def main():
         print()
         print("   Example .env file:")
         print("   API_KEY=sgai-your-actual-api-key-here")
-        print("   BASE_URL=https://api.scrapegraphai.com  # Optional")
         return
 
     print(f"🔑 Using API key: {API_KEY[:10]}...")
@@ -19,68 +19,12 @@ Usage:
 
 import json
 import os
-import time
-from typing import Any, Dict
 
 from dotenv import load_dotenv
 
 from scrapegraph_py import Client
 
 
-def poll_for_result(
-    client: Client, crawl_id: str, max_attempts: int = 20
-) -> Dict[str, Any]:
-    """
-    Poll for crawl results with intelligent backoff to avoid rate limits.
-
-    Args:
-        client: The ScrapeGraph client
-        crawl_id: The crawl ID to poll for
-        max_attempts: Maximum number of polling attempts
-
-    Returns:
-        The final result or raises an exception on timeout/failure
-    """
-    print("⏳ Starting to poll for results with rate-limit protection...")
-
-    # Initial wait to give the job time to start processing
-    time.sleep(15)
-
-    for attempt in range(max_attempts):
-        try:
-            result = client.get_crawl(crawl_id)
-            status = result.get("status")
-
-            if status == "success":
-                return result
-            elif status == "failed":
-                raise Exception(f"Crawl failed: {result.get('error', 'Unknown error')}")
-            else:
-                # Calculate progressive wait time: start at 15s, increase gradually
-                base_wait = 15
-                progressive_wait = min(60, base_wait + (attempt * 3))  # Cap at 60s
-
-                print(
-                    f"⏳ Status: {status} (attempt {attempt + 1}/{max_attempts}) - waiting {progressive_wait}s..."
-                )
-                time.sleep(progressive_wait)
-
-        except Exception as e:
-            if "rate" in str(e).lower() or "429" in str(e):
-                wait_time = min(90, 45 + (attempt * 10))
-                print(f"⚠️ Rate limit detected in error, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                continue
-            else:
-                print(f"❌ Error polling for results: {e}")
-                if attempt < max_attempts - 1:
-                    time.sleep(20)  # Wait before retry
-                    continue
-                raise
-
-    raise Exception(f"⏰ Timeout: Job did not complete after {max_attempts} attempts")
-
-
 def markdown_crawling_example():
     """
     Markdown Conversion Mode (NO AI/LLM Used)
@@ -135,9 +79,13 @@ def markdown_crawling_example():
     print("⏳ Polling for results...")
     print()
 
-    # Poll for results with rate-limit protection
+    # Poll for results with jittered exponential backoff
     try:
-        result = poll_for_result(client, crawl_id, max_attempts=20)
+        result = client.wait_for(
+            crawl_id, service="crawl", timeout=600, initial_interval=5
+        )
+        if result.get("status") == "failed":
+            raise Exception(f"Crawl failed: {result.get('error', 'Unknown error')}")
 
         print("✅ Markdown conversion completed successfully!")
         print()
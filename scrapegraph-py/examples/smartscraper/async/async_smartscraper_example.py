@@ -30,24 +30,19 @@ async def main():
         "https://github.com/ScrapeGraphAI/Scrapegraph-ai",
     ]
 
-    tasks = [
-        sgai_client.smartscraper(
-            website_url=url, user_prompt="Summarize the main content"
-        )
-        for url in urls
-    ]
-
-    # Execute requests concurrently
-    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    # Concurrent scraping requests with a bounded number of calls in flight
+    results = await sgai_client.smartscraper_many(
+        urls, user_prompt="Summarize the main content", concurrency=5
+    )
 
     # Process results
-    for i, response in enumerate(responses):
-        if isinstance(response, Exception):
-            print(f"\nError for {urls[i]}: {response}")
+    for item in results:
+        if not item.ok:
+            print(f"\nError for {item.input}: {item.error}")
         else:
-            print(f"\nPage {i+1} Summary:")
-            print(f"URL: {urls[i]}")
-            print(f"Result: {response['result']}")
+            print(f"\nPage {item.index + 1} Summary:")
+            print(f"URL: {item.input}")
+            print(f"Result: {item.result['result']}")
 
     await sgai_client.close()
 
@@ -44,38 +44,140 @@ Async Usage:
 
 For more information visit: https://scrapegraphai.com
 Documentation: https://docs.scrapegraphai.com
+
+Public names are loaded on first use, so importing the package is cheap and
+each client only imports its own HTTP library.
 """
 
-from .async_client import AsyncClient
-from .client import Client
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .client import Client
+    from .exceptions import CircuitOpenError
+    from .models.scheduled_jobs import (
+        GetJobExecutionsRequest,
+        GetScheduledJobRequest,
+        GetScheduledJobsRequest,
+        JobActionRequest,
+        JobActionResponse,
+        JobExecutionListResponse,
+        JobExecutionResponse,
+        JobTriggerResponse,
+        ScheduledJobCreate,
+        ScheduledJobListResponse,
+        ScheduledJobResponse,
+        ScheduledJobUpdate,
+        ServiceType,
+        TriggerJobRequest,
+    )
+    from .models.scrape import GetScrapeRequest, ScrapeRequest
+    from .utils.bulk import BulkResult
+    from .utils.cache import ResponseCache
+    from .utils.checkpoint import CheckpointStore, JobRecord, SQLiteCheckpointStore
+    from .utils.circuit_breaker import CircuitBreaker
+    from .utils.crawl_pages import CrawlPage
+    from .utils.dedup import (
+        DuplicateMatch,
+        FingerprintStore,
+        NearDuplicateFilter,
+        SQLiteFingerprintStore,
+    )
+    from .utils.fanout import FanOutProgress
+    from .utils.hedging import HedgePolicy
+    from .utils.path_filter import PathFilter, PathPreview
+    from .utils.rate_limiter import RateLimiter
+    from .utils.retry import RetryBudget, RetryPolicy
+    from .utils.tracing import OpenTelemetrySpans, RequestTracer, TraceEvent
+
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562), so ``from scrapegraph_py import Client`` never loads
+# aiohttp and ``import scrapegraph_py`` loads neither HTTP library.
+_LAZY_IMPORTS = {
+    "Client": ".client",
+    "AsyncClient": ".async_client",
+    "BulkResult": ".utils.bulk",
+    "RateLimiter": ".utils.rate_limiter",
+    "RetryPolicy": ".utils.retry",
+    "RetryBudget": ".utils.retry",
+    "ResponseCache": ".utils.cache",
+    "CircuitBreaker": ".utils.circuit_breaker",
+    "CircuitOpenError": ".exceptions",
+    "CrawlPage": ".utils.crawl_pages",
+    "CheckpointStore": ".utils.checkpoint",
+    "SQLiteCheckpointStore": ".utils.checkpoint",
+    "JobRecord": ".utils.checkpoint",
+    "NearDuplicateFilter": ".utils.dedup",
+    "FingerprintStore": ".utils.dedup",
+    "SQLiteFingerprintStore": ".utils.dedup",
+    "DuplicateMatch": ".utils.dedup",
+    "FanOutProgress": ".utils.fanout",
+    "PathFilter": ".utils.path_filter",
+    "PathPreview": ".utils.path_filter",
+    "HedgePolicy": ".utils.hedging",
+    "RequestTracer": ".utils.tracing",
+    "TraceEvent": ".utils.tracing",
+    "OpenTelemetrySpans": ".utils.tracing",
+    # Scrape Models
+    "ScrapeRequest": ".models.scrape",
+    "GetScrapeRequest": ".models.scrape",
+    # Scheduled Jobs Models
+    "ServiceType": ".models.scheduled_jobs",
+    "ScheduledJobCreate": ".models.scheduled_jobs",
+    "ScheduledJobUpdate": ".models.scheduled_jobs",
+    "ScheduledJobResponse": ".models.scheduled_jobs",
+    "ScheduledJobListResponse": ".models.scheduled_jobs",
+    "JobExecutionResponse": ".models.scheduled_jobs",
+    "JobExecutionListResponse": ".models.scheduled_jobs",
+    "JobTriggerResponse": ".models.scheduled_jobs",
+    "JobActionResponse": ".models.scheduled_jobs",
+    "GetScheduledJobsRequest": ".models.scheduled_jobs",
+    "GetScheduledJobRequest": ".models.scheduled_jobs",
+    "GetJobExecutionsRequest": ".models.scheduled_jobs",
+    "TriggerJobRequest": ".models.scheduled_jobs",
+    "JobActionRequest": ".models.scheduled_jobs",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-# Scrape Models
-from .models.scrape import (
-    ScrapeRequest,
-    GetScrapeRequest,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Scheduled Jobs Models
-from .models.scheduled_jobs import (
-    GetJobExecutionsRequest,
-    GetScheduledJobRequest,
-    GetScheduledJobsRequest,
-    JobActionRequest,
-    JobActionResponse,
-    JobExecutionListResponse,
-    JobExecutionResponse,
-    JobTriggerResponse,
-    ScheduledJobCreate,
-    ScheduledJobListResponse,
-    ScheduledJobResponse,
-    ScheduledJobUpdate,
-    ServiceType,
-    TriggerJobRequest,
-)
 
 __all__ = [
     "Client", 
     "AsyncClient",
+    "BulkResult",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryBudget",
+    "ResponseCache",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CrawlPage",
+    "CheckpointStore",
+    "SQLiteCheckpointStore",
+    "JobRecord",
+    "NearDuplicateFilter",
+    "FingerprintStore",
+    "SQLiteFingerprintStore",
+    "DuplicateMatch",
+    "FanOutProgress",
+    "PathFilter",
+    "PathPreview",
+    "HedgePolicy",
+    "RequestTracer",
+    "TraceEvent",
+    "OpenTelemetrySpans",
     # Scrape Models
     "ScrapeRequest",
     "GetScrapeRequest",
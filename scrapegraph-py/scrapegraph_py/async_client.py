@@ -9,10 +9,35 @@ The AsyncClient class supports:
 - API key authentication
 - SSL verification configuration
 - Request timeout configuration
-- Automatic retry logic with exponential backoff
+- Automatic retries with jittered exponential backoff, a retry budget and
+  idempotency keys (see RetryPolicy)
+- Opt-in in-process response cache (see ResponseCache)
+- Fast JSON encoding/decoding with orjson or msgspec when installed
+- Coalescing of identical concurrent requests into one HTTP call
 - Mock mode for testing
 - Async context manager support for proper resource cleanup
+- Lazy, per-event-loop session creation
+- Optional client-side rate limiting per endpoint family
+- Optional circuit breaker failing fast while an endpoint family is unhealthy
+  (see CircuitBreaker)
+- Optional hedging of slow status requests (see HedgePolicy)
+- Opt-in gzip/zstd compression of large request bodies, and zstd/brotli
+  response decoding when available
+- Request lifecycle tracing hooks (see RequestTracer), with an optional
+  OpenTelemetry span adapter
+- Opt-in durable checkpoints of submitted jobs, resumable after a restart
+  (see CheckpointStore and resume)
 - Concurrent requests using asyncio
+- Bounded-concurrency bulk requests (smartscraper_many, markdownify_many,
+  scrape_many, as_completed)
+- Multiplexed polling of job results (wait_for, wait_for_many)
+- Incremental decoding of large crawl/searchscraper results (stream_crawl,
+  stream_searchscraper), and page-by-page delivery of running crawls
+  (iter_crawl_pages)
+- Sitemap-driven fan-out of per-URL extraction with local path filtering,
+  per-domain concurrency caps and progress reporting (sitemap_fanout)
+- Dry runs of crawl include/exclude path patterns against the sitemap
+  (crawl_dry_run)
 
 Example:
     Basic usage with environment variables:
@@ -34,17 +59,34 @@ Example:
         >>> asyncio.run(main())
 """
 import asyncio
-from typing import Any, Dict, Optional, Callable
+import json
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
-from aiohttp.client_exceptions import ClientError
+from aiohttp import ClientSession, ClientTimeout, TraceConfig
+from aiohttp.client_exceptions import ClientError, ClientResponseError
 from pydantic import BaseModel
 from urllib.parse import urlparse
 import uuid as _uuid
 
-from scrapegraph_py.config import API_BASE_URL, DEFAULT_HEADERS
+from scrapegraph_py.config import (
+    API_BASE_URL,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_DOMAIN_CONCURRENCY,
+    DEFAULT_HEADERS,
+)
 from scrapegraph_py.exceptions import APIError
-from scrapegraph_py.logger import sgai_logger as logger
+from scrapegraph_py.logger import LazyPayload, sgai_logger as logger
 from scrapegraph_py.models.agenticscraper import (
     AgenticScraperRequest,
     GetAgenticScraperRequest,
@@ -76,7 +118,63 @@ from scrapegraph_py.models.scheduled_jobs import (
     ScheduledJobUpdate,
     TriggerJobRequest,
 )
+from scrapegraph_py.utils.bulk import (
+    BulkInputs,
+    BulkResult,
+    build_call_kwargs,
+    run_as_completed,
+    run_ordered,
+)
 from scrapegraph_py.utils.helpers import handle_async_response, validate_api_key
+from scrapegraph_py.utils.checkpoint import CheckpointStore
+from scrapegraph_py.utils.fanout import (
+    FanOutProgress,
+    ProgressCallback,
+    fan_out_async,
+)
+from scrapegraph_py.utils.path_filter import PathFilter, PathPreview
+from scrapegraph_py.utils.crawl_pages import (
+    CRAWL_PAGE_KEYS,
+    CRAWL_STATUS_KEYS,
+    CrawlPage,
+    CrawlPageCursor,
+)
+from scrapegraph_py.utils.json_stream import (
+    DEFAULT_STREAM_KEYS,
+    STREAM_CHUNK_SIZE,
+    aiter_json_items,
+    iter_json_items,
+)
+from scrapegraph_py.utils.poller import (
+    PollJob,
+    PollSchedule,
+    is_permanent_error,
+    poll_many_async,
+    resolve_poll_method,
+)
+from scrapegraph_py.utils.pool import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    ConnectionCounters,
+    build_connector,
+    connector_stats,
+    discard_session,
+)
+from scrapegraph_py.utils.codec import encode_json_body, get_codec
+from scrapegraph_py.utils.cache import ResponseCache, cache_key
+from scrapegraph_py.utils.circuit_breaker import CircuitBreaker, is_healthy
+from scrapegraph_py.utils.compression import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    compress_body,
+    get_compressor,
+    async_accept_encoding,
+)
+from scrapegraph_py.utils.hedging import HedgePolicy
+from scrapegraph_py.utils.tracing import RequestTracer
+from scrapegraph_py.utils.rate_limiter import RateLimiter, parse_retry_after
+from scrapegraph_py.utils.singleflight import SingleFlight, is_coalescable
+from scrapegraph_py.utils.retry import RetryPolicy
 from scrapegraph_py.utils.toon_converter import process_response_with_toon
 
 
@@ -95,7 +193,19 @@ class AsyncClient:
         max_retries (int): Maximum number of retry attempts
         retry_delay (float): Base delay between retries in seconds
         mock (bool): Whether mock mode is enabled
-        session (ClientSession): Aiohttp session for connection pooling
+        rate_limiter (Optional[RateLimiter]): Client-side rate limiter, if any
+        retry_policy (RetryPolicy): Policy deciding which failed requests are retried
+        response_cache (Optional[ResponseCache]): Response cache, if any
+        codec (JSONCodec): JSON codec for request bodies and responses
+        circuit_breaker (Optional[CircuitBreaker]): Circuit breaker, if any
+        hedge_policy (Optional[HedgePolicy]): Hedging policy for status requests, if any
+        request_compression (Optional[str]): Request body compression, if any
+        tracer (Optional[RequestTracer]): Request lifecycle tracer, if any
+        checkpoint_store (Optional[CheckpointStore]): Store of submitted jobs, if any
+        singleflight (Optional[SingleFlight]): Coalesces identical in-flight
+            requests, unless disabled
+        session (ClientSession): Aiohttp session for connection pooling, created
+            lazily for each event loop the client is used from
 
     Example:
         >>> async def example():
@@ -115,6 +225,22 @@ class AsyncClient:
         mock: Optional[bool] = None,
         mock_handler: Optional[Callable[[str, str, Dict[str, Any]], Any]] = None,
         mock_responses: Optional[Dict[str, Any]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        force_close: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        json_codec: Optional[str] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        tracer: Optional[RequestTracer] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize AsyncClient using API key from environment variable.
 
@@ -123,6 +249,33 @@ class AsyncClient:
             timeout: Request timeout in seconds. None means no timeout (infinite)
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            pool_size: Maximum number of simultaneous connections
+            pool_per_host: Maximum number of connections per host (None = unlimited)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            dns_cache_ttl: Seconds resolved DNS entries are cached (None = forever)
+            force_close: Close connections after each request instead of pooling
+            rate_limiter: Optional RateLimiter throttling requests per endpoint
+                          family. Can be shared between clients
+            retry_policy: Optional RetryPolicy replacing the default built
+                          from max_retries and retry_delay
+            response_cache: Optional ResponseCache answering repeated
+                            requests from memory. Can be shared between clients
+            coalesce_requests: Share one in-flight request between concurrent
+                               identical calls
+            json_codec: JSON codec for request bodies and responses ("orjson",
+                        "msgspec" or "json"). Defaults to the fastest installed
+                        codec
+            circuit_breaker: Optional CircuitBreaker failing fast while an endpoint
+                        family is unhealthy
+            hedge_policy: Optional HedgePolicy sending a second copy of slow status
+                          requests
+            request_compression: Compress request bodies with "gzip" or "zstd"
+                                 (None = send them uncompressed)
+            compression_threshold: Minimum body size in bytes to compress
+            tracer: Optional RequestTracer receiving timing events for every
+                    request phase, retry and poll
+            checkpoint_store: Optional CheckpointStore recording submitted jobs
+                    so they can be resumed instead of resubmitted
         """
         from os import getenv
 
@@ -147,6 +300,22 @@ class AsyncClient:
             mock=bool(mock),
             mock_handler=mock_handler,
             mock_responses=mock_responses,
+            pool_size=pool_size,
+            pool_per_host=pool_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            force_close=force_close,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+            json_codec=json_codec,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+            tracer=tracer,
+            checkpoint_store=checkpoint_store,
         )
 
     def __init__(
@@ -159,6 +328,22 @@ class AsyncClient:
         mock: bool = False,
         mock_handler: Optional[Callable[[str, str, Dict[str, Any]], Any]] = None,
         mock_responses: Optional[Dict[str, Any]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        force_close: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        json_codec: Optional[str] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        tracer: Optional[RequestTracer] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize AsyncClient with configurable parameters.
 
@@ -169,6 +354,33 @@ class AsyncClient:
             timeout: Request timeout in seconds. None means no timeout (infinite)
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            pool_size: Maximum number of simultaneous connections
+            pool_per_host: Maximum number of connections per host (None = unlimited)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            dns_cache_ttl: Seconds resolved DNS entries are cached (None = forever)
+            force_close: Close connections after each request instead of pooling
+            rate_limiter: Optional RateLimiter throttling requests per endpoint
+                          family. Can be shared between clients
+            retry_policy: Optional RetryPolicy replacing the default built
+                          from max_retries and retry_delay
+            response_cache: Optional ResponseCache answering repeated
+                            requests from memory. Can be shared between clients
+            coalesce_requests: Share one in-flight request between concurrent
+                               identical calls
+            json_codec: JSON codec for request bodies and responses ("orjson",
+                        "msgspec" or "json"). Defaults to the fastest installed
+                        codec
+            circuit_breaker: Optional CircuitBreaker failing fast while an endpoint
+                        family is unhealthy
+            hedge_policy: Optional HedgePolicy sending a second copy of slow status
+                          requests
+            request_compression: Compress request bodies with "gzip" or "zstd"
+                                 (None = send them uncompressed)
+            compression_threshold: Minimum body size in bytes to compress
+            tracer: Optional RequestTracer receiving timing events for every
+                    request phase, retry and poll
+            checkpoint_store: Optional CheckpointStore recording submitted jobs
+                    so they can be resumed instead of resubmitted
         """
         logger.info("🔑 Initializing AsyncClient")
 
@@ -184,30 +396,105 @@ class AsyncClient:
 
         validate_api_key(api_key)
         logger.debug(
-            f"🛠️ Configuration: verify_ssl={verify_ssl}, "
-            f"timeout={timeout}, max_retries={max_retries}"
+            "🛠️ Configuration: verify_ssl=%s, timeout=%s, max_retries=%s, "
+            "pool_size=%s, pool_per_host=%s",
+            verify_ssl,
+            timeout,
+            max_retries,
+            pool_size,
+            pool_per_host,
         )
         self.api_key = api_key
-        self.headers = {**DEFAULT_HEADERS, "SGAI-APIKEY": api_key}
+        self.headers = {
+            **DEFAULT_HEADERS,
+            "Accept-Encoding": async_accept_encoding(),
+            "SGAI-APIKEY": api_key,
+        }
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.mock = bool(mock)
         self.mock_handler = mock_handler
         self.mock_responses = mock_responses or {}
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self.response_cache = response_cache
+        self.codec = get_codec(json_codec)
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        get_compressor(request_compression)
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+        self.tracer = tracer
+        self.checkpoint_store = checkpoint_store
+        self.singleflight = SingleFlight() if coalesce_requests else None
 
         ssl = None if verify_ssl else False
         self.timeout = ClientTimeout(total=timeout) if timeout is not None else None
 
-        self.session = ClientSession(
-            headers=self.headers, connector=TCPConnector(ssl=ssl), timeout=self.timeout
-        )
+        self._connection_counters = ConnectionCounters()
+        self._pool_options = {
+            "ssl": ssl,
+            "pool_size": pool_size,
+            "pool_per_host": pool_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "dns_cache_ttl": dns_cache_ttl,
+            "force_close": force_close,
+        }
+        # Sessions are created lazily, one per event loop using the client
+        self._sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
 
         logger.info("✅ AsyncClient initialized successfully")
 
+    @property
+    def session(self) -> ClientSession:
+        """Aiohttp session bound to the running event loop.
+
+        The session is created on first use in each event loop, so building
+        the client costs nothing and one client can serve several loops.
+
+        Raises:
+            RuntimeError: If accessed outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._prune_sessions()
+            logger.debug("🧵 Creating session for the running event loop")
+            session = ClientSession(
+                headers=self.headers,
+                connector=build_connector(**self._pool_options),
+                timeout=self.timeout,
+                trace_configs=self._trace_configs(),
+            )
+            self._sessions[loop] = session
+        return session
+
+    def _trace_configs(self) -> List[TraceConfig]:
+        """aiohttp tracing for pool statistics and, if set, the tracer."""
+        trace_configs = [self._connection_counters.trace_config()]
+        if self.tracer is not None:
+            trace_configs.append(self.tracer.trace_config())
+        return trace_configs
+
+    def _prune_sessions(self) -> None:
+        """Drop sessions whose event loop has been closed."""
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            discard_session(self._sessions.pop(loop))
+
     async def _make_request(self, method: str, url: str, **kwargs) -> Any:
         """
         Make asynchronous HTTP request with retry logic and error handling.
 
+        Responses of cacheable endpoints are served from ``response_cache``
+        when one is configured, and concurrent identical requests share one
+        HTTP call unless coalescing is disabled. With a ``checkpoint_store``,
+        job submissions and status responses are recorded and a payload whose
+        job is still unfinished is answered with the recorded response. Store
+        calls run in a worker thread, so a blocking backend such as SQLite
+        does not stall the event loop.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Full URL for the request
@@ -220,6 +507,108 @@ class AsyncClient:
             APIError: If the API returns an error response
             ConnectionError: If unable to connect after all retries
 
+        Note:
+            In mock mode, this method returns deterministic responses without
+            making actual HTTP requests.
+        """
+        store = self.checkpoint_store
+        checkpoint = None
+        if store is not None:
+            checkpoint, submitted = await asyncio.to_thread(
+                store.lookup, method, url, kwargs
+            )
+            if submitted is not None:
+                logger.info("♻️ Job already submitted, re-attaching: %s %s", method, url)
+                return submitted
+
+        cache = self.response_cache
+        key = None
+        if cache is not None:
+            key, cached = cache.lookup(method, url, kwargs, self.headers)
+            if cached is not None:
+                logger.debug("💾 Cache hit for %s %s", method, url)
+                return cached
+
+        if self.singleflight is not None and is_coalescable(method, url):
+            flight_key = key or cache_key(method, url, kwargs.get("json"), kwargs.get("params"))
+            result = await self.singleflight.do(
+                flight_key, lambda: self._send_hedged(method, url, **kwargs)
+            )
+        else:
+            result = await self._send_hedged(method, url, **kwargs)
+        if key is not None:
+            cache.store(key, method, url, result)
+        if store is not None:
+            await asyncio.to_thread(store.record, checkpoint, method, url, kwargs, result)
+        return result
+
+    async def _send_hedged(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request, hedging it with a second copy if it is slow.
+
+        Status requests covered by ``hedge_policy`` get a second copy once the
+        first has been outstanding longer than the policy's latency
+        percentile and the hedge budget allows it. The first successful
+        response wins and the other copy is cancelled. Other requests are
+        sent once through :meth:`_send_request`.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            Parsed JSON response data
+        """
+        policy = self.hedge_policy
+        if policy is None or getattr(self, "mock", False) or not policy.applies(method, url):
+            return await self._send_request(method, url, **kwargs)
+
+        delay = policy.start(url)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(self._send_request(method, url, **kwargs))
+        tasks = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and policy.allow_hedge():
+                    logger.info(
+                        "🪁 No response after %.3fs, hedging %s %s", delay, method, url
+                    )
+                    tasks.add(asyncio.ensure_future(self._send_request(method, url, **kwargs)))
+            pending = tasks
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    break
+            if winner is None:
+                # Every copy failed: report the primary's error when it has one
+                winner = primary if primary.done() else next(iter(done))
+            result = winner.result()
+            policy.observe(url, time.perf_counter() - started, hedge_won=winner is not primary)
+            return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send_request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send an asynchronous HTTP request with retry logic and error handling.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            APIError: If the API returns an error response
+            CircuitOpenError: If the circuit breaker is open for this endpoint
+            ConnectionError: If unable to connect after all retries
+
         Note:
             In mock mode, this method returns deterministic responses without
             making actual HTTP requests.
@@ -227,42 +616,160 @@ class AsyncClient:
         # Short-circuit when mock mode is enabled
         if getattr(self, "mock", False):
             return self._mock_response(method, url, **kwargs)
-        for attempt in range(self.max_retries):
+
+        policy = self.retry_policy
+        idempotent = policy.prepare(method, kwargs)
+        logged_params = LazyPayload(kwargs)
+        kwargs = encode_json_body(kwargs, self.codec)
+        kwargs = compress_body(kwargs, self.request_compression, self.compression_threshold)
+        tracer = self.tracer
+        attempt = 0
+        while True:
+            await self._check_circuit(url)
+            retry_after = None
+            trace = tracer.start(method, url, attempt) if tracer is not None else None
+            started = time.perf_counter()
             try:
                 logger.info(
-                    f"🚀 Making {method} request to {url} "
-                    f"(Attempt {attempt + 1}/{self.max_retries})"
+                    "🚀 Making %s request to %s (Attempt %s/%s)",
+                    method,
+                    url,
+                    attempt + 1,
+                    policy.max_retries + 1,
                 )
-                logger.debug(f"🔍 Request parameters: {kwargs}")
-
-                async with self.session.request(method, url, **kwargs) as response:
-                    logger.debug(f"📥 Response status: {response.status}")
-                    result = await handle_async_response(response)
-                    logger.info(f"✅ Request completed successfully: {method} {url}")
+                logger.debug("🔍 Request parameters: %s", logged_params)
+
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(url)
+
+                started = time.perf_counter()
+                async with self.session.request(
+                    method, url, trace_request_ctx=trace, **kwargs
+                ) as response:
+                    logger.debug("📥 Response status: %s", response.status)
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.observe(url, response.status, response.headers)
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    result = await handle_async_response(response, self.codec)
+                    if trace is not None:
+                        trace.finish(status=response.status)
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record(url, None, time.perf_counter() - started)
+                    logger.info("✅ Request completed successfully: %s %s", method, url)
                     return result
 
-            except ClientError as e:
-                logger.warning(f"⚠️ Request attempt {attempt + 1} failed: {str(e)}")
-                if hasattr(e, "status") and e.status is not None:
-                    try:
-                        error_data = await e.response.json()
-                        error_msg = error_data.get("error", str(e))
-                        logger.error(f"🔴 API Error: {error_msg}")
-                        raise APIError(error_msg, status_code=e.status)
-                    except ValueError:
-                        logger.error("🔴 Could not parse error response")
-                        raise APIError(
-                            str(e),
-                            status_code=e.status if hasattr(e, "status") else None,
-                        )
-
-                if attempt == self.max_retries - 1:
-                    logger.error(f"❌ All retry attempts failed for {method} {url}")
-                    raise ConnectionError(f"Failed to connect to API: {str(e)}")
-
-                retry_delay = self.retry_delay * (attempt + 1)
-                logger.info(f"⏳ Waiting {retry_delay}s before retry {attempt + 2}")
+            except (APIError, ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, ClientResponseError):
+                    e = APIError(e.message, status_code=e.status)
+                logger.warning(
+                    "⚠️ Request attempt %s failed: %s",
+                    attempt + 1,
+                    str(e) or type(e).__name__,
+                )
+                if trace is not None:
+                    trace.finish(status=getattr(e, "status_code", None), error=e)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(url, e, time.perf_counter() - started)
+
+                if not policy.should_retry(e, attempt, idempotent):
+                    if isinstance(e, APIError):
+                        logger.error("🔴 API Error: %s", e.message)
+                        raise e
+                    logger.error("❌ All retry attempts failed for %s %s", method, url)
+                    raise ConnectionError(
+                        f"Failed to connect to API: {str(e) or type(e).__name__}"
+                    )
+
+                retry_delay = policy.backoff(attempt, retry_after)
+                logger.info("⏳ Waiting %.2fs before retry %s", retry_delay, attempt + 2)
+                if tracer is not None:
+                    tracer.retry(method, url, attempt, retry_delay, e)
                 await asyncio.sleep(retry_delay)
+                attempt += 1
+
+    async def _check_circuit(self, url: str) -> None:
+        """
+        Refuse a request while its circuit is open.
+
+        Once the circuit has been open for ``open_duration``, the service is
+        probed with :meth:`healthz` and the circuit closes if it is healthy.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or the probe failed
+        """
+        breaker = self.circuit_breaker
+        if breaker is None or not breaker.check(url):
+            return
+        logger.info("🩺 Circuit half-open, probing service health before %s", url)
+        try:
+            healthy = is_healthy(await self.healthz())
+        except Exception as e:
+            logger.warning("⚠️ Health probe failed: %s", str(e) or type(e).__name__)
+            healthy = False
+        breaker.probe_finished(url, healthy)
+
+    async def _stream_request(
+        self,
+        method: str,
+        url: str,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        value_keys: Iterable[str] = (),
+        skip: int = 0,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Send an asynchronous HTTP request and decode the response incrementally.
+
+        The body is read in chunks and only the elements of the arrays stored
+        under ``keys`` are decoded, one at a time, so memory stays bounded by
+        the largest element. Streaming requests are sent once and not retried.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            keys: Keys whose array elements are yielded
+            value_keys: Top-level keys whose string values are yielded too
+            skip: Number of leading array elements to skip without decoding
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Yields:
+            ``(key, element)`` pairs in document order
+
+        Raises:
+            APIError: If the API returns an error response
+            ConnectionError: If the connection fails or the body is cut short
+        """
+        if getattr(self, "mock", False):
+            result = self._mock_response(method, url, **kwargs)
+            for item in iter_json_items(
+                [json.dumps(result).encode("utf-8")], keys, value_keys=value_keys, skip=skip
+            ):
+                yield item
+            return
+
+        logger.info("🚀 Streaming %s request to %s", method, url)
+        await self._check_circuit(url)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(url)
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                logger.debug("📥 Response status: %s", response.status)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(url, response.status, response.headers)
+                if response.status >= 400:
+                    await handle_async_response(response, self.codec)
+                async for item in aiter_json_items(
+                    response.content.iter_chunked(STREAM_CHUNK_SIZE),
+                    keys,
+                    self.codec.loads,
+                    value_keys,
+                    skip,
+                ):
+                    yield item
+        except (ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error("🔴 Streaming failed: %s", str(e) or type(e).__name__)
+            raise ConnectionError(f"Failed to read API response: {str(e) or type(e).__name__}")
+        logger.info("✅ Streaming completed: %s %s", method, url)
 
     def _mock_response(self, method: str, url: str, **kwargs) -> Any:
         """Return a deterministic mock response without performing network I/O.
@@ -272,14 +779,17 @@ class AsyncClient:
         2) If mock_responses contains a key for the request path, use it
         3) Fallback to built-in defaults per endpoint family
         """
-        logger.info(f"🧪 Mock mode active. Returning stub for {method} {url}")
+        logger.info("🧪 Mock mode active. Returning stub for %s %s", method, url)
 
         # 1) Custom handler
         if self.mock_handler is not None:
             try:
                 return self.mock_handler(method, url, kwargs)
             except Exception as handler_error:
-                logger.warning(f"Custom mock_handler raised: {handler_error}. Falling back to defaults.")
+                logger.warning(
+                    "Custom mock_handler raised: %s. Falling back to defaults.",
+                    handler_error,
+                )
 
         # 2) Path-based override
         try:
@@ -456,7 +966,7 @@ class AsyncClient:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Starting markdownify request for {website_url}")
+        logger.info("🔍 Starting markdownify request for %s", website_url)
         if headers:
             logger.debug("🔧 Using custom headers")
         if stealth:
@@ -482,7 +992,7 @@ class AsyncClient:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching markdownify result for request {request_id}")
+        logger.info("🔍 Fetching markdownify result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -493,7 +1003,7 @@ class AsyncClient:
         result = await self._make_request(
             "GET", f"{API_BASE_URL}/markdownify/{request_id}"
         )
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     async def scrape(
@@ -515,9 +1025,9 @@ class AsyncClient:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Starting scrape request for {website_url}")
-        logger.debug(f"🔧 Render heavy JS: {render_heavy_js}")
-        logger.debug(f"🔧 Branding: {branding}")
+        logger.info("🔍 Starting scrape request for %s", website_url)
+        logger.debug("🔧 Render heavy JS: %s", render_heavy_js)
+        logger.debug("🔧 Branding: %s", branding)
         if headers:
             logger.debug("🔧 Using custom headers")
         if stealth:
@@ -547,7 +1057,7 @@ class AsyncClient:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching scrape result for request {request_id}")
+        logger.info("🔍 Fetching scrape result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -557,7 +1067,7 @@ class AsyncClient:
 
         result = await self._make_request(
             "GET", f"{API_BASE_URL}/scrape/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     async def sitemap(
@@ -587,7 +1097,7 @@ class AsyncClient:
             ...     for url in response.urls[:5]:
             ...         print(url)
         """
-        logger.info(f"🗺️  Starting sitemap extraction for {website_url}")
+        logger.info("🗺️  Starting sitemap extraction for %s", website_url)
 
         request = SitemapRequest(
             website_url=website_url,
@@ -598,7 +1108,10 @@ class AsyncClient:
         result = await self._make_request(
             "POST", f"{API_BASE_URL}/sitemap", json=request.model_dump()
         )
-        logger.info(f"✨ Sitemap extraction completed successfully - found {len(result.get('urls', []))} URLs")
+        logger.info(
+            "✨ Sitemap extraction completed successfully - found %s URLs",
+            len(result.get("urls", [])),
+        )
 
         # Parse response into SitemapResponse model
         return SitemapResponse(**result)
@@ -619,6 +1132,7 @@ class AsyncClient:
         render_heavy_js: bool = False,
         stealth: bool = False,
         return_toon: bool = False,
+        html_validation: str = "fast",
     ):
         """
         Send a smartscraper request with optional pagination support and cookies.
@@ -643,6 +1157,9 @@ class AsyncClient:
             render_heavy_js: Enable heavy JavaScript rendering
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
+            html_validation: How website_html is checked before sending: "fast"
+                             (size check and tag sniff), "lxml" (full lxml parse)
+                             or "strict" (full BeautifulSoup parse)
 
         Returns:
             Dictionary containing the scraping results, or TOON formatted string if return_toon=True
@@ -652,27 +1169,28 @@ class AsyncClient:
             APIError: If the API request fails
         """
         logger.info("🔍 Starting smartscraper request")
-        if website_url:
-            logger.debug(f"🌐 URL: {website_url}")
-        if website_html:
-            logger.debug("📄 Using provided HTML content")
-        if website_markdown:
-            logger.debug("📝 Using provided Markdown content")
-        if headers:
-            logger.debug("🔧 Using custom headers")
-        if cookies:
-            logger.debug("🍪 Using cookies for authentication/session management")
-        if number_of_scrolls is not None:
-            logger.debug(f"🔄 Number of scrolls: {number_of_scrolls}")
-        if total_pages is not None:
-            logger.debug(f"📄 Total pages to scrape: {total_pages}")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if render_heavy_js:
-            logger.debug("⚡ Heavy JavaScript rendering enabled")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
-        logger.debug(f"📝 Prompt: {user_prompt}")
+        if logger.is_enabled_for("DEBUG"):
+            if website_url:
+                logger.debug("🌐 URL: %s", website_url)
+            if website_html:
+                logger.debug("📄 Using provided HTML content")
+            if website_markdown:
+                logger.debug("📝 Using provided Markdown content")
+            if headers:
+                logger.debug("🔧 Using custom headers")
+            if cookies:
+                logger.debug("🍪 Using cookies for authentication/session management")
+            if number_of_scrolls is not None:
+                logger.debug("🔄 Number of scrolls: %s", number_of_scrolls)
+            if total_pages is not None:
+                logger.debug("📄 Total pages to scrape: %s", total_pages)
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if render_heavy_js:
+                logger.debug("⚡ Heavy JavaScript rendering enabled")
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
+            logger.debug("📝 Prompt: %s", user_prompt)
 
         request = SmartScraperRequest(
             website_url=website_url,
@@ -688,6 +1206,7 @@ class AsyncClient:
             plain_text=plain_text,
             render_heavy_js=render_heavy_js,
             stealth=stealth,
+            html_validation=html_validation,
         )
 
         logger.debug("✅ Request validation passed")
@@ -705,7 +1224,7 @@ class AsyncClient:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching smartscraper result for request {request_id}")
+        logger.info("🔍 Fetching smartscraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -716,15 +1235,15 @@ class AsyncClient:
         result = await self._make_request(
             "GET", f"{API_BASE_URL}/smartscraper/{request_id}"
         )
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     async def submit_feedback(
         self, request_id: str, rating: int, feedback_text: Optional[str] = None
     ):
         """Submit feedback for a request"""
-        logger.info(f"📝 Submitting feedback for request {request_id}")
-        logger.debug(f"⭐ Rating: {rating}, Feedback: {feedback_text}")
+        logger.info("📝 Submitting feedback for request %s", request_id)
+        logger.debug("⭐ Rating: %s, Feedback: %s", rating, feedback_text)
 
         feedback = FeedbackRequest(
             request_id=request_id, rating=rating, feedback_text=feedback_text
@@ -746,8 +1265,8 @@ class AsyncClient:
             f"{API_BASE_URL}/credits",
         )
         logger.info(
-            f"✨ Credits info retrieved: "
-            f"{result.get('remaining_credits')} credits remaining"
+            "✨ Credits info retrieved: %s credits remaining",
+            result.get("remaining_credits"),
         )
         return result
 
@@ -800,15 +1319,19 @@ class AsyncClient:
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
         logger.info("🔍 Starting searchscraper request")
-        logger.debug(f"📝 Prompt: {user_prompt}")
-        logger.debug(f"🌐 Number of results: {num_results}")
-        logger.debug(f"🤖 Extraction mode: {'AI extraction' if extraction_mode else 'Markdown conversion'}")
-        if headers:
-            logger.debug("🔧 Using custom headers")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
+        if logger.is_enabled_for("DEBUG"):
+            logger.debug("📝 Prompt: %s", user_prompt)
+            logger.debug("🌐 Number of results: %s", num_results)
+            logger.debug(
+                "🤖 Extraction mode: %s",
+                "AI extraction" if extraction_mode else "Markdown conversion",
+            )
+            if headers:
+                logger.debug("🔧 Using custom headers")
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
 
         request = SearchScraperRequest(
             user_prompt=user_prompt,
@@ -833,7 +1356,7 @@ class AsyncClient:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching searchscraper result for request {request_id}")
+        logger.info("🔍 Fetching searchscraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -844,9 +1367,33 @@ class AsyncClient:
         result = await self._make_request(
             "GET", f"{API_BASE_URL}/searchscraper/{request_id}"
         )
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
+    async def stream_searchscraper(
+        self, request_id: str, keys: Iterable[str] = DEFAULT_STREAM_KEYS
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream the result of a previous searchscraper request element by element
+
+        Args:
+            request_id: The request ID to fetch
+            keys: Keys whose array elements are yielded (pages, results and
+                  urls by default)
+
+        Yields:
+            ``(key, element)`` pairs in document order
+        """
+        logger.info("🔍 Streaming searchscraper result for request %s", request_id)
+
+        # Validate input using Pydantic model
+        GetSearchScraperRequest(request_id=request_id)
+        logger.debug("✅ Request ID validation passed")
+
+        async for item in self._stream_request(
+            "GET", f"{API_BASE_URL}/searchscraper/{request_id}", keys
+        ):
+            yield item
+
     async def crawl(
         self,
         url: str,
@@ -890,34 +1437,35 @@ class AsyncClient:
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
         logger.info("🔍 Starting crawl request")
-        logger.debug(f"🌐 URL: {url}")
-        logger.debug(
-            f"🤖 Extraction mode: {'AI' if extraction_mode else 'Markdown conversion'}"
-        )
-        if extraction_mode:
-            logger.debug(f"📝 Prompt: {prompt}")
-            logger.debug(f"📊 Schema provided: {bool(data_schema)}")
-        else:
+        if logger.is_enabled_for("DEBUG"):
+            logger.debug("🌐 URL: %s", url)
             logger.debug(
-                "📄 Markdown conversion mode - no AI processing, 2 credits per page"
+                "🤖 Extraction mode: %s", "AI" if extraction_mode else "Markdown conversion"
             )
-        logger.debug(f"💾 Cache website: {cache_website}")
-        logger.debug(f"🔍 Depth: {depth}")
-        logger.debug(f"📄 Max pages: {max_pages}")
-        logger.debug(f"🏠 Same domain only: {same_domain_only}")
-        logger.debug(f"🗺️ Use sitemap: {sitemap}")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if render_heavy_js:
-            logger.debug("⚡ Heavy JavaScript rendering enabled")
-        if batch_size is not None:
-            logger.debug(f"📦 Batch size: {batch_size}")
-        if include_paths:
-            logger.debug(f"✅ Include paths: {include_paths}")
-        if exclude_paths:
-            logger.debug(f"❌ Exclude paths: {exclude_paths}")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
+            if extraction_mode:
+                logger.debug("📝 Prompt: %s", prompt)
+                logger.debug("📊 Schema provided: %s", bool(data_schema))
+            else:
+                logger.debug(
+                    "📄 Markdown conversion mode - no AI processing, 2 credits per page"
+                )
+            logger.debug("💾 Cache website: %s", cache_website)
+            logger.debug("🔍 Depth: %s", depth)
+            logger.debug("📄 Max pages: %s", max_pages)
+            logger.debug("🏠 Same domain only: %s", same_domain_only)
+            logger.debug("🗺️ Use sitemap: %s", sitemap)
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if render_heavy_js:
+                logger.debug("⚡ Heavy JavaScript rendering enabled")
+            if batch_size is not None:
+                logger.debug("📦 Batch size: %s", batch_size)
+            if include_paths:
+                logger.debug("✅ Include paths: %s", include_paths)
+            if exclude_paths:
+                logger.debug("❌ Exclude paths: %s", exclude_paths)
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
 
         # Build request data, excluding None values
         request_data = {
@@ -957,6 +1505,49 @@ class AsyncClient:
         logger.info("✨ Crawl request completed successfully")
         return process_response_with_toon(result, return_toon)
 
+    async def crawl_dry_run(
+        self,
+        url: str,
+        include_paths: Optional[list[str]] = None,
+        exclude_paths: Optional[list[str]] = None,
+    ) -> PathPreview:
+        """Preview which sitemap URLs a crawl's path filters would keep
+
+        Fetches the sitemap of ``url`` and applies ``include_paths`` and
+        ``exclude_paths`` locally, without starting a crawl. Use it to catch
+        misconfigured patterns before spending crawl budget: patterns that
+        match no sitemap URL are listed in ``unused_patterns``. A crawl can
+        also reach pages that are missing from the sitemap.
+
+        Args:
+            url: The starting URL of the crawl
+            include_paths: Path patterns passed to crawl as include_paths
+            exclude_paths: Path patterns passed to crawl as exclude_paths
+
+        Returns:
+            PathPreview with the kept, excluded and not included URLs and
+            the number of URLs matched by each pattern
+
+        Raises:
+            ValueError: If a path pattern does not start with '/'
+
+        Example:
+            >>> preview = await client.crawl_dry_run(
+            ...     "https://example.com", include_paths=["/blog/**"]
+            ... )
+            >>> preview.summary(), preview.unused_patterns
+        """
+        path_filter = PathFilter(include_paths, exclude_paths)
+        sitemap = await self.sitemap(website_url=url)
+        preview = path_filter.preview(sitemap.urls)
+        logger.info(
+            "🔎 Crawl dry run for %s: %s of %s sitemap URLs kept",
+            url,
+            len(preview.kept),
+            preview.total,
+        )
+        return preview
+
     async def get_crawl(self, crawl_id: str, return_toon: bool = False):
         """Get the result of a previous crawl request
         
@@ -964,7 +1555,7 @@ class AsyncClient:
             crawl_id: The crawl ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching crawl result for request {crawl_id}")
+        logger.info("🔍 Fetching crawl result for request %s", crawl_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -973,9 +1564,97 @@ class AsyncClient:
         logger.debug("✅ Request ID validation passed")
 
         result = await self._make_request("GET", f"{API_BASE_URL}/crawl/{crawl_id}")
-        logger.info(f"✨ Successfully retrieved result for request {crawl_id}")
+        logger.info("✨ Successfully retrieved result for request %s", crawl_id)
         return process_response_with_toon(result, return_toon)
 
+    async def stream_crawl(
+        self, crawl_id: str, keys: Iterable[str] = DEFAULT_STREAM_KEYS
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream the result of a previous crawl request element by element
+
+        Unlike get_crawl, the response is decoded incrementally, so a crawl
+        with hundreds of pages never sits in memory all at once.
+
+        Args:
+            crawl_id: The crawl ID to fetch
+            keys: Keys whose array elements are yielded (pages, results and
+                  urls by default)
+
+        Yields:
+            ``(key, element)`` pairs, e.g. ``("pages", {"url": ..., "markdown": ...})``
+        """
+        logger.info("🔍 Streaming crawl result for request %s", crawl_id)
+
+        # Validate input using Pydantic model
+        GetCrawlRequest(crawl_id=crawl_id)
+        logger.debug("✅ Request ID validation passed")
+
+        async for item in self._stream_request(
+            "GET", f"{API_BASE_URL}/crawl/{crawl_id}", keys
+        ):
+            yield item
+
+    async def iter_crawl_pages(
+        self,
+        crawl_id: str,
+        cursor: int = 0,
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[CrawlPage]:
+        """Poll a crawl and yield each page once, as soon as it is available
+
+        Every poll streams the crawl status, skips the pages that were
+        already yielded without decoding them and yields the new ones, so
+        only a cursor (the number of pages emitted) is kept between polls.
+        The delay between polls grows while no new page shows up.
+
+        Args:
+            crawl_id: The crawl ID returned by crawl
+            cursor: Number of pages to skip, e.g. the index after the last
+                    page seen when resuming an earlier iteration
+            timeout: Deadline in seconds (None = no limit)
+            initial_interval: First delay between polls in seconds
+            max_interval: Upper bound for the delay between polls
+
+        Yields:
+            CrawlPage objects with the URL, markdown, extracted data and
+            metadata of each page, in crawl order
+
+        Raises:
+            APIError: If the crawl fails or is cancelled
+            TimeoutError: If the crawl is still running at the deadline
+
+        Example:
+            >>> async for page in client.iter_crawl_pages(job["crawl_id"]):
+            ...     print(page.index, page.url)
+        """
+        logger.info("🔍 Iterating pages of crawl %s from page %s", crawl_id, cursor)
+
+        # Validate input using Pydantic model
+        GetCrawlRequest(crawl_id=crawl_id)
+        logger.debug("✅ Request ID validation passed")
+
+        schedule = PollSchedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        pages = CrawlPageCursor(crawl_id, schedule, cursor)
+        url = f"{API_BASE_URL}/crawl/{crawl_id}"
+        while True:
+            async for key, value in self._stream_request(
+                "GET", url, CRAWL_PAGE_KEYS, value_keys=CRAWL_STATUS_KEYS, skip=pages.cursor
+            ):
+                page = pages.feed(key, value)
+                if page is not None:
+                    yield page
+            delay = pages.next_delay()
+            if delay is None:
+                logger.info("✨ Crawl %s finished after %s pages", crawl_id, pages.cursor)
+                return
+            await asyncio.sleep(delay)
+
     async def agenticscraper(
         self,
         url: str,
@@ -999,13 +1678,13 @@ class AsyncClient:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🤖 Starting agentic scraper request for {url}")
-        logger.debug(f"🔧 Use session: {use_session}")
-        logger.debug(f"📋 Steps: {steps}")
-        logger.debug(f"🧠 AI extraction: {ai_extraction}")
+        logger.info("🤖 Starting agentic scraper request for %s", url)
+        logger.debug("🔧 Use session: %s", use_session)
+        logger.debug("📋 Steps: %s", steps)
+        logger.debug("🧠 AI extraction: %s", ai_extraction)
         if ai_extraction:
-            logger.debug(f"💭 User prompt: {user_prompt}")
-            logger.debug(f"📋 Output schema provided: {output_schema is not None}")
+            logger.debug("💭 User prompt: %s", user_prompt)
+            logger.debug("📋 Output schema provided: %s", output_schema is not None)
         if stealth:
             logger.debug("🥷 Stealth mode enabled")
         if return_toon:
@@ -1035,7 +1714,7 @@ class AsyncClient:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching agentic scraper result for request {request_id}")
+        logger.info("🔍 Fetching agentic scraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -1044,7 +1723,7 @@ class AsyncClient:
         logger.debug("✅ Request ID validation passed")
 
         result = await self._make_request("GET", f"{API_BASE_URL}/agentic-scrapper/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     async def generate_schema(
@@ -1059,9 +1738,9 @@ class AsyncClient:
             existing_schema: Optional existing JSON schema to modify/extend
         """
         logger.info("🔧 Starting schema generation request")
-        logger.debug(f"💭 User prompt: {user_prompt}")
+        logger.debug("💭 User prompt: %s", user_prompt)
         if existing_schema:
-            logger.debug(f"📋 Existing schema provided: {existing_schema is not None}")
+            logger.debug("📋 Existing schema provided: %s", existing_schema is not None)
 
         request = GenerateSchemaRequest(
             user_prompt=user_prompt,
@@ -1081,14 +1760,14 @@ class AsyncClient:
         Args:
             request_id: The request ID returned from generate_schema
         """
-        logger.info(f"🔍 Fetching schema generation status for request {request_id}")
+        logger.info("🔍 Fetching schema generation status for request %s", request_id)
 
         # Validate input using Pydantic model
         GetSchemaStatusRequest(request_id=request_id)
         logger.debug("✅ Request ID validation passed")
 
         result = await self._make_request("GET", f"{API_BASE_URL}/generate_schema/{request_id}")
-        logger.info(f"✨ Successfully retrieved schema status for request {request_id}")
+        logger.info("✨ Successfully retrieved schema status for request %s", request_id)
         return result
 
     async def create_scheduled_job(
@@ -1100,7 +1779,7 @@ class AsyncClient:
         is_active: bool = True,
     ):
         """Create a new scheduled job"""
-        logger.info(f"📅 Creating scheduled job: {job_name}")
+        logger.info("📅 Creating scheduled job: %s", job_name)
 
         request = ScheduledJobCreate(
             job_name=job_name,
@@ -1140,17 +1819,19 @@ class AsyncClient:
             params["is_active"] = is_active
 
         result = await self._make_request("GET", f"{API_BASE_URL}/scheduled-jobs", params=params)
-        logger.info(f"✨ Successfully retrieved {len(result.get('jobs', []))} scheduled jobs")
+        logger.info(
+            "✨ Successfully retrieved %s scheduled jobs", len(result.get("jobs", []))
+        )
         return result
 
     async def get_scheduled_job(self, job_id: str):
         """Get details of a specific scheduled job"""
-        logger.info(f"🔍 Fetching scheduled job {job_id}")
+        logger.info("🔍 Fetching scheduled job %s", job_id)
 
         GetScheduledJobRequest(job_id=job_id)
 
         result = await self._make_request("GET", f"{API_BASE_URL}/scheduled-jobs/{job_id}")
-        logger.info(f"✨ Successfully retrieved scheduled job {job_id}")
+        logger.info("✨ Successfully retrieved scheduled job %s", job_id)
         return result
 
     async def update_scheduled_job(
@@ -1162,7 +1843,7 @@ class AsyncClient:
         is_active: Optional[bool] = None,
     ):
         """Update an existing scheduled job (partial update)"""
-        logger.info(f"📝 Updating scheduled job {job_id}")
+        logger.info("📝 Updating scheduled job %s", job_id)
 
         update_data = {}
         if job_name is not None:
@@ -1179,7 +1860,7 @@ class AsyncClient:
         result = await self._make_request(
             "PATCH", f"{API_BASE_URL}/scheduled-jobs/{job_id}", json=update_data
         )
-        logger.info(f"✨ Successfully updated scheduled job {job_id}")
+        logger.info("✨ Successfully updated scheduled job %s", job_id)
         return result
 
     async def replace_scheduled_job(
@@ -1191,7 +1872,7 @@ class AsyncClient:
         is_active: bool = True,
     ):
         """Replace an existing scheduled job (full update)"""
-        logger.info(f"🔄 Replacing scheduled job {job_id}")
+        logger.info("🔄 Replacing scheduled job %s", job_id)
 
         request_data = {
             "job_name": job_name,
@@ -1203,47 +1884,47 @@ class AsyncClient:
         result = await self._make_request(
             "PUT", f"{API_BASE_URL}/scheduled-jobs/{job_id}", json=request_data
         )
-        logger.info(f"✨ Successfully replaced scheduled job {job_id}")
+        logger.info("✨ Successfully replaced scheduled job %s", job_id)
         return result
 
     async def delete_scheduled_job(self, job_id: str):
         """Delete a scheduled job"""
-        logger.info(f"🗑️ Deleting scheduled job {job_id}")
+        logger.info("🗑️ Deleting scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = await self._make_request("DELETE", f"{API_BASE_URL}/scheduled-jobs/{job_id}")
-        logger.info(f"✨ Successfully deleted scheduled job {job_id}")
+        logger.info("✨ Successfully deleted scheduled job %s", job_id)
         return result
 
     async def pause_scheduled_job(self, job_id: str):
         """Pause a scheduled job"""
-        logger.info(f"⏸️ Pausing scheduled job {job_id}")
+        logger.info("⏸️ Pausing scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = await self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/pause")
-        logger.info(f"✨ Successfully paused scheduled job {job_id}")
+        logger.info("✨ Successfully paused scheduled job %s", job_id)
         return result
 
     async def resume_scheduled_job(self, job_id: str):
         """Resume a paused scheduled job"""
-        logger.info(f"▶️ Resuming scheduled job {job_id}")
+        logger.info("▶️ Resuming scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = await self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/resume")
-        logger.info(f"✨ Successfully resumed scheduled job {job_id}")
+        logger.info("✨ Successfully resumed scheduled job %s", job_id)
         return result
 
     async def trigger_scheduled_job(self, job_id: str):
         """Manually trigger a scheduled job"""
-        logger.info(f"🚀 Manually triggering scheduled job {job_id}")
+        logger.info("🚀 Manually triggering scheduled job %s", job_id)
 
         TriggerJobRequest(job_id=job_id)
 
         result = await self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/trigger")
-        logger.info(f"✨ Successfully triggered scheduled job {job_id}")
+        logger.info("✨ Successfully triggered scheduled job %s", job_id)
         return result
 
     async def get_job_executions(
@@ -1254,7 +1935,7 @@ class AsyncClient:
         status: Optional[str] = None,
     ):
         """Get execution history for a scheduled job"""
-        logger.info(f"📊 Fetching execution history for job {job_id}")
+        logger.info("📊 Fetching execution history for job %s", job_id)
 
         GetJobExecutionsRequest(
             job_id=job_id,
@@ -1270,13 +1951,401 @@ class AsyncClient:
         result = await self._make_request(
             "GET", f"{API_BASE_URL}/scheduled-jobs/{job_id}/executions", params=params
         )
-        logger.info(f"✨ Successfully retrieved execution history for job {job_id}")
+        logger.info("✨ Successfully retrieved execution history for job %s", job_id)
         return result
 
+    async def wait_for(
+        self,
+        request_id: str,
+        service: str = "smartscraper",
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Dict[str, Any]:
+        """Poll a job until it reaches a terminal status and return its result
+
+        Args:
+            request_id: Request ID (or crawl ID) returned by a job endpoint
+            service: Service that created the job. One of smartscraper,
+                     searchscraper, markdownify, scrape, crawl, agenticscraper
+                     or generate_schema
+            timeout: Deadline in seconds (None = no limit)
+            initial_interval: First delay between polls in seconds
+            max_interval: Upper bound for the delay between polls
+
+        Returns:
+            The final status response (status "completed", "failed", ...)
+
+        Raises:
+            TimeoutError: If the job is still pending at the deadline
+            APIError: If the status endpoint returns a permanent error
+
+        Example:
+            >>> job = await client.crawl(url="https://example.com", ...)
+            >>> result = await client.wait_for(job["crawl_id"], service="crawl")
+        """
+        items = [
+            item
+            async for item in self.wait_for_many(
+                [request_id],
+                service=service,
+                timeout=timeout,
+                initial_interval=initial_interval,
+                max_interval=max_interval,
+            )
+        ]
+        if items[0].error is not None:
+            raise items[0].error
+        logger.info("✨ %s job %s finished", service, request_id)
+        return items[0].result
+
+    async def wait_for_many(
+        self,
+        request_ids: Iterable[PollJob],
+        service: str = "smartscraper",
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Poll many job IDs and yield each result as soon as it is final
+
+        All IDs are polled from one scheduler loop with jittered exponential
+        backoff per job, so thousands of outstanding IDs can be watched at once.
+
+        Args:
+            request_ids: Request IDs returned by the job endpoints, or
+                         ``(service, request_id)`` tuples to mix job types
+            service: Service that created plain request IDs. One of
+                     smartscraper, searchscraper, markdownify, scrape, crawl,
+                     agenticscraper or generate_schema
+            timeout: Overall deadline in seconds for all jobs (None = no limit)
+            initial_interval: First delay between polls of a job in seconds
+            max_interval: Upper bound for the delay between polls of a job
+            concurrency: Maximum number of status requests in flight
+
+        Yields:
+            BulkResult per job, in completion order. Jobs still pending at the
+            deadline carry a TimeoutError; permanent API errors are reported
+            on the result instead of being raised
+
+        Example:
+            >>> async for item in client.wait_for_many(ids, service="crawl"):
+            ...     if item.ok:
+            ...         print(item.input, item.result["status"])
+        """
+        schedule = PollSchedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        logger.info("⏳ Waiting for %s jobs (timeout=%ss)", service, timeout)
+
+        async def fetch(job_service: str, request_id: str) -> Any:
+            get_status = getattr(self, resolve_poll_method(job_service))
+            if self.tracer is None:
+                return await get_status(request_id)
+            with self.tracer.poll(job_service, request_id) as poll:
+                poll.result = await get_status(request_id)
+            return poll.result
+
+        async for item in poll_many_async(
+            fetch, request_ids, service, schedule, concurrency
+        ):
+            yield item
+
+    async def resume(
+        self,
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Re-attach to the unfinished jobs recorded in the checkpoint store
+
+        Jobs submitted through a client with a checkpoint store (possibly in
+        an earlier process) are polled through their ``get_*`` endpoints
+        until they finish, instead of being submitted again. Their recorded
+        status is updated as they complete; jobs the API no longer knows
+        are marked failed.
+
+        Args:
+            timeout: Overall deadline in seconds for all jobs (None = no limit)
+            initial_interval: First delay between polls of a job in seconds
+            max_interval: Upper bound for the delay between polls of a job
+            concurrency: Maximum number of status requests in flight
+
+        Yields:
+            BulkResult per job, in completion order, with
+            ``(service, request_id)`` as input
+
+        Raises:
+            ValueError: If the client has no checkpoint store
+
+        Example:
+            >>> async for item in client.resume():
+            ...     if item.ok:
+            ...         print(item.input, item.result["status"])
+        """
+        store = self.checkpoint_store
+        if store is None:
+            raise ValueError("resume() requires a client created with a checkpoint_store")
+        records = await asyncio.to_thread(store.unfinished)
+        jobs = [(record.service, record.request_id) for record in records]
+        logger.info("♻️ Resuming %s unfinished jobs", len(jobs))
+        async for item in self.wait_for_many(
+            jobs,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            concurrency=concurrency,
+        ):
+            if item.error is not None and is_permanent_error(item.error):
+                await asyncio.to_thread(store.update_status, item.input[1], "failed")
+            yield item
+
+    async def as_completed(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        inputs: BulkInputs,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        input_key: str = "website_url",
+        **kwargs,
+    ) -> AsyncIterator[BulkResult]:
+        """Run an endpoint method over many inputs, yielding results as they finish
+
+        Inputs are consumed lazily from a regular or async iterable and at most
+        ``concurrency`` calls are in flight at any time. Errors are reported on
+        the yielded BulkResult instead of cancelling the batch.
+
+        Args:
+            method: Bound endpoint coroutine, e.g. ``client.smartscraper``
+            inputs: Iterable or async iterable of inputs. Each item is either a
+                    value for ``input_key`` or a dict of per-call keyword
+                    arguments that override ``kwargs``
+            concurrency: Maximum number of concurrent calls
+            input_key: Keyword argument receiving non-dict input items
+            **kwargs: Keyword arguments shared by every call
+
+        Yields:
+            BulkResult for every input, in completion order
+
+        Example:
+            >>> async for item in client.as_completed(
+            ...     client.smartscraper, urls, concurrency=20,
+            ...     user_prompt="Extract the title"
+            ... ):
+            ...     print(item.index, item.ok)
+        """
+        logger.info(
+            "📦 Starting bulk %s with concurrency %s",
+            getattr(method, "__name__", "call"),
+            concurrency,
+        )
+
+        async def call(item: Any) -> Any:
+            return await method(**build_call_kwargs(item, input_key, kwargs))
+
+        async for item in run_as_completed(call, inputs, concurrency):
+            yield item
+
+    async def sitemap_fanout(
+        self,
+        website_url: str,
+        method: Optional[Callable[..., Awaitable[Any]]] = None,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        per_domain_concurrency: Optional[int] = DEFAULT_DOMAIN_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+        input_key: str = "website_url",
+        **kwargs,
+    ) -> AsyncIterator[BulkResult]:
+        """Extract every sitemap URL of a website that passes the path filters
+
+        Fetches the sitemap, keeps the URLs matching ``include_paths`` and
+        not ``exclude_paths`` (same ``*``/``**`` semantics as crawl) and runs
+        ``method`` on each of them, streaming results as they finish. Unlike
+        crawl, the number of pages is not capped by ``max_pages``.
+
+        Args:
+            website_url: Website whose sitemap is fanned out
+            method: Bound per-URL endpoint method (default: markdownify)
+            include_paths: Path patterns to keep (default: all paths)
+            exclude_paths: Path patterns to drop; they take precedence
+            concurrency: Maximum number of concurrent calls
+            per_domain_concurrency: Maximum number of concurrent calls per
+                    domain (None = only the global limit)
+            on_progress: Callback receiving a FanOutProgress once the URLs
+                    are selected and after every result
+            input_key: Keyword argument receiving each URL
+            **kwargs: Keyword arguments shared by every call, e.g. user_prompt
+
+        Yields:
+            BulkResult per selected URL, in completion order
+
+        Raises:
+            ValueError: If a path pattern does not start with '/'
+
+        Example:
+            >>> async for item in client.sitemap_fanout(
+            ...     "https://example.com",
+            ...     client.smartscraper,
+            ...     include_paths=["/products/**"],
+            ...     concurrency=50,
+            ...     user_prompt="Extract the product name and price",
+            ... ):
+            ...     print(item.input, item.ok)
+        """
+        path_filter = PathFilter(include_paths, exclude_paths)
+        method = method or self.markdownify
+        sitemap = await self.sitemap(website_url=website_url)
+        urls = list(path_filter.filter(sitemap.urls))
+        progress = FanOutProgress(discovered=len(sitemap.urls), selected=len(urls))
+        logger.info(
+            "🗺️ Fanning out %s of %s sitemap URLs of %s",
+            len(urls),
+            len(sitemap.urls),
+            website_url,
+        )
+
+        async def call(url: str) -> Any:
+            return await method(**build_call_kwargs(url, input_key, kwargs))
+
+        async for item in fan_out_async(
+            call, urls, concurrency, per_domain_concurrency, progress, on_progress
+        ):
+            yield item
+
+    async def _run_many(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        inputs: BulkInputs,
+        concurrency: int,
+        input_key: str,
+        kwargs: Dict[str, Any],
+    ) -> List[BulkResult]:
+        logger.info(
+            "📦 Starting bulk %s with concurrency %s", method.__name__, concurrency
+        )
+
+        async def call(item: Any) -> Any:
+            return await method(**build_call_kwargs(item, input_key, kwargs))
+
+        results = await run_ordered(call, inputs, concurrency)
+        failed = sum(1 for item in results if not item.ok)
+        logger.info(
+            "✨ Bulk request finished: %s succeeded, %s failed",
+            len(results) - failed,
+            failed,
+        )
+        return results
+
+    async def smartscraper_many(
+        self,
+        inputs: BulkInputs,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        **kwargs,
+    ) -> List[BulkResult]:
+        """Send smartscraper requests for many inputs with bounded concurrency
+
+        Args:
+            inputs: Iterable or async iterable of website URLs, or dicts of
+                    per-call smartscraper arguments
+            concurrency: Maximum number of concurrent requests
+            **kwargs: smartscraper arguments shared by every call (e.g. user_prompt)
+
+        Returns:
+            List of BulkResult ordered like the inputs
+
+        Example:
+            >>> results = await client.smartscraper_many(
+            ...     urls, user_prompt="Extract the title", concurrency=20
+            ... )
+            >>> errors = [r for r in results if not r.ok]
+        """
+        return await self._run_many(
+            self.smartscraper, inputs, concurrency, "website_url", kwargs
+        )
+
+    async def markdownify_many(
+        self,
+        inputs: BulkInputs,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        **kwargs,
+    ) -> List[BulkResult]:
+        """Send markdownify requests for many inputs with bounded concurrency
+
+        Args:
+            inputs: Iterable or async iterable of website URLs, or dicts of
+                    per-call markdownify arguments
+            concurrency: Maximum number of concurrent requests
+            **kwargs: markdownify arguments shared by every call
+
+        Returns:
+            List of BulkResult ordered like the inputs
+        """
+        return await self._run_many(
+            self.markdownify, inputs, concurrency, "website_url", kwargs
+        )
+
+    async def scrape_many(
+        self,
+        inputs: BulkInputs,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        **kwargs,
+    ) -> List[BulkResult]:
+        """Send scrape requests for many inputs with bounded concurrency
+
+        Args:
+            inputs: Iterable or async iterable of website URLs, or dicts of
+                    per-call scrape arguments
+            concurrency: Maximum number of concurrent requests
+            **kwargs: scrape arguments shared by every call
+
+        Returns:
+            List of BulkResult ordered like the inputs
+        """
+        return await self._run_many(
+            self.scrape, inputs, concurrency, "website_url", kwargs
+        )
+
+    def pool_stats(self) -> Dict[str, Optional[int]]:
+        """Report live connection pool statistics
+
+        Returns:
+            dict: Pool limits plus acquired, idle and active connection counts,
+                  and how many connections were created, reused or queued
+                  (None for counts the installed transport does not expose)
+
+        Example:
+            >>> stats = client.pool_stats()
+            >>> print(f"{stats['reused']} reused / {stats['created']} created")
+        """
+        return connector_stats(
+            [session.connector for session in self._sessions.values()],
+            self._connection_counters,
+            self._pool_options["pool_size"],
+            self._pool_options["pool_per_host"],
+        )
+
     async def close(self):
-        """Close the session to free up resources"""
+        """Close the sessions of every event loop to free up resources"""
         logger.info("🔒 Closing AsyncClient session")
-        await self.session.close()
+        current = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+                )
+            else:
+                # The owning loop is idle or closed, so nothing can be awaited on it
+                discard_session(session)
         logger.debug("✅ Session closed successfully")
 
     async def __aenter__(self):
@@ -9,9 +9,31 @@ The Client class supports:
 - API key authentication
 - SSL verification configuration
 - Request timeout configuration
-- Automatic retry logic with exponential backoff
+- Automatic retries with jittered exponential backoff, a retry budget and
+  idempotency keys (see RetryPolicy)
+- Opt-in in-process response cache (see ResponseCache)
+- Fast JSON encoding/decoding with orjson or msgspec when installed
 - Mock mode for testing
 - Context manager support for proper resource cleanup
+- Thread-pool batch execution (map, imap_unordered)
+- Multiplexed polling of job results (wait_for, wait_for_many)
+- Incremental decoding of large crawl/searchscraper results (stream_crawl,
+  stream_searchscraper), and page-by-page delivery of running crawls
+  (iter_crawl_pages)
+- Sitemap-driven fan-out of per-URL extraction with local path filtering,
+  per-domain concurrency caps and progress reporting (sitemap_fanout)
+- Dry runs of crawl include/exclude path patterns against the sitemap
+  (crawl_dry_run)
+- Optional client-side rate limiting per endpoint family
+- Optional circuit breaker failing fast while an endpoint family is unhealthy
+  (see CircuitBreaker)
+- Optional hedging of slow status requests (see HedgePolicy)
+- Opt-in gzip/zstd compression of large request bodies, and zstd/brotli
+  response decoding when available
+- Request lifecycle tracing hooks (see RequestTracer), with an optional
+  OpenTelemetry span adapter
+- Opt-in durable checkpoints of submitted jobs, resumable after a restart
+  (see CheckpointStore and resume)
 
 Example:
     Basic usage with environment variables:
@@ -26,8 +48,13 @@ Example:
         >>> with Client(api_key="sgai-...") as client:
         ...     result = client.scrape(website_url="https://example.com")
 """
+import json
+import threading
+import time
 import uuid as _uuid
-from typing import Any, Callable, Dict, Optional
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -35,9 +62,14 @@ import urllib3
 from pydantic import BaseModel
 from requests.exceptions import RequestException
 
-from scrapegraph_py.config import API_BASE_URL, DEFAULT_HEADERS
+from scrapegraph_py.config import (
+    API_BASE_URL,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_DOMAIN_CONCURRENCY,
+    DEFAULT_HEADERS,
+)
 from scrapegraph_py.exceptions import APIError
-from scrapegraph_py.logger import sgai_logger as logger
+from scrapegraph_py.logger import LazyPayload, sgai_logger as logger
 from scrapegraph_py.models.agenticscraper import (
     AgenticScraperRequest,
     GetAgenticScraperRequest,
@@ -75,6 +107,46 @@ from scrapegraph_py.models.scheduled_jobs import (
     TriggerJobRequest,
 )
 from scrapegraph_py.utils.helpers import handle_sync_response, validate_api_key
+from scrapegraph_py.utils.checkpoint import CheckpointStore
+from scrapegraph_py.utils.fanout import (
+    FanOutProgress,
+    ProgressCallback,
+    fan_out_threads,
+)
+from scrapegraph_py.utils.path_filter import PathFilter, PathPreview
+from scrapegraph_py.utils.crawl_pages import (
+    CRAWL_PAGE_KEYS,
+    CRAWL_STATUS_KEYS,
+    CrawlPage,
+    CrawlPageCursor,
+)
+from scrapegraph_py.utils.json_stream import (
+    DEFAULT_STREAM_KEYS,
+    STREAM_CHUNK_SIZE,
+    iter_json_items,
+)
+from scrapegraph_py.utils.bulk import BulkResult, build_call_kwargs, run_in_threads
+from scrapegraph_py.utils.poller import (
+    PollJob,
+    PollSchedule,
+    is_permanent_error,
+    poll_many_sync,
+    resolve_poll_method,
+)
+from scrapegraph_py.utils.pool import DEFAULT_POOL_SIZE, adapter_stats, build_adapter
+from scrapegraph_py.utils.codec import encode_json_body, get_codec
+from scrapegraph_py.utils.cache import ResponseCache
+from scrapegraph_py.utils.circuit_breaker import CircuitBreaker, is_healthy
+from scrapegraph_py.utils.compression import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    compress_body,
+    get_compressor,
+    sync_accept_encoding,
+)
+from scrapegraph_py.utils.hedging import HedgePolicy
+from scrapegraph_py.utils.tracing import RequestTracer
+from scrapegraph_py.utils.rate_limiter import RateLimiter, parse_retry_after
+from scrapegraph_py.utils.retry import RetryPolicy
 from scrapegraph_py.utils.toon_converter import process_response_with_toon
 
 
@@ -93,6 +165,15 @@ class Client:
         max_retries (int): Maximum number of retry attempts
         retry_delay (float): Delay between retries in seconds
         mock (bool): Whether mock mode is enabled
+        rate_limiter (Optional[RateLimiter]): Client-side rate limiter, if any
+        retry_policy (RetryPolicy): Policy deciding which failed requests are retried
+        response_cache (Optional[ResponseCache]): Response cache, if any
+        codec (JSONCodec): JSON codec for request bodies and responses
+        circuit_breaker (Optional[CircuitBreaker]): Circuit breaker, if any
+        hedge_policy (Optional[HedgePolicy]): Hedging policy for status requests, if any
+        request_compression (Optional[str]): Request body compression, if any
+        tracer (Optional[RequestTracer]): Request lifecycle tracer, if any
+        checkpoint_store (Optional[CheckpointStore]): Store of submitted jobs, if any
         session (requests.Session): HTTP session for connection pooling
 
     Example:
@@ -112,6 +193,19 @@ class Client:
         mock: Optional[bool] = None,
         mock_handler: Optional[Callable[[str, str, Dict[str, Any]], Any]] = None,
         mock_responses: Optional[Dict[str, Any]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_per_host: Optional[int] = None,
+        force_close: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[str] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        tracer: Optional[RequestTracer] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize Client using API key from environment variable.
 
@@ -122,6 +216,29 @@ class Client:
             retry_delay: Delay between retries in seconds
             mock: If True, the client will not perform real HTTP requests and
                   will return stubbed responses. If None, reads from SGAI_MOCK env.
+            pool_size: Maximum number of connections kept open
+            pool_per_host: Maximum number of connections kept per host
+            force_close: Close connections after each request instead of pooling
+            rate_limiter: Optional RateLimiter throttling requests per endpoint
+                          family. Can be shared between clients
+            retry_policy: Optional RetryPolicy replacing the default built
+                          from max_retries and retry_delay
+            response_cache: Optional ResponseCache answering repeated
+                            requests from memory. Can be shared between clients
+            json_codec: JSON codec for request bodies and responses ("orjson",
+                        "msgspec" or "json"). Defaults to the fastest installed
+                        codec
+            circuit_breaker: Optional CircuitBreaker failing fast while an endpoint
+                        family is unhealthy
+            hedge_policy: Optional HedgePolicy sending a second copy of slow status
+                          requests
+            request_compression: Compress request bodies with "gzip" or "zstd"
+                                 (None = send them uncompressed)
+            compression_threshold: Minimum body size in bytes to compress
+            tracer: Optional RequestTracer receiving timing events for every
+                    request phase, retry and poll
+            checkpoint_store: Optional CheckpointStore recording submitted jobs
+                    so they can be resumed instead of resubmitted
         """
         from os import getenv
 
@@ -146,6 +263,19 @@ class Client:
             mock=bool(mock),
             mock_handler=mock_handler,
             mock_responses=mock_responses,
+            pool_size=pool_size,
+            pool_per_host=pool_per_host,
+            force_close=force_close,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            json_codec=json_codec,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+            tracer=tracer,
+            checkpoint_store=checkpoint_store,
         )
 
     def __init__(
@@ -158,6 +288,19 @@ class Client:
         mock: bool = False,
         mock_handler: Optional[Callable[[str, str, Dict[str, Any]], Any]] = None,
         mock_responses: Optional[Dict[str, Any]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_per_host: Optional[int] = None,
+        force_close: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        json_codec: Optional[str] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        tracer: Optional[RequestTracer] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize Client with configurable parameters.
 
@@ -174,6 +317,31 @@ class Client:
                            given (method, url, request_kwargs)
             mock_responses: Optional mapping of path (e.g. "/v1/credits") to
                             static response or callable returning a response
+            pool_size: Maximum number of connections kept open. Size it to at
+                       least the number of threads sharing the client
+            pool_per_host: Maximum number of connections kept per host
+                           (defaults to pool_size)
+            force_close: Close connections after each request instead of pooling
+            rate_limiter: Optional RateLimiter throttling requests per endpoint
+                          family. Can be shared between clients
+            retry_policy: Optional RetryPolicy replacing the default built
+                          from max_retries and retry_delay
+            response_cache: Optional ResponseCache answering repeated
+                            requests from memory. Can be shared between clients
+            json_codec: JSON codec for request bodies and responses ("orjson",
+                        "msgspec" or "json"). Defaults to the fastest installed
+                        codec
+            circuit_breaker: Optional CircuitBreaker failing fast while an endpoint
+                        family is unhealthy
+            hedge_policy: Optional HedgePolicy sending a second copy of slow status
+                          requests
+            request_compression: Compress request bodies with "gzip" or "zstd"
+                                 (None = send them uncompressed)
+            compression_threshold: Minimum body size in bytes to compress
+            tracer: Optional RequestTracer receiving timing events for every
+                    request phase, retry and poll
+            checkpoint_store: Optional CheckpointStore recording submitted jobs
+                    so they can be resumed instead of resubmitted
         """
         logger.info("🔑 Initializing Client")
 
@@ -189,34 +357,66 @@ class Client:
 
         validate_api_key(api_key)
         logger.debug(
-            f"🛠️ Configuration: verify_ssl={verify_ssl}, timeout={timeout}, "
-            f"max_retries={max_retries}"
+            "🛠️ Configuration: verify_ssl=%s, timeout=%s, max_retries=%s, "
+            "pool_size=%s, pool_per_host=%s",
+            verify_ssl,
+            timeout,
+            max_retries,
+            pool_size,
+            pool_per_host,
         )
 
         self.api_key = api_key
-        self.headers = {**DEFAULT_HEADERS, "SGAI-APIKEY": api_key}
+        self.headers = {
+            **DEFAULT_HEADERS,
+            "Accept-Encoding": sync_accept_encoding(),
+            "SGAI-APIKEY": api_key,
+        }
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.mock = bool(mock)
         self.mock_handler = mock_handler
         self.mock_responses = mock_responses or {}
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self.response_cache = response_cache
+        self.codec = get_codec(json_codec)
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        get_compressor(request_compression)
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+        self.tracer = tracer
+        self.checkpoint_store = checkpoint_store
 
         # Create a session for connection pooling
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         self.session.verify = verify_ssl
 
-        # Configure retries
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=requests.urllib3.Retry(
-                total=max_retries,
-                backoff_factor=retry_delay,
-                status_forcelist=[500, 502, 503, 504],
-            )
-        )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        if force_close:
+            self.session.headers["Connection"] = "close"
+
+        # Configure the connection pool size. Retries are driven by
+        # retry_policy in _make_request, so the adapter never retries itself
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self._mount_adapter()
+
+        # Thread pool for map / imap_unordered, created on first use. Batches
+        # lease it, so a pool replaced by a bigger one keeps serving the
+        # batches still using it and is shut down once the last one ends
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._executor_leases: Dict[ThreadPoolExecutor, int] = {}
+        self._executor_lock = threading.Lock()
+        # Adapters replaced by a bigger pool may still carry requests
+        self._retired_adapters: List[Any] = []
+        # Thread pool racing hedged status requests, created on first use
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
 
         # Add warning suppression if verify_ssl is False
         if not verify_ssl:
@@ -228,6 +428,120 @@ class Client:
         """
         Make HTTP request with error handling and retry logic.
 
+        Responses of cacheable endpoints are served from ``response_cache``
+        when one is configured. With a ``checkpoint_store``, job submissions
+        and status responses are recorded and a payload that was already
+        submitted is answered with the recorded response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            **kwargs: Additional arguments to pass to requests
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            APIError: If the API returns an error response
+            ConnectionError: If unable to connect to the API
+
+        Note:
+            In mock mode, this method returns deterministic responses without
+            making actual HTTP requests.
+        """
+        store = self.checkpoint_store
+        checkpoint = None
+        if store is not None:
+            checkpoint, submitted = store.lookup(method, url, kwargs)
+            if submitted is not None:
+                logger.info("♻️ Job already submitted, re-attaching: %s %s", method, url)
+                return submitted
+
+        cache = self.response_cache
+        key = None
+        if cache is not None:
+            key, cached = cache.lookup(method, url, kwargs, self.headers)
+            if cached is not None:
+                logger.debug("💾 Cache hit for %s %s", method, url)
+                return cached
+
+        result = self._send_hedged(method, url, **kwargs)
+        if key is not None:
+            cache.store(key, method, url, result)
+        if store is not None:
+            store.record(checkpoint, method, url, kwargs, result)
+        return result
+
+    def _send_hedged(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request, hedging it with a second copy if it is slow.
+
+        Status requests covered by ``hedge_policy`` run on a small thread
+        pool and get a second copy once the first has been outstanding longer
+        than the policy's latency percentile and the hedge budget allows it.
+        The first successful response wins. A copy that is already sending
+        cannot be interrupted, so the loser finishes in the background and
+        its response is discarded. Other requests are sent once through
+        :meth:`_send_request` on the calling thread.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            **kwargs: Additional arguments to pass to requests
+
+        Returns:
+            Parsed JSON response data
+        """
+        policy = self.hedge_policy
+        if policy is None or getattr(self, "mock", False) or not policy.applies(method, url):
+            return self._send_request(method, url, **kwargs)
+
+        delay = policy.start(url)
+        started = time.perf_counter()
+        if delay is None:
+            result = self._send_request(method, url, **kwargs)
+            policy.observe(url, time.perf_counter() - started)
+            return result
+
+        executor = self._get_hedge_executor()
+        primary = executor.submit(self._send_request, method, url, **kwargs)
+        futures = {primary}
+        try:
+            done, _ = wait(futures, timeout=delay)
+            if not done and policy.allow_hedge():
+                logger.info(
+                    "🪁 No response after %.3fs, hedging %s %s", delay, method, url
+                )
+                futures.add(executor.submit(self._send_request, method, url, **kwargs))
+            pending = futures
+            while True:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                winner = next((future for future in done if future.exception() is None), None)
+                if winner is not None or not pending:
+                    break
+            if winner is None:
+                # Every copy failed: report the primary's error when it has one
+                winner = primary if primary.done() else next(iter(done))
+            result = winner.result()
+            policy.observe(url, time.perf_counter() - started, hedge_won=winner is not primary)
+            return result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool used for hedged requests"""
+        with self._executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self.pool_size, thread_name_prefix="sgai-hedge"
+                )
+            return self._hedge_executor
+
+    def _send_request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send an HTTP request with retry logic and error handling.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Full URL for the request
@@ -238,6 +552,7 @@ class Client:
 
         Raises:
             APIError: If the API returns an error response
+            CircuitOpenError: If the circuit breaker is open for this endpoint
             ConnectionError: If unable to connect to the API
 
         Note:
@@ -247,38 +562,170 @@ class Client:
         # Short-circuit when mock mode is enabled
         if getattr(self, "mock", False):
             return self._mock_response(method, url, **kwargs)
+
+        policy = self.retry_policy
+        idempotent = policy.prepare(method, kwargs)
+        logged_params = LazyPayload(kwargs)
+        kwargs = encode_json_body(kwargs, self.codec)
+        kwargs = compress_body(kwargs, self.request_compression, self.compression_threshold)
+        tracer = self.tracer
+        attempt = 0
+        while True:
+            self._check_circuit(url)
+            retry_after = None
+            trace = tracer.start(method, url, attempt) if tracer is not None else None
+            started = time.perf_counter()
+            try:
+                logger.info(
+                    "🚀 Making %s request to %s (Attempt %s/%s)",
+                    method,
+                    url,
+                    attempt + 1,
+                    policy.max_retries + 1,
+                )
+                logger.debug("🔍 Request parameters: %s", logged_params)
+
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(url)
+
+                started = time.perf_counter()
+                if trace is not None:
+                    with trace.activate():
+                        response = self.session.request(
+                            method, url, timeout=self.timeout, **kwargs
+                        )
+                else:
+                    response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+                logger.debug("📥 Response status: %s", response.status_code)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(url, response.status_code, response.headers)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+                result = handle_sync_response(response, self.codec)
+                if trace is not None:
+                    trace.finish(status=response.status_code)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(url, None, time.perf_counter() - started)
+                logger.info("✅ Request completed successfully: %s %s", method, url)
+                return result
+
+            except (APIError, RequestException) as e:
+                if isinstance(e, RequestException) and e.response is not None:
+                    try:
+                        error_msg = e.response.json().get("error", str(e))
+                    except ValueError:
+                        error_msg = str(e)
+                    e = APIError(error_msg, status_code=e.response.status_code)
+                logger.warning("⚠️ Request attempt %s failed: %s", attempt + 1, e)
+                if trace is not None:
+                    trace.finish(status=getattr(e, "status_code", None), error=e)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(url, e, time.perf_counter() - started)
+
+                if not policy.should_retry(e, attempt, idempotent):
+                    if isinstance(e, APIError):
+                        logger.error("🔴 API Error: %s", e.message)
+                        raise e
+                    logger.error("🔴 Connection Error: %s", e)
+                    raise ConnectionError(f"Failed to connect to API: {str(e)}")
+
+                retry_delay = policy.backoff(attempt, retry_after)
+                logger.info("⏳ Waiting %.2fs before retry %s", retry_delay, attempt + 2)
+                if tracer is not None:
+                    tracer.retry(method, url, attempt, retry_delay, e)
+                time.sleep(retry_delay)
+                attempt += 1
+
+    def _check_circuit(self, url: str) -> None:
+        """
+        Refuse a request while its circuit is open.
+
+        Once the circuit has been open for ``open_duration``, the service is
+        probed with :meth:`healthz` and the circuit closes if it is healthy.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or the probe failed
+        """
+        breaker = self.circuit_breaker
+        if breaker is None or not breaker.check(url):
+            return
+        logger.info("🩺 Circuit half-open, probing service health before %s", url)
         try:
-            logger.info(f"🚀 Making {method} request to {url}")
-            logger.debug(f"🔍 Request parameters: {kwargs}")
+            healthy = is_healthy(self.healthz())
+        except Exception as e:
+            logger.warning("⚠️ Health probe failed: %s", e)
+            healthy = False
+        breaker.probe_finished(url, healthy)
+
+    def _stream_request(
+        self,
+        method: str,
+        url: str,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        value_keys: Iterable[str] = (),
+        skip: int = 0,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Send an HTTP request and decode the response incrementally.
 
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
-            logger.debug(f"📥 Response status: {response.status_code}")
+        The body is read in chunks and only the elements of the arrays stored
+        under ``keys`` are decoded, one at a time, so memory stays bounded by
+        the largest element. Streaming requests are sent once and not retried.
 
-            result = handle_sync_response(response)
-            logger.info(f"✅ Request completed successfully: {method} {url}")
-            return result
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL for the request
+            keys: Keys whose array elements are yielded
+            value_keys: Top-level keys whose string values are yielded too
+            skip: Number of leading array elements to skip without decoding
+            **kwargs: Additional arguments to pass to requests
+
+        Yields:
+            ``(key, element)`` pairs in document order
+
+        Raises:
+            APIError: If the API returns an error response
+            ConnectionError: If the connection fails or the body is cut short
+        """
+        if getattr(self, "mock", False):
+            result = self._mock_response(method, url, **kwargs)
+            yield from iter_json_items(
+                [json.dumps(result).encode("utf-8")], keys, value_keys=value_keys, skip=skip
+            )
+            return
 
+        logger.info("🚀 Streaming %s request to %s", method, url)
+        self._check_circuit(url)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        try:
+            response = self.session.request(
+                method, url, timeout=self.timeout, stream=True, **kwargs
+            )
         except RequestException as e:
-            logger.error(f"❌ Request failed: {str(e)}")
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get("error", str(e))
-                    logger.error(f"🔴 API Error: {error_msg}")
-                    raise APIError(error_msg, status_code=e.response.status_code)
-                except ValueError:
-                    logger.error("🔴 Could not parse error response")
-                    raise APIError(
-                        str(e),
-                        status_code=(
-                            e.response.status_code
-                            if hasattr(e.response, "status_code")
-                            else None
-                        ),
-                    )
-            logger.error(f"🔴 Connection Error: {str(e)}")
+            logger.error("🔴 Connection Error: %s", e)
             raise ConnectionError(f"Failed to connect to API: {str(e)}")
 
+        with response:
+            logger.debug("📥 Response status: %s", response.status_code)
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(url, response.status_code, response.headers)
+            if response.status_code >= 400:
+                handle_sync_response(response, self.codec)
+            try:
+                yield from iter_json_items(
+                    response.iter_content(STREAM_CHUNK_SIZE),
+                    keys,
+                    self.codec.loads,
+                    value_keys,
+                    skip,
+                )
+            except (RequestException, ValueError) as e:
+                logger.error("🔴 Streaming failed: %s", e)
+                raise ConnectionError(f"Failed to read API response: {str(e)}")
+        logger.info("✅ Streaming completed: %s %s", method, url)
+
     def _mock_response(self, method: str, url: str, **kwargs) -> Any:
         """Return a deterministic mock response without performing network I/O.
 
@@ -287,14 +734,17 @@ class Client:
         2) If mock_responses contains a key for the request path, use it
         3) Fallback to built-in defaults per endpoint family
         """
-        logger.info(f"🧪 Mock mode active. Returning stub for {method} {url}")
+        logger.info("🧪 Mock mode active. Returning stub for %s %s", method, url)
 
         # 1) Custom handler
         if self.mock_handler is not None:
             try:
                 return self.mock_handler(method, url, kwargs)
             except Exception as handler_error:
-                logger.warning(f"Custom mock_handler raised: {handler_error}. Falling back to defaults.")
+                logger.warning(
+                    "Custom mock_handler raised: %s. Falling back to defaults.",
+                    handler_error,
+                )
 
         # 2) Path-based override
         try:
@@ -468,7 +918,7 @@ class Client:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Starting markdownify request for {website_url}")
+        logger.info("🔍 Starting markdownify request for %s", website_url)
         if headers:
             logger.debug("🔧 Using custom headers")
         if stealth:
@@ -494,7 +944,7 @@ class Client:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching markdownify result for request {request_id}")
+        logger.info("🔍 Fetching markdownify result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -503,7 +953,7 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/markdownify/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     def scrape(
@@ -527,9 +977,9 @@ class Client:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Starting scrape request for {website_url}")
-        logger.debug(f"🔧 Render heavy JS: {render_heavy_js}")
-        logger.debug(f"🔧 Branding: {branding}")
+        logger.info("🔍 Starting scrape request for %s", website_url)
+        logger.debug("🔧 Render heavy JS: %s", render_heavy_js)
+        logger.debug("🔧 Branding: %s", branding)
         if headers:
             logger.debug("🔧 Using custom headers")
         if stealth:
@@ -560,7 +1010,7 @@ class Client:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching scrape result for request {request_id}")
+        logger.info("🔍 Fetching scrape result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -569,7 +1019,7 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/scrape/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     def sitemap(
@@ -599,7 +1049,7 @@ class Client:
             >>> for url in response.urls[:5]:
             ...     print(url)
         """
-        logger.info(f"🗺️  Starting sitemap extraction for {website_url}")
+        logger.info("🗺️  Starting sitemap extraction for %s", website_url)
 
         request = SitemapRequest(
             website_url=website_url,
@@ -610,7 +1060,10 @@ class Client:
         result = self._make_request(
             "POST", f"{API_BASE_URL}/sitemap", json=request.model_dump()
         )
-        logger.info(f"✨ Sitemap extraction completed successfully - found {len(result.get('urls', []))} URLs")
+        logger.info(
+            "✨ Sitemap extraction completed successfully - found %s URLs",
+            len(result.get("urls", [])),
+        )
 
         # Parse response into SitemapResponse model
         return SitemapResponse(**result)
@@ -631,6 +1084,7 @@ class Client:
         render_heavy_js: bool = False,
         stealth: bool = False,
         return_toon: bool = False,
+        html_validation: str = "fast",
     ):
         """
         Send a smartscraper request with optional pagination support and cookies.
@@ -655,6 +1109,9 @@ class Client:
             render_heavy_js: Enable heavy JavaScript rendering
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
+            html_validation: How website_html is checked before sending: "fast"
+                             (size check and tag sniff), "lxml" (full lxml parse)
+                             or "strict" (full BeautifulSoup parse)
 
         Returns:
             Dictionary containing the scraping results, or TOON formatted string if return_toon=True
@@ -664,27 +1121,28 @@ class Client:
             APIError: If the API request fails
         """
         logger.info("🔍 Starting smartscraper request")
-        if website_url:
-            logger.debug(f"🌐 URL: {website_url}")
-        if website_html:
-            logger.debug("📄 Using provided HTML content")
-        if website_markdown:
-            logger.debug("📝 Using provided Markdown content")
-        if headers:
-            logger.debug("🔧 Using custom headers")
-        if cookies:
-            logger.debug("🍪 Using cookies for authentication/session management")
-        if number_of_scrolls is not None:
-            logger.debug(f"🔄 Number of scrolls: {number_of_scrolls}")
-        if total_pages is not None:
-            logger.debug(f"📄 Total pages to scrape: {total_pages}")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if render_heavy_js:
-            logger.debug("⚡ Heavy JavaScript rendering enabled")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
-        logger.debug(f"📝 Prompt: {user_prompt}")
+        if logger.is_enabled_for("DEBUG"):
+            if website_url:
+                logger.debug("🌐 URL: %s", website_url)
+            if website_html:
+                logger.debug("📄 Using provided HTML content")
+            if website_markdown:
+                logger.debug("📝 Using provided Markdown content")
+            if headers:
+                logger.debug("🔧 Using custom headers")
+            if cookies:
+                logger.debug("🍪 Using cookies for authentication/session management")
+            if number_of_scrolls is not None:
+                logger.debug("🔄 Number of scrolls: %s", number_of_scrolls)
+            if total_pages is not None:
+                logger.debug("📄 Total pages to scrape: %s", total_pages)
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if render_heavy_js:
+                logger.debug("⚡ Heavy JavaScript rendering enabled")
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
+            logger.debug("📝 Prompt: %s", user_prompt)
 
         request = SmartScraperRequest(
             website_url=website_url,
@@ -700,6 +1158,7 @@ class Client:
             plain_text=plain_text,
             render_heavy_js=render_heavy_js,
             stealth=stealth,
+            html_validation=html_validation,
         )
         logger.debug("✅ Request validation passed")
 
@@ -716,7 +1175,7 @@ class Client:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching smartscraper result for request {request_id}")
+        logger.info("🔍 Fetching smartscraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -725,15 +1184,15 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/smartscraper/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     def submit_feedback(
         self, request_id: str, rating: int, feedback_text: Optional[str] = None
     ):
         """Submit feedback for a request"""
-        logger.info(f"📝 Submitting feedback for request {request_id}")
-        logger.debug(f"⭐ Rating: {rating}, Feedback: {feedback_text}")
+        logger.info("📝 Submitting feedback for request %s", request_id)
+        logger.debug("⭐ Rating: %s, Feedback: %s", rating, feedback_text)
 
         feedback = FeedbackRequest(
             request_id=request_id, rating=rating, feedback_text=feedback_text
@@ -755,8 +1214,8 @@ class Client:
             f"{API_BASE_URL}/credits",
         )
         logger.info(
-            f"✨ Credits info retrieved: {result.get('remaining_credits')} "
-            f"credits remaining"
+            "✨ Credits info retrieved: %s credits remaining",
+            result.get("remaining_credits"),
         )
         return result
 
@@ -811,15 +1270,19 @@ class Client:
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
         logger.info("🔍 Starting searchscraper request")
-        logger.debug(f"📝 Prompt: {user_prompt}")
-        logger.debug(f"🌐 Number of results: {num_results}")
-        logger.debug(f"🤖 Extraction mode: {'AI extraction' if extraction_mode else 'Markdown conversion'}")
-        if headers:
-            logger.debug("🔧 Using custom headers")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
+        if logger.is_enabled_for("DEBUG"):
+            logger.debug("📝 Prompt: %s", user_prompt)
+            logger.debug("🌐 Number of results: %s", num_results)
+            logger.debug(
+                "🤖 Extraction mode: %s",
+                "AI extraction" if extraction_mode else "Markdown conversion",
+            )
+            if headers:
+                logger.debug("🔧 Using custom headers")
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
 
         request = SearchScraperRequest(
             user_prompt=user_prompt,
@@ -845,7 +1308,7 @@ class Client:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching searchscraper result for request {request_id}")
+        logger.info("🔍 Fetching searchscraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -854,9 +1317,32 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/searchscraper/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
+    def stream_searchscraper(
+        self, request_id: str, keys: Iterable[str] = DEFAULT_STREAM_KEYS
+    ) -> Iterator[Tuple[str, Any]]:
+        """Stream the result of a previous searchscraper request element by element
+
+        Args:
+            request_id: The request ID to fetch
+            keys: Keys whose array elements are yielded (pages, results and
+                  urls by default)
+
+        Yields:
+            ``(key, element)`` pairs in document order
+        """
+        logger.info("🔍 Streaming searchscraper result for request %s", request_id)
+
+        # Validate input using Pydantic model
+        GetSearchScraperRequest(request_id=request_id)
+        logger.debug("✅ Request ID validation passed")
+
+        yield from self._stream_request(
+            "GET", f"{API_BASE_URL}/searchscraper/{request_id}", keys
+        )
+
     def crawl(
         self,
         url: str,
@@ -900,34 +1386,35 @@ class Client:
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
         logger.info("🔍 Starting crawl request")
-        logger.debug(f"🌐 URL: {url}")
-        logger.debug(
-            f"🤖 Extraction mode: {'AI' if extraction_mode else 'Markdown conversion'}"
-        )
-        if extraction_mode:
-            logger.debug(f"📝 Prompt: {prompt}")
-            logger.debug(f"📊 Schema provided: {bool(data_schema)}")
-        else:
+        if logger.is_enabled_for("DEBUG"):
+            logger.debug("🌐 URL: %s", url)
             logger.debug(
-                "📄 Markdown conversion mode - no AI processing, 2 credits per page"
+                "🤖 Extraction mode: %s", "AI" if extraction_mode else "Markdown conversion"
             )
-        logger.debug(f"💾 Cache website: {cache_website}")
-        logger.debug(f"🔍 Depth: {depth}")
-        logger.debug(f"📄 Max pages: {max_pages}")
-        logger.debug(f"🏠 Same domain only: {same_domain_only}")
-        logger.debug(f"🗺️ Use sitemap: {sitemap}")
-        if stealth:
-            logger.debug("🥷 Stealth mode enabled")
-        if render_heavy_js:
-            logger.debug("⚡ Heavy JavaScript rendering enabled")
-        if batch_size is not None:
-            logger.debug(f"📦 Batch size: {batch_size}")
-        if include_paths:
-            logger.debug(f"✅ Include paths: {include_paths}")
-        if exclude_paths:
-            logger.debug(f"❌ Exclude paths: {exclude_paths}")
-        if return_toon:
-            logger.debug("🎨 TOON format output enabled")
+            if extraction_mode:
+                logger.debug("📝 Prompt: %s", prompt)
+                logger.debug("📊 Schema provided: %s", bool(data_schema))
+            else:
+                logger.debug(
+                    "📄 Markdown conversion mode - no AI processing, 2 credits per page"
+                )
+            logger.debug("💾 Cache website: %s", cache_website)
+            logger.debug("🔍 Depth: %s", depth)
+            logger.debug("📄 Max pages: %s", max_pages)
+            logger.debug("🏠 Same domain only: %s", same_domain_only)
+            logger.debug("🗺️ Use sitemap: %s", sitemap)
+            if stealth:
+                logger.debug("🥷 Stealth mode enabled")
+            if render_heavy_js:
+                logger.debug("⚡ Heavy JavaScript rendering enabled")
+            if batch_size is not None:
+                logger.debug("📦 Batch size: %s", batch_size)
+            if include_paths:
+                logger.debug("✅ Include paths: %s", include_paths)
+            if exclude_paths:
+                logger.debug("❌ Exclude paths: %s", exclude_paths)
+            if return_toon:
+                logger.debug("🎨 TOON format output enabled")
 
         # Build request data, excluding None values
         request_data = {
@@ -965,6 +1452,49 @@ class Client:
         logger.info("✨ Crawl request completed successfully")
         return process_response_with_toon(result, return_toon)
 
+    def crawl_dry_run(
+        self,
+        url: str,
+        include_paths: Optional[list[str]] = None,
+        exclude_paths: Optional[list[str]] = None,
+    ) -> PathPreview:
+        """Preview which sitemap URLs a crawl's path filters would keep
+
+        Fetches the sitemap of ``url`` and applies ``include_paths`` and
+        ``exclude_paths`` locally, without starting a crawl. Use it to catch
+        misconfigured patterns before spending crawl budget: patterns that
+        match no sitemap URL are listed in ``unused_patterns``. A crawl can
+        also reach pages that are missing from the sitemap.
+
+        Args:
+            url: The starting URL of the crawl
+            include_paths: Path patterns passed to crawl as include_paths
+            exclude_paths: Path patterns passed to crawl as exclude_paths
+
+        Returns:
+            PathPreview with the kept, excluded and not included URLs and
+            the number of URLs matched by each pattern
+
+        Raises:
+            ValueError: If a path pattern does not start with '/'
+
+        Example:
+            >>> preview = client.crawl_dry_run(
+            ...     "https://example.com", include_paths=["/blog/**"]
+            ... )
+            >>> preview.summary(), preview.unused_patterns
+        """
+        path_filter = PathFilter(include_paths, exclude_paths)
+        sitemap = self.sitemap(website_url=url)
+        preview = path_filter.preview(sitemap.urls)
+        logger.info(
+            "🔎 Crawl dry run for %s: %s of %s sitemap URLs kept",
+            url,
+            len(preview.kept),
+            preview.total,
+        )
+        return preview
+
     def get_crawl(self, crawl_id: str, return_toon: bool = False):
         """Get the result of a previous crawl request
         
@@ -972,7 +1502,7 @@ class Client:
             crawl_id: The crawl ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching crawl result for request {crawl_id}")
+        logger.info("🔍 Fetching crawl result for request %s", crawl_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -981,9 +1511,94 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/crawl/{crawl_id}")
-        logger.info(f"✨ Successfully retrieved result for request {crawl_id}")
+        logger.info("✨ Successfully retrieved result for request %s", crawl_id)
         return process_response_with_toon(result, return_toon)
 
+    def stream_crawl(
+        self, crawl_id: str, keys: Iterable[str] = DEFAULT_STREAM_KEYS
+    ) -> Iterator[Tuple[str, Any]]:
+        """Stream the result of a previous crawl request element by element
+
+        Unlike get_crawl, the response is decoded incrementally, so a crawl
+        with hundreds of pages never sits in memory all at once.
+
+        Args:
+            crawl_id: The crawl ID to fetch
+            keys: Keys whose array elements are yielded (pages, results and
+                  urls by default)
+
+        Yields:
+            ``(key, element)`` pairs, e.g. ``("pages", {"url": ..., "markdown": ...})``
+        """
+        logger.info("🔍 Streaming crawl result for request %s", crawl_id)
+
+        # Validate input using Pydantic model
+        GetCrawlRequest(crawl_id=crawl_id)
+        logger.debug("✅ Request ID validation passed")
+
+        yield from self._stream_request("GET", f"{API_BASE_URL}/crawl/{crawl_id}", keys)
+
+    def iter_crawl_pages(
+        self,
+        crawl_id: str,
+        cursor: int = 0,
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[CrawlPage]:
+        """Poll a crawl and yield each page once, as soon as it is available
+
+        Every poll streams the crawl status, skips the pages that were
+        already yielded without decoding them and yields the new ones, so
+        only a cursor (the number of pages emitted) is kept between polls.
+        The delay between polls grows while no new page shows up.
+
+        Args:
+            crawl_id: The crawl ID returned by crawl
+            cursor: Number of pages to skip, e.g. the index after the last
+                    page seen when resuming an earlier iteration
+            timeout: Deadline in seconds (None = no limit)
+            initial_interval: First delay between polls in seconds
+            max_interval: Upper bound for the delay between polls
+
+        Yields:
+            CrawlPage objects with the URL, markdown, extracted data and
+            metadata of each page, in crawl order
+
+        Raises:
+            APIError: If the crawl fails or is cancelled
+            TimeoutError: If the crawl is still running at the deadline
+
+        Example:
+            >>> for page in client.iter_crawl_pages(job["crawl_id"]):
+            ...     print(page.index, page.url)
+        """
+        logger.info("🔍 Iterating pages of crawl %s from page %s", crawl_id, cursor)
+
+        # Validate input using Pydantic model
+        GetCrawlRequest(crawl_id=crawl_id)
+        logger.debug("✅ Request ID validation passed")
+
+        schedule = PollSchedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        pages = CrawlPageCursor(crawl_id, schedule, cursor)
+        url = f"{API_BASE_URL}/crawl/{crawl_id}"
+        while True:
+            for key, value in self._stream_request(
+                "GET", url, CRAWL_PAGE_KEYS, value_keys=CRAWL_STATUS_KEYS, skip=pages.cursor
+            ):
+                page = pages.feed(key, value)
+                if page is not None:
+                    yield page
+            delay = pages.next_delay()
+            if delay is None:
+                logger.info("✨ Crawl %s finished after %s pages", crawl_id, pages.cursor)
+                return
+            time.sleep(delay)
+
     def agenticscraper(
         self,
         url: str,
@@ -1009,13 +1624,13 @@ class Client:
             stealth: Enable stealth mode to avoid bot detection
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🤖 Starting agentic scraper request for {url}")
-        logger.debug(f"🔧 Use session: {use_session}")
-        logger.debug(f"📋 Steps: {steps}")
-        logger.debug(f"🧠 AI extraction: {ai_extraction}")
+        logger.info("🤖 Starting agentic scraper request for %s", url)
+        logger.debug("🔧 Use session: %s", use_session)
+        logger.debug("📋 Steps: %s", steps)
+        logger.debug("🧠 AI extraction: %s", ai_extraction)
         if ai_extraction:
-            logger.debug(f"💭 User prompt: {user_prompt}")
-            logger.debug(f"📋 Output schema provided: {output_schema is not None}")
+            logger.debug("💭 User prompt: %s", user_prompt)
+            logger.debug("📋 Output schema provided: %s", output_schema is not None)
         if stealth:
             logger.debug("🥷 Stealth mode enabled")
         if return_toon:
@@ -1046,7 +1661,7 @@ class Client:
             request_id: The request ID to fetch
             return_toon: If True, return response in TOON format (reduces token usage by 30-60%)
         """
-        logger.info(f"🔍 Fetching agentic scraper result for request {request_id}")
+        logger.info("🔍 Fetching agentic scraper result for request %s", request_id)
         if return_toon:
             logger.debug("🎨 TOON format output enabled")
 
@@ -1055,7 +1670,7 @@ class Client:
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/agentic-scrapper/{request_id}")
-        logger.info(f"✨ Successfully retrieved result for request {request_id}")
+        logger.info("✨ Successfully retrieved result for request %s", request_id)
         return process_response_with_toon(result, return_toon)
 
     def generate_schema(
@@ -1070,9 +1685,9 @@ class Client:
             existing_schema: Optional existing JSON schema to modify/extend
         """
         logger.info("🔧 Starting schema generation request")
-        logger.debug(f"💭 User prompt: {user_prompt}")
+        logger.debug("💭 User prompt: %s", user_prompt)
         if existing_schema:
-            logger.debug(f"📋 Existing schema provided: {existing_schema is not None}")
+            logger.debug("📋 Existing schema provided: %s", existing_schema is not None)
 
         request = GenerateSchemaRequest(
             user_prompt=user_prompt,
@@ -1092,14 +1707,14 @@ class Client:
         Args:
             request_id: The request ID returned from generate_schema
         """
-        logger.info(f"🔍 Fetching schema generation status for request {request_id}")
+        logger.info("🔍 Fetching schema generation status for request %s", request_id)
 
         # Validate input using Pydantic model
         GetSchemaStatusRequest(request_id=request_id)
         logger.debug("✅ Request ID validation passed")
 
         result = self._make_request("GET", f"{API_BASE_URL}/generate_schema/{request_id}")
-        logger.info(f"✨ Successfully retrieved schema status for request {request_id}")
+        logger.info("✨ Successfully retrieved schema status for request %s", request_id)
         return result
 
     def create_scheduled_job(
@@ -1111,7 +1726,7 @@ class Client:
         is_active: bool = True,
     ):
         """Create a new scheduled job"""
-        logger.info(f"📅 Creating scheduled job: {job_name}")
+        logger.info("📅 Creating scheduled job: %s", job_name)
 
         request = ScheduledJobCreate(
             job_name=job_name,
@@ -1151,17 +1766,19 @@ class Client:
             params["is_active"] = is_active
 
         result = self._make_request("GET", f"{API_BASE_URL}/scheduled-jobs", params=params)
-        logger.info(f"✨ Successfully retrieved {len(result.get('jobs', []))} scheduled jobs")
+        logger.info(
+            "✨ Successfully retrieved %s scheduled jobs", len(result.get("jobs", []))
+        )
         return result
 
     def get_scheduled_job(self, job_id: str):
         """Get details of a specific scheduled job"""
-        logger.info(f"🔍 Fetching scheduled job {job_id}")
+        logger.info("🔍 Fetching scheduled job %s", job_id)
 
         GetScheduledJobRequest(job_id=job_id)
 
         result = self._make_request("GET", f"{API_BASE_URL}/scheduled-jobs/{job_id}")
-        logger.info(f"✨ Successfully retrieved scheduled job {job_id}")
+        logger.info("✨ Successfully retrieved scheduled job %s", job_id)
         return result
 
     def update_scheduled_job(
@@ -1173,7 +1790,7 @@ class Client:
         is_active: Optional[bool] = None,
     ):
         """Update an existing scheduled job (partial update)"""
-        logger.info(f"📝 Updating scheduled job {job_id}")
+        logger.info("📝 Updating scheduled job %s", job_id)
 
         update_data = {}
         if job_name is not None:
@@ -1190,7 +1807,7 @@ class Client:
         result = self._make_request(
             "PATCH", f"{API_BASE_URL}/scheduled-jobs/{job_id}", json=update_data
         )
-        logger.info(f"✨ Successfully updated scheduled job {job_id}")
+        logger.info("✨ Successfully updated scheduled job %s", job_id)
         return result
 
     def replace_scheduled_job(
@@ -1202,7 +1819,7 @@ class Client:
         is_active: bool = True,
     ):
         """Replace an existing scheduled job (full update)"""
-        logger.info(f"🔄 Replacing scheduled job {job_id}")
+        logger.info("🔄 Replacing scheduled job %s", job_id)
 
         request_data = {
             "job_name": job_name,
@@ -1214,47 +1831,47 @@ class Client:
         result = self._make_request(
             "PUT", f"{API_BASE_URL}/scheduled-jobs/{job_id}", json=request_data
         )
-        logger.info(f"✨ Successfully replaced scheduled job {job_id}")
+        logger.info("✨ Successfully replaced scheduled job %s", job_id)
         return result
 
     def delete_scheduled_job(self, job_id: str):
         """Delete a scheduled job"""
-        logger.info(f"🗑️ Deleting scheduled job {job_id}")
+        logger.info("🗑️ Deleting scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = self._make_request("DELETE", f"{API_BASE_URL}/scheduled-jobs/{job_id}")
-        logger.info(f"✨ Successfully deleted scheduled job {job_id}")
+        logger.info("✨ Successfully deleted scheduled job %s", job_id)
         return result
 
     def pause_scheduled_job(self, job_id: str):
         """Pause a scheduled job"""
-        logger.info(f"⏸️ Pausing scheduled job {job_id}")
+        logger.info("⏸️ Pausing scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/pause")
-        logger.info(f"✨ Successfully paused scheduled job {job_id}")
+        logger.info("✨ Successfully paused scheduled job %s", job_id)
         return result
 
     def resume_scheduled_job(self, job_id: str):
         """Resume a paused scheduled job"""
-        logger.info(f"▶️ Resuming scheduled job {job_id}")
+        logger.info("▶️ Resuming scheduled job %s", job_id)
 
         JobActionRequest(job_id=job_id)
 
         result = self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/resume")
-        logger.info(f"✨ Successfully resumed scheduled job {job_id}")
+        logger.info("✨ Successfully resumed scheduled job %s", job_id)
         return result
 
     def trigger_scheduled_job(self, job_id: str):
         """Manually trigger a scheduled job"""
-        logger.info(f"🚀 Manually triggering scheduled job {job_id}")
+        logger.info("🚀 Manually triggering scheduled job %s", job_id)
 
         TriggerJobRequest(job_id=job_id)
 
         result = self._make_request("POST", f"{API_BASE_URL}/scheduled-jobs/{job_id}/trigger")
-        logger.info(f"✨ Successfully triggered scheduled job {job_id}")
+        logger.info("✨ Successfully triggered scheduled job %s", job_id)
         return result
 
     def get_job_executions(
@@ -1265,7 +1882,7 @@ class Client:
         status: Optional[str] = None,
     ):
         """Get execution history for a scheduled job"""
-        logger.info(f"📊 Fetching execution history for job {job_id}")
+        logger.info("📊 Fetching execution history for job %s", job_id)
 
         GetJobExecutionsRequest(
             job_id=job_id,
@@ -1281,12 +1898,387 @@ class Client:
         result = self._make_request(
             "GET", f"{API_BASE_URL}/scheduled-jobs/{job_id}/executions", params=params
         )
-        logger.info(f"✨ Successfully retrieved execution history for job {job_id}")
+        logger.info("✨ Successfully retrieved execution history for job %s", job_id)
         return result
 
+    def wait_for(
+        self,
+        request_id: str,
+        service: str = "smartscraper",
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Dict[str, Any]:
+        """Poll a job until it reaches a terminal status and return its result
+
+        Args:
+            request_id: Request ID (or crawl ID) returned by a job endpoint
+            service: Service that created the job. One of smartscraper,
+                     searchscraper, markdownify, scrape, crawl, agenticscraper
+                     or generate_schema
+            timeout: Deadline in seconds (None = no limit)
+            initial_interval: First delay between polls in seconds
+            max_interval: Upper bound for the delay between polls
+
+        Returns:
+            The final status response (status "completed", "failed", ...)
+
+        Raises:
+            TimeoutError: If the job is still pending at the deadline
+            APIError: If the status endpoint returns a permanent error
+
+        Example:
+            >>> job = client.crawl(url="https://example.com", ...)
+            >>> result = client.wait_for(job["crawl_id"], service="crawl")
+        """
+        (item,) = self.wait_for_many(
+            [request_id],
+            service=service,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+        )
+        if item.error is not None:
+            raise item.error
+        logger.info("✨ %s job %s finished", service, request_id)
+        return item.result
+
+    def wait_for_many(
+        self,
+        request_ids: Iterable[PollJob],
+        service: str = "smartscraper",
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[BulkResult]:
+        """Poll many job IDs and yield each result as soon as it is final
+
+        All IDs are polled from one scheduler loop with jittered exponential
+        backoff per job, so thousands of outstanding IDs can be watched at once.
+
+        Args:
+            request_ids: Request IDs returned by the job endpoints, or
+                         ``(service, request_id)`` tuples to mix job types
+            service: Service that created plain request IDs. One of
+                     smartscraper, searchscraper, markdownify, scrape, crawl,
+                     agenticscraper or generate_schema
+            timeout: Overall deadline in seconds for all jobs (None = no limit)
+            initial_interval: First delay between polls of a job in seconds
+            max_interval: Upper bound for the delay between polls of a job
+
+        Yields:
+            BulkResult per job, in completion order. Jobs still pending at the
+            deadline carry a TimeoutError; permanent API errors are reported
+            on the result instead of being raised
+
+        Example:
+            >>> for item in client.wait_for_many(ids, service="crawl"):
+            ...     if item.ok:
+            ...         print(item.input, item.result["status"])
+        """
+        schedule = PollSchedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        logger.info("⏳ Waiting for %s jobs (timeout=%ss)", service, timeout)
+
+        def fetch(job_service: str, request_id: str) -> Any:
+            get_status = getattr(self, resolve_poll_method(job_service))
+            if self.tracer is None:
+                return get_status(request_id)
+            with self.tracer.poll(job_service, request_id) as poll:
+                poll.result = get_status(request_id)
+            return poll.result
+
+        yield from poll_many_sync(fetch, request_ids, service, schedule)
+
+    def resume(
+        self,
+        timeout: Optional[float] = 600.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[BulkResult]:
+        """Re-attach to the unfinished jobs recorded in the checkpoint store
+
+        Jobs submitted through a client with a checkpoint store (possibly in
+        an earlier process) are polled through their ``get_*`` endpoints
+        until they finish, instead of being submitted again. Their recorded
+        status is updated as they complete; jobs the API no longer knows
+        are marked failed.
+
+        Args:
+            timeout: Overall deadline in seconds for all jobs (None = no limit)
+            initial_interval: First delay between polls of a job in seconds
+            max_interval: Upper bound for the delay between polls of a job
+
+        Yields:
+            BulkResult per job, in completion order, with
+            ``(service, request_id)`` as input
+
+        Raises:
+            ValueError: If the client has no checkpoint store
+
+        Example:
+            >>> for item in client.resume():
+            ...     if item.ok:
+            ...         print(item.input, item.result["status"])
+        """
+        store = self.checkpoint_store
+        if store is None:
+            raise ValueError("resume() requires a client created with a checkpoint_store")
+        jobs = [(record.service, record.request_id) for record in store.unfinished()]
+        logger.info("♻️ Resuming %s unfinished jobs", len(jobs))
+        for item in self.wait_for_many(
+            jobs, timeout=timeout, initial_interval=initial_interval, max_interval=max_interval
+        ):
+            if item.error is not None and is_permanent_error(item.error):
+                store.update_status(item.input[1], "failed")
+            yield item
+
+    def _mount_adapter(self) -> None:
+        self._adapter = build_adapter(
+            0,
+            pool_size=self.pool_size,
+            pool_per_host=self.pool_per_host,
+            traced=self.tracer is not None,
+        )
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    @contextmanager
+    def _lease_executor(self, max_workers: int) -> Iterator[ThreadPoolExecutor]:
+        """Lend out the managed thread pool for one batch, growing it and the
+        connection pool so that ``max_workers`` threads never wait for a
+        connection
+
+        A smaller pool is replaced rather than resized. Batches still running
+        on it keep using it; it is shut down when the last of them ends.
+        """
+        with self._executor_lock:
+            if self._executor is None or self._executor_workers < max_workers:
+                if (self.pool_per_host or self.pool_size) < max_workers:
+                    logger.debug(
+                        "🔧 Growing connection pool to %s connections", max_workers
+                    )
+                    self.pool_size = max(self.pool_size, max_workers)
+                    if self.pool_per_host is not None:
+                        self.pool_per_host = max_workers
+                    self._retired_adapters.append(self._adapter)
+                    self._mount_adapter()
+                if self._executor is not None and not self._executor_leases.get(
+                    self._executor
+                ):
+                    self._executor.shutdown(wait=False)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="sgai-client"
+                )
+                self._executor_workers = max_workers
+            executor = self._executor
+            self._executor_leases[executor] = self._executor_leases.get(executor, 0) + 1
+        try:
+            yield executor
+        finally:
+            with self._executor_lock:
+                leases = self._executor_leases.pop(executor) - 1
+                if leases:
+                    self._executor_leases[executor] = leases
+                elif executor is not self._executor:
+                    executor.shutdown(wait=False)
+
+    def imap_unordered(
+        self,
+        method: Callable[..., Any],
+        inputs: Iterable[Any],
+        max_workers: int = DEFAULT_BULK_CONCURRENCY,
+        input_key: str = "website_url",
+        **kwargs,
+    ) -> Iterator[BulkResult]:
+        """Run an endpoint method over many inputs on a thread pool, yielding
+        results as they finish
+
+        Calls run on a thread pool managed by the client and share its
+        session, whose connection pool is grown to at least ``max_workers``
+        connections. Inputs are consumed lazily and errors are reported on
+        the yielded BulkResult instead of stopping the batch.
+
+        Args:
+            method: Bound endpoint method, e.g. ``client.smartscraper``
+            inputs: Iterable of inputs. Each item is either a value for
+                    ``input_key`` or a dict of per-call keyword arguments that
+                    override ``kwargs``
+            max_workers: Maximum number of concurrent calls
+            input_key: Keyword argument receiving non-dict input items
+            **kwargs: Keyword arguments shared by every call
+
+        Yields:
+            BulkResult for every input, in completion order
+
+        Example:
+            >>> for item in client.imap_unordered(
+            ...     client.smartscraper, urls, max_workers=16,
+            ...     user_prompt="Extract the title"
+            ... ):
+            ...     print(item.input, item.ok)
+        """
+        logger.info(
+            "📦 Starting threaded %s with %s workers",
+            getattr(method, "__name__", "call"),
+            max_workers,
+        )
+
+        def call(item: Any) -> Any:
+            return method(**build_call_kwargs(item, input_key, kwargs))
+
+        with self._lease_executor(max_workers) as executor:
+            yield from run_in_threads(call, inputs, executor, max_workers)
+
+    def sitemap_fanout(
+        self,
+        website_url: str,
+        method: Optional[Callable[..., Any]] = None,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_BULK_CONCURRENCY,
+        per_domain_concurrency: Optional[int] = DEFAULT_DOMAIN_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+        input_key: str = "website_url",
+        **kwargs,
+    ) -> Iterator[BulkResult]:
+        """Extract every sitemap URL of a website that passes the path filters
+
+        Fetches the sitemap, keeps the URLs matching ``include_paths`` and
+        not ``exclude_paths`` (same ``*``/``**`` semantics as crawl) and runs
+        ``method`` on each of them, streaming results as they finish. Unlike
+        crawl, the number of pages is not capped by ``max_pages``.
+
+        Args:
+            website_url: Website whose sitemap is fanned out
+            method: Bound per-URL endpoint method (default: markdownify)
+            include_paths: Path patterns to keep (default: all paths)
+            exclude_paths: Path patterns to drop; they take precedence
+            max_workers: Maximum number of concurrent calls
+            per_domain_concurrency: Maximum number of concurrent calls per
+                    domain (None = only the global limit)
+            on_progress: Callback receiving a FanOutProgress once the URLs
+                    are selected and after every result
+            input_key: Keyword argument receiving each URL
+            **kwargs: Keyword arguments shared by every call, e.g. user_prompt
+
+        Yields:
+            BulkResult per selected URL, in completion order
+
+        Raises:
+            ValueError: If a path pattern does not start with '/'
+
+        Example:
+            >>> for item in client.sitemap_fanout(
+            ...     "https://example.com",
+            ...     client.smartscraper,
+            ...     include_paths=["/products/**"],
+            ...     user_prompt="Extract the product name and price",
+            ... ):
+            ...     print(item.input, item.ok)
+        """
+        path_filter = PathFilter(include_paths, exclude_paths)
+        method = method or self.markdownify
+        sitemap = self.sitemap(website_url=website_url)
+        urls = list(path_filter.filter(sitemap.urls))
+        progress = FanOutProgress(discovered=len(sitemap.urls), selected=len(urls))
+        logger.info(
+            "🗺️ Fanning out %s of %s sitemap URLs of %s",
+            len(urls),
+            len(sitemap.urls),
+            website_url,
+        )
+
+        def call(url: str) -> Any:
+            return method(**build_call_kwargs(url, input_key, kwargs))
+
+        with self._lease_executor(max_workers) as executor:
+            yield from fan_out_threads(
+                call,
+                urls,
+                executor,
+                max_workers,
+                per_domain_concurrency,
+                progress,
+                on_progress,
+            )
+
+    def map(
+        self,
+        method: Callable[..., Any],
+        inputs: Iterable[Any],
+        max_workers: int = DEFAULT_BULK_CONCURRENCY,
+        input_key: str = "website_url",
+        **kwargs,
+    ) -> List[BulkResult]:
+        """Run an endpoint method over many inputs on a thread pool
+
+        Same as imap_unordered, but waits for every call and returns the
+        results in input order.
+
+        Args:
+            method: Bound endpoint method, e.g. ``client.markdownify``
+            inputs: Iterable of input values or dicts of per-call arguments
+            max_workers: Maximum number of concurrent calls
+            input_key: Keyword argument receiving non-dict input items
+            **kwargs: Keyword arguments shared by every call
+
+        Returns:
+            List of BulkResult ordered like the inputs
+
+        Example:
+            >>> results = client.map(client.markdownify, urls, max_workers=8)
+            >>> failed = [item for item in results if not item.ok]
+        """
+        results = sorted(
+            self.imap_unordered(method, inputs, max_workers, input_key, **kwargs),
+            key=lambda item: item.index,
+        )
+        failed = sum(1 for item in results if not item.ok)
+        logger.info(
+            "✨ Threaded batch finished: %s succeeded, %s failed",
+            len(results) - failed,
+            failed,
+        )
+        return results
+
+    def pool_stats(self) -> Dict[str, Optional[int]]:
+        """Report live connection pool statistics
+
+        Returns:
+            dict: Pool limits plus acquired, idle and active connection counts,
+                  and how many connections were created or reused
+                  (None for counts the installed transport does not expose)
+
+        Example:
+            >>> stats = client.pool_stats()
+            >>> print(f"{stats['reused']} reused / {stats['created']} created")
+        """
+        return adapter_stats(self._adapter, self.pool_size, self.pool_per_host)
+
     def close(self):
         """Close the session to free up resources"""
         logger.info("🔒 Closing Client session")
+        # Shut the pools down outside the lock: running batch workers may
+        # still need it to reach the hedge pool
+        with self._executor_lock:
+            executors = set(self._executor_leases)
+            if self._executor is not None:
+                executors.add(self._executor)
+            self._executor = None
+            self._executor_workers = 0
+            retired, self._retired_adapters = self._retired_adapters, []
+        for executor in executors:
+            executor.shutdown(wait=True)
+        with self._executor_lock:
+            hedge_executor, self._hedge_executor = self._hedge_executor, None
+        if hedge_executor is not None:
+            hedge_executor.shutdown(wait=True)
+        for adapter in retired:
+            adapter.close()
         self.session.close()
         logger.debug("✅ Session closed successfully")
 
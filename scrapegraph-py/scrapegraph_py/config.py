@@ -7,9 +7,15 @@ and default headers used for all API requests.
 Attributes:
     API_BASE_URL (str): Base URL for the ScrapeGraphAI API endpoints
     DEFAULT_HEADERS (dict): Default HTTP headers for API requests
+    DEFAULT_BULK_CONCURRENCY (int): Default number of concurrent calls for
+        bulk operations
+    DEFAULT_DOMAIN_CONCURRENCY (int): Default number of concurrent calls per
+        target domain in a sitemap fan-out
 """
 API_BASE_URL = "https://api.scrapegraphai.com/v1"
 DEFAULT_HEADERS = {
     "accept": "application/json",
     "Content-Type": "application/json",
 }
+DEFAULT_BULK_CONCURRENCY = 10
+DEFAULT_DOMAIN_CONCURRENCY = 5
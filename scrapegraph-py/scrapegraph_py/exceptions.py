@@ -1,30 +1,59 @@
-"""
-Custom exceptions for the ScrapeGraphAI SDK.
-
-This module defines custom exception classes used throughout the SDK
-for handling API errors and other exceptional conditions.
-"""
-
-
-class APIError(Exception):
-    """
-    Exception raised for API errors.
-
-    This exception is raised when the API returns an error response,
-    providing both the error message and HTTP status code for debugging.
-
-    Attributes:
-        message (str): The error message from the API
-        status_code (int): HTTP status code of the error response
-
-    Example:
-        >>> try:
-        ...     client.smartscraper(website_url="invalid")
-        ... except APIError as e:
-        ...     print(f"API error {e.status_code}: {e.message}")
-    """
-
-    def __init__(self, message: str, status_code: int = None):
-        self.status_code = status_code
-        self.message = message
-        super().__init__(f"[{status_code}] {message}")
+"""
+Custom exceptions for the ScrapeGraphAI SDK.
+
+This module defines custom exception classes used throughout the SDK
+for handling API errors and other exceptional conditions.
+"""
+
+
+class APIError(Exception):
+    """
+    Exception raised for API errors.
+
+    This exception is raised when the API returns an error response,
+    providing both the error message and HTTP status code for debugging.
+
+    Attributes:
+        message (str): The error message from the API
+        status_code (int): HTTP status code of the error response
+
+    Example:
+        >>> try:
+        ...     client.smartscraper(website_url="invalid")
+        ... except APIError as e:
+        ...     print(f"API error {e.status_code}: {e.message}")
+    """
+
+    def __init__(self, message: str, status_code: int = None):
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"[{status_code}] {message}")
+
+
+class CircuitOpenError(APIError):
+    """
+    Exception raised when a request is refused by an open circuit breaker.
+
+    The request was not sent: recent calls to the same endpoint family failed
+    or were too slow, so the client fails fast until a health check passes.
+    Its ``status_code`` is 503, as the endpoint is treated as unavailable.
+
+    Attributes:
+        family (str): Endpoint family whose circuit is open
+        retry_after (float): Seconds until the next health probe is allowed
+
+    Example:
+        >>> try:
+        ...     client.smartscraper(website_url="https://example.com", user_prompt="...")
+        ... except CircuitOpenError as e:
+        ...     print(f"{e.family} unavailable, retry in {e.retry_after:.0f}s")
+    """
+
+    def __init__(self, family: str, retry_after: float):
+        self.family = family
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for '{family}' after repeated failures; "
+            f"retry in {retry_after:.1f}s",
+            status_code=503,
+        )
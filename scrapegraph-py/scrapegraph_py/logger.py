@@ -14,10 +14,16 @@ Example:
 
     Disable logging:
         >>> sgai_logger.disable()
+
+Messages take lazy %-style arguments, so nothing is formatted unless the
+record is actually emitted. Wrap request payloads in :class:`LazyPayload`
+to log them truncated and with credentials redacted:
+
+    >>> sgai_logger.debug("Request parameters: %s", LazyPayload(kwargs))
 """
 import logging
 import logging.handlers
-from typing import Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Union
 
 # Emoji mappings for different log levels
 LOG_EMOJIS: Dict[int, str] = {
@@ -29,6 +35,96 @@ LOG_EMOJIS: Dict[int, str] = {
 }
 
 
+# Longest string/bytes value rendered by format_payload before truncation
+DEFAULT_MAX_VALUE_LENGTH = 200
+
+# Payload keys whose values are never logged (compared case-insensitively)
+REDACTED_KEYS: FrozenSet[str] = frozenset(
+    {
+        "sgai-apikey",
+        "api_key",
+        "apikey",
+        "authorization",
+        "cookie",
+        "cookies",
+        "set-cookie",
+        "password",
+        "token",
+        "x-api-key",
+    }
+)
+
+
+def format_payload(
+    payload: Any,
+    max_length: int = DEFAULT_MAX_VALUE_LENGTH,
+    redact: FrozenSet[str] = REDACTED_KEYS,
+) -> str:
+    """
+    Render request parameters for a log message.
+
+    Values of keys listed in ``redact`` are replaced by ``<redacted>`` at
+    any depth, and strings or bytes longer than ``max_length`` are cut with a
+    note of their full size, so a multi-megabyte ``website_html`` costs a few
+    hundred bytes of log output.
+
+    Args:
+        payload: Parameters to render (usually the request kwargs)
+        max_length: Longest string or bytes value rendered in full
+        redact: Lower-case keys whose values are hidden
+
+    Returns:
+        A repr-like rendering of the payload
+    """
+    return repr(_truncate(payload, max_length, redact))
+
+
+class _Raw(str):
+    """String rendered without quotes by repr()"""
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _truncate(value: Any, max_length: int, redact: FrozenSet[str]) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _Raw("<redacted>")
+            if isinstance(key, str) and key.lower() in redact
+            else _truncate(item, max_length, redact)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        items = [_truncate(item, max_length, redact) for item in value]
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, (str, bytes, bytearray)) and len(value) > max_length:
+        unit = "chars" if isinstance(value, str) else "bytes"
+        return _Raw(f"{value[:max_length]!r}... ({len(value)} {unit})")
+    return value
+
+
+class LazyPayload:
+    """
+    Log argument that renders a payload with :func:`format_payload` only
+    when the record is emitted.
+
+    Args:
+        payload: Parameters to render
+        max_length: Longest string or bytes value rendered in full
+    """
+
+    __slots__ = ("payload", "max_length")
+
+    def __init__(self, payload: Any, max_length: int = DEFAULT_MAX_VALUE_LENGTH):
+        self.payload = payload
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        return format_payload(self.payload, self.max_length)
+
+    __repr__ = __str__
+
+
 class EmojiFormatter(logging.Formatter):
     """
     Custom log formatter that adds emojis to log messages.
@@ -142,55 +238,81 @@ class ScrapegraphLogger:
         self.logger.handlers.clear()
         self.enabled = False
 
-    def debug(self, message: str) -> None:
+    def is_enabled_for(self, level: Union[int, str]) -> bool:
+        """
+        Check whether messages of ``level`` would be emitted.
+
+        Use it to skip building expensive log output:
+
+            >>> if sgai_logger.is_enabled_for("DEBUG"):
+            ...     sgai_logger.debug("State: %s", expensive_dump())
+
+        Args:
+            level: Logging level as an int or a name such as 'DEBUG'
+
+        Returns:
+            True if logging is enabled at ``level``
+        """
+        if not self.enabled:
+            return False
+        if isinstance(level, str):
+            level = getattr(logging, level.upper(), logging.INFO)
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args: Any) -> None:
         """
-        Log debug message if logging is enabled.
+        Log a debug message if logging is enabled.
 
         Args:
-            message: The debug message to log
+            message: The debug message, with optional %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self.enabled:
-            self.logger.debug(message)
+        if self.enabled and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, stacklevel=2)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """
-        Log info message if logging is enabled.
+        Log an info message if logging is enabled.
 
         Args:
-            message: The info message to log
+            message: The info message, with optional %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self.enabled:
-            self.logger.info(message)
+        if self.enabled and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, stacklevel=2)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """
-        Log warning message if logging is enabled.
+        Log a warning message if logging is enabled.
 
         Args:
-            message: The warning message to log
+            message: The warning message, with optional %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self.enabled:
-            self.logger.warning(message)
+        if self.enabled and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, stacklevel=2)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """
-        Log error message if logging is enabled.
+        Log an error message if logging is enabled.
 
         Args:
-            message: The error message to log
+            message: The error message, with optional %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self.enabled:
-            self.logger.error(message)
+        if self.enabled and self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, *args, stacklevel=2)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """
-        Log critical message if logging is enabled.
+        Log a critical message if logging is enabled.
 
         Args:
-            message: The critical message to log
+            message: The critical message, with optional %-style placeholders
+            *args: Values merged into the message only if it is emitted
         """
-        if self.enabled:
-            self.logger.critical(message)
+        if self.enabled and self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, *args, stacklevel=2)
 
 
 # Default logger instance
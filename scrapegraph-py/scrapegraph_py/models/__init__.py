@@ -24,15 +24,56 @@ Example:
     ... )
 """
 
-from .agenticscraper import AgenticScraperRequest, GetAgenticScraperRequest
-from .crawl import CrawlRequest, GetCrawlRequest
-from .feedback import FeedbackRequest
-from .scrape import GetScrapeRequest, ScrapeRequest
-from .markdownify import GetMarkdownifyRequest, MarkdownifyRequest
-from .searchscraper import GetSearchScraperRequest, SearchScraperRequest
-from .sitemap import SitemapRequest, SitemapResponse
-from .smartscraper import GetSmartScraperRequest, SmartScraperRequest
-from .schema import GenerateSchemaRequest, GetSchemaStatusRequest, SchemaGenerationResponse
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agenticscraper import AgenticScraperRequest, GetAgenticScraperRequest
+    from .crawl import CrawlRequest, GetCrawlRequest
+    from .feedback import FeedbackRequest
+    from .scrape import GetScrapeRequest, ScrapeRequest
+    from .markdownify import GetMarkdownifyRequest, MarkdownifyRequest
+    from .searchscraper import GetSearchScraperRequest, SearchScraperRequest
+    from .sitemap import SitemapRequest, SitemapResponse
+    from .smartscraper import GetSmartScraperRequest, SmartScraperRequest
+    from .schema import GenerateSchemaRequest, GetSchemaStatusRequest, SchemaGenerationResponse
+
+# Models are imported on first access (PEP 562), so importing one endpoint's
+# models does not build the pydantic classes of every other endpoint
+_LAZY_IMPORTS = {
+    "AgenticScraperRequest": ".agenticscraper",
+    "GetAgenticScraperRequest": ".agenticscraper",
+    "CrawlRequest": ".crawl",
+    "GetCrawlRequest": ".crawl",
+    "FeedbackRequest": ".feedback",
+    "GetScrapeRequest": ".scrape",
+    "ScrapeRequest": ".scrape",
+    "GetMarkdownifyRequest": ".markdownify",
+    "MarkdownifyRequest": ".markdownify",
+    "GetSearchScraperRequest": ".searchscraper",
+    "SearchScraperRequest": ".searchscraper",
+    "SitemapRequest": ".sitemap",
+    "SitemapResponse": ".sitemap",
+    "GetSmartScraperRequest": ".smartscraper",
+    "SmartScraperRequest": ".smartscraper",
+    "GenerateSchemaRequest": ".schema",
+    "GetSchemaStatusRequest": ".schema",
+    "SchemaGenerationResponse": ".schema",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "AgenticScraperRequest",
@@ -17,6 +17,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
+from scrapegraph_py.utils.schema_cache import cached_json_schema
+
 
 class SearchScraperRequest(BaseModel):
     """
@@ -81,9 +83,11 @@ class SearchScraperRequest(BaseModel):
         # Set exclude_none=True to exclude None values from serialization
         kwargs.setdefault("exclude_none", True)
         data = super().model_dump(*args, **kwargs)
-        # Convert the Pydantic model schema to dict if present
+        # Convert the Pydantic model schema to dict if present, generating it
+        # once per model class. Every dump gets its own copy, so changing it
+        # never leaks into other requests
         if self.output_schema is not None:
-            data["output_schema"] = self.output_schema.model_json_schema()
+            data["output_schema"] = cached_json_schema(self.output_schema)
         return data
 
 
@@ -12,17 +12,14 @@ The SmartScraper can:
 - Process URLs, raw HTML content, or Markdown content
 """
 
-from typing import Dict, Optional, Type
+from typing import Dict, Literal, Optional, Type
 from uuid import UUID
 
-try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
-except ImportError:
-    HAS_BS4 = False
-
 from pydantic import BaseModel, Field, conint, model_validator
 
+from scrapegraph_py.utils.content_validation import validate_html, validate_markdown
+from scrapegraph_py.utils.schema_cache import cached_json_schema
+
 
 class SmartScraperRequest(BaseModel):
     """
@@ -44,6 +41,9 @@ class SmartScraperRequest(BaseModel):
         mock: Whether to use mock mode for testing
         plain_text: Whether to return plain text instead of structured data
         render_heavy_js: Whether to render heavy JavaScript content
+        html_validation: How website_html is checked locally: "fast" (size
+            check and tag sniff), "lxml" (full lxml parse) or "strict" (full
+            BeautifulSoup parse). Not sent to the API
 
     Example:
         >>> request = SmartScraperRequest(
@@ -100,6 +100,11 @@ class SmartScraperRequest(BaseModel):
     plain_text: bool = Field(default=False, description="Whether to return the result as plain text")
     render_heavy_js: bool = Field(default=False, description="Whether to render heavy JavaScript on the page")
     stealth: bool = Field(default=False, description="Enable stealth mode to avoid bot detection")
+    html_validation: Literal["fast", "lxml", "strict"] = Field(
+        default="fast",
+        exclude=True,
+        description="Local validation of website_html: 'fast', 'lxml' or 'strict'",
+    )
 
     @model_validator(mode="after")
     def validate_user_prompt(self) -> "SmartScraperRequest":
@@ -125,21 +130,7 @@ class SmartScraperRequest(BaseModel):
 
         # Validate HTML content
         if self.website_html is not None:
-            if len(self.website_html.encode("utf-8")) > 2 * 1024 * 1024:
-                raise ValueError("Website HTML content exceeds maximum size of 2MB")
-            if not HAS_BS4:
-                raise ImportError(
-                    "beautifulsoup4 is required for HTML validation. "
-                    "Install it with: pip install scrapegraph-py[html] or pip install beautifulsoup4"
-                )
-            try:
-                soup = BeautifulSoup(self.website_html, "html.parser")
-                if not soup.find():
-                    raise ValueError("Invalid HTML - no parseable content found")
-            except Exception as e:
-                if isinstance(e, ImportError):
-                    raise
-                raise ValueError(f"Invalid HTML structure: {str(e)}")
+            validate_html(self.website_html, self.html_validation)
 
         # Validate URL
         elif self.website_url is not None:
@@ -153,10 +144,7 @@ class SmartScraperRequest(BaseModel):
 
         # Validate Markdown content
         elif self.website_markdown is not None:
-            if not self.website_markdown.strip():
-                raise ValueError("Website markdown cannot be empty")
-            if len(self.website_markdown.encode("utf-8")) > 2 * 1024 * 1024:
-                raise ValueError("Website markdown content exceeds maximum size of 2MB")
+            validate_markdown(self.website_markdown)
 
         return self
 
@@ -164,9 +152,11 @@ class SmartScraperRequest(BaseModel):
         # Set exclude_none=True to exclude None values from serialization
         kwargs.setdefault("exclude_none", True)
         data = super().model_dump(*args, **kwargs)
-        # Convert the Pydantic model schema to dict if present
+        # Convert the Pydantic model schema to dict if present, generating it
+        # once per model class. Every dump gets its own copy, so changing it
+        # never leaks into other requests
         if self.output_schema is not None:
-            data["output_schema"] = self.output_schema.model_json_schema()
+            data["output_schema"] = cached_json_schema(self.output_schema)
         return data
 
 
@@ -0,0 +1,256 @@
+"""
+Bounded-concurrency bulk execution helpers for the ScrapeGraphAI SDK.
+
+This module runs one coroutine per input with a fixed number of workers
+pulling from a shared input iterator. Inputs may be a regular iterable or
+an async iterable and are consumed lazily, so memory stays flat no matter
+how many inputs are submitted: at most ``concurrency`` calls are in flight
+and no task is created per input.
+
+The synchronous client gets the same behaviour from a thread pool: at most
+``max_workers`` calls are submitted at a time and inputs are pulled lazily as
+calls finish.
+
+Errors raised by individual calls are captured on the corresponding
+:class:`BulkResult` instead of cancelling the rest of the batch.
+
+Example:
+    >>> async with AsyncClient.from_env() as client:
+    ...     async for item in client.as_completed(
+    ...         client.markdownify, urls, concurrency=20
+    ...     ):
+    ...         if item.ok:
+    ...             print(item.input, item.result["status"])
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+BulkInputs = Union[Iterable[Any], AsyncIterable[Any]]
+
+_DONE = object()
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of a single call made as part of a bulk operation.
+
+    Attributes:
+        index (int): Position of the input in the submitted iterable
+        input (Any): The input item exactly as submitted
+        result (Any): The endpoint response when the call succeeded
+        error (Optional[BaseException]): The exception raised by the call, if any
+    """
+
+    index: int
+    input: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call completed without raising."""
+        return self.error is None
+
+
+def build_call_kwargs(
+    item: Any, input_key: str, common: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Merge a bulk input item with the keyword arguments shared by the batch.
+
+    A mapping item provides per-call keyword arguments that override the
+    shared ones; any other item is passed as the ``input_key`` argument.
+
+    Args:
+        item: A single bulk input (e.g. a URL string or a dict of kwargs)
+        input_key: Keyword argument that receives non-mapping items
+        common: Keyword arguments applied to every call
+
+    Returns:
+        Keyword arguments for the endpoint method
+    """
+    if isinstance(item, dict):
+        return {**common, **item}
+    return {**common, input_key: item}
+
+
+async def _enumerate_async(inputs: BulkInputs) -> AsyncIterator[Tuple[int, Any]]:
+    index = 0
+    if hasattr(inputs, "__aiter__"):
+        async for item in inputs:
+            yield index, item
+            index += 1
+    else:
+        for item in inputs:
+            yield index, item
+            index += 1
+
+
+async def run_as_completed(
+    func: Callable[[Any], Awaitable[Any]],
+    inputs: BulkInputs,
+    concurrency: int,
+) -> AsyncIterator[BulkResult]:
+    """
+    Run ``func`` over ``inputs`` with at most ``concurrency`` calls in flight.
+
+    Results are yielded as soon as each call finishes, in completion order.
+    Closing the generator early cancels the calls still in flight.
+
+    Args:
+        func: Coroutine function called once per input item
+        inputs: Iterable or async iterable of input items
+        concurrency: Maximum number of concurrent calls (>= 1)
+
+    Yields:
+        BulkResult for every input item
+
+    Raises:
+        ValueError: If concurrency is lower than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = _enumerate_async(inputs)
+    source_lock = asyncio.Lock()
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def next_input() -> Any:
+        async with source_lock:
+            try:
+                return await source.__anext__()
+            except StopAsyncIteration:
+                return _DONE
+
+    async def worker() -> None:
+        while True:
+            item = await next_input()
+            if item is _DONE:
+                return
+            index, value = item
+            try:
+                outcome = BulkResult(index=index, input=value, result=await func(value))
+            except Exception as e:
+                outcome = BulkResult(index=index, input=value, error=e)
+            await results.put(outcome)
+
+    async def supervise() -> None:
+        try:
+            await asyncio.gather(*workers)
+        except Exception as e:
+            # The input iterable itself failed; surface it to the consumer
+            await results.put(e)
+        finally:
+            await results.put(_DONE)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    supervisor = asyncio.create_task(supervise())
+    try:
+        while True:
+            outcome = await results.get()
+            if outcome is _DONE:
+                break
+            if isinstance(outcome, BaseException):
+                raise outcome
+            yield outcome
+    finally:
+        for task in (*workers, supervisor):
+            task.cancel()
+        await asyncio.gather(*workers, supervisor, return_exceptions=True)
+        await source.aclose()
+
+
+async def run_ordered(
+    func: Callable[[Any], Awaitable[Any]],
+    inputs: BulkInputs,
+    concurrency: int,
+) -> List[BulkResult]:
+    """
+    Run ``func`` over ``inputs`` and return the results in input order.
+
+    Args:
+        func: Coroutine function called once per input item
+        inputs: Iterable or async iterable of input items
+        concurrency: Maximum number of concurrent calls (>= 1)
+
+    Returns:
+        List of BulkResult, one per input, ordered like the inputs
+    """
+    collected = [item async for item in run_as_completed(func, inputs, concurrency)]
+    collected.sort(key=lambda item: item.index)
+    return collected
+
+
+def run_in_threads(
+    func: Callable[[Any], Any],
+    inputs: Iterable[Any],
+    executor: Executor,
+    max_workers: int,
+) -> Iterator[BulkResult]:
+    """
+    Run ``func`` over ``inputs`` on an executor, yielding results as they finish.
+
+    At most ``max_workers`` calls are submitted at any time. Closing the
+    generator early cancels the calls that have not started yet.
+
+    Args:
+        func: Function called once per input item
+        inputs: Iterable of input items, consumed lazily
+        executor: Executor running the calls
+        max_workers: Maximum number of calls in flight (>= 1)
+
+    Yields:
+        BulkResult for every input item, in completion order
+
+    Raises:
+        ValueError: If max_workers is lower than 1
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    source = enumerate(inputs)
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_workers:
+                try:
+                    index, value = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(func, value)] = (index, value)
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, value = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    outcome = BulkResult(
+                        index=index, input=value, result=future.result()
+                    )
+                else:
+                    outcome = BulkResult(index=index, input=value, error=error)
+                yield outcome
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,265 @@
+"""
+In-process response cache for the ScrapeGraphAI SDK.
+
+Pipelines often repeat the same ``smartscraper``, ``markdownify`` or
+``scrape`` call (same URL, prompt and schema) across stages. An opt-in
+:class:`ResponseCache` in front of ``_make_request`` answers those repeats
+from memory instead of paying the latency and credits again.
+
+- the key is a SHA-256 of the method, endpoint path and canonical JSON of the
+  request payload (``model_dump()``, which includes the ``output_schema``
+  JSON schema), query parameters and request headers. The headers carry the
+  API key, so a cache shared by clients of different accounts never answers
+  one account with another's response
+- entries are evicted least-recently-used once ``max_size`` is reached, and
+  expire after a per-endpoint-family TTL
+- mutating endpoints (scheduled-jobs, feedback) and methods other than
+  GET/POST are never cached
+- status lookups (``GET /smartscraper/{id}``) are only cached once the job
+  finished, and failed results are never cached
+
+A cache is thread-safe and can be shared between a ``Client`` and an
+``AsyncClient``.
+
+Example:
+    >>> cache = ResponseCache(max_size=500, ttl=600, ttls={"searchscraper": 60})
+    >>> client = Client.from_env(response_cache=cache)
+    >>> client.markdownify(website_url="https://example.com")
+    >>> client.markdownify(website_url="https://example.com")  # served from cache
+    >>> cache.stats()["hits"]
+    1
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from scrapegraph_py.utils.helpers import endpoint_family
+
+# Endpoint families cached by default
+DEFAULT_CACHED_FAMILIES = frozenset(
+    {
+        "smartscraper",
+        "markdownify",
+        "scrape",
+        "searchscraper",
+        "sitemap",
+        "generate_schema",
+    }
+)
+
+# Families that change server-side state and must never be cached
+NEVER_CACHE = frozenset({"scheduled-jobs", "feedback"})
+
+CACHEABLE_METHODS = frozenset({"GET", "POST"})
+
+_UNFINISHED_STATUSES = frozenset(
+    {"queued", "pending", "processing", "running", "started"}
+)
+_FAILED_STATUSES = frozenset({"failed", "error", "cancelled"})
+
+# Transport headers that never change the decoded response; leaving them out
+# keeps one cache shareable between a Client and an AsyncClient
+_UNKEYED_HEADERS = frozenset(
+    {"accept-encoding", "connection", "content-encoding", "idempotency-key"}
+)
+
+
+def cache_key(
+    method: str,
+    url: str,
+    payload: Any = None,
+    params: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    Build a stable cache key for a request.
+
+    Args:
+        method: HTTP method
+        url: Full request URL (only the path is used, so the key does not
+             depend on the API host)
+        payload: JSON body of the request
+        params: Query parameters of the request
+        headers: Request headers, including the API key; header names are
+                 case-insensitive
+
+    Returns:
+        Hex digest identifying the request
+    """
+    parts = [method.upper(), urlparse(url).path, payload, params]
+    keyed = sorted(
+        (name.lower(), str(value))
+        for name, value in (headers or {}).items()
+        if name.lower() not in _UNKEYED_HEADERS
+    )
+    if keyed:
+        parts.append(keyed)
+    canonical = json.dumps(
+        parts,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _is_storable(method: str, result: Any) -> bool:
+    if not isinstance(result, dict):
+        return result is not None
+    status = str(result.get("status", "")).lower()
+    if status in _FAILED_STATUSES or result.get("error"):
+        return False
+    # A pending status response will change, a pending submission will not
+    return method == "POST" or status not in _UNFINISHED_STATUSES
+
+
+class ResponseCache:
+    """
+    Size- and TTL-bounded LRU cache of API responses.
+
+    Attributes:
+        max_size (int): Maximum number of cached responses
+        ttl (float): Default time to live in seconds
+        ttls (dict): Time to live per endpoint family. Only families listed
+            here are cached; unless overridden, the default families use
+            ``ttl``. A TTL of 0 disables caching for that family
+        hits (int): Requests answered from the cache
+        misses (int): Cacheable requests that had to go to the API
+        evictions (int): Entries dropped because the cache was full
+        expirations (int): Entries dropped because their TTL ran out
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 3600.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = dict.fromkeys(DEFAULT_CACHED_FAMILIES, ttl)
+        self.ttls.update(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, method: str, url: str) -> Optional[float]:
+        """
+        Return the TTL for a request, or None if it must not be cached.
+        """
+        if method.upper() not in CACHEABLE_METHODS:
+            return None
+        family = endpoint_family(url)
+        if family in NEVER_CACHE:
+            return None
+        ttl = self.ttls.get(family)
+        return ttl if ttl else None
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Returns:
+            ``(found, response)``; the response is a copy the caller may
+            modify
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a response for ``ttl`` seconds, evicting the LRU entry if full."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Check the cache for a request about to be sent.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            kwargs: Keyword arguments of the request (``json``, ``params``
+                    and ``headers`` are part of the key)
+            headers: Headers the client sends with every request, such as
+                     the API key
+
+        Returns:
+            ``(key, response)``. ``key`` is None if the request is not
+            cacheable; ``response`` is None on a miss
+        """
+        if self.ttl_for(method, url) is None:
+            return None, None
+        key = cache_key(
+            method,
+            url,
+            kwargs.get("json"),
+            kwargs.get("params"),
+            {**(headers or {}), **(kwargs.get("headers") or {})},
+        )
+        _, value = self.get(key)
+        return key, value
+
+    def store(self, key: Optional[str], method: str, url: str, result: Any) -> None:
+        """Store the response of a request previously passed to :meth:`lookup`."""
+        ttl = self.ttl_for(method, url)
+        if key is None or ttl is None or not _is_storable(method.upper(), result):
+            return
+        self.set(key, result, ttl)
+
+    def clear(self) -> None:
+        """Drop all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and
+            expirations
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,307 @@
+"""
+Durable checkpoints of submitted jobs for the ScrapeGraphAI SDK.
+
+Job-style endpoints (smartscraper, searchscraper, markdownify, scrape, crawl,
+agentic scraper and schema generation) answer a submission with an ID that
+is needed to fetch the result later. A worker that restarts mid-batch loses
+those IDs and has to submit, and pay for, the same jobs again. With a
+:class:`CheckpointStore` attached, the client:
+
+- records every submission with its canonical payload, returned ID, status
+  and result location (the URL of its ``get_*`` endpoint)
+- answers a repeated submission of a checkpointed payload with the recorded
+  response while that job is unfinished; once the job reached a terminal
+  status (completed or failed) the payload is submitted again
+- updates the recorded status whenever the job's status endpoint is polled
+- re-attaches to unfinished jobs through ``resume()``
+
+The store is pluggable: a backend implements :meth:`CheckpointStore.load`,
+:meth:`~CheckpointStore.save`, :meth:`~CheckpointStore.update_status` and
+:meth:`~CheckpointStore.unfinished`. :class:`SQLiteCheckpointStore` is the
+default backend and can be shared between threads, processes and between a
+``Client`` and an ``AsyncClient``.
+
+Example:
+    >>> store = SQLiteCheckpointStore("jobs.db")
+    >>> client = Client.from_env(checkpoint_store=store)
+    >>> client.crawl(url="https://example.com", prompt="...", data_schema=schema)
+    >>> # after a restart, with the same store
+    >>> for item in client.resume():
+    ...     print(item.input, item.result["status"])
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from scrapegraph_py.utils.cache import cache_key
+from scrapegraph_py.utils.helpers import endpoint_family
+from scrapegraph_py.utils.poller import TERMINAL_STATUSES
+
+# Endpoint families of job endpoints and the service polling them
+JOB_SERVICES: Dict[str, str] = {
+    "smartscraper": "smartscraper",
+    "searchscraper": "searchscraper",
+    "markdownify": "markdownify",
+    "scrape": "scrape",
+    "crawl": "crawl",
+    "agentic-scrapper": "agenticscraper",
+    "generate_schema": "generate_schema",
+}
+
+# Response fields carrying the ID of a submitted job
+_ID_FIELDS = ("request_id", "crawl_id", "id")
+
+
+@dataclass
+class JobRecord:
+    """
+    A submitted job as recorded in a checkpoint store.
+
+    Attributes:
+        key (str): Hash of the method, endpoint and canonical request payload
+        service (str): Service that created the job, e.g. "crawl"
+        request_id (str): ID returned by the submission
+        payload (Any): JSON body of the submission
+        status (str): Latest known status of the job
+        location (str): URL of the status endpoint holding the result
+        response (Any): Response of the submission
+        created_at (float): Submission time (seconds since the epoch)
+        updated_at (float): Time of the latest status update
+    """
+
+    key: str
+    service: str
+    request_id: str
+    payload: Any
+    status: str
+    location: str
+    response: Any = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a terminal status."""
+        return self.status in TERMINAL_STATUSES
+
+
+def job_id(result: Any) -> Optional[str]:
+    """Return the job ID of a submission response, if it has one."""
+    if not isinstance(result, dict):
+        return None
+    for field in _ID_FIELDS:
+        if result.get(field):
+            return str(result[field])
+    return None
+
+
+def _status(result: Any, default: str) -> str:
+    if not isinstance(result, dict) or not result.get("status"):
+        return default
+    return str(result["status"]).lower()
+
+
+class CheckpointStore(ABC):
+    """
+    Base class of checkpoint stores.
+
+    Backends implement the storage primitives :meth:`load`, :meth:`save`,
+    :meth:`update_status` and :meth:`unfinished`; the clients only call
+    :meth:`lookup`, :meth:`record` and :meth:`unfinished`.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[JobRecord]:
+        """Return the record stored under ``key``, if any."""
+
+    @abstractmethod
+    def save(self, record: JobRecord) -> None:
+        """Insert or replace a record."""
+
+    @abstractmethod
+    def update_status(self, request_id: str, status: str) -> None:
+        """Set the status of the job with this ID; unknown IDs are ignored."""
+
+    @abstractmethod
+    def unfinished(self) -> List[JobRecord]:
+        """Return the jobs that have not reached a terminal status, oldest first."""
+
+    def close(self) -> None:
+        """Release the resources held by the store."""
+
+    def lookup(
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Check the store for a request about to be sent.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            kwargs: Keyword arguments of the request (``json`` and ``params``
+                    are part of the key)
+
+        Returns:
+            ``(key, response)``. ``key`` is None unless the request submits
+            a job; ``response`` is the recorded submission response when the
+            same payload was already submitted and the job is unfinished
+        """
+        if method.upper() != "POST" or endpoint_family(url) not in JOB_SERVICES:
+            return None, None
+        key = cache_key(method, url, kwargs.get("json"), kwargs.get("params"))
+        record = self.load(key)
+        if record is None or record.finished:
+            return key, None
+        return key, record.response
+
+    def record(
+        self,
+        key: Optional[str],
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        result: Any,
+    ) -> None:
+        """
+        Record the response of a request.
+
+        Submissions previously passed to :meth:`lookup` are saved with their
+        ID; responses of job status endpoints update the recorded status.
+        """
+        family = endpoint_family(url)
+        if family not in JOB_SERVICES:
+            return
+        if key is not None:
+            request_id = job_id(result)
+            if request_id is None:
+                return
+            now = time.time()
+            self.save(
+                JobRecord(
+                    key=key,
+                    service=JOB_SERVICES[family],
+                    request_id=request_id,
+                    payload=kwargs.get("json"),
+                    status=_status(result, "queued"),
+                    location=f"{url.rstrip('/')}/{request_id}",
+                    response=result,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        elif method.upper() == "GET":
+            request_id = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+            # Responses without a status field describe a finished job
+            self.update_status(request_id, _status(result, "completed"))
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store backed by a SQLite database file.
+
+    Every write is committed immediately, so a record survives a crash right
+    after the submission returned. The database uses write-ahead logging,
+    which lets several worker processes share one file.
+
+    Attributes:
+        path (str): Path of the database file (":memory:" for a
+            non-durable in-memory store)
+    """
+
+    def __init__(self, path: str = "scrapegraph_checkpoints.db"):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " key TEXT PRIMARY KEY, service TEXT NOT NULL, request_id TEXT NOT NULL,"
+                " payload TEXT, status TEXT NOT NULL, location TEXT NOT NULL, response TEXT,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_request_id ON jobs (request_id)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def load(self, key: str) -> Optional[JobRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else self._to_record(row)
+
+    def save(self, record: JobRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.key,
+                    record.service,
+                    record.request_id,
+                    json.dumps(record.payload, default=str),
+                    record.status,
+                    record.location,
+                    json.dumps(record.response, default=str),
+                    record.created_at,
+                    record.updated_at,
+                ),
+            )
+
+    def update_status(self, request_id: str, status: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE request_id = ?",
+                (status, time.time(), request_id),
+            )
+
+    def unfinished(self) -> List[JobRecord]:
+        placeholders = ", ".join("?" * len(TERMINAL_STATUSES))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM jobs WHERE status NOT IN ({placeholders}) ORDER BY created_at",
+                sorted(TERMINAL_STATUSES),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_record(row: Tuple[Any, ...]) -> JobRecord:
+        (
+            key,
+            service,
+            request_id,
+            payload,
+            status,
+            location,
+            response,
+            created,
+            updated,
+        ) = row
+        return JobRecord(
+            key=key,
+            service=service,
+            request_id=request_id,
+            payload=json.loads(payload),
+            status=status,
+            location=location,
+            response=json.loads(response),
+            created_at=created,
+            updated_at=updated,
+        )
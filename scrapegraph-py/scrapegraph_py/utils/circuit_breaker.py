@@ -0,0 +1,228 @@
+"""
+Per-endpoint-family circuit breaker for the ScrapeGraphAI SDK.
+
+When the backend degrades, every ``smartscraper`` or ``crawl`` call would
+otherwise wait out its timeout and retries. A :class:`CircuitBreaker` watches
+the outcome of recent calls per endpoint family and opens the family's
+circuit once too many of them fail or are too slow. While open, requests
+fail immediately with :class:`~scrapegraph_py.exceptions.CircuitOpenError`.
+
+After ``open_duration`` the next request runs the client's ``healthz()``
+check as a half-open probe. If the service reports healthy the circuit
+closes and traffic flows again; otherwise it stays open for another
+``open_duration``. Only one caller probes at a time; the others keep failing
+fast meanwhile.
+
+Server errors (5xx), connection failures and timeouts count as failures.
+Client errors (4xx) do not: the service answered, it just rejected the
+request. A breaker is thread-safe and can be shared between a ``Client`` and
+an ``AsyncClient``.
+
+Example:
+    >>> breaker = CircuitBreaker(failure_rate=0.5, min_requests=10, slow_call_duration=20)
+    >>> client = Client.from_env(circuit_breaker=breaker)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from scrapegraph_py.exceptions import CircuitOpenError
+from scrapegraph_py.utils.helpers import endpoint_family
+from scrapegraph_py.utils.retry import classify_error
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Families never guarded, so the health probe itself can always get through
+UNGUARDED_FAMILIES = frozenset({"healthz"})
+
+HEALTHY_STATUSES = frozenset({"healthy", "ok", "up", "pass"})
+
+
+def is_failure(error: Optional[BaseException]) -> bool:
+    """
+    Decide whether a call outcome indicates a degraded backend.
+
+    Args:
+        error: Exception raised by the call, or None if it succeeded
+
+    Returns:
+        True for server errors, connection failures and timeouts
+    """
+    if error is None or isinstance(error, CircuitOpenError):
+        return False
+    category = classify_error(error)
+    if category == "status":
+        return error.status_code is None or error.status_code >= 500
+    return category is not None
+
+
+def is_healthy(result: Any) -> bool:
+    """Interpret a ``healthz()`` response."""
+    if not isinstance(result, dict) or "status" not in result:
+        return True
+    return str(result["status"]).lower() in HEALTHY_STATUSES
+
+
+class _Circuit:
+    __slots__ = ("state", "calls", "opened_at", "probing_since")
+
+    def __init__(self):
+        self.state = CLOSED
+        # (timestamp, counts as failure)
+        self.calls: Deque[Tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.probing_since: Optional[float] = None
+
+
+class CircuitBreaker:
+    """
+    Opens per endpoint family after a failure rate or latency threshold.
+
+    Attributes:
+        failure_rate (float): Share of failed (or slow) calls in the window
+            that opens the circuit
+        min_requests (int): Calls needed in the window before the rate is
+            evaluated
+        window (float): Length of the sliding window in seconds
+        slow_call_duration (Optional[float]): Calls taking longer than this
+            many seconds count as failures (None = latency is ignored)
+        open_duration (float): Seconds to stay open before probing health
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 60.0,
+        slow_call_duration: Optional[float] = None,
+        open_duration: float = 30.0,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min_requests < 1:
+            raise ValueError("min_requests must be at least 1")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.slow_call_duration = slow_call_duration
+        self.open_duration = open_duration
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+        return circuit
+
+    def state(self, url: str) -> str:
+        """Return the state of the circuit guarding ``url``."""
+        with self._lock:
+            return self._circuit(endpoint_family(url)).state
+
+    def check(self, url: str) -> bool:
+        """
+        Admit or refuse a request before it is sent.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if the caller must run the health probe and report it with
+            :meth:`probe_finished` before sending the request
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or another caller is
+                probing it
+        """
+        family = endpoint_family(url)
+        if family in UNGUARDED_FAMILIES:
+            return False
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.state == CLOSED:
+                return False
+            now = time.monotonic()
+            if (
+                circuit.state == HALF_OPEN
+                and now - circuit.probing_since < self.open_duration
+            ):
+                raise CircuitOpenError(family, self.open_duration)
+            remaining = circuit.opened_at + self.open_duration - now
+            if circuit.state == OPEN and remaining > 0:
+                raise CircuitOpenError(family, remaining)
+            circuit.state = HALF_OPEN
+            circuit.probing_since = now
+            return True
+
+    def probe_finished(self, url: str, healthy: bool) -> None:
+        """
+        Close or re-open a half-open circuit after its health probe.
+
+        Raises:
+            CircuitOpenError: If the probe failed
+        """
+        family = endpoint_family(url)
+        with self._lock:
+            circuit = self._circuit(family)
+            circuit.probing_since = None
+            circuit.calls.clear()
+            if healthy:
+                circuit.state = CLOSED
+                return
+            circuit.state = OPEN
+            circuit.opened_at = time.monotonic()
+        raise CircuitOpenError(family, self.open_duration)
+
+    def record(self, url: str, error: Optional[BaseException], elapsed: float) -> None:
+        """
+        Record the outcome of a request that was sent.
+
+        Args:
+            url: Request URL
+            error: Exception raised by the request, or None on success
+            elapsed: Duration of the request in seconds
+        """
+        family = endpoint_family(url)
+        if family in UNGUARDED_FAMILIES:
+            return
+        failed = is_failure(error) or (
+            self.slow_call_duration is not None and elapsed > self.slow_call_duration
+        )
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.state != CLOSED:
+                return
+            calls = circuit.calls
+            calls.append((now, failed))
+            while calls and calls[0][0] < now - self.window:
+                calls.popleft()
+            if not failed or len(calls) < self.min_requests:
+                return
+            failures = sum(1 for _, call_failed in calls if call_failed)
+            if failures / len(calls) >= self.failure_rate:
+                circuit.state = OPEN
+                circuit.opened_at = now
+                calls.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the state of every endpoint family seen so far.
+
+        Returns:
+            Mapping of family to its state, calls and failures in the window
+        """
+        with self._lock:
+            return {
+                family: {
+                    "state": circuit.state,
+                    "calls": len(circuit.calls),
+                    "failures": sum(1 for _, failed in circuit.calls if failed),
+                }
+                for family, circuit in self._circuits.items()
+            }
@@ -0,0 +1,260 @@
+"""
+Pluggable JSON codecs for request bodies and responses.
+
+Encoding a 2 MB ``website_html`` payload or decoding a large crawl result
+with the standard ``json`` module is a significant share of the CPU spent
+per call. Both clients therefore encode request bodies to bytes themselves
+and decode responses straight from bytes through a codec:
+
+- ``orjson`` when installed (``pip install scrapegraph-py[fastjson]``)
+- ``msgspec`` when installed
+- the standard library ``json`` module otherwise
+
+Fast codecs fall back to the standard library for payloads they cannot
+encode (for example integers wider than 64 bits), so switching codecs never
+changes which payloads are accepted.
+
+Values that are sent unchanged with many requests, such as the JSON schema of
+an ``output_schema`` model, can be wrapped in :class:`CachedJSON` so they are
+encoded once per codec instead of once per request. Request payloads get a
+:class:`CachedJSONCopy` of the shared value, which callers may change freely:
+its cached bytes are only reused while it still equals its source.
+
+Example:
+    >>> codec = get_codec()
+    >>> codec.name
+    'orjson'
+    >>> codec.loads(codec.dumps({"a": 1}))
+    {'a': 1}
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+
+class JSONCodec:
+    """
+    Standard library codec, and the interface of every codec.
+
+    Attributes:
+        name (str): Name used to select the codec
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode JSON from bytes or text.
+
+        Raises:
+            ValueError: If ``data`` is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+class CachedJSON(dict):
+    """
+    Dict that remembers its encoded form.
+
+    When a request body holds a CachedJSON at its top level,
+    :func:`encode_json_body` splices in bytes encoded the first time the
+    value was sent, instead of encoding it again. Instances are shared
+    between requests and must be treated as read-only.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, codec: "JSONCodec") -> bytes:
+        """Return the value encoded with ``codec``, encoding it on first use."""
+        data = self._encoded.get(codec.name)
+        if data is None:
+            data = self._encoded[codec.name] = codec.dumps(dict(self))
+        return data
+
+
+class CachedJSONCopy(dict):
+    """
+    Private, mutable copy of a CachedJSON value.
+
+    :func:`dumps_payload` splices in the bytes of ``source`` only while the
+    copy still equals it, so changing the copy changes what is sent and
+    never affects ``source`` or other copies.
+
+    Attributes:
+        source (CachedJSON): The shared value this is a copy of
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: CachedJSON):
+        # Decoding the cached bytes is a fast deep copy of a JSON value
+        super().__init__(json.loads(source.encoded(_STDLIB_CODEC)))
+        self.source = source
+
+
+def _cached_bytes(value: Any, codec: JSONCodec) -> Optional[bytes]:
+    """Cached encoding of a payload value, if it has an up-to-date one."""
+    if isinstance(value, CachedJSON):
+        return value.encoded(codec)
+    if isinstance(value, CachedJSONCopy) and value == value.source:
+        return value.source.encoded(codec)
+    return None
+
+
+def dumps_payload(payload: Any, codec: JSONCodec) -> bytes:
+    """
+    Encode a request payload, reusing the bytes of top-level CachedJSON values
+    and of unchanged CachedJSONCopy values.
+
+    Args:
+        payload: Request payload
+        codec: Codec used to encode it
+
+    Returns:
+        Encoded payload
+    """
+    if not isinstance(payload, dict):
+        return codec.dumps(payload)
+    cached = {}
+    for key, value in payload.items():
+        data = _cached_bytes(value, codec)
+        if data is not None:
+            cached[key] = data
+    if not cached:
+        return codec.dumps(payload)
+    rest = {key: value for key, value in payload.items() if key not in cached}
+    members = b",".join(codec.dumps(key) + b":" + data for key, data in cached.items())
+    body = codec.dumps(rest)
+    return body[:-1] + (b"," if rest else b"") + members + b"}"
+
+
+# Codecs in order of preference
+CODECS = {
+    "orjson": (OrjsonCodec, ORJSON_AVAILABLE),
+    "msgspec": (MsgspecCodec, MSGSPEC_AVAILABLE),
+    "json": (JSONCodec, True),
+}
+
+_default_codec: Optional[JSONCodec] = None
+_STDLIB_CODEC = JSONCodec()
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec.
+
+    Args:
+        codec: Codec instance, codec name ("orjson", "msgspec", "json"), or
+               None for the fastest installed codec
+
+    Returns:
+        The codec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    global _default_codec
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        if _default_codec is None:
+            name = next(name for name, (_, available) in CODECS.items() if available)
+            _default_codec = CODECS[name][0]()
+        return _default_codec
+    if codec not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{codec}'. Expected one of: {', '.join(CODECS)}"
+        )
+    codec_class, available = CODECS[codec]
+    if not available:
+        raise ImportError(
+            f"{codec} is not installed. Install it with: pip install {codec}"
+        )
+    return codec_class()
+
+
+def encode_json_body(kwargs: Dict[str, Any], codec: JSONCodec) -> Dict[str, Any]:
+    """
+    Replace a ``json=`` request argument by pre-encoded ``data=`` bytes.
+
+    Args:
+        kwargs: Keyword arguments of the request
+        codec: Codec used to encode the body
+
+    Returns:
+        New keyword arguments; ``kwargs`` is left untouched
+    """
+    if "json" not in kwargs:
+        return kwargs
+    kwargs = dict(kwargs)
+    payload = kwargs.pop("json")
+    if payload is not None:
+        kwargs["data"] = dumps_payload(payload, codec)
+        headers = dict(kwargs.get("headers") or {})
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+    return kwargs
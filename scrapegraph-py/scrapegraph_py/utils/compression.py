@@ -0,0 +1,150 @@
+"""
+HTTP compression for request bodies and responses.
+
+Requests that upload a page (``smartscraper`` with ``website_html`` or
+``website_markdown``) can carry megabytes of JSON, which compresses 5-10x.
+With ``request_compression`` set, both clients compress request bodies of at
+least ``compression_threshold`` bytes and send them with a matching
+``Content-Encoding`` header:
+
+- ``"gzip"`` uses the standard library and is understood by every server
+- ``"zstd"`` needs ``zstandard`` (``pip install scrapegraph-py[compression]``)
+  and compresses faster at a similar ratio
+
+Request compression is opt-in because the server has to accept compressed
+bodies. Response compression is negotiated: ``Accept-Encoding`` lists zstd and
+brotli first, but only when the HTTP library can decode them, so a client
+never receives an encoding it cannot read.
+
+Example:
+    >>> client = Client.from_env(request_compression="gzip", compression_threshold=32_768)
+"""
+
+import gzip
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+# Response encodings in order of preference, with their q-values
+_ACCEPT_PREFERENCE = (("zstd", 1.0), ("br", 0.9), ("gzip", 0.8), ("deflate", 0.5))
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output deterministic for identical bodies
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _zstd(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": _gzip,
+    "zstd": _zstd,
+}
+
+
+def get_compressor(algorithm: Optional[str]) -> Optional[Callable[[bytes], bytes]]:
+    """
+    Resolve a request compression algorithm.
+
+    Args:
+        algorithm: "gzip", "zstd", or None to disable compression
+
+    Returns:
+        Function compressing a body, or None
+
+    Raises:
+        ValueError: If the algorithm is unknown
+        ImportError: If zstd is requested but zstandard is not installed
+    """
+    if algorithm is None:
+        return None
+    if algorithm not in COMPRESSORS:
+        raise ValueError(
+            f"Unknown compression '{algorithm}'. Expected one of: {', '.join(COMPRESSORS)}"
+        )
+    if algorithm == "zstd" and not ZSTD_AVAILABLE:
+        raise ImportError(
+            "zstandard is not installed. Install it with: pip install zstandard"
+        )
+    return COMPRESSORS[algorithm]
+
+
+def compress_body(
+    kwargs: Dict[str, Any], algorithm: Optional[str], threshold: int
+) -> Dict[str, Any]:
+    """
+    Compress a pre-encoded ``data=`` request body above a size threshold.
+
+    Args:
+        kwargs: Keyword arguments of the request, after ``encode_json_body``
+        algorithm: "gzip", "zstd", or None to leave the body untouched
+        threshold: Minimum body size in bytes worth compressing
+
+    Returns:
+        New keyword arguments; ``kwargs`` is left untouched
+    """
+    data = kwargs.get("data")
+    if algorithm is None or not isinstance(data, bytes) or len(data) < threshold:
+        return kwargs
+    compressed = COMPRESSORS[algorithm](data)
+    if len(compressed) >= len(data):
+        return kwargs
+    kwargs = dict(kwargs)
+    kwargs["data"] = compressed
+    headers = dict(kwargs.get("headers") or {})
+    headers["Content-Encoding"] = algorithm
+    kwargs["headers"] = headers
+    return kwargs
+
+
+def accept_encoding(brotli: bool, zstd: bool) -> str:
+    """
+    Build an ``Accept-Encoding`` header value.
+
+    Args:
+        brotli: Whether brotli responses can be decoded
+        zstd: Whether zstd responses can be decoded
+
+    Returns:
+        Header value listing the decodable encodings by preference
+    """
+    supported = {"gzip", "deflate"}
+    if brotli:
+        supported.add("br")
+    if zstd:
+        supported.add("zstd")
+    return ", ".join(
+        name if q == 1.0 else f"{name};q={q}"
+        for name, q in _ACCEPT_PREFERENCE
+        if name in supported
+    )
+
+
+def sync_accept_encoding() -> str:
+    """``Accept-Encoding`` for the requests/urllib3 transport of ``Client``."""
+    import urllib3.response
+
+    return accept_encoding(
+        brotli=urllib3.response.brotli is not None,
+        zstd=getattr(urllib3.response, "HAS_ZSTD", False),
+    )
+
+
+def async_accept_encoding() -> str:
+    """``Accept-Encoding`` for the aiohttp transport of ``AsyncClient``."""
+    from aiohttp import compression_utils
+
+    return accept_encoding(
+        brotli=getattr(compression_utils, "HAS_BROTLI", False),
+        zstd=getattr(compression_utils, "HAS_ZSTD", False),
+    )
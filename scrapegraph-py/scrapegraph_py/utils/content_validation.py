@@ -0,0 +1,141 @@
+"""
+Validation of uploaded page content (``website_html`` / ``website_markdown``).
+
+Uploads can be up to 2 MB, so validation is written to avoid work that grows
+with the document:
+
+- :func:`utf8_size_exceeds` measures the UTF-8 size chunk by chunk and stops
+  as soon as the limit is crossed, without encoding the whole string
+- :func:`has_html_tag` looks for the first start tag and returns immediately
+  instead of building a DOM
+
+HTML can be checked in three modes:
+
+- ``"fast"`` (default): size check plus tag sniff
+- ``"lxml"``: additionally parses the document with lxml, which is much faster
+  than BeautifulSoup (``pip install lxml``)
+- ``"strict"``: parses the document with BeautifulSoup's ``html.parser`` and
+  requires at least one element, as earlier releases did
+
+The fast sniff accepts any document containing something shaped like a start
+tag (``<`` followed by a letter). Tags that only appear inside comments are
+therefore accepted by ``"fast"`` but rejected by ``"strict"``.
+"""
+
+import re
+from importlib.util import find_spec
+
+# The parsers are only imported by the modes that use them
+HAS_BS4 = find_spec("bs4") is not None
+HAS_LXML = find_spec("lxml") is not None
+
+MAX_CONTENT_BYTES = 2 * 1024 * 1024
+HTML_VALIDATION_MODES = ("fast", "lxml", "strict")
+
+# Characters encoded per step when measuring the UTF-8 size
+_SIZE_CHUNK = 64 * 1024
+
+# html.parser treats "<" followed by a letter as the start of a tag
+_START_TAG = re.compile(r"<[a-zA-Z]")
+
+
+def utf8_size_exceeds(text: str, limit: int = MAX_CONTENT_BYTES) -> bool:
+    """
+    Tell whether ``text`` encodes to more than ``limit`` UTF-8 bytes.
+
+    A character encodes to 1-4 bytes, so most documents are decided from
+    their length alone. Otherwise the text is measured in chunks, ASCII
+    chunks without encoding them, until the limit is crossed.
+
+    Args:
+        text: Text to measure
+        limit: Maximum size in bytes
+
+    Returns:
+        True if the encoded text is larger than ``limit``
+    """
+    if len(text) > limit:
+        return True
+    if len(text) * 4 <= limit:
+        return False
+    size = 0
+    for start in range(0, len(text), _SIZE_CHUNK):
+        chunk = text[start : start + _SIZE_CHUNK]
+        size += (
+            len(chunk)
+            if chunk.isascii()
+            else len(chunk.encode("utf-8", "surrogatepass"))
+        )
+        if size > limit:
+            return True
+    return False
+
+
+def has_html_tag(html: str) -> bool:
+    """Return True as soon as a start tag is found in ``html``."""
+    return _START_TAG.search(html) is not None
+
+
+def validate_html(html: str, mode: str = "fast") -> None:
+    """
+    Validate uploaded HTML.
+
+    Args:
+        html: HTML document
+        mode: "fast", "lxml" or "strict" (see module documentation)
+
+    Raises:
+        ValueError: If the document is too large or contains no HTML
+        ImportError: If the mode's parser is not installed
+    """
+    if mode not in HTML_VALIDATION_MODES:
+        raise ValueError(
+            f"Unknown HTML validation mode '{mode}'. "
+            f"Expected one of: {', '.join(HTML_VALIDATION_MODES)}"
+        )
+    if utf8_size_exceeds(html):
+        raise ValueError("Website HTML content exceeds maximum size of 2MB")
+
+    if mode == "strict":
+        if not HAS_BS4:
+            raise ImportError(
+                "beautifulsoup4 is required for HTML validation. "
+                "Install it with: pip install scrapegraph-py[html] or pip install beautifulsoup4"
+            )
+        from bs4 import BeautifulSoup
+
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+            if not soup.find():
+                raise ValueError("Invalid HTML - no parseable content found")
+        except Exception as e:
+            raise ValueError(f"Invalid HTML structure: {str(e)}")
+        return
+
+    if not has_html_tag(html):
+        raise ValueError("Invalid HTML - no parseable content found")
+    if mode == "lxml":
+        if not HAS_LXML:
+            raise ImportError(
+                "lxml is required for lxml HTML validation. Install it with: pip install lxml"
+            )
+        import lxml.html
+        from lxml.etree import ParserError
+
+        try:
+            lxml.html.document_fromstring(html)
+        except (ParserError, ValueError) as e:
+            raise ValueError(f"Invalid HTML structure: {str(e)}")
+
+
+def validate_markdown(markdown: str) -> None:
+    """
+    Validate uploaded Markdown.
+
+    Raises:
+        ValueError: If the document is empty or too large
+    """
+    if not markdown or markdown.isspace():
+        raise ValueError("Website markdown cannot be empty")
+    if utf8_size_exceeds(markdown):
+        raise ValueError("Website markdown content exceeds maximum size of 2MB")
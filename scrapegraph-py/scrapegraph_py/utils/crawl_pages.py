@@ -0,0 +1,137 @@
+"""
+Page-by-page delivery of crawl results while the crawl is still running.
+
+``iter_crawl_pages`` polls ``GET /crawl/{id}`` and yields every page once, as
+soon as it first shows up in a status response. The only state kept between
+polls is a cursor, the number of pages already emitted. The crawl reports
+its pages in discovery order and only ever appends to the list, so the next
+poll skips that many elements without decoding them and hands each new page
+out straight from the response stream.
+
+Example:
+    >>> async for page in client.iter_crawl_pages(job["crawl_id"]):
+    ...     print(page.url, len(page.markdown or ""))
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.poller import TERMINAL_STATUSES, PollSchedule
+
+# Arrays holding crawled pages and the top-level values read alongside them
+CRAWL_PAGE_KEYS = ("pages",)
+CRAWL_STATUS_KEYS = ("status", "error")
+
+FAILED_STATUSES = frozenset({"failed", "error", "cancelled"})
+
+# Per-page keys the API uses for data extracted in AI extraction mode
+_DATA_KEYS = ("data", "extracted_data", "llm_result")
+
+
+@dataclass
+class CrawlPage:
+    """
+    A single crawled page.
+
+    Attributes:
+        index (int): Position of the page in the crawl, starting at 0
+        url (Optional[str]): URL of the page
+        markdown (Optional[str]): Markdown content of the page, if any
+        data (Any): Data extracted from the page in AI extraction mode, if any
+        metadata (Dict[str, Any]): Page metadata reported by the API
+        raw (Any): The page exactly as returned by the API
+    """
+
+    index: int
+    url: Optional[str] = None
+    markdown: Optional[str] = None
+    data: Any = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    raw: Any = None
+
+    @classmethod
+    def from_response(cls, index: int, page: Any) -> "CrawlPage":
+        """Build a CrawlPage from one element of the ``pages`` array."""
+        if not isinstance(page, dict):
+            return cls(
+                index=index, url=page if isinstance(page, str) else None, raw=page
+            )
+        data = next(
+            (page[key] for key in _DATA_KEYS if page.get(key) is not None), None
+        )
+        return cls(
+            index=index,
+            url=page.get("url"),
+            markdown=page.get("markdown"),
+            data=data,
+            metadata=page.get("metadata") or {},
+            raw=page,
+        )
+
+
+class CrawlPageCursor:
+    """
+    Polling state of one ``iter_crawl_pages`` call.
+
+    Fed the ``(key, value)`` pairs of each status response, it turns new
+    pages into CrawlPage objects and decides when and whether to poll again.
+
+    Attributes:
+        crawl_id (str): The crawl being followed
+        cursor (int): Number of pages emitted so far
+        status (Optional[str]): Crawl status from the latest poll
+    """
+
+    def __init__(self, crawl_id: str, schedule: PollSchedule, cursor: int = 0):
+        if cursor < 0:
+            raise ValueError("cursor must be >= 0")
+        self.crawl_id = crawl_id
+        self.cursor = cursor
+        self.status: Optional[str] = None
+        self._schedule = schedule
+        self._deadline = schedule.deadline()
+        self._interval = schedule.initial_interval
+        self._error: Optional[str] = None
+        self._emitted = 0
+
+    def feed(self, key: str, value: Any) -> Optional[CrawlPage]:
+        """Consume one streamed item; return a page if it is a new one."""
+        if key == "status":
+            self.status = str(value).lower()
+        elif key == "error":
+            self._error = value
+        elif key in CRAWL_PAGE_KEYS:
+            page = CrawlPage.from_response(self.cursor, value)
+            self.cursor += 1
+            self._emitted += 1
+            return page
+        return None
+
+    def next_delay(self) -> Optional[float]:
+        """
+        Finish a poll and return the delay before the next one.
+
+        Returns:
+            Seconds to sleep, or None once the crawl has finished
+
+        Raises:
+            APIError: If the crawl failed or was cancelled
+            TimeoutError: If the crawl is still running at the deadline
+        """
+        status, self.status = self.status, None
+        progressed, self._emitted = self._emitted > 0, 0
+        if status is None or status in TERMINAL_STATUSES:
+            if status in FAILED_STATUSES:
+                raise APIError(self._error or f"Crawl {self.crawl_id} {status}")
+            return None
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise TimeoutError(
+                f"Crawl {self.crawl_id} still {status} after {self._schedule.timeout}s"
+            )
+        self._interval = self._schedule.next_interval(self._interval, progressed)
+        delay = self._schedule.delay(self._interval)
+        if self._deadline is not None:
+            delay = min(delay, max(0.0, self._deadline - time.monotonic()))
+        return delay
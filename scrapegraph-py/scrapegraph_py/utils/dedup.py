@@ -0,0 +1,374 @@
+"""
+Near-duplicate suppression for crawled and converted pages.
+
+Crawls and sitemap fan-outs return many pages whose content is almost the
+same: pagination variants, URLs differing only in tracking parameters, print
+views. :class:`NearDuplicateFilter` fingerprints the content of each page and
+flags (or drops) the pages that are within a few bits of a page seen before,
+so they can be skipped before extraction, storage or indexing:
+
+- the fingerprint is a 64-bit SimHash over lower-cased three-word shingles,
+  so small edits move it by a few bits while unrelated pages differ in
+  about half of them
+- fingerprints are split into bands (six of 10-11 bits by default) and
+  indexed by band; two fingerprints fewer bits apart than there are bands
+  agree on at least one band, so a lookup only compares against the pages
+  sharing a band and still finds every near-duplicate
+- the index lives in a :class:`FingerprintStore`; with
+  :class:`SQLiteFingerprintStore` it is kept on disk, so a page is also
+  recognised when it was seen in an earlier run
+
+It works on ``CrawlPage`` objects from ``iter_crawl_pages``, page dicts of a
+``get_crawl`` response, bulk and fan-out ``BulkResult`` objects (e.g. of
+``markdownify``) and plain strings.
+
+Example:
+    >>> dedup = NearDuplicateFilter(SQLiteFingerprintStore("fingerprints.db"))
+    >>> for page in dedup.unique(client.iter_crawl_pages(job["crawl_id"])):
+    ...     store(page.url, page.markdown)
+    >>> for item, match in dedup.scan(client.sitemap_fanout("https://example.com")):
+    ...     if match is not None:
+    ...         print(item.input, "duplicates", match.duplicate_of)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from scrapegraph_py.utils.bulk import BulkResult
+from scrapegraph_py.utils.crawl_pages import CrawlPage
+
+FINGERPRINT_BITS = 64
+# An index with n bands finds every fingerprint up to n - 1 bits away
+# (pigeonhole); more bands tolerate larger edits but match more candidates
+DEFAULT_BANDS = 6
+
+# Response keys holding the content of a page, in order of preference
+_TEXT_KEYS = ("markdown", "result", "content", "markdown_content")
+_URL_KEYS = ("url", "website_url")
+_TOKEN = re.compile(r"\w+")
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    Return the 64-bit SimHash of a text.
+
+    Every run of ``shingle_size`` consecutive lower-cased words is hashed;
+    bit ``i`` of the fingerprint is set when it is set in most shingle
+    hashes. Texts sharing most of their shingles get fingerprints a few
+    bits apart.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    shingles = [
+        " ".join(tokens[i : i + shingle_size])
+        for i in range(max(1, len(tokens) - shingle_size + 1))
+    ]
+    binary = {
+        shingle: format(
+            int.from_bytes(blake2b(shingle.encode(), digest_size=8).digest(), "big"),
+            "064b",
+        )
+        for shingle in set(shingles)
+    }
+    # Bit column i of all shingle hashes is every 64th character from i
+    bits = "".join(map(binary.__getitem__, shingles))
+    majority = len(shingles) / 2
+    return int(
+        "".join(
+            "1" if bits[i::FINGERPRINT_BITS].count("1") > majority else "0"
+            for i in range(FINGERPRINT_BITS)
+        ),
+        2,
+    )
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of bits in which two fingerprints differ."""
+    return bin(a ^ b).count("1")
+
+
+def split_bands(fingerprint: int, count: int = DEFAULT_BANDS) -> Tuple[int, ...]:
+    """Split a fingerprint into ``count`` bands of (nearly) equal width."""
+    edges = [i * FINGERPRINT_BITS // count for i in range(count + 1)]
+    return tuple(
+        (fingerprint >> low) & ((1 << (high - low)) - 1)
+        for low, high in zip(edges, edges[1:])
+    )
+
+
+def page_text(item: Any) -> Optional[str]:
+    """Return the content of a page, conversion result or string, if any."""
+    if isinstance(item, BulkResult):
+        item = item.result
+    if isinstance(item, CrawlPage):
+        if item.markdown:
+            return item.markdown
+        return (
+            None
+            if item.data is None
+            else json.dumps(item.data, sort_keys=True, default=str)
+        )
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        return next(
+            (item[key] for key in _TEXT_KEYS if isinstance(item.get(key), str)), None
+        )
+    return None
+
+
+def page_key(item: Any) -> Optional[str]:
+    """Return the URL identifying a page or conversion result, if known."""
+    if isinstance(item, BulkResult):
+        if isinstance(item.input, str):
+            return item.input
+        return page_key(item.input) or page_key(item.result)
+    if isinstance(item, CrawlPage):
+        return item.url
+    if isinstance(item, dict):
+        return next((str(item[key]) for key in _URL_KEYS if item.get(key)), None)
+    return None
+
+
+@dataclass
+class DuplicateMatch:
+    """
+    A page found to be a near-duplicate of an indexed one.
+
+    Attributes:
+        key (str): URL (or fingerprint, when the URL is unknown) of the page
+        duplicate_of (str): Key of the indexed page it duplicates; equal to
+            ``key`` when the same page was indexed before, e.g. in an
+            earlier run
+        distance (int): Bits in which the two fingerprints differ
+    """
+
+    key: str
+    duplicate_of: str
+    distance: int
+
+
+class FingerprintStore(ABC):
+    """
+    Base class of fingerprint indexes.
+
+    Backends implement :meth:`add`, :meth:`candidates` and ``__len__``;
+    :class:`NearDuplicateFilter` does the fingerprinting and comparison.
+
+    Attributes:
+        bands (int): Number of bands fingerprints are indexed under
+    """
+
+    bands: int = DEFAULT_BANDS
+
+    @abstractmethod
+    def add(self, key: str, fingerprint: int) -> None:
+        """Index a fingerprint under ``key``, replacing any earlier one."""
+
+    @abstractmethod
+    def candidates(self, fingerprint: int) -> List[Tuple[str, int]]:
+        """Return ``(key, fingerprint)`` of the entries sharing a band, oldest first."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of indexed fingerprints."""
+
+    def close(self) -> None:
+        """Release the resources held by the store."""
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """
+    Fingerprint index backed by a SQLite database file.
+
+    Each band is a separate indexed column, so a lookup is a single query
+    reading only the entries that share a band with the fingerprint. The
+    band count is recorded in the database, which can only be reopened with
+    the same count.
+
+    Attributes:
+        path (str): Path of the database file (":memory:" for an index that
+            only lives as long as the store)
+        bands (int): Number of bands fingerprints are indexed under
+
+    Raises:
+        ValueError: If the database was created with another band count
+    """
+
+    def __init__(
+        self, path: str = "scrapegraph_fingerprints.db", bands: int = DEFAULT_BANDS
+    ):
+        if not 1 <= bands <= FINGERPRINT_BITS:
+            raise ValueError(f"bands must be between 1 and {FINGERPRINT_BITS}")
+        self.path = str(path)
+        self.bands = bands
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        columns = ", ".join(f"band{i} INTEGER NOT NULL" for i in range(bands))
+        with self._lock:
+            created = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if created and created != bands:
+                self._conn.close()
+                raise ValueError(
+                    f"{self.path} was created with {created} bands, not {bands}"
+                )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                f" key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, {columns},"
+                " created_at REAL NOT NULL)"
+            )
+            for i in range(bands):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS fingerprints_band{i} ON fingerprints (band{i})"
+                )
+            self._conn.execute(f"PRAGMA user_version = {bands}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def add(self, key: str, fingerprint: int) -> None:
+        placeholders = ", ".join("?" * (self.bands + 3))
+        row = (
+            key,
+            format(fingerprint, "016x"),
+            *split_bands(fingerprint, self.bands),
+            time.time(),
+        )
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO fingerprints VALUES ({placeholders})", row
+            )
+
+    def candidates(self, fingerprint: int) -> List[Tuple[str, int]]:
+        where = " OR ".join(f"band{i} = ?" for i in range(self.bands))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, fingerprint FROM fingerprints WHERE {where} ORDER BY created_at",
+                split_bands(fingerprint, self.bands),
+            ).fetchall()
+        return [(key, int(value, 16)) for key, value in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class NearDuplicateFilter:
+    """
+    Flags pages whose content nearly matches a page indexed before.
+
+    Every page that is not a duplicate is added to the index, so the first
+    page of a group of near-duplicates is kept and the others are flagged.
+    Items without content (e.g. failed BulkResults) are passed through and
+    never indexed.
+
+    Attributes:
+        store (FingerprintStore): Index of the fingerprints seen so far
+        max_distance (int): Largest fingerprint distance, in bits, that
+            counts as a near-duplicate (default and upper bound: one less
+            than the bands of the store). Unrelated pages are some 30 bits
+            apart; pages of a few hundred words or less scatter more under
+            small edits than long ones
+        shingle_size (int): Number of words per shingle
+        checked (int): Pages fingerprinted by this filter
+        duplicates (int): Pages flagged as near-duplicates by this filter
+    """
+
+    def __init__(
+        self,
+        store: Optional[FingerprintStore] = None,
+        max_distance: Optional[int] = None,
+        shingle_size: int = 3,
+    ):
+        store = store if store is not None else SQLiteFingerprintStore(":memory:")
+        if max_distance is None:
+            max_distance = store.bands - 1
+        if not 0 <= max_distance < store.bands:
+            raise ValueError(f"max_distance must be between 0 and {store.bands - 1}")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+        self.store = store
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self.checked = 0
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def check(self, item: Any, key: Optional[str] = None) -> Optional[DuplicateMatch]:
+        """
+        Check one page and index it unless it is a near-duplicate.
+
+        Args:
+            item: CrawlPage, page or response dict, BulkResult or string
+            key: Key to index the page under (default: its URL, or its
+                 fingerprint when the URL is unknown)
+
+        Returns:
+            DuplicateMatch if the page nearly matches an indexed page,
+            None otherwise (including items without content)
+        """
+        text = page_text(item)
+        if not text or not _TOKEN.search(text):
+            return None
+        fingerprint = simhash(text, self.shingle_size)
+        key = key or page_key(item) or format(fingerprint, "016x")
+        with self._lock:
+            self.checked += 1
+            best = None
+            for other, other_fingerprint in self.store.candidates(fingerprint):
+                distance = hamming_distance(fingerprint, other_fingerprint)
+                if distance <= self.max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (other, distance)
+            if best is None:
+                self.store.add(key, fingerprint)
+                return None
+            self.duplicates += 1
+        return DuplicateMatch(key=key, duplicate_of=best[0], distance=best[1])
+
+    def scan(
+        self, items: Iterable[Any]
+    ) -> Iterator[Tuple[Any, Optional[DuplicateMatch]]]:
+        """Yield ``(item, match)`` for every item; ``match`` flags near-duplicates."""
+        for item in items:
+            yield item, self.check(item)
+
+    def unique(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Yield the items that are not near-duplicates, in order."""
+        for item in items:
+            if self.check(item) is None:
+                yield item
+
+    async def ascan(
+        self, items: AsyncIterable[Any]
+    ) -> AsyncIterator[Tuple[Any, Optional[DuplicateMatch]]]:
+        """Async counterpart of :meth:`scan`."""
+        async for item in items:
+            yield item, self.check(item)
+
+    async def aunique(self, items: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`unique`."""
+        async for item in items:
+            if self.check(item) is None:
+                yield item
@@ -0,0 +1,238 @@
+"""
+Sitemap-driven fan-out of per-URL extraction.
+
+``crawl`` traverses a site server-side and is capped at ``max_pages``. For
+large sites ``sitemap_fanout`` instead takes the site's sitemap, filters it
+locally with the crawl path pattern semantics (see :class:`PathFilter`) and
+runs ``markdownify``, ``smartscraper`` or any other per-URL endpoint over the
+selected URLs at high concurrency:
+
+- results are streamed as they finish; the result queue and the lazily
+  consumed inputs are bounded, so a slow consumer pauses the workers
+  instead of piling up responses (backpressure)
+- every domain gets its own concurrency cap, and URLs are interleaved
+  round-robin by domain so a capped domain does not hold up the others
+- a :class:`FanOutProgress` snapshot is passed to an optional callback once
+  the URLs are selected and after every result
+
+Example:
+    >>> async for item in client.sitemap_fanout(
+    ...     "https://example.com",
+    ...     include_paths=["/blog/**"],
+    ...     concurrency=50,
+    ...     on_progress=lambda p: print(f"{p.done}/{p.selected}"),
+    ... ):
+    ...     if item.ok:
+    ...         store(item.input, item.result)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+from urllib.parse import urlsplit
+
+from scrapegraph_py.utils.bulk import BulkResult, run_as_completed, run_in_threads
+
+ProgressCallback = Callable[["FanOutProgress"], None]
+
+
+@dataclass
+class FanOutProgress:
+    """
+    Progress of a sitemap fan-out.
+
+    Attributes:
+        discovered (int): URLs listed in the sitemap
+        selected (int): URLs kept by the path filters
+        completed (int): Extractions that succeeded
+        failed (int): Extractions that raised
+        in_flight (int): Extractions currently running
+        started_at (float): ``time.monotonic()`` when the fan-out started
+    """
+
+    discovered: int = 0
+    selected: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def done(self) -> int:
+        """URLs processed so far, successfully or not."""
+        return self.completed + self.failed
+
+    @property
+    def remaining(self) -> int:
+        """Selected URLs not processed yet."""
+        return self.selected - self.done
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the fan-out started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """URLs processed per second."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def _adjust(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+
+def domain_of(url: str) -> str:
+    """Return the lower-cased host of a URL."""
+    return (urlsplit(url).hostname or "").lower()
+
+
+def interleave_by_domain(urls: Iterable[str]) -> List[str]:
+    """
+    Order URLs round-robin across their domains.
+
+    The order within each domain is kept.
+    """
+    queues: "OrderedDict[str, Deque[str]]" = OrderedDict()
+    for url in urls:
+        queues.setdefault(domain_of(url), deque()).append(url)
+    ordered = []
+    while queues:
+        for domain in list(queues):
+            queue = queues[domain]
+            ordered.append(queue.popleft())
+            if not queue:
+                del queues[domain]
+    return ordered
+
+
+class _DomainSlots:
+    """Per-domain semaphores, created on first use."""
+
+    def __init__(self, limit: Optional[int], factory: Callable[[int], Any]):
+        if limit is not None and limit < 1:
+            raise ValueError("per_domain_concurrency must be at least 1")
+        self.limit = limit
+        self._factory = factory
+        self._slots: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Any:
+        domain = domain_of(url)
+        with self._lock:
+            slot = self._slots.get(domain)
+            if slot is None:
+                slot = self._slots[domain] = self._factory(self.limit)
+            return slot
+
+
+def _report(progress: FanOutProgress, on_progress: Optional[ProgressCallback]) -> None:
+    if on_progress is not None:
+        on_progress(progress)
+
+
+async def fan_out_async(
+    func: Callable[[str], Awaitable[Any]],
+    urls: List[str],
+    concurrency: int,
+    per_domain: Optional[int],
+    progress: FanOutProgress,
+    on_progress: Optional[ProgressCallback] = None,
+) -> AsyncIterator[BulkResult]:
+    """
+    Run ``func`` over URLs with global and per-domain concurrency caps.
+
+    Args:
+        func: Coroutine function called once per URL
+        urls: Selected URLs
+        concurrency: Maximum number of calls in flight
+        per_domain: Maximum number of calls in flight per domain (None = no cap)
+        progress: Progress record updated as calls start and finish
+        on_progress: Callback receiving ``progress`` after every result
+
+    Yields:
+        BulkResult per URL, in completion order
+    """
+    slots = _DomainSlots(per_domain, asyncio.Semaphore)
+
+    async def call(url: str) -> Any:
+        slot = None if slots.limit is None else slots.get(url)
+        if slot is not None:
+            await slot.acquire()
+        progress._adjust(in_flight=1)
+        try:
+            return await func(url)
+        finally:
+            progress._adjust(in_flight=-1)
+            if slot is not None:
+                slot.release()
+
+    _report(progress, on_progress)
+    async for item in run_as_completed(call, interleave_by_domain(urls), concurrency):
+        progress._adjust(**{"completed" if item.ok else "failed": 1})
+        _report(progress, on_progress)
+        yield item
+
+
+def fan_out_threads(
+    func: Callable[[str], Any],
+    urls: List[str],
+    executor: Any,
+    max_workers: int,
+    per_domain: Optional[int],
+    progress: FanOutProgress,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Iterator[BulkResult]:
+    """
+    Thread-pool counterpart of :func:`fan_out_async`.
+
+    Args:
+        func: Function called once per URL
+        urls: Selected URLs
+        executor: Executor running the calls
+        max_workers: Maximum number of calls in flight
+        per_domain: Maximum number of calls in flight per domain (None = no cap)
+        progress: Progress record updated as calls start and finish
+        on_progress: Callback receiving ``progress`` after every result
+
+    Yields:
+        BulkResult per URL, in completion order
+    """
+    slots = _DomainSlots(per_domain, threading.BoundedSemaphore)
+
+    def call(url: str) -> Any:
+        slot = None if slots.limit is None else slots.get(url)
+        if slot is not None:
+            slot.acquire()
+        progress._adjust(in_flight=1)
+        try:
+            return func(url)
+        finally:
+            progress._adjust(in_flight=-1)
+            if slot is not None:
+                slot.release()
+
+    _report(progress, on_progress)
+    for item in run_in_threads(call, interleave_by_domain(urls), executor, max_workers):
+        progress._adjust(**{"completed" if item.ok else "failed": 1})
+        _report(progress, on_progress)
+        yield item
@@ -0,0 +1,165 @@
+"""
+Hedged requests for idempotent status calls.
+
+Polling ``get_smartscraper``, ``get_crawl`` and the other status endpoints is
+cheap on the server, but a single slow connection or stalled worker pushes
+the latency of an individual call into seconds. A :class:`HedgePolicy` lets
+the clients send a second copy of such a GET once the first has been
+outstanding longer than a percentile of recent latencies for its endpoint
+family. Whichever copy answers first wins and the other is cancelled.
+
+Hedges are paid for from a :class:`~scrapegraph_py.utils.retry.RetryBudget`:
+every hedgeable request deposits ``ratio`` tokens and every hedge withdraws
+one, so with the default ratio hedging adds at most ~5% extra load, however
+slow the backend gets.
+
+No hedge is sent for a family until ``min_samples`` latencies have been seen,
+unless ``initial_delay`` is given.
+
+Example:
+    >>> policy = HedgePolicy(percentile=95, budget=RetryBudget(ratio=0.05))
+    >>> client = AsyncClient.from_env(hedge_policy=policy)
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Optional
+
+from scrapegraph_py.utils.helpers import endpoint_family
+from scrapegraph_py.utils.retry import RetryBudget
+
+# Families whose GET endpoints are idempotent status lookups
+DEFAULT_HEDGED_FAMILIES = frozenset(
+    {
+        "smartscraper",
+        "searchscraper",
+        "markdownify",
+        "scrape",
+        "crawl",
+        "agentic-scrapper",
+        "generate_schema",
+        "scheduled-jobs",
+    }
+)
+
+
+class HedgePolicy:
+    """
+    Decides when a status request gets a hedged second copy.
+
+    Thread-safe, so one policy can be shared by several clients.
+
+    Attributes:
+        percentile (float): Latency percentile (0-100) after which a hedge
+            is sent
+        min_samples (int): Latencies needed per family before hedging starts
+        window (int): Number of recent latencies kept per family
+        min_delay (float): Lower bound for the hedge delay in seconds
+        initial_delay (Optional[float]): Hedge delay used before
+            ``min_samples`` latencies have been seen (None = do not hedge)
+        budget (RetryBudget): Budget every hedge is withdrawn from
+        families (FrozenSet[str]): Endpoint families whose GETs are hedged
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.01,
+        initial_delay: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+        families: Iterable[str] = DEFAULT_HEDGED_FAMILIES,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError(
+                "window must be at least min_samples, which must be positive"
+            )
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.budget = (
+            budget if budget is not None else RetryBudget(ratio=0.05, reserve=5.0)
+        )
+        self.families: FrozenSet[str] = frozenset(families)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    def applies(self, method: str, url: str) -> bool:
+        """Return True if the request may be hedged."""
+        return method.upper() == "GET" and endpoint_family(url) in self.families
+
+    def start(self, url: str) -> Optional[float]:
+        """
+        Register a hedgeable request and return its hedge delay.
+
+        Returns:
+            Seconds to wait before hedging, or None if the request must not
+            be hedged yet
+        """
+        self.budget.deposit()
+        family = endpoint_family(url)
+        with self._lock:
+            self._requests += 1
+            latencies = self._latencies.get(family)
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        index = min(
+            len(ordered) - 1, math.ceil(self.percentile / 100 * len(ordered)) - 1
+        )
+        return max(ordered[index], self.min_delay)
+
+    def allow_hedge(self) -> bool:
+        """Withdraw one hedge from the budget; return False if exhausted."""
+        allowed = self.budget.withdraw()
+        with self._lock:
+            if allowed:
+                self._hedges += 1
+            else:
+                self._denied += 1
+        return allowed
+
+    def observe(self, url: str, latency: float, hedge_won: bool = False) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            url: Request URL
+            latency: Seconds until the first successful response
+            hedge_won: Whether the hedged copy answered first
+        """
+        family = endpoint_family(url)
+        with self._lock:
+            latencies = self._latencies.get(family)
+            if latencies is None:
+                latencies = self._latencies[family] = deque(maxlen=self.window)
+            latencies.append(latency)
+            if hedge_won:
+                self._hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report hedging activity.
+
+        Returns:
+            Dict with hedgeable requests, hedges sent, hedges that won,
+            hedges denied by the budget and the remaining budget
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "denied": self._denied,
+                "budget": self.budget.balance,
+            }
@@ -5,13 +5,16 @@ This module provides utility functions for API key validation and
 HTTP response handling for both synchronous and asynchronous requests.
 """
 
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urlparse
 from uuid import UUID
 
-import aiohttp
-from requests import Response
-
 from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.codec import JSONCodec, get_codec
+
+if TYPE_CHECKING:
+    import aiohttp
+    from requests import Response
 
 
 def validate_api_key(api_key: str) -> bool:
@@ -48,7 +51,32 @@ def validate_api_key(api_key: str) -> bool:
     return True
 
 
-def handle_sync_response(response: Response) -> Dict[str, Any]:
+def endpoint_family(url: str) -> str:
+    """
+    Return the endpoint family of an API URL.
+
+    The family is the first path segment after the API version, so every
+    operation on one resource (submit, status, pause, ...) shares it.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        Endpoint family name, e.g. "smartscraper" or "scheduled-jobs"
+
+    Example:
+        >>> endpoint_family("https://api.scrapegraphai.com/v1/crawl/1234")
+        'crawl'
+    """
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    if segments and segments[0].startswith("v") and segments[0][1:].isdigit():
+        segments = segments[1:]
+    return segments[0] if segments else ""
+
+
+def handle_sync_response(
+    response: "Response", codec: Optional[JSONCodec] = None
+) -> Dict[str, Any]:
     """
     Handle and parse synchronous HTTP responses.
 
@@ -56,6 +84,8 @@ def handle_sync_response(response: Response) -> Dict[str, Any]:
 
     Args:
         response: The requests Response object
+        codec: JSON codec used to decode the body (defaults to the fastest
+               installed codec)
 
     Returns:
         Parsed JSON response data as a dictionary
@@ -68,7 +98,7 @@ def handle_sync_response(response: Response) -> Dict[str, Any]:
         >>> data = handle_sync_response(response)
     """
     try:
-        data = response.json()
+        data = (codec or get_codec()).loads(response.content)
     except ValueError:
         # If response is not JSON, use the raw text
         data = {"error": response.text}
@@ -82,7 +112,9 @@ def handle_sync_response(response: Response) -> Dict[str, Any]:
     return data
 
 
-async def handle_async_response(response: aiohttp.ClientResponse) -> Dict[str, Any]:
+async def handle_async_response(
+    response: "aiohttp.ClientResponse", codec: Optional[JSONCodec] = None
+) -> Dict[str, Any]:
     """
     Handle and parse asynchronous HTTP responses.
 
@@ -90,6 +122,8 @@ async def handle_async_response(response: aiohttp.ClientResponse) -> Dict[str, A
 
     Args:
         response: The aiohttp ClientResponse object
+        codec: JSON codec used to decode the body (defaults to the fastest
+               installed codec)
 
     Returns:
         Parsed JSON response data as a dictionary
@@ -102,7 +136,7 @@ async def handle_async_response(response: aiohttp.ClientResponse) -> Dict[str, A
         ...     data = await handle_async_response(response)
     """
     try:
-        data = await response.json()
+        data = (codec or get_codec()).loads(await response.read())
         text = None
     except ValueError:
         # If response is not JSON, use the raw text
@@ -0,0 +1,263 @@
+"""
+Incremental JSON decoding of large API responses.
+
+Crawl and searchscraper results can hold hundreds of markdown pages. Decoding
+them with ``response.json()`` keeps the raw bytes, the text and the decoded
+dict in memory at once. :class:`JSONItemStream` instead scans the body as it
+arrives and decodes the elements of selected arrays (``pages``, ``results``,
+``urls`` by default) one at a time, so peak memory grows with the largest
+single element rather than with the whole response.
+
+The scanner only tracks structure (strings, brackets, keys); everything
+outside the selected arrays is skipped without being decoded. Each element is
+decoded with a full JSON decoder (the client's codec, or the standard ``json``
+module), so elements are fully validated. String values of selected top-level
+keys (such as ``status``) can be reported as well, and leading elements that
+were already consumed can be skipped without being decoded.
+
+Example:
+    >>> stream = JSONItemStream(keys=("pages",))
+    >>> for chunk in chunks:
+    ...     for key, page in stream.feed(chunk):
+    ...         index(page)
+    >>> stream.close()
+"""
+
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+DEFAULT_STREAM_KEYS: Tuple[str, ...] = ("pages", "results", "urls")
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_STRUCTURAL = re.compile(rb'["\[\]{},:]')
+# Remainder of a JSON string up to and including its closing quote
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+class JSONItemStream:
+    """
+    Push parser yielding the elements of selected arrays of a JSON document.
+
+    Arrays are selected by the object key they are stored under, at any
+    depth. Arrays nested inside an element being decoded are part of that
+    element and are not reported separately.
+
+    Attributes:
+        keys (FrozenSet[str]): Keys whose array elements are yielded
+        loads (Callable): Decoder applied to each element
+        value_keys (FrozenSet[str]): Top-level keys whose string values are
+            yielded as ``(key, value)``
+        skip (int): Number of leading elements still to be skipped undecoded
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        loads: Callable[[bytes], Any] = json.loads,
+        value_keys: Iterable[str] = (),
+        skip: int = 0,
+    ):
+        self.keys = frozenset(keys)
+        self.loads = loads
+        self.value_keys = frozenset(value_keys)
+        self.skip = skip
+        self._buf = bytearray()
+        self._pos = 0
+        # One entry per open container: True for objects, False for arrays
+        self._stack: List[bool] = []
+        self._key: Optional[str] = None
+        self._expect_key = False
+        self._string_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._item_depth = 0
+        self._item_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            chunk: Raw bytes of the response body
+
+        Returns:
+            ``(key, element)`` pairs completed by this chunk
+
+        Raises:
+            ValueError: If an element is not valid JSON
+        """
+        buf = self._buf
+        buf += chunk
+        items: List[Tuple[str, Any]] = []
+        pos = self._pos
+        stack = self._stack
+        size = len(buf)
+
+        while pos < size:
+            if self._string_start is not None:
+                match = _STRING_REST.match(buf, pos)
+                if match is None:
+                    # Unterminated so far: resume after the scanned bytes, but
+                    # not between an escaping backslash and its character
+                    tail = 0
+                    while tail < size - pos and buf[size - 1 - tail] == 0x5C:
+                        tail += 1
+                    pos = size - tail % 2
+                    break
+                pos = match.end()
+                if self._item_start is None:
+                    if self._expect_key:
+                        self._key = json.loads(buf[self._string_start : pos])
+                    elif self._is_value_key():
+                        items.append(
+                            (self._key, json.loads(buf[self._string_start : pos]))
+                        )
+                self._string_start = None
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = size
+                break
+            char = buf[match.start()]
+            index = match.start()
+            pos = match.end()
+
+            if char == 0x22:  # "
+                self._string_start = index
+            elif char == 0x7B:  # {
+                stack.append(True)
+                self._expect_key = True
+                self._key = None
+            elif char == 0x5B:  # [
+                parent_key = self._key if stack and stack[-1] else None
+                stack.append(False)
+                self._expect_key = False
+                if self._item_start is None and parent_key in self.keys:
+                    self._item_start = pos
+                    self._item_depth = len(stack)
+                    self._item_key = parent_key
+            elif char == 0x5D or char == 0x7D:  # ] }
+                if (
+                    char == 0x5D
+                    and self._item_start is not None
+                    and len(stack) == self._item_depth
+                ):
+                    self._emit(buf, index, items, closing=True)
+                    self._item_start = None
+                if not stack:
+                    raise ValueError("Unbalanced JSON document")
+                stack.pop()
+                self._expect_key = False
+            elif char == 0x2C:  # ,
+                if self._item_start is not None and len(stack) == self._item_depth:
+                    self._emit(buf, index, items, closing=False)
+                    self._item_start = pos
+                elif stack and stack[-1]:
+                    self._expect_key = True
+            else:  # :
+                self._expect_key = False
+
+        self._pos = pos
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Signal the end of the document.
+
+        Raises:
+            ValueError: If the document was truncated
+        """
+        if self._stack or self._string_start is not None:
+            raise ValueError("Truncated JSON document")
+
+    def _emit(
+        self, buf: bytearray, end: int, items: List[Tuple[str, Any]], closing: bool
+    ) -> None:
+        raw = buf[self._item_start : end]
+        if raw.strip():
+            if self.skip:
+                self.skip -= 1
+            else:
+                items.append((self._item_key, self.loads(raw)))
+        elif not closing:
+            raise ValueError("Empty element in JSON array")
+
+    def _is_value_key(self) -> bool:
+        # A value directly inside the top-level object, under a value key
+        return len(self._stack) == 1 and self._stack[0] and self._key in self.value_keys
+
+    def _compact(self) -> None:
+        # Keep only bytes still needed: the element being collected, or a
+        # key string whose end has not arrived yet
+        keep = self._pos
+        if self._item_start is not None:
+            keep = self._item_start
+        elif self._string_start is not None:
+            if self._expect_key or self._is_value_key():
+                keep = self._string_start
+            else:
+                # Value strings outside selected arrays are never decoded
+                self._string_start = keep
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._item_start is not None:
+                self._item_start -= keep
+            if self._string_start is not None:
+                self._string_start -= keep
+
+
+def iter_json_items(
+    chunks: Iterable[bytes],
+    keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+    loads: Callable[[bytes], Any] = json.loads,
+    value_keys: Iterable[str] = (),
+    skip: int = 0,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ``(key, element)`` pairs from a JSON document given as byte chunks.
+
+    Args:
+        chunks: Iterable of raw body chunks
+        keys: Keys whose array elements are yielded
+        loads: Decoder applied to each element
+        value_keys: Top-level keys whose string values are yielded too
+        skip: Number of leading elements to skip without decoding them
+
+    Raises:
+        ValueError: If the document is malformed or truncated
+    """
+    stream = JSONItemStream(keys, loads, value_keys, skip)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    stream.close()
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[bytes],
+    keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+    loads: Callable[[bytes], Any] = json.loads,
+    value_keys: Iterable[str] = (),
+    skip: int = 0,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Asynchronous counterpart of :func:`iter_json_items`.
+    """
+    stream = JSONItemStream(keys, loads, value_keys, skip)
+    async for chunk in chunks:
+        for item in stream.feed(chunk):
+            yield item
+    stream.close()
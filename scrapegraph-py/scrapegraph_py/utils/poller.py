@@ -0,0 +1,346 @@
+"""
+Multiplexed result polling for asynchronous ScrapeGraphAI jobs.
+
+Job-style endpoints (smartscraper, searchscraper, markdownify, scrape, crawl,
+agentic scraper and schema generation) return an ID that has to be polled
+through the matching ``get_*`` endpoint until the job reaches a terminal
+status. This module polls any number of outstanding IDs from a single
+scheduler loop:
+
+- every job keeps its own next-poll time in one heap, so thousands of IDs
+  cost one loop rather than one sleeper each
+- the poll interval grows exponentially while a job is pending and drops
+  back to the initial interval when its status changes
+- every delay gets random jitter so batches submitted together spread out
+- an overall deadline bounds the whole wait
+
+Results are yielded the moment a job reaches a terminal status.
+
+Example:
+    >>> async for item in client.wait_for_many(ids, service="smartscraper"):
+    ...     print(item.input, item.result["status"])
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.bulk import BulkResult
+
+# Maps the service that created a job to the client method fetching its status
+POLL_METHODS: Dict[str, str] = {
+    "smartscraper": "get_smartscraper",
+    "searchscraper": "get_searchscraper",
+    "markdownify": "get_markdownify",
+    "scrape": "get_scrape",
+    "crawl": "get_crawl",
+    "agenticscraper": "get_agenticscraper",
+    "generate_schema": "get_schema_status",
+}
+
+TERMINAL_STATUSES = frozenset({"completed", "success", "failed", "error", "cancelled"})
+
+PollJob = Union[str, Tuple[str, str]]
+
+
+def is_terminal(result: Any) -> bool:
+    """
+    Check whether a status response describes a finished job.
+
+    Responses without a status field are treated as final.
+
+    Args:
+        result: Response of a ``get_*`` endpoint
+
+    Returns:
+        True if the job will not change anymore
+    """
+    if not isinstance(result, dict) or "status" not in result:
+        return True
+    return str(result["status"]).lower() in TERMINAL_STATUSES
+
+
+def resolve_poll_method(service: str) -> str:
+    """
+    Return the client method name used to poll jobs of a service.
+
+    Raises:
+        ValueError: If the service has no status endpoint
+    """
+    try:
+        return POLL_METHODS[service]
+    except KeyError:
+        raise ValueError(
+            f"Unknown service '{service}'. Expected one of: {', '.join(POLL_METHODS)}"
+        )
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    Check whether a failed poll will keep failing if retried.
+
+    Args:
+        error: Exception raised by a ``get_*`` endpoint
+
+    Returns:
+        True for client errors other than rate limiting and for invalid IDs
+    """
+    if isinstance(error, APIError) and error.status_code is not None:
+        return 400 <= error.status_code < 500 and error.status_code != 429
+    return isinstance(error, ValueError)
+
+
+class PollSchedule:
+    """
+    Adaptive backoff schedule shared by all jobs of one wait.
+
+    Attributes:
+        initial_interval (float): First delay between polls in seconds
+        max_interval (float): Upper bound for the delay between polls
+        multiplier (float): Growth factor applied while a job stays pending
+        jitter (float): Random spread applied to each delay, as a fraction
+        timeout (Optional[float]): Overall deadline in seconds (None = no limit)
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+        jitter: float = 0.2,
+        timeout: Optional[float] = 600.0,
+    ):
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError(
+                "Poll intervals must satisfy 0 < initial_interval <= max_interval"
+            )
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+
+    def next_interval(self, interval: float, progressed: bool) -> float:
+        """Interval to use after a non-terminal poll."""
+        if progressed:
+            return self.initial_interval
+        return min(interval * self.multiplier, self.max_interval)
+
+    def delay(self, interval: float) -> float:
+        """Jittered delay for the given interval."""
+        spread = interval * self.jitter
+        return max(0.0, interval + random.uniform(-spread, spread))
+
+    def deadline(self) -> Optional[float]:
+        """Absolute monotonic deadline for a wait starting now."""
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+
+class _Entry:
+    __slots__ = ("index", "job", "service", "request_id", "interval", "status")
+
+    def __init__(self, index: int, job: PollJob, default_service: str):
+        if isinstance(job, tuple):
+            service, request_id = job
+        else:
+            service, request_id = default_service, job
+        resolve_poll_method(service)
+        self.index = index
+        self.job = job
+        self.service = service
+        self.request_id = request_id
+        self.interval = 0.0
+        self.status: Optional[str] = None
+
+
+class _Scheduler:
+    """Heap of jobs ordered by their next poll time."""
+
+    def __init__(self, jobs: Iterable[PollJob], service: str, schedule: PollSchedule):
+        self.schedule = schedule
+        self.deadline = schedule.deadline()
+        self._counter = itertools.count()
+        self._heap: List[Tuple[float, int, _Entry]] = []
+        now = time.monotonic()
+        for index, job in enumerate(jobs):
+            entry = _Entry(index, job, service)
+            entry.interval = schedule.initial_interval
+            self.push(entry, now)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def pop_due(self, limit: int) -> List[_Entry]:
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < limit:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def next_due_in(self) -> float:
+        if not self._heap:
+            return 0.0
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        return (
+            None
+            if self.deadline is None
+            else max(0.0, self.deadline - time.monotonic())
+        )
+
+    def handle(
+        self, entry: _Entry, result: Any = None, error: Optional[Exception] = None
+    ) -> Optional[BulkResult]:
+        """Return a final result, or reschedule the job and return None."""
+        if error is not None:
+            if is_permanent_error(error):
+                return BulkResult(index=entry.index, input=entry.job, error=error)
+            progressed = False
+            if isinstance(error, APIError) and error.status_code == 429:
+                entry.interval = self.schedule.max_interval
+        elif is_terminal(result):
+            return BulkResult(index=entry.index, input=entry.job, result=result)
+        else:
+            status = str(result.get("status"))
+            progressed = entry.status is not None and status != entry.status
+            entry.status = status
+        entry.interval = self.schedule.next_interval(entry.interval, progressed)
+        self.push(entry, time.monotonic() + self.schedule.delay(entry.interval))
+        return None
+
+    def push(self, entry: _Entry, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._counter), entry))
+
+    def drain_timeouts(self) -> List[BulkResult]:
+        results = [
+            BulkResult(
+                index=entry.index,
+                input=entry.job,
+                error=TimeoutError(
+                    f"{entry.service} job {entry.request_id} did not finish before the deadline"
+                ),
+            )
+            for _, _, entry in self._heap
+        ]
+        self._heap.clear()
+        return results
+
+
+async def poll_many_async(
+    fetch: Callable[[str, str], Awaitable[Any]],
+    jobs: Iterable[PollJob],
+    service: str,
+    schedule: PollSchedule,
+    concurrency: int,
+) -> AsyncIterator[BulkResult]:
+    """
+    Poll many jobs from one scheduler loop, yielding each as it finishes.
+
+    Args:
+        fetch: Coroutine ``fetch(service, request_id)`` returning the job status
+        jobs: Request IDs, or ``(service, request_id)`` tuples
+        service: Service used for plain request IDs
+        schedule: Backoff schedule and deadline
+        concurrency: Maximum number of status requests in flight
+
+    Yields:
+        BulkResult per job; jobs still pending at the deadline carry a
+        TimeoutError
+    """
+    scheduler = _Scheduler(jobs, service, schedule)
+    in_flight: Dict[asyncio.Task, _Entry] = {}
+    try:
+        while scheduler or in_flight:
+            if scheduler.expired():
+                for entry in in_flight.values():
+                    scheduler.push(entry, time.monotonic())
+                for item in scheduler.drain_timeouts():
+                    yield item
+                return
+
+            for entry in scheduler.pop_due(concurrency - len(in_flight)):
+                task = asyncio.ensure_future(fetch(entry.service, entry.request_id))
+                in_flight[task] = entry
+
+            wait_for = scheduler.next_due_in() if scheduler else None
+            remaining = scheduler.remaining()
+            if remaining is not None:
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+
+            if not in_flight:
+                await asyncio.sleep(wait_for or 0)
+                continue
+
+            done, _ = await asyncio.wait(
+                in_flight,
+                timeout=wait_for if len(in_flight) < concurrency else remaining,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                entry = in_flight.pop(task)
+                try:
+                    item = scheduler.handle(entry, result=task.result())
+                except Exception as e:
+                    item = scheduler.handle(entry, error=e)
+                if item is not None:
+                    yield item
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+def poll_many_sync(
+    fetch: Callable[[str, str], Any],
+    jobs: Iterable[PollJob],
+    service: str,
+    schedule: PollSchedule,
+) -> Iterator[BulkResult]:
+    """
+    Synchronous counterpart of :func:`poll_many_async`.
+
+    Status requests are sent one at a time from the scheduler loop.
+    """
+    scheduler = _Scheduler(jobs, service, schedule)
+    while scheduler:
+        if scheduler.expired():
+            yield from scheduler.drain_timeouts()
+            return
+        due = scheduler.pop_due(len(scheduler))
+        if not due:
+            wait_for = scheduler.next_due_in()
+            remaining = scheduler.remaining()
+            if remaining is not None:
+                wait_for = min(wait_for, remaining)
+            time.sleep(wait_for)
+            continue
+        for entry in due:
+            try:
+                item = scheduler.handle(
+                    entry, result=fetch(entry.service, entry.request_id)
+                )
+            except Exception as e:
+                item = scheduler.handle(entry, error=e)
+            if item is not None:
+                yield item
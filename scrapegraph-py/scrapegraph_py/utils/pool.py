@@ -0,0 +1,291 @@
+"""
+Connection pool configuration and statistics for the ScrapeGraphAI SDK.
+
+This module builds the connection pools used by both clients and reports
+live pool statistics, so pools can be sized from real traffic instead of
+guesses.
+
+Statistics are returned as a dictionary with the same keys for both clients:
+
+    - limit: Maximum number of connections in the pool
+    - limit_per_host: Maximum number of connections per host (0 = unlimited)
+    - acquired: Connections currently checked out by in-flight requests
+    - idle: Open connections waiting in the pool for reuse
+    - active: Open connections (acquired + idle)
+    - created: Connections opened since the client was created
+    - reused: Requests served on an already-open connection
+    - queued: Requests that waited for a free connection (AsyncClient only)
+
+Neither aiohttp nor urllib3 exposes connection counts publicly, so
+``acquired``, ``idle``, ``active`` and the urllib3 ``created``/``reused``
+counts are read from transport internals (``TCPConnector._acquired`` and
+``_conns``, ``HTTPConnectionPool.pool`` and ``num_connections``). Each read is
+guarded: when an installed transport version no longer has the expected
+internals, the affected counts are reported as None ("unknown") rather than
+as a wrong number. The versions the internals are verified against are noted
+next to the dependency constraints in pyproject.toml.
+
+Example:
+    >>> client = Client.from_env(pool_size=50)
+    >>> client.pool_stats()
+    {'limit': 50, 'limit_per_host': 0, 'acquired': 0, 'idle': 1, ...}
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+# aiohttp and requests are imported on use, so that each client only loads
+# its own transport
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, TCPConnector, TraceConfig
+    from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_DNS_CACHE_TTL = 10
+
+PoolStats = Dict[str, Optional[int]]
+
+
+class ConnectionCounters:
+    """
+    Connection counters fed by aiohttp tracing signals.
+
+    Attributes:
+        created (int): Number of new connections opened
+        reused (int): Number of requests served on a pooled connection
+        queued (int): Number of requests that waited for a free connection
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+
+    def trace_config(self) -> "TraceConfig":
+        """Build a TraceConfig that updates these counters."""
+        from aiohttp import TraceConfig
+
+        trace_config = TraceConfig()
+
+        async def on_create(session, context, params):
+            self.created += 1
+
+        async def on_reuse(session, context, params):
+            self.reused += 1
+
+        async def on_queued(session, context, params):
+            self.queued += 1
+
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_connection_queued_start.append(on_queued)
+        return trace_config
+
+
+def build_connector(
+    ssl: Any,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    pool_per_host: Optional[int] = None,
+    keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+    force_close: bool = False,
+) -> "TCPConnector":
+    """
+    Create an aiohttp connector with the given pool settings.
+
+    Args:
+        ssl: SSL setting passed to aiohttp (None for default verification,
+             False to disable it)
+        pool_size: Maximum number of simultaneous connections
+        pool_per_host: Maximum number of connections per host (None = unlimited)
+        keepalive_timeout: Seconds an idle connection is kept open
+        dns_cache_ttl: Seconds resolved DNS entries are cached (None = forever)
+        force_close: Close connections after each request instead of pooling
+
+    Returns:
+        Configured TCPConnector
+    """
+    from aiohttp import TCPConnector
+
+    options: Dict[str, Any] = {
+        "ssl": ssl,
+        "limit": pool_size,
+        "limit_per_host": pool_per_host or 0,
+        "ttl_dns_cache": dns_cache_ttl,
+        "force_close": force_close,
+    }
+    # aiohttp rejects a keep-alive timeout on connectors that never keep alive
+    if not force_close:
+        options["keepalive_timeout"] = keepalive_timeout
+    return TCPConnector(**options)
+
+
+def build_adapter(
+    max_retries: Any,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    pool_per_host: Optional[int] = None,
+    traced: bool = False,
+) -> "HTTPAdapter":
+    """
+    Create a requests adapter with the given pool settings.
+
+    urllib3 keeps one pool per host, so ``pool_per_host`` (or ``pool_size``
+    when no per-host limit is given) bounds the connections kept per host.
+
+    Args:
+        max_retries: Retry configuration passed to the adapter
+        pool_size: Maximum number of connections kept open
+        pool_per_host: Maximum number of connections kept per host
+        traced: Report connection phases to the active RequestTrace
+
+    Returns:
+        Configured HTTPAdapter
+    """
+    options = {"max_retries": max_retries, "pool_maxsize": pool_per_host or pool_size}
+    if traced:
+        from scrapegraph_py.utils.tracing import traced_adapter
+
+        return traced_adapter(**options)
+
+    from requests.adapters import HTTPAdapter
+
+    return HTTPAdapter(**options)
+
+
+def _connector_counts(connector: "TCPConnector") -> Optional[Tuple[int, int]]:
+    """Acquired and idle connections of a connector, or None if unknown."""
+    try:
+        acquired = len(connector._acquired)
+        idle = sum(len(conns) for conns in connector._conns.values())
+    except (AttributeError, TypeError):
+        return None
+    return acquired, idle
+
+
+def _pool_counts(pool: Any) -> Optional[Tuple[int, int, int, int]]:
+    """Acquired, idle, created and sent counts of a urllib3 pool, or None."""
+    try:
+        waiting = list(pool.pool.queue)
+        acquired = pool.pool.maxsize - len(waiting)
+        idle = sum(1 for conn in waiting if conn is not None)
+        created, sent = int(pool.num_connections), int(pool.num_requests)
+    except (AttributeError, TypeError):
+        return None
+    return acquired, idle, created, sent
+
+
+def _stats(
+    pool_size: int,
+    pool_per_host: Optional[int],
+    counts: Optional[Tuple[int, int]],
+    created: Optional[int],
+    reused: Optional[int],
+    queued: Optional[int],
+) -> PoolStats:
+    acquired, idle = counts if counts is not None else (None, None)
+    return {
+        "limit": pool_size,
+        "limit_per_host": pool_per_host or 0,
+        "acquired": acquired,
+        "idle": idle,
+        "active": None if counts is None else acquired + idle,
+        "created": created,
+        "reused": reused,
+        "queued": queued,
+    }
+
+
+def connector_stats(
+    connectors: Iterable[Optional["TCPConnector"]],
+    counters: ConnectionCounters,
+    pool_size: int,
+    pool_per_host: Optional[int] = None,
+) -> PoolStats:
+    """
+    Report live statistics for one or more aiohttp connectors.
+
+    Args:
+        connectors: Connectors to inspect, one per live session
+        counters: Counters collected through tracing
+        pool_size: Configured pool size
+        pool_per_host: Configured per-host limit
+
+    Returns:
+        Pool statistics dictionary; connection counts are None when the
+        installed aiohttp does not expose them
+    """
+    counts: Optional[Tuple[int, int]] = (0, 0)
+    for connector in connectors:
+        if connector is None or connector.closed:
+            continue
+        found = _connector_counts(connector)
+        if found is None:
+            counts = None
+            break
+        counts = (counts[0] + found[0], counts[1] + found[1])
+    return _stats(
+        pool_size,
+        pool_per_host,
+        counts,
+        counters.created,
+        counters.reused,
+        counters.queued,
+    )
+
+
+def discard_session(session: "ClientSession") -> None:
+    """
+    Close a session whose event loop can no longer be awaited on.
+
+    The connector's transports are closed synchronously and the session is
+    switched to the closed state, so no "Unclosed client session" warning is
+    emitted when it is garbage collected. If the installed aiohttp has no
+    synchronous ``TCPConnector._close``, the transports are left to the
+    garbage collector.
+
+    Args:
+        session: The session to discard
+    """
+    connector = session.connector
+    close = getattr(connector, "_close", None)
+    if connector is not None and not connector.closed and callable(close):
+        close()
+    session.detach()
+
+
+def adapter_stats(
+    adapter: "HTTPAdapter", pool_size: int, pool_per_host: Optional[int] = None
+) -> PoolStats:
+    """
+    Report live statistics for a requests adapter.
+
+    Args:
+        adapter: The adapter to inspect
+        pool_size: Configured pool size
+        pool_per_host: Configured per-host limit
+
+    Returns:
+        Pool statistics dictionary; counts are None when the installed
+        urllib3 does not expose them
+    """
+    totals: Optional[Tuple[int, int, int, int]] = (0, 0, 0, 0)
+    try:
+        pools = adapter.poolmanager.pools
+        keys = list(pools.keys())
+    except AttributeError:
+        keys, totals = [], None
+    for key in keys:
+        pool = pools.get(key)
+        if pool is None or getattr(pool, "pool", None) is None:
+            continue
+        found = _pool_counts(pool)
+        if found is None:
+            totals = None
+            break
+        totals = tuple(total + count for total, count in zip(totals, found))
+    if totals is None:
+        return _stats(pool_size, pool_per_host, None, None, None, 0)
+    acquired, idle, created, sent = totals
+    return _stats(
+        pool_size, pool_per_host, (acquired, idle), created, max(sent - created, 0), 0
+    )
@@ -0,0 +1,252 @@
+"""
+Client-side rate limiting for the ScrapeGraphAI SDK.
+
+This module provides a token-bucket rate limiter with one bucket per
+endpoint family (smartscraper, crawl, scheduled-jobs, ...). A single
+:class:`RateLimiter` is thread-safe and can be shared between a ``Client``
+and an ``AsyncClient`` so both draw from the same budget.
+
+The limiter adapts to the server:
+
+- a 429 response halves the family's rate and pauses the bucket for the
+  ``Retry-After`` delay
+- ``X-RateLimit-Remaining`` / ``RateLimit-Remaining`` of 0 pauses the
+  bucket until the advertised reset
+- successful responses slowly restore the configured rate
+
+Example:
+    >>> limiter = RateLimiter(rate=5, burst=10, limits={"crawl": (1, 2)})
+    >>> client = Client.from_env(rate_limiter=limiter)
+    >>> async_client = AsyncClient.from_env(rate_limiter=limiter)
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+from scrapegraph_py.utils.helpers import endpoint_family
+
+# Largest pause honoured from a server header, so a bogus value cannot stall
+# the client indefinitely
+MAX_PAUSE = 300.0
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+        now: Current wall-clock time (defaults to time.time())
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def parse_rate_limit_reset(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the pause requested by exhausted rate-limit headers.
+
+    Supports ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` and the IETF
+    ``RateLimit-Remaining``/``RateLimit-Reset`` pair. Reset values larger
+    than a day are treated as epoch timestamps.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Delay in seconds if the quota is exhausted, otherwise None
+    """
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = headers.get(f"{prefix}Remaining")
+        if remaining is None:
+            continue
+        try:
+            if float(remaining) > 0:
+                return None
+            reset = float(headers.get(f"{prefix}Reset", "1"))
+        except ValueError:
+            return None
+        if reset > 86400:
+            reset -= time.time()
+        return max(0.0, reset)
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Implemented as a generic cell rate algorithm: instead of counting tokens
+    it tracks the theoretical arrival time of the next request, which lets
+    callers reserve a slot and sleep outside the lock.
+
+    Attributes:
+        rate (float): Current sustained rate in requests per second
+        burst (int): Number of requests allowed back-to-back
+        max_rate (float): Configured rate that recovery climbs back to
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate_ratio: float = 0.05):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self._min_rate = rate * min_rate_ratio
+        self._tat = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a slot for one request.
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            start = max(now, self._paused_until)
+            tat = max(self._tat, start)
+            allowed_at = max(tat - (self.burst - 1) * interval, start)
+            self._tat = tat + interval
+            return max(0.0, allowed_at - now)
+
+    def pause(self, seconds: float) -> None:
+        """Refuse to grant slots for the next ``seconds`` seconds."""
+        with self._lock:
+            until = time.monotonic() + min(seconds, MAX_PAUSE)
+            self._paused_until = max(self._paused_until, until)
+
+    def slow_down(self) -> None:
+        """Halve the current rate (multiplicative decrease)."""
+        with self._lock:
+            self.rate = max(self.rate / 2, self._min_rate)
+
+    def recover(self) -> None:
+        """Raise the current rate towards the configured rate (additive increase)."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.rate + self.max_rate * 0.05, self.max_rate)
+
+
+class RateLimiter:
+    """
+    Per-endpoint-family rate limiter shared by sync and async clients.
+
+    Attributes:
+        rate (float): Default requests per second for each family
+        burst (int): Default burst size for each family
+        limits (dict): Per-family ``(rate, burst)`` overrides
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, burst=20, limits={"crawl": (1, 1)})
+        >>> limiter.stats()["crawl"]["rate"]
+        1
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for the endpoint family of ``url``."""
+        family = endpoint_family(url)
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    rate, burst = self.limits.get(family, (self.rate, self.burst))
+                    bucket = self._buckets[family] = TokenBucket(rate, burst)
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        Block the calling thread until a request to ``url`` may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """
+        Wait without blocking the event loop until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, url: str, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the family's bucket to a response.
+
+        Args:
+            url: Request URL
+            status: HTTP status code of the response
+            headers: Response headers
+        """
+        bucket = self.bucket(url)
+        pause = parse_rate_limit_reset(headers)
+        if status == 429:
+            bucket.slow_down()
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                pause = max(pause or 0.0, retry_after)
+            elif pause is None:
+                pause = 1.0 / bucket.rate
+        elif status < 400:
+            bucket.recover()
+        if pause:
+            bucket.pause(pause)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Report the current rate of every endpoint family seen so far.
+
+        Returns:
+            Mapping of family to its current and configured rate and burst
+        """
+        return {
+            family: {
+                "rate": bucket.rate,
+                "max_rate": bucket.max_rate,
+                "burst": bucket.burst,
+            }
+            for family, bucket in list(self._buckets.items())
+        }
@@ -0,0 +1,245 @@
+"""
+Retry policy shared by the synchronous and asynchronous clients.
+
+:class:`RetryPolicy` decides whether a failed attempt is retried and how long
+to wait before the next one:
+
+- delays follow full-jitter exponential backoff, or the server's
+  ``Retry-After`` when it sends one
+- HTTP statuses in ``retry_statuses`` (429 and 5xx by default) are retried
+- connection failures are always retried because the request never reached
+  the server; timeouts and dropped connections are only retried when the
+  request is idempotent
+- POST and PATCH requests get an ``Idempotency-Key`` header, reused on every
+  attempt, so the server can deduplicate them and they become safe to retry
+- an optional :class:`RetryBudget` caps retries to a share of the traffic, so
+  an outage does not turn into a retry storm
+
+Example:
+    >>> policy = RetryPolicy(max_retries=5, base_delay=0.5, budget=RetryBudget(ratio=0.1))
+    >>> client = Client.from_env(retry_policy=policy)
+    >>> async_client = AsyncClient.from_env(retry_policy=policy)
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import uuid
+from typing import Any, Dict, FrozenSet, Optional
+
+from scrapegraph_py.exceptions import APIError
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Methods that can be repeated without changing the result on the server
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def _classify_requests_error(error: BaseException, requests: Any) -> Optional[str]:
+    from urllib3.exceptions import NewConnectionError
+
+    if isinstance(error, requests.exceptions.SSLError):
+        return None
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return "connect"
+    if isinstance(error, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return "connect" if isinstance(reason, NewConnectionError) else "transport"
+    if isinstance(error, requests.exceptions.ChunkedEncodingError):
+        return "transport"
+    return None
+
+
+def _classify_aiohttp_error(error: BaseException, aiohttp: Any) -> Optional[str]:
+    if isinstance(error, aiohttp.ClientSSLError):
+        return None
+    if isinstance(
+        error, (aiohttp.ConnectionTimeoutError, aiohttp.ClientConnectorError)
+    ):
+        return "connect"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return "transport"
+    return None
+
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """
+    Sort a failed attempt into a retry category.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        ``"status"`` for API errors, ``"connect"`` when the request was never
+        sent, ``"timeout"`` or ``"transport"`` when it may have reached the
+        server, and None for errors that retrying cannot fix
+    """
+    if isinstance(error, APIError):
+        return "status"
+    # An error can only come from a transport that has been imported, so
+    # neither is imported here just to classify errors of the other one
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(error, requests.exceptions.RequestException):
+        return _classify_requests_error(error, requests)
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+        return _classify_aiohttp_error(error, aiohttp)
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    return None
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests sent.
+
+    Every new request deposits ``ratio`` tokens and every retry withdraws
+    one. The balance starts at, and never exceeds, ``reserve`` so that
+    occasional failures are always retried while a sustained outage only
+    produces ``ratio`` retries per request. Thread-safe, so one budget can be
+    shared by several clients.
+
+    Attributes:
+        ratio (float): Retries allowed per request in steady state
+        reserve (float): Retries available before any traffic was seen
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        if ratio < 0 or reserve < 0:
+            raise ValueError("ratio and reserve must not be negative")
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Record a new (non-retry) request."""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget; return False if it is exhausted."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and when.
+
+    Attributes:
+        max_retries (int): Retries after the first attempt
+        base_delay (float): Backoff ceiling for the first retry in seconds
+        max_delay (float): Upper bound for the backoff ceiling
+        retry_statuses (FrozenSet[int]): HTTP statuses that are retried
+        budget (Optional[RetryBudget]): Shared retry budget, if any
+        idempotency_keys (bool): Whether POST/PATCH requests get an
+            Idempotency-Key header
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES,
+        budget: Optional[RetryBudget] = None,
+        idempotency_keys: bool = True,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+        self.idempotency_keys = idempotency_keys
+
+    def prepare(self, method: str, kwargs: Dict[str, Any]) -> bool:
+        """
+        Prepare a request for retries and record it in the budget.
+
+        Adds an Idempotency-Key header to POST/PATCH requests (unless the
+        caller already set one) by updating ``kwargs["headers"]`` in place.
+
+        Args:
+            method: HTTP method
+            kwargs: Keyword arguments of the request
+
+        Returns:
+            True if the request can safely be repeated after an ambiguous
+            failure such as a timeout
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        headers = kwargs.get("headers") or {}
+        if IDEMPOTENCY_HEADER in headers:
+            return True
+        if self.idempotency_keys and method in ("POST", "PATCH"):
+            kwargs["headers"] = {**headers, IDEMPOTENCY_HEADER: str(uuid.uuid4())}
+            return True
+        return False
+
+    def should_retry(
+        self, error: BaseException, attempt: int, idempotent: bool
+    ) -> bool:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based number of the attempt that failed
+            idempotent: Value returned by :meth:`prepare`
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt >= self.max_retries:
+            return False
+        category = classify_error(error)
+        if category == "status":
+            retryable = error.status_code in self.retry_statuses
+        elif category in ("timeout", "transport"):
+            retryable = idempotent
+        else:
+            retryable = category == "connect"
+        if not retryable:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before the retry following ``attempt``.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Seconds to wait
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
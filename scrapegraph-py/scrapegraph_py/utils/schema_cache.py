@@ -0,0 +1,125 @@
+"""
+Process-wide cache of the JSON schemas of ``output_schema`` models.
+
+``SmartScraperRequest`` and ``SearchScraperRequest`` send the JSON schema of
+their ``output_schema`` model with every request. Generating it with
+``model_json_schema()`` walks the whole model, so a batch using one model
+class would regenerate the same schema for every call. The schema is instead
+generated once per model class and kept as a
+:class:`~scrapegraph_py.utils.codec.CachedJSON`, so its encoded bytes are
+reused as well.
+
+Every call returns a fresh :class:`~scrapegraph_py.utils.codec.CachedJSONCopy`
+of the cached schema, so a request payload can be changed without affecting
+other requests; its encoded bytes are reused only while it is unchanged.
+
+Entries are stored on the model class itself: models created dynamically
+(for example with ``pydantic.create_model``) never share an entry even when
+their names match, and their entries are collected with the class. An entry
+is regenerated when the model is rebuilt with ``model_rebuild()``, which
+replaces the model's core schema; :func:`invalidate_schema` drops entries
+explicitly.
+
+Example:
+    >>> schema = cached_json_schema(Product)
+    >>> schema == cached_json_schema(Product)
+    True
+"""
+
+import itertools
+import threading
+import weakref
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from scrapegraph_py.utils.codec import CachedJSON, CachedJSONCopy
+
+_cache_ids = itertools.count()
+
+
+class SchemaCache:
+    """
+    Cache of model JSON schemas keyed by model class. Thread-safe.
+    """
+
+    def __init__(self):
+        # Each cache keeps its entries under its own attribute of the model
+        # class. An entry holds the model's core schema, which refers back to
+        # the class, so it could not live in a WeakKeyDictionary
+        self._attribute = f"__scrapegraph_json_schema_{next(_cache_ids)}__"
+        self._models: "weakref.WeakSet[type]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _lookup(self, model: Type[BaseModel]) -> Optional[CachedJSON]:
+        entry = model.__dict__.get(self._attribute)
+        # model_rebuild() replaces the core schema object; holding the old one
+        # in the entry keeps it alive, so an identity check cannot be fooled
+        if entry is None or entry[0] is not model.__dict__.get(
+            "__pydantic_core_schema__"
+        ):
+            return None
+        return entry[1]
+
+    def get(self, model: Type[BaseModel]) -> CachedJSONCopy:
+        """
+        Return the JSON schema of ``model``, generating it on first use.
+
+        Args:
+            model: Pydantic model class
+
+        Returns:
+            A private copy of the model's JSON schema
+        """
+        with self._lock:
+            schema = self._lookup(model)
+            if schema is not None:
+                self._hits += 1
+                return CachedJSONCopy(schema)
+            self._misses += 1
+        core_schema = model.__dict__.get("__pydantic_core_schema__")
+        schema = CachedJSON(model.model_json_schema())
+        with self._lock:
+            type.__setattr__(model, self._attribute, (core_schema, schema))
+            self._models.add(model)
+        return CachedJSONCopy(schema)
+
+    def invalidate(self, model: Optional[Type[BaseModel]] = None) -> None:
+        """
+        Drop the cached schema of ``model``, or of every model if None.
+        """
+        with self._lock:
+            models = list(self._models) if model is None else [model]
+            for cached in models:
+                if self._attribute in cached.__dict__:
+                    type.__delattr__(cached, self._attribute)
+                self._models.discard(cached)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+
+        Returns:
+            Dict with the number of cached models, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._models),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+schema_cache = SchemaCache()
+
+
+def cached_json_schema(model: Type[BaseModel]) -> CachedJSONCopy:
+    """Return a copy of the JSON schema of ``model`` from the process-wide cache."""
+    return schema_cache.get(model)
+
+
+def invalidate_schema(model: Optional[Type[BaseModel]] = None) -> None:
+    """Drop cached schemas from the process-wide cache (all if ``model`` is None)."""
+    schema_cache.invalidate(model)
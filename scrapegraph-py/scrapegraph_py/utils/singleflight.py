@@ -0,0 +1,115 @@
+"""
+Coalescing of identical in-flight requests for the async client.
+
+When many coroutines send the same request at once (fan-out stages sharing
+URLs, dozens of waiters polling one crawl_id), :class:`SingleFlight` lets the
+first caller send it and makes every concurrent caller with the same key
+await that one call. All callers receive the result, or the exception.
+
+- keys are the same canonical hash used by the response cache (method,
+  endpoint path, JSON payload and query parameters)
+- only GET and POST requests to non-mutating endpoints are coalesced, so
+  for example two concurrent scheduled-job triggers still both happen
+- a caller being cancelled does not cancel the shared call while other
+  callers are still waiting for it
+- calls are tracked per event loop, matching the client's per-loop sessions
+
+Example:
+    >>> flight = SingleFlight()
+    >>> result = await flight.do("key", lambda: fetch())
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from scrapegraph_py.utils.cache import CACHEABLE_METHODS, NEVER_CACHE
+from scrapegraph_py.utils.helpers import endpoint_family
+
+
+def is_coalescable(method: str, url: str) -> bool:
+    """Return True if concurrent identical requests may share one call."""
+    return (
+        method.upper() in CACHEABLE_METHODS and endpoint_family(url) not in NEVER_CACHE
+    )
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers with the same key.
+
+    Attributes:
+        calls (int): Calls actually started
+        coalesced (int): Callers that joined a call already in flight
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Tuple[asyncio.AbstractEventLoop, str], _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``func`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The result of the shared call. Callers that joined an existing
+            call receive a copy, so they cannot affect each other by
+            modifying it
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        slot = (asyncio.get_running_loop(), key)
+        call = self._in_flight.get(slot)
+        leader = call is None
+        if leader:
+            call = _Call(asyncio.ensure_future(func()))
+            call.task.add_done_callback(lambda _: self._forget(slot, call))
+            self._in_flight[slot] = call
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if not call.task.done() and call.waiters == 1:
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+        return result if leader else copy.deepcopy(result)
+
+    def _forget(self, slot: Tuple[asyncio.AbstractEventLoop, str], call: _Call) -> None:
+        if self._in_flight.get(slot) is call:
+            del self._in_flight[slot]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report coalescing counters.
+
+        Returns:
+            Dictionary with in_flight, calls and coalesced
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
@@ -4,14 +4,11 @@ TOON format conversion utilities.
 This module provides utilities to convert API responses to TOON format,
 which reduces token usage by 30-60% compared to JSON.
 """
+from importlib.util import find_spec
 from typing import Any, Dict, Optional
 
-try:
-    from toon import encode as toon_encode
-    TOON_AVAILABLE = True
-except ImportError:
-    TOON_AVAILABLE = False
-    toon_encode = None
+# toonify is only imported when a response is actually converted
+TOON_AVAILABLE = find_spec("toon") is not None
 
 
 def convert_to_toon(data: Any, options: Optional[Dict[str, Any]] = None) -> str:
@@ -32,11 +29,13 @@ def convert_to_toon(data: Any, options: Optional[Dict[str, Any]] = None) -> str:
     Raises:
         ImportError: If toonify library is not installed
     """
-    if not TOON_AVAILABLE or toon_encode is None:
+    if not TOON_AVAILABLE:
         raise ImportError(
             "toonify library is not installed. "
             "Install it with: pip install toonify"
         )
+    from toon import encode as toon_encode
+
     
     return toon_encode(data, options=options)
 
@@ -0,0 +1,538 @@
+"""
+Request lifecycle tracing for the ScrapeGraphAI SDK.
+
+A :class:`RequestTracer` passed to either client as ``tracer`` receives a
+:class:`TraceEvent` for every phase of every request attempt, so tail
+latency can be attributed to the network, the connection pool or the
+service:
+
+    - queued: Waiting for a connection from the pool
+    - dns: Resolving the API host (AsyncClient only; for Client it is part
+      of connect)
+    - connect: Opening the TCP connection (AsyncClient: including TLS)
+    - tls: TLS handshake (Client only)
+    - first_byte: From the request being sent to the response headers
+    - completed: Whole attempt, once the body has been read and decoded, or
+      once it failed
+    - retry: A failed attempt is about to be retried
+    - poll: One status request made while waiting for a job; the job is
+      described by the event's details rather than its url
+
+AsyncClient reports the connection phases through aiohttp tracing signals and
+Client through instrumented urllib3 connection pools. Phases an attempt does
+not go through (a reused connection has no dns/connect/tls) are not reported.
+Callbacks run synchronously on the request path and should be fast; an
+exception raised by a callback is logged and ignored.
+
+Example:
+    >>> tracer = RequestTracer([lambda event: print(event.name, event.duration)])
+    >>> client = Client.from_env(tracer=tracer)
+
+With ``opentelemetry-api`` installed, :class:`OpenTelemetrySpans` turns the
+events into one client span per attempt:
+
+    >>> tracer = RequestTracer([OpenTelemetrySpans()])
+"""
+
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from scrapegraph_py.logger import sgai_logger as logger
+
+if TYPE_CHECKING:
+    from aiohttp import TraceConfig
+    from requests.adapters import HTTPAdapter
+
+HAS_OPENTELEMETRY = find_spec("opentelemetry") is not None
+
+TRACE_EVENTS = (
+    "queued",
+    "dns",
+    "connect",
+    "tls",
+    "first_byte",
+    "completed",
+    "retry",
+    "poll",
+)
+
+
+@dataclass
+class TraceEvent:
+    """
+    Timing of one phase of a request.
+
+    Attributes:
+        name (str): Phase name, one of TRACE_EVENTS
+        method (str): HTTP method of the request
+        url (str): Request URL
+        attempt (int): Zero-based attempt number
+        trace_id (int): Identifier shared by all events of one attempt
+        start (float): Wall-clock time the phase began (seconds since the epoch)
+        duration (float): Length of the phase in seconds
+        status (Optional[int]): HTTP status, once known
+        error (Optional[BaseException]): Error that ended the attempt, if any
+        details (Dict[str, Any]): Phase specific data
+    """
+
+    name: str
+    method: str
+    url: str
+    attempt: int = 0
+    trace_id: int = 0
+    start: float = 0.0
+    duration: float = 0.0
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+TraceCallback = Callable[[TraceEvent], None]
+
+# Attempt traced on the current thread (Client) or task (AsyncClient)
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar(
+    "scrapegraph_request_trace", default=None
+)
+
+
+class RequestTrace:
+    """
+    Timing state of one request attempt.
+
+    Created by :meth:`RequestTracer.start`; the connection-level hooks mark
+    the phases on it and :meth:`finish` reports the attempt as a whole.
+    """
+
+    __slots__ = (
+        "tracer",
+        "trace_id",
+        "method",
+        "url",
+        "attempt",
+        "started",
+        "events",
+        "finished",
+        "_wall",
+        "_marks",
+    )
+
+    def __init__(
+        self,
+        tracer: "RequestTracer",
+        trace_id: int,
+        method: str,
+        url: str,
+        attempt: int,
+    ):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.method = method
+        self.url = url
+        self.attempt = attempt
+        self.events: List[TraceEvent] = []
+        self.finished = False
+        self._marks: Dict[str, float] = {}
+        self._wall = time.time()
+        self.started = time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        """Note that phase ``name`` begins now."""
+        self._marks[name] = time.perf_counter()
+
+    def phase(self, name: str, **details: Any) -> None:
+        """Report phase ``name`` as ending now, if it was marked."""
+        begin = self._marks.pop(name, None)
+        if begin is not None:
+            self.record(name, begin, time.perf_counter(), **details)
+
+    def record(self, name: str, begin: float, end: float, **details: Any) -> None:
+        """
+        Report a phase between two ``time.perf_counter()`` readings.
+        """
+        event = TraceEvent(
+            name=name,
+            method=self.method,
+            url=self.url,
+            attempt=self.attempt,
+            trace_id=self.trace_id,
+            start=self._wall + (begin - self.started),
+            duration=end - begin,
+            details=details,
+        )
+        self.events.append(event)
+        self.tracer.emit(event)
+
+    def finish(
+        self, status: Optional[int] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Report the attempt as completed. Later calls are ignored.
+
+        The event's details hold the earlier phase events under ``phases``
+        and, when the response headers were seen, the time spent reading
+        the body under ``body``.
+        """
+        if self.finished:
+            return
+        self.finished = True
+        duration = time.perf_counter() - self.started
+        details: Dict[str, Any] = {"phases": list(self.events)}
+        for event in self.events:
+            if event.name == "first_byte":
+                headers_at = event.start + event.duration - self._wall
+                details["body"] = max(0.0, duration - headers_at)
+        self.tracer.emit(
+            TraceEvent(
+                name="completed",
+                method=self.method,
+                url=self.url,
+                attempt=self.attempt,
+                trace_id=self.trace_id,
+                start=self._wall,
+                duration=duration,
+                status=status,
+                error=error,
+                details=details,
+            )
+        )
+
+    def activate(self) -> "_Activation":
+        """Context manager making this the attempt seen by the urllib3 hooks."""
+        return _Activation(self)
+
+
+class _Activation:
+    __slots__ = ("trace", "token")
+
+    def __init__(self, trace: RequestTrace):
+        self.trace = trace
+
+    def __enter__(self) -> RequestTrace:
+        self.token = _current_trace.set(self.trace)
+        return self.trace
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _current_trace.reset(self.token)
+
+
+class PollTrace:
+    """
+    Context manager timing one status request made while waiting for a job.
+
+    Set ``result`` inside the block so the job status is reported.
+    """
+
+    __slots__ = ("tracer", "service", "request_id", "result", "_wall", "_started")
+
+    def __init__(self, tracer: "RequestTracer", service: str, request_id: str):
+        self.tracer = tracer
+        self.service = service
+        self.request_id = request_id
+        self.result: Any = None
+
+    def __enter__(self) -> "PollTrace":
+        self._wall = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        status = self.result.get("status") if isinstance(self.result, dict) else None
+        self.tracer.emit(
+            TraceEvent(
+                name="poll",
+                method="GET",
+                url="",
+                start=self._wall,
+                duration=time.perf_counter() - self._started,
+                error=exc_val,
+                details={
+                    "service": self.service,
+                    "request_id": self.request_id,
+                    "job_status": status,
+                },
+            )
+        )
+
+
+class RequestTracer:
+    """
+    Dispatches request timing events to registered callbacks.
+
+    Args:
+        callbacks: Functions called with every TraceEvent
+    """
+
+    def __init__(self, callbacks: Iterable[TraceCallback] = ()):
+        self._callbacks: List[TraceCallback] = list(callbacks)
+        self._ids = itertools.count(1)
+
+    def add_callback(self, callback: TraceCallback) -> None:
+        """Register a function called with every TraceEvent."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: TraceCallback) -> None:
+        """Unregister a callback added earlier."""
+        self._callbacks.remove(callback)
+
+    def emit(self, event: TraceEvent) -> None:
+        """Send an event to every callback."""
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning("⚠️ Trace callback %r failed: %s", callback, e)
+
+    def start(self, method: str, url: str, attempt: int = 0) -> RequestTrace:
+        """Begin tracing one request attempt."""
+        return RequestTrace(self, next(self._ids), method, url, attempt)
+
+    def retry(
+        self, method: str, url: str, attempt: int, delay: float, error: BaseException
+    ) -> None:
+        """
+        Report that failed attempt ``attempt`` will be retried after ``delay``.
+        """
+        self.emit(
+            TraceEvent(
+                name="retry",
+                method=method,
+                url=url,
+                attempt=attempt,
+                start=time.time(),
+                duration=delay,
+                status=getattr(error, "status_code", None),
+                error=error,
+            )
+        )
+
+    def poll(self, service: str, request_id: str) -> PollTrace:
+        """Time one status request made while waiting for a job."""
+        return PollTrace(self, service, request_id)
+
+    def trace_config(self) -> "TraceConfig":
+        """
+        Build an aiohttp TraceConfig reporting connection phases.
+
+        Requests must pass their RequestTrace as ``trace_request_ctx``.
+        """
+        from aiohttp import TraceConfig
+
+        trace_config = TraceConfig()
+
+        def marker(name):
+            async def on_signal(session, context, params):
+                if isinstance(context.trace_request_ctx, RequestTrace):
+                    context.trace_request_ctx.mark(name)
+
+            return on_signal
+
+        def reporter(name, **getters):
+            async def on_signal(session, context, params):
+                trace = context.trace_request_ctx
+                if isinstance(trace, RequestTrace):
+                    trace.phase(
+                        name, **{key: get(params) for key, get in getters.items()}
+                    )
+
+            return on_signal
+
+        async def on_dns_end(session, context, params):
+            trace = context.trace_request_ctx
+            if isinstance(trace, RequestTrace):
+                trace.phase("dns", host=params.host)
+                # connect then only measures what follows the resolution
+                trace.mark("connect")
+
+        trace_config.on_connection_queued_start.append(marker("queued"))
+        trace_config.on_connection_queued_end.append(reporter("queued"))
+        trace_config.on_connection_create_start.append(marker("connect"))
+        trace_config.on_dns_resolvehost_start.append(marker("dns"))
+        trace_config.on_dns_resolvehost_end.append(on_dns_end)
+        trace_config.on_connection_create_end.append(reporter("connect"))
+        trace_config.on_request_headers_sent.append(marker("first_byte"))
+        trace_config.on_request_chunk_sent.append(marker("first_byte"))
+        trace_config.on_request_end.append(
+            reporter("first_byte", status=lambda params: params.response.status)
+        )
+        return trace_config
+
+
+@lru_cache(maxsize=None)
+def _traced_adapter_class() -> type:
+    # urllib3 classes reporting pool checkout, connect, TLS and first byte
+    # to the attempt active in the calling context
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TracedConnectionMixin:
+        def _new_conn(self):
+            trace = _current_trace.get()
+            if trace is None:
+                return super()._new_conn()
+            begin = time.perf_counter()
+            sock = super()._new_conn()
+            self._sgai_connected = time.perf_counter()
+            trace.record("connect", begin, self._sgai_connected, host=self.host)
+            return sock
+
+        def request(self, *args, **kwargs):
+            super().request(*args, **kwargs)
+            trace = _current_trace.get()
+            if trace is not None:
+                trace.mark("first_byte")
+
+        def getresponse(self):
+            response = super().getresponse()
+            trace = _current_trace.get()
+            if trace is not None:
+                trace.phase("first_byte", status=response.status)
+            return response
+
+    class TracedHTTPConnection(TracedConnectionMixin, HTTPConnection):
+        pass
+
+    class TracedHTTPSConnection(TracedConnectionMixin, HTTPSConnection):
+        def connect(self):
+            self._sgai_connected = None
+            super().connect()
+            trace = _current_trace.get()
+            if trace is not None and self._sgai_connected is not None:
+                trace.record("tls", self._sgai_connected, time.perf_counter())
+
+    class TracedPoolMixin:
+        def _get_conn(self, timeout=None):
+            trace = _current_trace.get()
+            if trace is None:
+                return super()._get_conn(timeout)
+            begin = time.perf_counter()
+            conn = super()._get_conn(timeout)
+            trace.record("queued", begin, time.perf_counter())
+            return conn
+
+    class TracedHTTPConnectionPool(TracedPoolMixin, HTTPConnectionPool):
+        ConnectionCls = TracedHTTPConnection
+
+    class TracedHTTPSConnectionPool(TracedPoolMixin, HTTPSConnectionPool):
+        ConnectionCls = TracedHTTPSConnection
+
+    class TracedHTTPAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TracedHTTPConnectionPool,
+                "https": TracedHTTPSConnectionPool,
+            }
+
+    return TracedHTTPAdapter
+
+
+def traced_adapter(**options: Any) -> "HTTPAdapter":
+    """
+    Create a requests adapter whose connection pools report to the active
+    RequestTrace. Options are passed to ``HTTPAdapter``.
+    """
+    return _traced_adapter_class()(**options)
+
+
+class OpenTelemetrySpans:
+    """
+    Trace callback recording OpenTelemetry spans.
+
+    Every attempt becomes a CLIENT span carrying its phases as span events,
+    every poll becomes a span, and retries are added as events to the
+    current span.
+
+    Args:
+        tracer: OpenTelemetry tracer to use (default: the global tracer
+                provider's ``scrapegraph_py`` tracer)
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed
+    """
+
+    def __init__(self, tracer: Any = None):
+        if not HAS_OPENTELEMETRY:
+            raise ImportError(
+                "OpenTelemetrySpans requires opentelemetry-api. "
+                "Install it with: pip install 'scrapegraph-py[tracing]'"
+            )
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("scrapegraph_py")
+
+    def __call__(self, event: TraceEvent) -> None:
+        if event.name == "completed":
+            self._span(
+                f"{event.method} {_path(event.url)}",
+                event,
+                self._attempt_attributes(event),
+            )
+        elif event.name == "poll":
+            self._span(
+                f"poll {event.details['service']}", event, self._poll_attributes(event)
+            )
+        elif event.name == "retry":
+            self._trace.get_current_span().add_event(
+                "scrapegraph.retry",
+                {
+                    "scrapegraph.attempt": event.attempt,
+                    "scrapegraph.retry_delay": event.duration,
+                },
+                timestamp=_ns(event.start),
+            )
+
+    def _span(self, name: str, event: TraceEvent, attributes: Dict[str, Any]) -> None:
+        span = self._tracer.start_span(
+            name,
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=_ns(event.start),
+            attributes=attributes,
+        )
+        for phase in event.details.get("phases", ()):
+            span.add_event(
+                phase.name,
+                {"scrapegraph.duration_ms": phase.duration * 1000},
+                timestamp=_ns(phase.start),
+            )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(event.error))
+            )
+        span.end(end_time=_ns(event.start + event.duration))
+
+    @staticmethod
+    def _attempt_attributes(event: TraceEvent) -> Dict[str, Any]:
+        attributes = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "scrapegraph.attempt": event.attempt,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        return attributes
+
+    @staticmethod
+    def _poll_attributes(event: TraceEvent) -> Dict[str, Any]:
+        attributes = {
+            "scrapegraph.service": event.details["service"],
+            "scrapegraph.request_id": event.details["request_id"],
+        }
+        if event.details.get("job_status") is not None:
+            attributes["scrapegraph.job_status"] = str(event.details["job_status"])
+        return attributes
+
+
+def _ns(seconds: float) -> int:
+    return int(seconds * 1_000_000_000)
+
+
+def _path(url: str) -> str:
+    return url.split("://", 1)[-1].split("/", 1)[-1].split("?", 1)[0]
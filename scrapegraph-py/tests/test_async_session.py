@@ -0,0 +1,84 @@
+"""
+Tests for lazy, per-event-loop session management in AsyncClient
+"""
+
+import asyncio
+import warnings
+
+import pytest
+
+from scrapegraph_py.async_client import AsyncClient
+from tests.utils import generate_mock_api_key
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def test_construction_outside_loop_creates_no_session(mock_api_key):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        client = AsyncClient(api_key=mock_api_key)
+        del client
+
+
+def test_session_requires_running_loop(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    with pytest.raises(RuntimeError):
+        client.session
+
+
+@pytest.mark.asyncio
+async def test_session_is_created_once_per_loop(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    assert client.pool_stats()["active"] == 0
+
+    first = client.session
+    assert client.session is first
+    assert first._loop is asyncio.get_running_loop()
+
+    await client.close()
+    assert first.closed
+
+
+def test_one_client_serves_several_loops(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+
+    async def grab():
+        return client.session
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+
+    asyncio.run(client.close())
+    assert first.closed
+    assert second.closed
+
+
+def test_close_reaches_idle_loops(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    idle_loop = asyncio.new_event_loop()
+    try:
+
+        async def grab():
+            return client.session
+
+        idle_session = idle_loop.run_until_complete(grab())
+        asyncio.run(client.close())
+        assert idle_session.closed
+    finally:
+        idle_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_session_recreated_after_close(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    first = client.session
+    await client.close()
+
+    second = client.session
+    assert second is not first
+    assert not second.closed
+    await client.close()
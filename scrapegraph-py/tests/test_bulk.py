@@ -0,0 +1,142 @@
+"""
+Tests for bounded-concurrency bulk operations on AsyncClient
+"""
+
+import asyncio
+
+import pytest
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.utils.bulk import BulkResult, run_as_completed, run_ordered
+from tests.utils import generate_mock_api_key
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+class TestBulkRunner:
+    """Test the generic bulk runner"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def work(value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return value * 2
+
+        results = await run_ordered(work, range(50), concurrency=4)
+
+        assert peak <= 4
+        assert [r.result for r in results] == [v * 2 for v in range(50)]
+
+    @pytest.mark.asyncio
+    async def test_inputs_are_consumed_lazily(self):
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for value in range(1000):
+                pulled += 1
+                yield value
+
+        async def work(value):
+            return value
+
+        gen = run_as_completed(work, source(), concurrency=2)
+        await gen.__anext__()
+        await gen.aclose()
+
+        assert pulled < 10
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_inputs(self):
+        async def source():
+            for value in range(5):
+                yield value
+
+        async def work(value):
+            return value + 1
+
+        results = await run_ordered(work, source(), concurrency=3)
+        assert [r.result for r in results] == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_returned_per_item(self):
+        async def work(value):
+            if value == 2:
+                raise ValueError("boom")
+            return value
+
+        results = await run_ordered(work, range(4), concurrency=2)
+
+        assert [r.ok for r in results] == [True, True, False, True]
+        assert isinstance(results[2].error, ValueError)
+        assert results[3].result == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        async def work(value):
+            return value
+
+        with pytest.raises(ValueError):
+            await run_ordered(work, [1], concurrency=0)
+
+
+class TestAsyncClientBulk:
+    """Test the bulk endpoint methods in mock mode"""
+
+    @pytest.mark.asyncio
+    async def test_smartscraper_many(self, mock_api_key):
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        async with AsyncClient(api_key=mock_api_key, mock=True) as client:
+            results = await client.smartscraper_many(
+                urls, user_prompt="Extract title", concurrency=3
+            )
+
+        assert len(results) == 10
+        assert all(isinstance(r, BulkResult) and r.ok for r in results)
+        assert [r.input for r in results] == urls
+        assert all(r.result["request_id"].startswith("mock-req-") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_smartscraper_many_reports_validation_errors(self, mock_api_key):
+        inputs = ["https://example.com", "not-a-url"]
+        async with AsyncClient(api_key=mock_api_key, mock=True) as client:
+            results = await client.smartscraper_many(
+                inputs, user_prompt="Extract title"
+            )
+
+        assert results[0].ok
+        assert not results[1].ok
+
+    @pytest.mark.asyncio
+    async def test_markdownify_and_scrape_many(self, mock_api_key):
+        async with AsyncClient(api_key=mock_api_key, mock=True) as client:
+            markdown = await client.markdownify_many(["https://example.com"])
+            scraped = await client.scrape_many(
+                [{"website_url": "https://example.com", "render_heavy_js": True}]
+            )
+
+        assert markdown[0].ok
+        assert scraped[0].ok
+
+    @pytest.mark.asyncio
+    async def test_as_completed(self, mock_api_key):
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        async with AsyncClient(api_key=mock_api_key, mock=True) as client:
+            seen = [
+                item.index
+                async for item in client.as_completed(
+                    client.smartscraper, urls, concurrency=2, user_prompt="Extract"
+                )
+            ]
+
+        assert sorted(seen) == list(range(5))
@@ -0,0 +1,248 @@
+"""
+Tests for the opt-in response cache
+"""
+
+import time
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.cache import ResponseCache, cache_key
+from tests.utils import generate_mock_api_key
+
+BASE = "https://api.scrapegraphai.com/v1"
+
+
+class Product(BaseModel):
+    name: str
+
+
+class Offer(BaseModel):
+    price: float
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def counting_handler(response=None):
+    calls = []
+
+    def handler(method, url, kwargs):
+        calls.append((method, url))
+        return (
+            response
+            if response is not None
+            else {"status": "completed", "call": len(calls)}
+        )
+
+    return handler, calls
+
+
+class TestCacheKey:
+    def test_key_ignores_payload_key_order(self):
+        assert cache_key("POST", f"{BASE}/scrape", {"a": 1, "b": 2}) == cache_key(
+            "post", "https://other-host/v1/scrape", {"b": 2, "a": 1}
+        )
+
+    def test_key_depends_on_endpoint_and_params(self):
+        payload = {"website_url": "https://example.com"}
+        assert cache_key("POST", f"{BASE}/scrape", payload) != cache_key(
+            "POST", f"{BASE}/markdownify", payload
+        )
+        assert cache_key("GET", f"{BASE}/scrape", params={"page": 1}) != cache_key(
+            "GET", f"{BASE}/scrape", params={"page": 2}
+        )
+
+
+    def test_key_depends_on_api_key_not_transport_headers(self):
+        url = f"{BASE}/markdownify"
+        payload = {"website_url": "https://example.com"}
+        first = cache_key("POST", url, payload, headers={"SGAI-APIKEY": "sgai-a"})
+
+        assert first != cache_key("POST", url, payload, headers={"SGAI-APIKEY": "sgai-b"})
+        assert first == cache_key(
+            "POST",
+            url,
+            payload,
+            headers={"sgai-apikey": "sgai-a", "Accept-Encoding": "gzip, br"},
+        )
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache()
+        cache.set("a", {"x": 1}, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_returned_values_are_copies(self):
+        cache = ResponseCache()
+        cache.set("a", {"items": [1]}, ttl=60)
+        cache.get("a")[1]["items"].append(2)
+        assert cache.get("a")[1] == {"items": [1]}
+
+    def test_mutating_endpoints_are_never_cached(self):
+        cache = ResponseCache(ttls={"feedback": 60, "scheduled-jobs": 60})
+        assert cache.ttl_for("POST", f"{BASE}/feedback") is None
+        assert cache.ttl_for("POST", f"{BASE}/scheduled-jobs") is None
+        assert cache.ttl_for("GET", f"{BASE}/scheduled-jobs/1") is None
+        assert cache.ttl_for("DELETE", f"{BASE}/smartscraper/1") is None
+        assert cache.ttl_for("GET", f"{BASE}/credits") is None
+        assert cache.ttl_for("POST", f"{BASE}/smartscraper") == cache.ttl
+
+    def test_per_endpoint_ttls(self):
+        cache = ResponseCache(
+            ttl=100, ttls={"searchscraper": 5, "markdownify": 0, "crawl": 30}
+        )
+        assert cache.ttl_for("POST", f"{BASE}/searchscraper") == 5
+        assert cache.ttl_for("POST", f"{BASE}/markdownify") is None
+        assert cache.ttl_for("POST", f"{BASE}/crawl") == 30
+        assert cache.ttl_for("POST", f"{BASE}/scrape") == 100
+
+
+class TestClientCaching:
+    def test_repeated_smartscraper_is_served_from_cache(self, mock_api_key):
+        handler, calls = counting_handler()
+        cache = ResponseCache()
+        client = Client(
+            api_key=mock_api_key, mock=True, mock_handler=handler, response_cache=cache
+        )
+
+        first = client.smartscraper(
+            user_prompt="Extract products",
+            website_url="https://example.com",
+            output_schema=Product,
+        )
+        second = client.smartscraper(
+            user_prompt="Extract products",
+            website_url="https://example.com",
+            output_schema=Product,
+        )
+
+        assert first == second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_output_schema_is_part_of_the_key(self, mock_api_key):
+        handler, calls = counting_handler()
+        client = Client(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=handler,
+            response_cache=ResponseCache(),
+        )
+
+        client.smartscraper(
+            user_prompt="Extract",
+            website_url="https://example.com",
+            output_schema=Product,
+        )
+        client.smartscraper(
+            user_prompt="Extract",
+            website_url="https://example.com",
+            output_schema=Offer,
+        )
+
+        assert len(calls) == 2
+
+    def test_feedback_is_not_cached(self, mock_api_key):
+        handler, calls = counting_handler({"status": "ok"})
+        cache = ResponseCache()
+        client = Client(
+            api_key=mock_api_key, mock=True, mock_handler=handler, response_cache=cache
+        )
+        request_id = str(uuid4())
+
+        client.submit_feedback(request_id=request_id, rating=5)
+        client.submit_feedback(request_id=request_id, rating=5)
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    def test_pending_status_is_not_cached(self, mock_api_key):
+        statuses = iter(["processing", "completed", "unused"])
+        cache = ResponseCache()
+        client = Client(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=lambda method, url, kwargs: {"status": next(statuses)},
+            response_cache=cache,
+        )
+        request_id = str(uuid4())
+
+        assert client.get_smartscraper(request_id)["status"] == "processing"
+        assert client.get_smartscraper(request_id)["status"] == "completed"
+        assert client.get_smartscraper(request_id)["status"] == "completed"
+        assert cache.stats()["hits"] == 1
+
+    def test_failed_results_are_not_cached(self, mock_api_key):
+        handler, calls = counting_handler({"status": "failed", "error": "boom"})
+        client = Client(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=handler,
+            response_cache=ResponseCache(),
+        )
+
+        client.markdownify(website_url="https://example.com")
+        client.markdownify(website_url="https://example.com")
+
+        assert len(calls) == 2
+
+    def test_shared_cache_keeps_accounts_apart(self):
+        handler, calls = counting_handler()
+        cache = ResponseCache()
+        clients = [
+            Client(
+                api_key=generate_mock_api_key(),
+                mock=True,
+                mock_handler=handler,
+                response_cache=cache,
+            )
+            for _ in range(2)
+        ]
+
+        results = [
+            client.markdownify(website_url="https://example.com") for client in clients
+        ]
+
+        assert [result["call"] for result in results] == [1, 2]
+        assert clients[0].markdownify(website_url="https://example.com") == results[0]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_with_async_client(self, mock_api_key):
+        handler, calls = counting_handler()
+        cache = ResponseCache()
+        sync_client = Client(
+            api_key=mock_api_key, mock=True, mock_handler=handler, response_cache=cache
+        )
+        sync_client.markdownify(website_url="https://example.com")
+
+        async with AsyncClient(
+            api_key=mock_api_key, mock=True, mock_handler=handler, response_cache=cache
+        ) as client:
+            result = await client.markdownify(website_url="https://example.com")
+
+        assert result["call"] == 1
+        assert len(calls) == 1
@@ -0,0 +1,224 @@
+"""
+Tests for durable job checkpoints and resume
+"""
+
+import re
+import threading
+from uuid import uuid4
+
+import pytest
+import responses
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.config import API_BASE_URL
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.checkpoint import (
+    CheckpointStore,
+    JobRecord,
+    SQLiteCheckpointStore,
+)
+from tests.utils import generate_mock_api_key
+
+FAST = {"initial_interval": 0.01, "max_interval": 0.01}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "jobs.db"
+
+
+class FakeAPI:
+    """Mock handler handing out job IDs and answering status requests"""
+
+    def __init__(self):
+        self.submissions = []
+        self.polls = []
+        self.statuses = {}
+
+    def __call__(self, method, url, kwargs):
+        if method == "POST":
+            request_id = str(uuid4())
+            self.submissions.append(url)
+            self.statuses[request_id] = "processing"
+            key = "crawl_id" if url.endswith("/crawl") else "request_id"
+            return {key: request_id, "status": "queued"}
+        request_id = url.rsplit("/", 1)[-1]
+        self.polls.append(request_id)
+        return {"request_id": request_id, "status": self.statuses[request_id]}
+
+
+def client_for(api, store, mock_api_key):
+    return Client(
+        api_key=mock_api_key, mock=True, mock_handler=api, checkpoint_store=store
+    )
+
+
+def test_submissions_are_recorded(mock_api_key, db_path):
+    api = FakeAPI()
+    store = SQLiteCheckpointStore(db_path)
+    client = client_for(api, store, mock_api_key)
+
+    job = client.markdownify(website_url="https://example.com")
+    client.markdownify(website_url="https://example.org")
+
+    assert len(store) == 2
+    record, _ = store.unfinished()
+    assert record.request_id == job["request_id"]
+    assert record.service == "markdownify"
+    assert record.payload["website_url"] == "https://example.com"
+    assert record.status == "queued"
+    assert record.location.endswith(f"/markdownify/{job['request_id']}")
+
+
+def test_repeated_submission_is_not_sent_again(mock_api_key, db_path):
+    api = FakeAPI()
+    first = client_for(api, SQLiteCheckpointStore(db_path), mock_api_key)
+    job = first.markdownify(website_url="https://example.com")
+
+    # A restarted worker with the same store
+    second = client_for(api, SQLiteCheckpointStore(db_path), mock_api_key)
+    assert second.markdownify(website_url="https://example.com") == job
+    assert len(api.submissions) == 1
+
+
+@pytest.mark.parametrize("status", ["failed", "completed"])
+def test_finished_jobs_are_resubmitted(mock_api_key, db_path, status):
+    api = FakeAPI()
+    client = client_for(api, SQLiteCheckpointStore(db_path), mock_api_key)
+    job = client.markdownify(website_url="https://example.com")
+    api.statuses[job["request_id"]] = status
+    client.get_markdownify(job["request_id"])
+
+    again = client.markdownify(website_url="https://example.com")
+    assert again["request_id"] != job["request_id"]
+    assert len(api.submissions) == 2
+
+
+def test_completed_submissions_are_not_replayed(mock_api_key, db_path):
+    runs = []
+
+    def handler(method, url, kwargs):
+        runs.append(url)
+        return {"request_id": str(uuid4()), "status": "completed", "run": len(runs)}
+
+    client = Client(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=handler,
+        checkpoint_store=SQLiteCheckpointStore(db_path),
+    )
+    results = [
+        client.smartscraper(user_prompt="Extract", website_url="https://example.com")
+        for _ in range(3)
+    ]
+
+    assert [result["run"] for result in results] == [1, 2, 3]
+
+
+def test_incomplete_backend_fails_on_creation():
+    class Partial(CheckpointStore):
+        def load(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_resume_reattaches_to_unfinished_jobs(mock_api_key, db_path):
+    api = FakeAPI()
+    client = client_for(api, SQLiteCheckpointStore(db_path), mock_api_key)
+    done = client.smartscraper(user_prompt="Extract", website_url="https://example.com")
+    crawl = client.crawl(
+        url="https://example.com", prompt="Extract", data_schema={"type": "object"}
+    )
+    api.statuses[done["request_id"]] = "completed"
+    client.get_smartscraper(done["request_id"])
+    api.statuses[crawl["crawl_id"]] = "completed"
+
+    restarted = client_for(api, SQLiteCheckpointStore(db_path), mock_api_key)
+    items = list(restarted.resume(**FAST))
+
+    assert [item.input for item in items] == [("crawl", crawl["crawl_id"])]
+    assert items[0].result["status"] == "completed"
+    assert len(api.submissions) == 2
+    assert restarted.checkpoint_store.unfinished() == []
+
+
+@responses.activate
+def test_resume_marks_unknown_jobs_failed(mock_api_key, db_path):
+    responses.add(
+        responses.GET,
+        re.compile(re.escape(API_BASE_URL) + "/.*"),
+        json={"error": "Job not found"},
+        status=404,
+    )
+    store = SQLiteCheckpointStore(db_path)
+    store.save(
+        JobRecord(
+            key="k",
+            service="scrape",
+            request_id=str(uuid4()),
+            payload={"website_url": "https://example.com"},
+            status="processing",
+            location="",
+        )
+    )
+    client = Client(api_key=mock_api_key, checkpoint_store=store)
+
+    (item,) = client.resume(**FAST)
+    assert isinstance(item.error, APIError) and item.error.status_code == 404
+    assert store.unfinished() == []
+
+
+def test_resume_requires_a_store(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+    with pytest.raises(ValueError, match="checkpoint_store"):
+        list(client.resume())
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_the_store(mock_api_key, db_path):
+    api = FakeAPI()
+    store = SQLiteCheckpointStore(db_path)
+    client = AsyncClient(
+        api_key=mock_api_key, mock=True, mock_handler=api, checkpoint_store=store
+    )
+    job = await client.markdownify(website_url="https://example.com")
+    assert await client.markdownify(website_url="https://example.com") == job
+
+    api.statuses[job["request_id"]] = "completed"
+    items = [item async for item in client.resume(**FAST)]
+    assert [item.input for item in items] == [("markdownify", job["request_id"])]
+    assert store.unfinished() == []
+    assert len(api.submissions) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_keeps_store_calls_off_the_loop(mock_api_key, db_path):
+    threads = []
+
+    class RecordingStore(SQLiteCheckpointStore):
+        def lookup(self, method, url, kwargs):
+            threads.append(threading.get_ident())
+            return super().lookup(method, url, kwargs)
+
+        def record(self, *args):
+            threads.append(threading.get_ident())
+            super().record(*args)
+
+    client = AsyncClient(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=FakeAPI(),
+        checkpoint_store=RecordingStore(db_path),
+    )
+    await client.markdownify(website_url="https://example.com")
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
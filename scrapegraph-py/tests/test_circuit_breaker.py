@@ -0,0 +1,250 @@
+"""
+Tests for the per-endpoint-family circuit breaker
+"""
+
+import asyncio
+import time
+
+import pytest
+import requests
+import responses
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError, CircuitOpenError
+from scrapegraph_py.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    is_failure,
+    is_healthy,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp
+
+SMARTSCRAPER = "https://api.scrapegraphai.com/v1/smartscraper"
+MARKDOWNIFY = "https://api.scrapegraphai.com/v1/markdownify"
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def fail_smartscraper():
+    responses.add(
+        responses.POST, SMARTSCRAPER, json={"error": "upstream unavailable"}, status=503
+    )
+
+
+def trip(breaker, url=SMARTSCRAPER, count=None):
+    for _ in range(count or breaker.min_requests):
+        breaker.record(url, APIError("boom", status_code=500), 0.01)
+
+
+def test_opens_after_failure_rate():
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=4)
+    breaker.record(SMARTSCRAPER, None, 0.01)
+    breaker.record(SMARTSCRAPER, APIError("boom", status_code=502), 0.01)
+    breaker.record(SMARTSCRAPER, None, 0.01)
+    assert breaker.state(SMARTSCRAPER) == CLOSED
+
+    breaker.record(SMARTSCRAPER, APIError("boom", status_code=502), 0.01)
+
+    assert breaker.state(SMARTSCRAPER) == OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.check(SMARTSCRAPER)
+    assert exc_info.value.family == "smartscraper"
+    assert 0 < exc_info.value.retry_after <= breaker.open_duration
+    assert exc_info.value.status_code == 503
+    assert str(exc_info.value).startswith("[503] Circuit open for 'smartscraper'")
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker(failure_rate=1.0, min_requests=3, slow_call_duration=0.5)
+    for _ in range(3):
+        breaker.record(SMARTSCRAPER, None, 2.0)
+
+    assert breaker.state(SMARTSCRAPER) == OPEN
+
+
+def test_client_errors_do_not_count():
+    assert not is_failure(None)
+    assert not is_failure(APIError("bad request", status_code=400))
+    assert not is_failure(APIError("rate limited", status_code=429))
+    assert is_failure(APIError("bad gateway", status_code=502))
+    assert is_failure(requests.exceptions.ConnectTimeout())
+    assert not is_failure(ValueError("not transport related"))
+
+
+def test_old_calls_leave_the_window():
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=2, window=0.05)
+    trip(breaker, count=1)
+    time.sleep(0.1)
+    breaker.record(SMARTSCRAPER, APIError("boom", status_code=500), 0.01)
+
+    assert breaker.state(SMARTSCRAPER) == CLOSED
+
+
+def test_families_are_isolated():
+    breaker = CircuitBreaker(min_requests=2)
+    trip(breaker)
+
+    assert breaker.state(SMARTSCRAPER) == OPEN
+    assert breaker.check(MARKDOWNIFY) is False
+    assert breaker.stats()["smartscraper"]["state"] == OPEN
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker(min_requests=2, open_duration=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+
+    assert breaker.check(SMARTSCRAPER) is True
+    assert breaker.state(SMARTSCRAPER) == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check(SMARTSCRAPER)
+
+    breaker.probe_finished(SMARTSCRAPER, True)
+    assert breaker.state(SMARTSCRAPER) == CLOSED
+    assert breaker.check(SMARTSCRAPER) is False
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(min_requests=2, open_duration=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.check(SMARTSCRAPER) is True
+
+    with pytest.raises(CircuitOpenError):
+        breaker.probe_finished(SMARTSCRAPER, False)
+    assert breaker.state(SMARTSCRAPER) == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check(SMARTSCRAPER)
+
+
+def test_health_statuses():
+    assert is_healthy({"status": "healthy", "message": "Service is operational"})
+    assert is_healthy({"message": "no status field"})
+    assert not is_healthy({"status": "degraded"})
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(min_requests=0)
+
+
+@responses.activate
+def test_client_fails_fast_once_open(mock_api_key):
+    fail_smartscraper()
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=3)
+    client = Client(api_key=mock_api_key, max_retries=0, circuit_breaker=breaker)
+
+    for _ in range(3):
+        with pytest.raises(APIError) as exc_info:
+            client._make_request("POST", SMARTSCRAPER, json={"user_prompt": "x"})
+        assert not isinstance(exc_info.value, CircuitOpenError)
+
+    with pytest.raises(CircuitOpenError):
+        client._make_request("POST", SMARTSCRAPER, json={"user_prompt": "x"})
+    assert len(responses.calls) == 3
+    client.close()
+
+
+@responses.activate
+def test_client_stops_retrying_when_circuit_opens(mock_api_key):
+    fail_smartscraper()
+    breaker = CircuitBreaker(failure_rate=1.0, min_requests=2)
+    client = Client(
+        api_key=mock_api_key, max_retries=5, retry_delay=0.001, circuit_breaker=breaker
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client._make_request("POST", SMARTSCRAPER, json={"user_prompt": "x"})
+    assert len(responses.calls) == 2
+    client.close()
+
+
+@responses.activate
+def test_client_probes_healthz_before_closing(mock_api_key, monkeypatch):
+    fail_smartscraper()
+    breaker = CircuitBreaker(min_requests=1, open_duration=0.05)
+    client = Client(api_key=mock_api_key, max_retries=0, circuit_breaker=breaker)
+    probes = []
+
+    def healthz():
+        probes.append(True)
+        return {"status": "unhealthy"} if len(probes) == 1 else {"status": "healthy"}
+
+    monkeypatch.setattr(client, "healthz", healthz)
+    trip(breaker)
+    time.sleep(0.06)
+
+    # Unhealthy probe: the request is refused without reaching the server
+    with pytest.raises(CircuitOpenError):
+        client._make_request("POST", SMARTSCRAPER, json={"user_prompt": "x"})
+    assert len(responses.calls) == 0
+
+    time.sleep(0.06)
+    with pytest.raises(APIError) as exc_info:
+        client._make_request("POST", SMARTSCRAPER, json={"user_prompt": "x"})
+    assert not isinstance(exc_info.value, CircuitOpenError)
+    assert len(probes) == 2
+    assert len(responses.calls) == 1
+    client.close()
+
+
+def test_probe_exception_keeps_circuit_open(mock_api_key, monkeypatch):
+    breaker = CircuitBreaker(min_requests=1, open_duration=0.01)
+    client = Client(api_key=mock_api_key, circuit_breaker=breaker)
+
+    def healthz():
+        raise ConnectionError("Failed to connect to API")
+
+    monkeypatch.setattr(client, "healthz", healthz)
+    trip(breaker)
+    time.sleep(0.02)
+
+    with pytest.raises(CircuitOpenError):
+        client._check_circuit(SMARTSCRAPER)
+    assert breaker.state(SMARTSCRAPER) == OPEN
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast_and_recovers(mock_api_key, monkeypatch):
+    hits = []
+    healthy = False
+
+    async def handler(request):
+        hits.append(request.path)
+        if not healthy:
+            return web.json_response({"error": "upstream unavailable"}, status=503)
+        return web.json_response({"request_id": "abc", "status": "completed"})
+
+    breaker = CircuitBreaker(failure_rate=1.0, min_requests=2, open_duration=0.05)
+    async with serve_aiohttp([web.post("/v1/smartscraper", handler)]) as base_url:
+        url = f"{base_url}/v1/smartscraper"
+        async with AsyncClient(
+            api_key=mock_api_key, max_retries=0, circuit_breaker=breaker
+        ) as client:
+
+            async def healthz():
+                return {"status": "healthy" if healthy else "unhealthy"}
+
+            monkeypatch.setattr(client, "healthz", healthz)
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    await client._make_request("POST", url, json={"user_prompt": "x"})
+            with pytest.raises(CircuitOpenError):
+                await client._make_request("POST", url, json={"user_prompt": "x"})
+            assert len(hits) == 2
+
+            healthy = True
+            await asyncio.sleep(0.06)
+            result = await client._make_request("POST", url, json={"user_prompt": "x"})
+
+    assert result["status"] == "completed"
+    assert breaker.state(url) == CLOSED
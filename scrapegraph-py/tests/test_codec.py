@@ -0,0 +1,121 @@
+"""
+Tests for the pluggable JSON codecs
+"""
+
+import json
+
+import pytest
+import responses
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.codec import (
+    CODECS,
+    JSONCodec,
+    encode_json_body,
+    get_codec,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp
+
+AVAILABLE = [name for name, (_, available) in CODECS.items() if available]
+
+PAYLOAD = {
+    "user_prompt": "Extract prices in €",
+    "website_html": '<p>"quoted" ☃</p>',
+    "numbers": [1, 2.5, None, True],
+    "nested": {"deep": {"list": []}},
+}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+SMARTSCRAPER = "https://api.scrapegraphai.com/v1/smartscraper"
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_round_trip(name):
+    codec = get_codec(name)
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(bytearray(encoded)) == PAYLOAD
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_invalid_json_raises_value_error(name):
+    with pytest.raises(ValueError):
+        get_codec(name).loads(b"<html>Bad gateway</html>")
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_unsupported_values_fall_back_to_stdlib(name):
+    assert json.loads(get_codec(name).dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_default_is_fastest_available():
+    assert get_codec().name == AVAILABLE[0]
+    assert get_codec() is get_codec()
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_codec_instances_pass_through():
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+
+
+def test_encode_json_body():
+    kwargs = {"json": {"a": 1}, "headers": {"Idempotency-Key": "k"}}
+    encoded = encode_json_body(kwargs, JSONCodec())
+
+    assert encoded["data"] == b'{"a":1}'
+    assert encoded["headers"] == {
+        "Idempotency-Key": "k",
+        "Content-Type": "application/json",
+    }
+    assert "json" not in encoded
+    assert "json" in kwargs
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+@responses.activate
+def test_client_sends_pre_encoded_body(mock_api_key, name):
+    responses.add_callback(
+        responses.POST, SMARTSCRAPER, callback=lambda request: (200, {}, request.body)
+    )
+    client = Client(api_key=mock_api_key, json_codec=name)
+
+    result = client._make_request("POST", SMARTSCRAPER, json=PAYLOAD)
+
+    assert result == PAYLOAD
+    request = responses.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.body == get_codec(name).dumps(PAYLOAD)
+
+
+@pytest.mark.asyncio
+async def test_async_client_sends_pre_encoded_body(mock_api_key):
+    received = []
+
+    async def handler(request):
+        received.append((request.content_type, await request.read()))
+        return web.Response(body=await request.read(), content_type="text/plain")
+
+    async with serve_aiohttp([web.post("/v1/smartscraper", handler)]) as base_url:
+        async with AsyncClient(api_key=mock_api_key) as client:
+            result = await client._make_request(
+                "POST", f"{base_url}/v1/smartscraper", json=PAYLOAD
+            )
+
+    # The body is decoded as JSON whatever the response content type says
+    assert result == PAYLOAD
+    assert received[0] == ("application/json", client.codec.dumps(PAYLOAD))
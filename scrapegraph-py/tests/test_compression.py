@@ -0,0 +1,161 @@
+"""
+Tests for request body compression and Accept-Encoding negotiation
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.compression import (
+    ZSTD_AVAILABLE,
+    accept_encoding,
+    compress_body,
+    get_compressor,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp, serve_http
+
+LARGE_PAYLOAD = {
+    "user_prompt": "Extract all products",
+    "website_html": "<tr><td>Product</td><td>€9.99</td></tr>" * 5000,
+}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def gzip_server():
+    received = []
+
+    def respond(request):
+        body = request.body
+        encoding = request.headers.get("Content-Encoding")
+        received.append((encoding, len(body), request.headers.get("Accept-Encoding")))
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body)
+        response = gzip.compress(
+            json.dumps({"size": len(payload["website_html"])}).encode()
+        )
+        return 200, response, {"Content-Encoding": "gzip"}
+
+    with serve_http(respond) as base_url:
+        yield f"{base_url}/v1/smartscraper", received
+
+
+def test_compress_body_above_threshold():
+    kwargs = {
+        "data": json.dumps(LARGE_PAYLOAD).encode(),
+        "headers": {"Idempotency-Key": "k"},
+    }
+    compressed = compress_body(kwargs, "gzip", threshold=1024)
+
+    assert compressed["headers"] == {"Idempotency-Key": "k", "Content-Encoding": "gzip"}
+    assert len(compressed["data"]) < len(kwargs["data"]) / 5
+    assert gzip.decompress(compressed["data"]) == kwargs["data"]
+    assert "Content-Encoding" not in kwargs["headers"]
+
+
+def test_small_or_missing_bodies_are_untouched():
+    small = {"data": b'{"a":1}'}
+    assert compress_body(small, "gzip", threshold=1024) is small
+    assert compress_body({"params": {}}, "gzip", threshold=0) == {"params": {}}
+    assert compress_body({"data": b"x" * 2048}, None, threshold=0) == {
+        "data": b"x" * 2048
+    }
+
+
+def test_incompressible_bodies_are_sent_as_is():
+    body = {"data": os.urandom(4096)}
+    assert compress_body(body, "gzip", threshold=0) is body
+
+
+def test_get_compressor_validation():
+    assert get_compressor(None) is None
+    assert get_compressor("gzip") is not None
+    with pytest.raises(ValueError):
+        get_compressor("lz4")
+    if not ZSTD_AVAILABLE:
+        with pytest.raises(ImportError):
+            get_compressor("zstd")
+
+
+@pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+def test_zstd_round_trip():
+    import zstandard
+
+    data = json.dumps(LARGE_PAYLOAD).encode()
+    compressed = compress_body({"data": data}, "zstd", threshold=0)
+    assert compressed["headers"]["Content-Encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompress(compressed["data"]) == data
+
+
+def test_accept_encoding_lists_only_decodable_encodings():
+    assert accept_encoding(brotli=False, zstd=False) == "gzip;q=0.8, deflate;q=0.5"
+    assert (
+        accept_encoding(brotli=True, zstd=True)
+        == "zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.5"
+    )
+
+
+def test_invalid_compression_option(mock_api_key):
+    with pytest.raises(ValueError):
+        Client(api_key=mock_api_key, request_compression="lz4")
+
+
+def test_client_compresses_large_bodies(mock_api_key, gzip_server):
+    url, received = gzip_server
+    client = Client(
+        api_key=mock_api_key, request_compression="gzip", compression_threshold=1024
+    )
+
+    result = client._make_request("POST", url, json=LARGE_PAYLOAD)
+    client._make_request("POST", url, json={"website_html": "<p>small</p>"})
+    client.close()
+
+    assert result == {"size": len(LARGE_PAYLOAD["website_html"])}
+    (encoding, size, accept), (small_encoding, _, _) = received
+    assert encoding == "gzip"
+    assert size < len(json.dumps(LARGE_PAYLOAD)) / 5
+    assert small_encoding is None
+    assert "gzip" in accept
+
+
+def test_client_sends_uncompressed_by_default(mock_api_key, gzip_server):
+    url, received = gzip_server
+    client = Client(api_key=mock_api_key)
+    client._make_request("POST", url, json=LARGE_PAYLOAD)
+    client.close()
+
+    assert received[0][0] is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_compresses_large_bodies(mock_api_key):
+    received = []
+
+    async def handler(request):
+        body = await request.read()
+        received.append((request.headers.get("Content-Encoding"), len(body)))
+        payload = json.loads(gzip.decompress(body))
+        return web.json_response({"size": len(payload["website_html"])})
+
+    routes = [web.post("/v1/smartscraper", handler)]
+    async with serve_aiohttp(routes, auto_decompress=False) as base_url:
+        async with AsyncClient(
+            api_key=mock_api_key, request_compression="gzip", compression_threshold=1024
+        ) as client:
+            result = await client._make_request(
+                "POST", f"{base_url}/v1/smartscraper", json=LARGE_PAYLOAD
+            )
+
+    assert result == {"size": len(LARGE_PAYLOAD["website_html"])}
+    assert received[0][0] == "gzip"
+    assert received[0][1] < len(json.dumps(LARGE_PAYLOAD)) / 5
@@ -0,0 +1,139 @@
+"""
+Tests for the validation of uploaded HTML and Markdown
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.models.smartscraper import SmartScraperRequest
+from scrapegraph_py.utils.content_validation import (
+    HAS_BS4,
+    HAS_LXML,
+    MAX_CONTENT_BYTES,
+    has_html_tag,
+    utf8_size_exceeds,
+    validate_html,
+    validate_markdown,
+)
+from tests.utils import generate_mock_api_key
+
+VALID_HTML = "<html><body><h1>Title</h1><p>Content</p></body></html>"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "a" * MAX_CONTENT_BYTES,
+        "a" * (MAX_CONTENT_BYTES + 1),
+        "€" * (MAX_CONTENT_BYTES // 3),
+        "€" * (MAX_CONTENT_BYTES // 3 + 1),
+        "a" * (MAX_CONTENT_BYTES - 200_000) + "😀" * 60_000,
+        "😀" * (MAX_CONTENT_BYTES // 4),
+    ],
+)
+def test_utf8_size_matches_encoded_length(text):
+    expected = len(text.encode("utf-8")) > MAX_CONTENT_BYTES
+    assert utf8_size_exceeds(text) is expected
+
+
+def test_utf8_size_custom_limit():
+    assert utf8_size_exceeds("ééé", limit=5)
+    assert not utf8_size_exceeds("ééé", limit=6)
+
+
+def test_tag_sniff():
+    assert has_html_tag(VALID_HTML)
+    assert has_html_tag("text before <p>a paragraph")
+    assert not has_html_tag("not html content")
+    assert not has_html_tag("1 < 2 and 3 > 2")
+
+
+@pytest.mark.parametrize("mode", ["fast", "strict"] + (["lxml"] if HAS_LXML else []))
+def test_modes_accept_valid_and_reject_text(mode):
+    validate_html(VALID_HTML, mode)
+    with pytest.raises(ValueError):
+        validate_html("not html content", mode)
+
+
+def test_size_limit_applies_to_every_mode():
+    large_html = "<html><body>" + "x" * MAX_CONTENT_BYTES + "</body></html>"
+    for mode in ("fast", "lxml", "strict"):
+        with pytest.raises(ValueError, match="exceeds maximum size"):
+            validate_html(large_html, mode)
+
+
+@pytest.mark.skipif(not HAS_BS4, reason="beautifulsoup4 not installed")
+def test_strict_mode_rejects_commented_out_tags():
+    html = "<!-- <p>hidden</p> -->"
+    validate_html(html, "fast")
+    with pytest.raises(ValueError):
+        validate_html(html, "strict")
+
+
+@pytest.mark.skipif(HAS_LXML, reason="lxml installed")
+def test_lxml_mode_requires_lxml():
+    with pytest.raises(ImportError):
+        validate_html(VALID_HTML, "lxml")
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        validate_html(VALID_HTML, "regex")
+
+
+def test_markdown_validation():
+    validate_markdown("# Title")
+    for empty in ("", "  \n\t "):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            validate_markdown(empty)
+    with pytest.raises(ValueError, match="exceeds maximum size"):
+        validate_markdown("é" * MAX_CONTENT_BYTES)
+
+
+def test_request_mode_is_not_sent_to_api():
+    request = SmartScraperRequest(
+        user_prompt="Extract the title",
+        website_html=VALID_HTML,
+        html_validation="strict",
+    )
+
+    assert request.html_validation == "strict"
+    assert "html_validation" not in request.model_dump()
+
+
+def test_request_rejects_unknown_mode():
+    with pytest.raises(ValidationError):
+        SmartScraperRequest(
+            user_prompt="Extract the title",
+            website_html=VALID_HTML,
+            html_validation="regex",
+        )
+
+
+@pytest.mark.skipif(not HAS_BS4, reason="beautifulsoup4 not installed")
+def test_clients_forward_the_validation_mode():
+    html = "<!-- <p>hidden</p> -->"
+    client = Client(api_key=generate_mock_api_key(), mock=True)
+
+    assert client.smartscraper(user_prompt="Extract the title", website_html=html)
+    with pytest.raises(ValueError):
+        client.smartscraper(
+            user_prompt="Extract the title", website_html=html, html_validation="strict"
+        )
+    client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not HAS_BS4, reason="beautifulsoup4 not installed")
+async def test_async_client_forwards_the_validation_mode():
+    html = "<!-- <p>hidden</p> -->"
+    async with AsyncClient(api_key=generate_mock_api_key(), mock=True) as client:
+        with pytest.raises(ValueError):
+            await client.smartscraper(
+                user_prompt="Extract the title",
+                website_html=html,
+                html_validation="strict",
+            )
@@ -0,0 +1,124 @@
+"""
+Tests for page-by-page iteration of running crawls
+"""
+
+from uuid import uuid4
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.crawl_pages import CrawlPage
+from tests.utils import generate_mock_api_key, serve_aiohttp
+
+FAST = {"initial_interval": 0.01, "max_interval": 0.01}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def page(i):
+    return {
+        "url": f"https://example.com/{i}",
+        "markdown": f"# Page {i}",
+        "metadata": {"depth": i},
+    }
+
+
+def growing_crawl(batches, final_status="success"):
+    """Status responses exposing the given number of pages per poll"""
+    polls = []
+
+    def respond():
+        count = batches[min(len(polls), len(batches) - 1)]
+        status = final_status if len(polls) >= len(batches) - 1 else "processing"
+        polls.append(count)
+        return {"status": status, "result": {"pages": [page(i) for i in range(count)]}}
+
+    return respond, polls
+
+
+def test_pages_are_yielded_once_as_they_appear(mock_api_key):
+    respond, polls = growing_crawl([1, 1, 3, 4])
+    client = Client(
+        api_key=mock_api_key, mock=True, mock_handler=lambda *args: respond()
+    )
+
+    pages = list(client.iter_crawl_pages(str(uuid4()), **FAST))
+
+    assert polls == [1, 1, 3, 4]
+    assert [p.index for p in pages] == [0, 1, 2, 3]
+    assert [p.url for p in pages] == [f"https://example.com/{i}" for i in range(4)]
+    assert pages[2].markdown == "# Page 2" and pages[2].metadata == {"depth": 2}
+    assert pages[0].raw == page(0)
+
+
+def test_iteration_resumes_from_a_cursor(mock_api_key):
+    respond, _ = growing_crawl([3])
+    client = Client(
+        api_key=mock_api_key, mock=True, mock_handler=lambda *args: respond()
+    )
+
+    pages = list(client.iter_crawl_pages(str(uuid4()), cursor=2, **FAST))
+
+    assert [(p.index, p.url) for p in pages] == [(2, "https://example.com/2")]
+
+
+def test_failed_crawl_raises(mock_api_key):
+    respond, _ = growing_crawl([1, 2], final_status="failed")
+
+    def handler(*args):
+        return dict(respond(), error="Site unreachable")
+
+    client = Client(api_key=mock_api_key, mock=True, mock_handler=handler)
+    pages = []
+    with pytest.raises(APIError, match="Site unreachable"):
+        for item in client.iter_crawl_pages(str(uuid4()), **FAST):
+            pages.append(item)
+    assert len(pages) == 2
+
+
+def test_running_crawl_times_out(mock_api_key):
+    client = Client(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=lambda *args: {"status": "processing", "result": {"pages": []}},
+    )
+    with pytest.raises(TimeoutError):
+        list(client.iter_crawl_pages(str(uuid4()), timeout=0.05, **FAST))
+
+
+def test_extracted_data_is_exposed():
+    item = CrawlPage.from_response(0, {"url": "u", "llm_result": {"title": "T"}})
+    assert item.data == {"title": "T"} and item.markdown is None and item.metadata == {}
+    assert (
+        CrawlPage.from_response(1, "https://example.com").url == "https://example.com"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_over_http(mock_api_key):
+    respond, polls = growing_crawl([2, 2, 5])
+    crawl_id = str(uuid4())
+
+    async def status(request):
+        return web.json_response(respond())
+
+    routes = [web.get(f"/v1/crawl/{crawl_id}", status)]
+    async with serve_aiohttp(routes, host="localhost") as base_url:
+        import scrapegraph_py.async_client as module
+
+        original, module.API_BASE_URL = module.API_BASE_URL, f"{base_url}/v1"
+        try:
+            async with AsyncClient(api_key=mock_api_key) as client:
+                pages = [p async for p in client.iter_crawl_pages(crawl_id, **FAST)]
+        finally:
+            module.API_BASE_URL = original
+
+    assert polls == [2, 2, 5]
+    assert [p.index for p in pages] == [0, 1, 2, 3, 4]
+    assert pages[4].markdown == "# Page 4"
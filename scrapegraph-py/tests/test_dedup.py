@@ -0,0 +1,162 @@
+"""
+Tests for near-duplicate page suppression
+"""
+
+import random
+
+import pytest
+
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.bulk import BulkResult
+from scrapegraph_py.utils.crawl_pages import CrawlPage
+from scrapegraph_py.utils.dedup import (
+    FINGERPRINT_BITS,
+    FingerprintStore,
+    NearDuplicateFilter,
+    SQLiteFingerprintStore,
+    hamming_distance,
+    simhash,
+    split_bands,
+)
+from tests.utils import generate_mock_api_key
+
+WORDS = [f"word{i}" for i in range(3000)]
+
+
+def article(seed, words=800):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def paginated(text, page):
+    return f"{text}\n\nPage {page} of 12 · Next"
+
+
+def test_simhash_separates_near_and_unrelated_texts():
+    text = article(1)
+
+    assert simhash(text) == simhash(text.upper())
+    assert hamming_distance(simhash(text), simhash(paginated(text, 2))) <= 5
+    assert hamming_distance(simhash(text), simhash(article(2))) > 12
+
+
+def test_split_bands_cover_the_fingerprint():
+    fingerprint = simhash(article(3))
+    for count in (1, 4, 6, 64):
+        parts = split_bands(fingerprint, count)
+        edges = [i * FINGERPRINT_BITS // count for i in range(count + 1)]
+        assert len(parts) == count
+        assert sum(part << low for part, low in zip(parts, edges)) == fingerprint
+
+
+def test_crawl_page_variants_are_flagged():
+    base, other = article(4), article(5)
+    pages = [
+        CrawlPage(index=0, url="https://example.com/list", markdown=base),
+        CrawlPage(
+            index=1, url="https://example.com/list?page=2", markdown=paginated(base, 2)
+        ),
+        CrawlPage(index=2, url="https://example.com/about", markdown=other),
+        CrawlPage(index=3, url="https://example.com/list/print", markdown=base),
+        CrawlPage(index=4, url="https://example.com/empty"),
+    ]
+    dedup = NearDuplicateFilter()
+
+    matches = [match for _, match in dedup.scan(pages)]
+
+    assert [match is None for match in matches] == [True, False, True, False, True]
+    assert matches[1].duplicate_of == "https://example.com/list"
+    assert (
+        matches[3].key == "https://example.com/list/print" and matches[3].distance == 0
+    )
+    assert dedup.checked == 4 and dedup.duplicates == 2
+    assert len(dedup.store) == 2
+
+
+def test_index_is_kept_across_runs(tmp_path):
+    path = tmp_path / "fingerprints.db"
+    pages = [
+        {"url": f"https://example.com/{i}", "markdown": article(10 + i)}
+        for i in range(3)
+    ]
+
+    first = NearDuplicateFilter(SQLiteFingerprintStore(path))
+    assert list(first.unique(pages)) == pages
+    first.store.close()
+
+    second = NearDuplicateFilter(SQLiteFingerprintStore(path))
+    variant = {
+        "url": "https://example.com/1?utm_source=feed",
+        "markdown": paginated(article(11), 3),
+    }
+    new = {"url": "https://example.com/new", "markdown": article(20)}
+    assert list(second.unique([pages[0], variant, new])) == [new]
+    assert second.check(pages[2]).duplicate_of == "https://example.com/2"
+
+    with pytest.raises(ValueError):
+        SQLiteFingerprintStore(path, bands=4)
+
+
+def test_max_distance_is_bounded_by_the_bands():
+    assert (
+        NearDuplicateFilter(SQLiteFingerprintStore(":memory:", bands=4)).max_distance
+        == 3
+    )
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(SQLiteFingerprintStore(":memory:", bands=4), max_distance=4)
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(shingle_size=0)
+
+
+def test_incomplete_backend_fails_on_creation():
+    class Partial(FingerprintStore):
+        def add(self, key, fingerprint):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_bulk_markdownify_results_are_deduplicated():
+    base = article(30)
+    content = {
+        "https://example.com/a": base,
+        "https://example.com/a?ref=nav": paginated(base, 1),
+        "https://example.com/b": article(31),
+    }
+
+    def handler(method, url, kwargs):
+        return {"status": "completed", "result": content[kwargs["json"]["website_url"]]}
+
+    client = Client(api_key=generate_mock_api_key(), mock=True, mock_handler=handler)
+    dedup = NearDuplicateFilter()
+    failed = BulkResult(
+        index=3, input="https://example.com/down", error=RuntimeError("boom")
+    )
+
+    results = sorted(
+        client.imap_unordered(client.markdownify, list(content), max_workers=1),
+        key=lambda item: item.index,
+    )
+    kept = list(dedup.unique(results + [failed]))
+
+    assert [item.input for item in kept] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/down",
+    ]
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_unique():
+    base = article(40)
+
+    async def pages():
+        for i, text in enumerate([base, paginated(base, 2), article(41)]):
+            yield CrawlPage(index=i, url=f"https://example.com/{i}", markdown=text)
+
+    dedup = NearDuplicateFilter()
+    kept = [page.index async for page in dedup.aunique(pages())]
+
+    assert kept == [0, 2]
@@ -0,0 +1,195 @@
+"""
+Tests for the sitemap-driven fan-out pipeline
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.fanout import interleave_by_domain
+from tests.utils import generate_mock_api_key
+
+SITEMAP = [
+    "https://example.com/",
+    "https://example.com/blog/a",
+    "https://example.com/blog/b",
+    "https://example.com/blog/drafts/c",
+    "https://shop.example.com/blog/d",
+    "https://shop.example.com/blog/e",
+    "https://example.com/about",
+]
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def sitemap_handler(method, url, kwargs):
+    if url.endswith("/sitemap"):
+        return {"urls": SITEMAP}
+    return {
+        "request_id": "1",
+        "status": "completed",
+        "result": kwargs["json"]["website_url"],
+    }
+
+
+class Gauge:
+    """Tracks the peak number of concurrent calls per domain"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = {}
+        self.peak = {}
+
+    def enter(self, url):
+        domain = url.split("/")[2]
+        with self.lock:
+            self.current[domain] = self.current.get(domain, 0) + 1
+            self.peak[domain] = max(self.peak.get(domain, 0), self.current[domain])
+        return domain
+
+    def leave(self, domain):
+        with self.lock:
+            self.current[domain] -= 1
+
+
+def test_interleave_by_domain():
+    assert interleave_by_domain(["a://x/1", "a://x/2", "a://y/1", "a://x/3"]) == [
+        "a://x/1",
+        "a://y/1",
+        "a://x/2",
+        "a://x/3",
+    ]
+
+
+def test_sync_fanout_filters_and_reports_progress(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True, mock_handler=sitemap_handler)
+    snapshots = []
+
+    items = list(
+        client.sitemap_fanout(
+            "https://example.com",
+            include_paths=["/blog/**"],
+            exclude_paths=["/blog/drafts/*"],
+            max_workers=4,
+            on_progress=lambda p: snapshots.append((p.selected, p.done, p.in_flight)),
+        )
+    )
+
+    assert sorted(item.input for item in items) == [
+        "https://example.com/blog/a",
+        "https://example.com/blog/b",
+        "https://shop.example.com/blog/d",
+        "https://shop.example.com/blog/e",
+    ]
+    assert all(item.ok and item.result["result"] == item.input for item in items)
+    assert snapshots[0] == (4, 0, 0) and snapshots[-1] == (4, 4, 0)
+    assert len(snapshots) == 5
+
+
+def test_sync_fanout_caps_concurrency_per_domain(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True, mock_handler=sitemap_handler)
+    gauge = Gauge()
+
+    def extract(website_url, **kwargs):
+        domain = gauge.enter(website_url)
+        time.sleep(0.02)
+        gauge.leave(domain)
+        if website_url.endswith("/about"):
+            raise ValueError("boom")
+        return kwargs
+
+    items = list(
+        client.sitemap_fanout(
+            "https://example.com",
+            extract,
+            max_workers=8,
+            per_domain_concurrency=2,
+            user_prompt="Extract",
+        )
+    )
+
+    assert len(items) == len(SITEMAP)
+    assert gauge.peak == {"example.com": 2, "shop.example.com": 2}
+    assert [item.input for item in items if not item.ok] == [
+        "https://example.com/about"
+    ]
+    assert all(item.result == {"user_prompt": "Extract"} for item in items if item.ok)
+
+
+@pytest.mark.asyncio
+async def test_async_fanout(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key, mock=True, mock_handler=sitemap_handler)
+    gauge = Gauge()
+    progress = []
+
+    async def extract(website_url):
+        domain = gauge.enter(website_url)
+        await asyncio.sleep(0.01)
+        gauge.leave(domain)
+        return website_url.upper()
+
+    items = [
+        item
+        async for item in client.sitemap_fanout(
+            "https://example.com",
+            extract,
+            exclude_paths=["/"],
+            concurrency=10,
+            per_domain_concurrency=3,
+            on_progress=progress.append,
+        )
+    ]
+
+    assert len(items) == len(SITEMAP) - 1
+    assert all(item.result == item.input.upper() for item in items)
+    assert gauge.peak["example.com"] == 3
+    final = progress[-1]
+    assert (final.discovered, final.selected, final.completed, final.failed) == (
+        7,
+        6,
+        6,
+        0,
+    )
+
+
+def test_invalid_patterns_are_rejected_before_fetching(mock_api_key):
+    calls = []
+    client = Client(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=lambda *args: calls.append(args) or {},
+    )
+    with pytest.raises(ValueError):
+        next(client.sitemap_fanout("https://example.com", include_paths=["blog/*"]))
+    assert calls == []
+
+
+def test_crawl_dry_run(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True, mock_handler=sitemap_handler)
+    preview = client.crawl_dry_run(
+        "https://example.com",
+        include_paths=["/blog/**", "/docs/**"],
+        exclude_paths=["/blog/drafts/*"],
+    )
+
+    assert preview.summary() == {
+        "total": 7,
+        "kept": 4,
+        "excluded": 1,
+        "not_included": 2,
+    }
+    assert preview.unused_patterns == ["/docs/**"]
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_dry_run(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key, mock=True, mock_handler=sitemap_handler)
+    preview = await client.crawl_dry_run("https://example.com", exclude_paths=["/"])
+    assert preview.excluded == ["https://example.com/"]
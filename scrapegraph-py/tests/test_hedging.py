@@ -0,0 +1,163 @@
+"""
+Tests for hedged status requests
+"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.hedging import HedgePolicy
+from scrapegraph_py.utils.retry import RetryBudget
+from tests.utils import generate_mock_api_key, serve_aiohttp, serve_http
+
+STATUS_URL = "https://api.scrapegraphai.com/v1/smartscraper/1234"
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def stalling_server():
+    """Server whose first request stalls for a second, the rest answer at once"""
+    hits = []
+
+    def respond(request):
+        hits.append(time.perf_counter())
+        if len(hits) == 1:
+            time.sleep(1.0)
+        return 200, b'{"request_id": "1234", "status": "completed"}'
+
+    with serve_http(respond) as base_url:
+        yield f"{base_url}/v1/smartscraper/1234", hits
+
+
+def test_delay_follows_latency_percentile():
+    policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.001)
+    assert policy.start(STATUS_URL) is None
+
+    for latency in range(1, 11):
+        policy.observe(STATUS_URL, latency / 100)
+
+    assert policy.start(STATUS_URL) == pytest.approx(0.09)
+    # Other families keep their own latency history
+    assert policy.start("https://api.scrapegraphai.com/v1/crawl/1") is None
+
+
+def test_min_delay_and_initial_delay():
+    policy = HedgePolicy(min_samples=1, min_delay=0.05, initial_delay=0.2)
+    assert policy.start(STATUS_URL) == 0.2
+
+    policy.observe(STATUS_URL, 0.001)
+    assert policy.start(STATUS_URL) == 0.05
+
+
+def test_only_status_gets_are_hedged():
+    policy = HedgePolicy()
+    assert policy.applies("GET", STATUS_URL)
+    assert policy.applies("get", "https://api.scrapegraphai.com/v1/scheduled-jobs/abc")
+    assert not policy.applies("POST", "https://api.scrapegraphai.com/v1/smartscraper")
+    assert not policy.applies("GET", "https://api.scrapegraphai.com/v1/credits")
+
+
+def test_budget_limits_hedges():
+    policy = HedgePolicy(budget=RetryBudget(ratio=0.25, reserve=1.0))
+    assert policy.allow_hedge()
+    assert not policy.allow_hedge()
+
+    for _ in range(4):
+        policy.start(STATUS_URL)
+    assert policy.allow_hedge()
+    assert policy.stats()["hedges"] == 2
+    assert policy.stats()["denied"] == 1
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=100)
+    with pytest.raises(ValueError):
+        HedgePolicy(min_samples=10, window=5)
+
+
+def test_client_hedges_slow_request(mock_api_key, stalling_server):
+    url, hits = stalling_server
+    policy = HedgePolicy(initial_delay=0.05)
+    client = Client(api_key=mock_api_key, max_retries=0, hedge_policy=policy)
+
+    start = time.perf_counter()
+    result = client._make_request("GET", url)
+    elapsed = time.perf_counter() - start
+
+    assert result["status"] == "completed"
+    assert elapsed < 0.5
+    assert len(hits) == 2
+    assert policy.stats()["hedge_wins"] == 1
+    client.close()
+
+
+def test_client_does_not_hedge_fast_requests(mock_api_key, stalling_server):
+    url, hits = stalling_server
+    hits.append(0.0)  # skip the stalled first request
+    policy = HedgePolicy(initial_delay=0.5)
+    client = Client(api_key=mock_api_key, hedge_policy=policy)
+
+    for _ in range(3):
+        client._make_request("GET", url)
+
+    assert len(hits) == 1 + 3
+    assert policy.stats()["hedges"] == 0
+    client.close()
+
+
+def test_client_respects_exhausted_budget(mock_api_key, stalling_server):
+    url, hits = stalling_server
+    policy = HedgePolicy(initial_delay=0.05, budget=RetryBudget(ratio=0, reserve=0))
+    client = Client(api_key=mock_api_key, hedge_policy=policy)
+
+    start = time.perf_counter()
+    client._make_request("GET", url)
+
+    assert time.perf_counter() - start >= 1.0
+    assert len(hits) == 1
+    assert policy.stats()["denied"] == 1
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_hedges_and_cancels_loser(mock_api_key):
+    calls = 0
+    cancelled = asyncio.Event()
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return web.json_response({"request_id": "1234", "status": "completed"})
+
+    policy = HedgePolicy(initial_delay=0.05)
+    routes = [web.get("/v1/smartscraper/{request_id}", handler)]
+    async with serve_aiohttp(routes, handler_cancellation=True) as base_url:
+        async with AsyncClient(
+            api_key=mock_api_key, max_retries=0, hedge_policy=policy
+        ) as client:
+            start = time.perf_counter()
+            result = await client._make_request(
+                "GET", f"{base_url}/v1/smartscraper/1234"
+            )
+            elapsed = time.perf_counter() - start
+            await asyncio.wait_for(cancelled.wait(), timeout=2)
+
+    assert result["status"] == "completed"
+    assert elapsed < 1.0
+    assert calls == 2
+    assert policy.stats()["hedge_wins"] == 1
@@ -0,0 +1,206 @@
+"""
+Tests for incremental JSON decoding of large responses
+"""
+
+import json
+from uuid import uuid4
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.json_stream import JSONItemStream, iter_json_items
+from tests.utils import generate_mock_api_key, serve_aiohttp, serve_http
+
+
+def crawl_document(pages=20, size=2000):
+    return {
+        "status": "success",
+        "crawl_id": "abc",
+        "result": {
+            "llm_result": {"summary": 'text with "pages": [1, 2] inside'},
+            "pages": [
+                {
+                    "url": f"https://example.com/{i}",
+                    "markdown": f"# Page {i}\n"
+                    + 'Line with "quotes", \\ and [brackets] {}\n' * size,
+                    "metadata": {"links": ["a", "b"], "pages": [i]},
+                }
+                for i in range(pages)
+            ],
+        },
+        "urls": ["https://example.com/a", None, 3, True],
+    }
+
+
+def chunked(raw, size):
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+class TestJSONItemStream:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 4096, 10**8])
+    def test_items_match_full_decode(self, chunk_size):
+        document = crawl_document(pages=5, size=20)
+        raw = json.dumps(document).encode()
+
+        items = list(iter_json_items(chunked(raw, chunk_size)))
+
+        expected = [("pages", page) for page in document["result"]["pages"]]
+        expected += [("urls", url) for url in document["urls"]]
+        assert items == expected
+
+    def test_only_selected_keys(self):
+        raw = json.dumps({"results": [1, 2], "urls": ["x"], "pages": []}).encode()
+        assert list(iter_json_items([raw], keys=("urls",))) == [("urls", "x")]
+        assert list(iter_json_items([raw], keys=("pages",))) == []
+
+    def test_unicode_and_escapes_across_chunks(self):
+        raw = json.dumps(
+            {"results": ['café \\" ☃', {"k": "\\\\"}]}, ensure_ascii=False
+        ).encode()
+        assert list(iter_json_items(chunked(raw, 1))) == [
+            ("results", 'café \\" ☃'),
+            ("results", {"k": "\\\\"}),
+        ]
+
+    def test_buffer_stays_bounded_by_largest_item(self):
+        raw = json.dumps(crawl_document(pages=50, size=500)).encode()
+        largest = max(
+            len(json.dumps(page))
+            for page in crawl_document(pages=50, size=500)["result"]["pages"]
+        )
+        stream = JSONItemStream()
+        peak = 0
+        for chunk in chunked(raw, 8192):
+            stream.feed(chunk)
+            peak = max(peak, len(stream._buf))
+        stream.close()
+
+        assert len(raw) > 20 * largest
+        assert peak < largest + 8192 * 2
+
+    def test_truncated_document(self):
+        raw = json.dumps(crawl_document(pages=2, size=1)).encode()
+        with pytest.raises(ValueError):
+            list(iter_json_items([raw[:-10]]))
+
+    def test_invalid_element(self):
+        with pytest.raises(ValueError):
+            list(iter_json_items([b'{"pages": [{"a": tru}]}']))
+
+
+@pytest.fixture
+def crawl_server():
+    document = crawl_document()
+    raw = json.dumps(document).encode()
+
+    def respond(request):
+        if "missing" in request.path:
+            return 404, b'{"error": "Crawl not found"}'
+        return 200, chunked(raw, 1000)
+
+    with serve_http(respond) as base_url:
+        yield f"{base_url}/v1/crawl", document
+
+
+class TestClientStreaming:
+    def test_stream_request(self, mock_api_key, crawl_server):
+        url, document = crawl_server
+        client = Client(api_key=mock_api_key)
+
+        pages = [
+            item
+            for key, item in client._stream_request(
+                "GET", f"{url}/abc", keys=("pages",)
+            )
+        ]
+
+        assert pages == document["result"]["pages"]
+
+    def test_stream_request_error(self, mock_api_key, crawl_server):
+        url, _ = crawl_server
+        client = Client(api_key=mock_api_key)
+
+        with pytest.raises(APIError) as exc_info:
+            list(client._stream_request("GET", f"{url}/missing"))
+        assert exc_info.value.status_code == 404
+
+    def test_stream_crawl_mock_mode(self, mock_api_key):
+        document = crawl_document(pages=3, size=1)
+        client = Client(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=lambda method, url, kwargs: document,
+        )
+
+        items = list(client.stream_crawl(str(uuid4()), keys=("pages",)))
+
+        assert [page["url"] for _, page in items] == [
+            f"https://example.com/{i}" for i in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_stream_request(self, mock_api_key):
+        document = crawl_document()
+        raw = json.dumps(document).encode()
+
+        async def handler(request):
+            response = web.StreamResponse()
+            response.content_type = "application/json"
+            await response.prepare(request)
+            for chunk in chunked(raw, 1000):
+                await response.write(chunk)
+            await response.write_eof()
+            return response
+
+        async with serve_aiohttp([web.get("/v1/crawl/abc", handler)]) as base_url:
+            async with AsyncClient(api_key=mock_api_key) as client:
+                items = [
+                    item
+                    async for item in client._stream_request(
+                        "GET", f"{base_url}/v1/crawl/abc"
+                    )
+                ]
+
+        assert [item for key, item in items if key == "pages"] == document["result"][
+            "pages"
+        ]
+        assert [item for key, item in items if key == "urls"] == document["urls"]
+
+    @pytest.mark.asyncio
+    async def test_async_stream_searchscraper_mock_mode(self, mock_api_key):
+        document = {"status": "completed", "results": [{"title": "a"}, {"title": "b"}]}
+        async with AsyncClient(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=lambda method, url, kwargs: document,
+        ) as client:
+            items = [item async for item in client.stream_searchscraper(str(uuid4()))]
+
+        assert items == [("results", {"title": "a"}), ("results", {"title": "b"})]
+
+
+def test_value_keys_and_skip():
+    raw = json.dumps(crawl_document(pages=5, size=3)).encode()
+    for size in (1, 7, len(raw)):
+        items = list(
+            iter_json_items(
+                chunked(raw, size),
+                ("pages",),
+                value_keys=("status", "crawl_id"),
+                skip=3,
+            )
+        )
+        assert [key for key, _ in items] == ["status", "crawl_id", "pages", "pages"]
+        assert items[0][1] == "success"
+        assert [value["url"] for _, value in items[2:]] == [
+            "https://example.com/3",
+            "https://example.com/4",
+        ]
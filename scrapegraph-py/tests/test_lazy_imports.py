@@ -0,0 +1,61 @@
+"""
+Tests for lazy loading of the package's public names
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import scrapegraph_py
+from scrapegraph_py import models
+
+
+def loaded_modules(statement):
+    probe = f"{statement}; import sys; print(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    "statement, forbidden",
+    [
+        ("import scrapegraph_py", {"requests", "aiohttp", "pydantic", "bs4"}),
+        ("from scrapegraph_py import Client", {"aiohttp", "bs4", "toon"}),
+        ("from scrapegraph_py import AsyncClient", {"requests", "bs4", "toon"}),
+        (
+            "from scrapegraph_py.models import CrawlRequest",
+            {"scrapegraph_py.models.smartscraper"},
+        ),
+    ],
+)
+def test_heavy_dependencies_load_on_use(statement, forbidden):
+    assert not loaded_modules(statement) & forbidden
+
+
+def test_every_public_name_resolves():
+    for name in scrapegraph_py.__all__:
+        assert getattr(scrapegraph_py, name).__name__ == name
+    for name in models.__all__:
+        assert getattr(models, name).__name__ == name
+
+
+def test_resolved_names_are_the_defining_objects():
+    from scrapegraph_py.client import Client
+
+    assert scrapegraph_py.Client is Client
+    assert "Client" in vars(scrapegraph_py)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        scrapegraph_py.NotAThing
+    with pytest.raises(ImportError):
+        from scrapegraph_py import NotAThing  # noqa: F401
+
+
+def test_dir_lists_lazy_names():
+    assert set(scrapegraph_py.__all__) <= set(dir(scrapegraph_py))
+    assert set(models.__all__) <= set(dir(models))
@@ -0,0 +1,83 @@
+"""
+Tests for the SDK logger's lazy arguments and payload rendering
+"""
+
+import logging
+
+import pytest
+
+from scrapegraph_py.logger import LazyPayload, format_payload, sgai_logger
+
+
+class Exploding:
+    def __repr__(self):
+        raise AssertionError("payload was rendered")
+
+    __str__ = __repr__
+
+
+@pytest.fixture
+def logging_at():
+    def configure(level):
+        sgai_logger.set_logging(level=level)
+
+    yield configure
+    sgai_logger.disable()
+    sgai_logger.logger.setLevel(logging.INFO)
+
+
+def test_arguments_are_not_rendered_when_disabled():
+    sgai_logger.disable()
+    sgai_logger.debug("payload: %s", Exploding())
+    sgai_logger.error("payload: %s", LazyPayload({"x": Exploding()}))
+    assert not sgai_logger.is_enabled_for("ERROR")
+
+
+def test_arguments_are_not_rendered_below_the_level(logging_at):
+    logging_at("INFO")
+    sgai_logger.debug("payload: %s", Exploding())
+    assert sgai_logger.is_enabled_for(logging.INFO)
+    assert not sgai_logger.is_enabled_for("debug")
+
+
+def test_arguments_are_merged_when_emitted(logging_at, caplog):
+    logging_at("DEBUG")
+    with caplog.at_level(logging.DEBUG, logger="scrapegraph"):
+        sgai_logger.info("Waiting %.2fs before retry %s", 1.5, 2)
+        sgai_logger.debug("Request parameters: %s", LazyPayload({"json": {"a": 1}}))
+
+    assert caplog.messages == [
+        "Waiting 1.50s before retry 2",
+        "Request parameters: {'json': {'a': 1}}",
+    ]
+    assert caplog.records[0].funcName == "test_arguments_are_merged_when_emitted"
+
+
+def test_long_values_are_truncated():
+    html = "<p>" + "x" * 10_000 + "</p>"
+    rendered = format_payload(
+        {"json": {"website_html": html}, "data": b"y" * 5000}, max_length=20
+    )
+
+    assert "(10007 chars)" in rendered
+    assert "(5000 bytes)" in rendered
+    assert len(rendered) < 200
+
+
+def test_credentials_are_redacted():
+    payload = {
+        "headers": {"SGAI-APIKEY": "sgai-secret", "Authorization": "Bearer secret"},
+        "json": {"cookies": {"session": "secret"}, "steps": [{"password": "secret"}]},
+    }
+    rendered = format_payload(payload)
+
+    assert "secret" not in rendered
+    assert rendered.count("<redacted>") == 4
+
+
+def test_short_payloads_are_unchanged():
+    payload = {
+        "json": {"user_prompt": "Extract", "total_pages": 2},
+        "params": ("a", None),
+    }
+    assert format_payload(payload) == repr(payload)
@@ -0,0 +1,117 @@
+"""
+Tests for local include/exclude path filtering
+"""
+
+import pytest
+
+from scrapegraph_py.utils.path_filter import PathFilter
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected",
+    [
+        ("/products/*", "/products/shoe", True),
+        ("/products/*", "/products/", True),
+        ("/products/*", "/products/shoes/red", False),
+        ("/products/*", "/products", False),
+        ("/blog/**", "/blog", True),
+        ("/blog/**", "/blog/2024/01/post", True),
+        ("/blog/**", "/blogger", False),
+        ("/docs/**/index", "/docs/index", True),
+        ("/docs/**/index", "/docs/a/b/index", True),
+        ("/docs/*.html", "/docs/page.html", True),
+        ("/docs/*.html", "/docs/pagexhtml", False),
+        ("/a+b/(x)", "/a+b/(x)", True),
+    ],
+)
+def test_pattern_semantics(pattern, path, expected):
+    assert PathFilter(include_paths=[pattern]).matches(path) is expected
+
+
+def test_exclude_takes_precedence():
+    paths = PathFilter(
+        include_paths=["/products/**"], exclude_paths=["/products/archived/*"]
+    )
+    assert paths.matches("https://example.com/products/new/item?ref=1")
+    assert not paths.matches("https://example.com/products/archived/item")
+    assert not paths.matches("https://example.com/about")
+
+
+def test_no_patterns_keep_everything():
+    urls = ["https://example.com/", "https://example.com", "https://example.com/a/b"]
+    assert list(PathFilter().filter(urls)) == urls
+
+
+def test_patterns_must_start_with_a_slash():
+    with pytest.raises(ValueError, match="must start with '/'"):
+        PathFilter(exclude_paths=["admin/*"])
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com", True),
+        ("https://example.com?page=2", True),
+        ("https://example.com/products/a?next=/admin/x", True),
+        ("https://example.com:8443/products/a#/admin/x", True),
+        ("https://example.com/admin/users", False),
+        ("/admin/users?x=1", False),
+    ],
+)
+def test_only_the_path_is_matched(url, expected):
+    paths = PathFilter(include_paths=["/", "/products/**"], exclude_paths=["/admin/*"])
+    assert paths.matches(url) is expected
+
+
+def test_matches_reference_semantics():
+    import random
+    import re
+    from urllib.parse import urlsplit
+
+    def reference(pattern, path):
+        regex = "".join(
+            (
+                "(?:/.*)?"
+                if token == "/**"
+                else (
+                    ".*"
+                    if token == "**"
+                    else "[^/]*" if token == "*" else re.escape(token)
+                )
+            )
+            for token in re.findall(r"/\*\*(?=/|$)|\*\*|\*|[^*]", pattern)
+        )
+        return re.fullmatch(regex, path) is not None
+
+    include, exclude = ["/blog/**", "/p/*/view", "/a/**/z"], ["/blog/tmp*", "/p/x/*"]
+    paths = PathFilter(include, exclude)
+    rng = random.Random(7)
+    segments = ["blog", "p", "a", "z", "x", "view", "tmp", "tmp1", ""]
+    for _ in range(2000):
+        path = "/" + "/".join(rng.choice(segments) for _ in range(rng.randint(0, 4)))
+        url = f"https://example.com{path}?q=/blog/a"
+        expected = any(
+            reference(p, urlsplit(url).path or "/") for p in include
+        ) and not any(reference(p, urlsplit(url).path or "/") for p in exclude)
+        assert paths.matches(url) is expected, url
+
+
+def test_preview_explains_the_filter():
+    urls = [
+        "https://example.com/blog/a",
+        "https://example.com/blog/drafts/b",
+        "https://example.com/shop/c",
+    ]
+    preview = PathFilter(["/blog/**", "/news/*"], ["/blog/drafts/*"]).preview(urls)
+
+    assert preview.kept == ["https://example.com/blog/a"]
+    assert preview.excluded == ["https://example.com/blog/drafts/b"]
+    assert preview.not_included == ["https://example.com/shop/c"]
+    assert preview.include_hits == {"/blog/**": 2, "/news/*": 0}
+    assert preview.unused_patterns == ["/news/*"]
+    assert preview.summary() == {
+        "total": 3,
+        "kept": 1,
+        "excluded": 1,
+        "not_included": 1,
+    }
@@ -0,0 +1,168 @@
+"""
+Tests for the multiplexed job result poller
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.poller import PollSchedule, is_terminal
+from tests.utils import generate_mock_api_key
+
+FAST = {"initial_interval": 0.001, "max_interval": 0.005}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def progressing_handler(polls_until_done, statuses=("queued", "processing")):
+    """Mock handler returning pending statuses before completing each job"""
+    calls = {}
+
+    def handler(method, url, kwargs):
+        request_id = url.rstrip("/").rsplit("/", 1)[-1]
+        calls[request_id] = calls.get(request_id, 0) + 1
+        count = calls[request_id]
+        if count >= polls_until_done.get(request_id, 1):
+            return {"status": "completed", "request_id": request_id}
+        return {"status": statuses[min(count, len(statuses)) - 1]}
+
+    return handler, calls
+
+
+class TestPollSchedule:
+    def test_interval_grows_and_caps(self):
+        schedule = PollSchedule(initial_interval=1, max_interval=3, multiplier=2)
+        assert schedule.next_interval(1, progressed=False) == 2
+        assert schedule.next_interval(2, progressed=False) == 3
+
+    def test_progress_resets_interval(self):
+        schedule = PollSchedule(initial_interval=1, max_interval=30)
+        assert schedule.next_interval(20, progressed=True) == 1
+
+    def test_jitter_stays_in_range(self):
+        schedule = PollSchedule(jitter=0.2)
+        for _ in range(100):
+            assert 8 <= schedule.delay(10) <= 12
+
+    def test_invalid_intervals(self):
+        with pytest.raises(ValueError):
+            PollSchedule(initial_interval=5, max_interval=1)
+
+    def test_is_terminal(self):
+        assert is_terminal({"status": "completed"})
+        assert is_terminal({"status": "FAILED"})
+        assert not is_terminal({"status": "processing"})
+        assert is_terminal({"result": "no status field"})
+
+
+class TestSyncPoller:
+    def test_wait_for(self, mock_api_key):
+        request_id = str(uuid4())
+        handler, calls = progressing_handler({request_id: 3})
+        client = Client(api_key=mock_api_key, mock=True, mock_handler=handler)
+
+        result = client.wait_for(request_id, service="smartscraper", **FAST)
+
+        assert result["status"] == "completed"
+        assert calls[request_id] == 3
+
+    def test_wait_for_many_yields_in_completion_order(self, mock_api_key):
+        slow, fast = str(uuid4()), str(uuid4())
+        handler, _ = progressing_handler({slow: 4, fast: 1})
+        client = Client(api_key=mock_api_key, mock=True, mock_handler=handler)
+
+        items = list(client.wait_for_many([slow, fast], service="crawl", **FAST))
+
+        assert [item.input for item in items] == [fast, slow]
+        assert all(item.ok for item in items)
+
+    def test_deadline(self, mock_api_key):
+        client = Client(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=lambda method, url, kwargs: {"status": "processing"},
+        )
+
+        with pytest.raises(TimeoutError):
+            client.wait_for(str(uuid4()), service="markdownify", timeout=0.02, **FAST)
+
+    def test_unknown_service(self, mock_api_key):
+        client = Client(api_key=mock_api_key, mock=True)
+        with pytest.raises(ValueError):
+            client.wait_for(str(uuid4()), service="sitemap")
+
+    def test_permanent_error_is_reported(self, mock_api_key):
+        def missing(request_id):
+            raise APIError("not found", status_code=404)
+
+        client = Client(api_key=mock_api_key, mock=True)
+        client.get_scrape = missing
+
+        items = list(client.wait_for_many([str(uuid4())], service="scrape", **FAST))
+        assert isinstance(items[0].error, APIError)
+
+
+class TestAsyncPoller:
+    @pytest.mark.asyncio
+    async def test_wait_for_many_mixed_services(self, mock_api_key):
+        ids = [str(uuid4()) for _ in range(20)]
+        handler, calls = progressing_handler(
+            {request_id: 1 + i % 4 for i, request_id in enumerate(ids)}
+        )
+        jobs = [
+            ("crawl" if i % 2 else "searchscraper", request_id)
+            for i, request_id in enumerate(ids)
+        ]
+
+        async with AsyncClient(
+            api_key=mock_api_key, mock=True, mock_handler=handler
+        ) as client:
+            items = [
+                item async for item in client.wait_for_many(jobs, concurrency=5, **FAST)
+            ]
+
+        assert sorted(item.index for item in items) == list(range(20))
+        assert all(item.ok for item in items)
+        assert sum(calls.values()) == sum(1 + i % 4 for i in range(20))
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self, mock_api_key):
+        request_id = str(uuid4())
+        attempts = 0
+
+        async def flaky_get(request_id):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise APIError("unavailable", status_code=503)
+            return {"status": "completed"}
+
+        async with AsyncClient(api_key=mock_api_key, mock=True) as client:
+            client.get_smartscraper = flaky_get
+            result = await client.wait_for(request_id, **FAST)
+
+        assert result["status"] == "completed"
+        assert attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_deadline(self, mock_api_key):
+        async with AsyncClient(
+            api_key=mock_api_key,
+            mock=True,
+            mock_handler=lambda method, url, kwargs: {"status": "processing"},
+        ) as client:
+            items = [
+                item
+                async for item in client.wait_for_many(
+                    [str(uuid4()), str(uuid4())], timeout=0.02, **FAST
+                )
+            ]
+
+        assert len(items) == 2
+        assert all(isinstance(item.error, TimeoutError) for item in items)
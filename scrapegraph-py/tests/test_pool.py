@@ -0,0 +1,143 @@
+"""
+Tests for connection pool configuration and pool statistics
+"""
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.utils.pool import ConnectionCounters, adapter_stats, connector_stats
+from tests.utils import generate_mock_api_key, serve_aiohttp, serve_http
+
+STAT_KEYS = {
+    "limit",
+    "limit_per_host",
+    "acquired",
+    "idle",
+    "active",
+    "created",
+    "reused",
+    "queued",
+}
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def http_server():
+    with serve_http(lambda request: (200, b'{"status": "ok"}')) as base_url:
+        yield base_url
+
+
+class TestTransportInternals:
+    @pytest.mark.asyncio
+    async def test_installed_transports_expose_pool_counts(
+        self, mock_api_key, http_server
+    ):
+        # Fails when an aiohttp or urllib3 upgrade removes the internals
+        # pool statistics rely on (see the note in pyproject.toml)
+        client = Client(api_key=mock_api_key)
+        client._make_request("GET", f"{http_server}/healthz")
+        assert None not in client.pool_stats().values()
+        client.close()
+
+        async with AsyncClient(api_key=mock_api_key) as async_client:
+            assert async_client.session.connector is not None
+            assert None not in async_client.pool_stats().values()
+
+    def test_missing_internals_are_reported_as_unknown(self):
+        class Connector:
+            closed = False
+
+        class Pool:
+            pool = object()
+            num_connections = 1
+            num_requests = 1
+
+        class Adapter:
+            class poolmanager:
+                pools = {"host": Pool()}
+
+        stats = connector_stats([Connector()], ConnectionCounters(), 10)
+        assert stats["acquired"] is None and stats["active"] is None
+        assert stats["limit"] == 10 and stats["created"] == 0
+
+        stats = adapter_stats(Adapter(), 10)
+        assert stats["idle"] is None and stats["reused"] is None
+        assert stats["limit"] == 10
+
+
+class TestSyncPool:
+    def test_pool_settings(self, mock_api_key):
+        client = Client(api_key=mock_api_key, pool_size=32, pool_per_host=8)
+        stats = client.pool_stats()
+
+        assert set(stats) == STAT_KEYS
+        assert stats["limit"] == 32
+        assert stats["limit_per_host"] == 8
+        assert client.session.get_adapter("https://")._pool_maxsize == 8
+        client.close()
+
+    def test_pool_maxsize_follows_pool_size(self, mock_api_key):
+        client = Client(api_key=mock_api_key, pool_size=24)
+        assert client.session.get_adapter("https://")._pool_maxsize == 24
+        client.close()
+
+    def test_force_close_header(self, mock_api_key):
+        client = Client(api_key=mock_api_key, force_close=True)
+        assert client.session.headers["Connection"] == "close"
+        client.close()
+
+    def test_connection_reuse_is_counted(self, mock_api_key, http_server):
+        client = Client(api_key=mock_api_key)
+        for _ in range(3):
+            client._make_request("GET", f"{http_server}/healthz")
+
+        stats = client.pool_stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 2
+        assert stats["idle"] == 1
+        assert stats["acquired"] == 0
+        client.close()
+
+
+class TestAsyncPool:
+    @pytest.mark.asyncio
+    async def test_pool_settings(self, mock_api_key):
+        async with AsyncClient(
+            api_key=mock_api_key,
+            pool_size=16,
+            pool_per_host=4,
+            keepalive_timeout=30,
+            dns_cache_ttl=60,
+        ) as client:
+            stats = client.pool_stats()
+
+        assert set(stats) == STAT_KEYS
+        assert stats["limit"] == 16
+        assert stats["limit_per_host"] == 4
+
+    @pytest.mark.asyncio
+    async def test_force_close(self, mock_api_key):
+        async with AsyncClient(api_key=mock_api_key, force_close=True) as client:
+            assert client.session.connector.force_close
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse_is_counted(self, mock_api_key):
+        async def handler(request):
+            return web.json_response({"status": "ok"})
+
+        async with serve_aiohttp([web.get("/healthz", handler)]) as base_url:
+            async with AsyncClient(api_key=mock_api_key) as client:
+                for _ in range(3):
+                    await client._make_request("GET", f"{base_url}/healthz")
+                stats = client.pool_stats()
+
+        assert stats["created"] == 1
+        assert stats["reused"] == 2
+        assert stats["idle"] == 1
+        assert stats["acquired"] == 0
@@ -0,0 +1,162 @@
+"""
+Tests for the client-side rate limiter
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import responses
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.helpers import endpoint_family
+from scrapegraph_py.utils.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp
+
+BASE = "https://api.scrapegraphai.com/v1"
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def test_endpoint_family():
+    assert endpoint_family(f"{BASE}/smartscraper") == "smartscraper"
+    assert endpoint_family(f"{BASE}/crawl/1234") == "crawl"
+    assert endpoint_family(f"{BASE}/scheduled-jobs/1/pause") == "scheduled-jobs"
+    assert endpoint_family("https://example.com/") == ""
+
+
+class TestHeaderParsing:
+    def test_retry_after_seconds(self):
+        assert parse_retry_after("7") == 7
+
+    def test_retry_after_http_date(self):
+        now = time.time()
+        delay = parse_retry_after(formatdate(now + 30, usegmt=True), now=now)
+        assert 29 <= delay <= 31
+
+    def test_retry_after_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_rate_limit_headers(self):
+        assert parse_rate_limit_reset({"X-RateLimit-Remaining": "3"}) is None
+        assert (
+            parse_rate_limit_reset(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+            )
+            == 12
+        )
+        assert (
+            parse_rate_limit_reset({"RateLimit-Remaining": "0", "RateLimit-Reset": "4"})
+            == 4
+        )
+        epoch_reset = str(int(time.time()) + 20)
+        assert (
+            18
+            <= parse_rate_limit_reset(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": epoch_reset}
+            )
+            <= 20
+        )
+
+
+class TestTokenBucket:
+    def test_burst_then_throttle(self):
+        bucket = TokenBucket(rate=10, burst=3)
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(0.1, abs=0.02)
+        assert waits[4] == pytest.approx(0.2, abs=0.02)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=100, burst=10)
+        bucket.pause(2)
+        assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+    def test_slow_down_and_recover(self):
+        bucket = TokenBucket(rate=8, burst=1)
+        bucket.slow_down()
+        assert bucket.rate == 4
+        for _ in range(100):
+            bucket.recover()
+        assert bucket.rate == 8
+
+
+class TestRateLimiter:
+    def test_families_have_separate_buckets(self):
+        limiter = RateLimiter(rate=1, burst=1, limits={"crawl": (50, 5)})
+        assert limiter.bucket(f"{BASE}/smartscraper") is limiter.bucket(
+            f"{BASE}/smartscraper/1"
+        )
+        assert limiter.bucket(f"{BASE}/crawl").rate == 50
+        assert limiter.bucket(f"{BASE}/smartscraper").rate == 1
+
+    def test_429_slows_down_and_pauses(self):
+        limiter = RateLimiter(rate=100, burst=100)
+        url = f"{BASE}/smartscraper"
+        limiter.observe(url, 429, {"Retry-After": "1"})
+
+        assert limiter.stats()["smartscraper"]["rate"] == 50
+        assert limiter.bucket(url).reserve() == pytest.approx(1, abs=0.05)
+        assert limiter.bucket(f"{BASE}/crawl").reserve() == 0
+
+    def test_exhausted_quota_pauses(self):
+        limiter = RateLimiter(rate=100, burst=100)
+        url = f"{BASE}/markdownify"
+        limiter.observe(
+            url, 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.5"}
+        )
+        assert limiter.bucket(url).reserve() == pytest.approx(0.5, abs=0.05)
+
+
+class TestClientIntegration:
+    @responses.activate
+    def test_sync_client_observes_429(self, mock_api_key):
+        limiter = RateLimiter(rate=100, burst=100)
+        responses.add(
+            responses.GET,
+            f"{BASE}/credits",
+            json={"error": "Too many requests"},
+            status=429,
+            headers={"Retry-After": "0.2"},
+        )
+        client = Client(api_key=mock_api_key, rate_limiter=limiter, max_retries=0)
+
+        with pytest.raises(APIError):
+            client.get_credits()
+
+        assert limiter.stats()["credits"]["rate"] == 50
+        assert limiter.bucket(f"{BASE}/credits").reserve() > 0.1
+
+    @pytest.mark.asyncio
+    async def test_async_client_shares_limiter(self, mock_api_key):
+        async def handler(request):
+            return web.json_response(
+                {"error": "Too many requests"},
+                status=429,
+                headers={"Retry-After": "0.2"},
+            )
+
+        limiter = RateLimiter(rate=100, burst=100)
+        sync_client = Client(api_key=mock_api_key, rate_limiter=limiter, max_retries=0)
+        async with serve_aiohttp([web.get("/v1/healthz", handler)]) as base_url:
+            url = f"{base_url}/v1/healthz"
+            async with AsyncClient(
+                api_key=mock_api_key, rate_limiter=limiter, max_retries=0
+            ) as client:
+                with pytest.raises(APIError):
+                    await client._make_request("GET", url)
+
+        assert sync_client.rate_limiter.bucket(url).reserve() > 0.1
@@ -0,0 +1,213 @@
+"""
+Tests for the retry policy shared by Client and AsyncClient
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+import requests
+import responses
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.retry import (
+    IDEMPOTENCY_HEADER,
+    RetryBudget,
+    RetryPolicy,
+    classify_error,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp
+
+FAST = {"retry_delay": 0.001}
+SMARTSCRAPER = "https://api.scrapegraphai.com/v1/smartscraper"
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def fail_with(method, *statuses):
+    """Fail with the given statuses before answering 200"""
+    queue = list(statuses)
+
+    def callback(request):
+        status = queue.pop(0) if queue else 200
+        body = {"status": "ok"} if status == 200 else {"error": "unavailable"}
+        return status, {}, json.dumps(body)
+
+    responses.add_callback(
+        method, SMARTSCRAPER, callback=callback, content_type="application/json"
+    )
+
+
+def idempotency_keys():
+    return [call.request.headers.get(IDEMPOTENCY_HEADER) for call in responses.calls]
+
+
+class TestRetryPolicy:
+    def test_full_jitter_backoff(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for attempt, ceiling in [(0, 1), (1, 2), (2, 4), (6, 5)]:
+            delays = [policy.backoff(attempt) for _ in range(200)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert max(delays) > ceiling / 2
+
+    def test_retry_after_is_honoured(self):
+        policy = RetryPolicy(base_delay=0.01)
+        assert policy.backoff(0, retry_after=3) == 3
+
+    def test_status_classes(self):
+        policy = RetryPolicy()
+        assert policy.should_retry(APIError("busy", status_code=503), 0, False)
+        assert policy.should_retry(APIError("slow down", status_code=429), 0, False)
+        assert not policy.should_retry(APIError("bad", status_code=400), 0, True)
+        assert not policy.should_retry(APIError("busy", status_code=503), 3, True)
+
+    def test_timeouts_need_idempotency(self):
+        policy = RetryPolicy()
+        for error in (asyncio.TimeoutError(), requests.exceptions.ReadTimeout()):
+            assert classify_error(error) == "timeout"
+            assert policy.should_retry(error, 0, idempotent=True)
+            assert not policy.should_retry(error, 0, idempotent=False)
+
+    def test_connect_errors_always_retry(self):
+        policy = RetryPolicy()
+        error = requests.exceptions.ConnectTimeout()
+        assert classify_error(error) == "connect"
+        assert policy.should_retry(error, 0, idempotent=False)
+        assert classify_error(aiohttp.ServerDisconnectedError()) == "transport"
+        assert classify_error(ValueError("bug")) is None
+
+    def test_idempotency_key_for_post(self):
+        policy = RetryPolicy()
+        kwargs = {"json": {}}
+        assert policy.prepare("POST", kwargs)
+        key = kwargs["headers"][IDEMPOTENCY_HEADER]
+
+        kwargs = {"headers": {IDEMPOTENCY_HEADER: "mine"}}
+        assert policy.prepare("POST", kwargs)
+        assert kwargs["headers"][IDEMPOTENCY_HEADER] == "mine"
+
+        kwargs = {}
+        assert policy.prepare("GET", kwargs)
+        assert "headers" not in kwargs
+        assert key
+
+    def test_idempotency_keys_disabled(self):
+        kwargs = {}
+        assert not RetryPolicy(idempotency_keys=False).prepare("POST", kwargs)
+        assert "headers" not in kwargs
+
+
+class TestRetryBudget:
+    def test_budget_caps_retries(self):
+        budget = RetryBudget(ratio=0.5, reserve=2)
+        policy = RetryPolicy(max_retries=10, budget=budget)
+        error = APIError("busy", status_code=503)
+
+        assert policy.should_retry(error, 0, True)
+        assert policy.should_retry(error, 1, True)
+        assert not policy.should_retry(error, 2, True)
+
+        policy.prepare("GET", {})
+        policy.prepare("GET", {})
+        assert policy.should_retry(error, 2, True)
+        assert not policy.should_retry(error, 3, True)
+
+    def test_balance_never_exceeds_reserve(self):
+        budget = RetryBudget(ratio=1, reserve=3)
+        for _ in range(10):
+            budget.deposit()
+        assert budget.balance == 3
+
+
+class TestSyncClientRetries:
+    @responses.activate
+    def test_5xx_is_retried_with_same_idempotency_key(self, mock_api_key):
+        fail_with(responses.POST, 503, 502)
+        client = Client(api_key=mock_api_key, **FAST)
+
+        result = client._make_request("POST", SMARTSCRAPER, json={})
+
+        assert result == {"status": "ok"}
+        keys = idempotency_keys()
+        assert len(keys) == 3
+        assert keys[0] and len(set(keys)) == 1
+
+    @responses.activate
+    def test_client_errors_are_not_retried(self, mock_api_key):
+        fail_with(responses.GET, 400)
+        client = Client(api_key=mock_api_key, **FAST)
+
+        with pytest.raises(APIError) as exc_info:
+            client._make_request("GET", SMARTSCRAPER)
+
+        assert exc_info.value.status_code == 400
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self, mock_api_key):
+        fail_with(responses.GET, *[500] * 5)
+        client = Client(api_key=mock_api_key, max_retries=2, **FAST)
+
+        with pytest.raises(APIError):
+            client._make_request("GET", SMARTSCRAPER)
+
+        assert len(responses.calls) == 3
+
+    def test_connection_refused_raises_connection_error(self, mock_api_key):
+        client = Client(api_key=mock_api_key, max_retries=1, **FAST)
+        with pytest.raises(ConnectionError):
+            client._make_request("GET", "http://127.0.0.1:9/v1/credits")
+
+
+class TestAsyncClientRetries:
+    @pytest.mark.asyncio
+    async def test_5xx_and_timeouts_are_retried(self, mock_api_key):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers.get(IDEMPOTENCY_HEADER))
+            if len(calls) == 1:
+                return web.json_response({"error": "unavailable"}, status=503)
+            if len(calls) == 2:
+                await asyncio.sleep(1)
+            return web.json_response({"status": "ok"})
+
+        async with serve_aiohttp([web.post("/v1/smartscraper", handler)]) as base_url:
+            async with AsyncClient(api_key=mock_api_key, **FAST) as client:
+                result = await client._make_request(
+                    "POST",
+                    f"{base_url}/v1/smartscraper",
+                    json={},
+                    timeout=aiohttp.ClientTimeout(total=0.2),
+                )
+
+        assert result == {"status": "ok"}
+        assert len(calls) == 3
+        assert calls[0] and len(set(calls)) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_budget_stops_retry_storm(self, mock_api_key):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            return web.json_response({"error": "down"}, status=500)
+
+        policy = RetryPolicy(
+            max_retries=5, base_delay=0.001, budget=RetryBudget(ratio=0, reserve=3)
+        )
+        async with serve_aiohttp([web.get("/v1/credits", handler)]) as base_url:
+            async with AsyncClient(api_key=mock_api_key, retry_policy=policy) as client:
+                for _ in range(4):
+                    with pytest.raises(APIError):
+                        await client._make_request("GET", f"{base_url}/v1/credits")
+
+        assert calls == 4 + 3
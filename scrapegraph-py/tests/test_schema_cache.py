@@ -0,0 +1,174 @@
+"""
+Tests for the output_schema JSON schema cache
+"""
+
+import gc
+import json
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from scrapegraph_py.models.searchscraper import SearchScraperRequest
+from scrapegraph_py.models.smartscraper import SmartScraperRequest
+from scrapegraph_py.utils.codec import (
+    CachedJSON,
+    CachedJSONCopy,
+    encode_json_body,
+    get_codec,
+)
+from scrapegraph_py.utils.schema_cache import (
+    SchemaCache,
+    cached_json_schema,
+    invalidate_schema,
+    schema_cache,
+)
+
+
+class Product(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+def test_schema_is_generated_once_per_model():
+    cache = SchemaCache()
+    first = cache.get(Product)
+    second = cache.get(Product)
+
+    assert first == Product.model_json_schema()
+    assert second == first and second is not first
+    assert second.source is first.source
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_requests_share_the_cached_schema():
+    invalidate_schema(Product)
+    requests = [
+        SmartScraperRequest(
+            user_prompt="Extract the product",
+            website_url=f"https://example.com/{i}",
+            output_schema=Product,
+        )
+        for i in range(3)
+    ]
+    schemas = [request.model_dump()["output_schema"] for request in requests]
+
+    assert all(isinstance(schema, CachedJSONCopy) for schema in schemas)
+    assert all(schema.source is schemas[0].source for schema in schemas)
+    search = SearchScraperRequest(user_prompt="Find products", output_schema=Product)
+    assert search.model_dump()["output_schema"].source is schemas[0].source
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_changing_a_dumped_schema_is_sent_and_not_shared(name):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+    request = SmartScraperRequest(
+        user_prompt="Extract the product",
+        website_url="https://example.com",
+        output_schema=Product,
+    )
+    data = request.model_dump()
+    data["output_schema"]["title"] = "MUTATED"
+
+    body = encode_json_body({"json": data}, codec)["data"]
+    assert json.loads(body) == json.loads(json.dumps(data))
+    assert json.loads(body)["output_schema"]["title"] == "MUTATED"
+    assert request.model_dump()["output_schema"]["title"] == "Product"
+    fresh = encode_json_body({"json": request.model_dump()}, codec)["data"]
+    assert json.loads(fresh)["output_schema"] == Product.model_json_schema()
+
+
+def test_dynamic_models_with_the_same_name_do_not_collide():
+    first = create_model("Dynamic", title=(str, ...))
+    second = create_model("Dynamic", price=(float, ...))
+
+    assert "title" in cached_json_schema(first)["properties"]
+    assert "price" in cached_json_schema(second)["properties"]
+
+
+def test_entries_are_dropped_with_their_model():
+    cache = SchemaCache()
+    model = create_model("Ephemeral", value=(int, ...))
+    cache.get(model)
+    assert cache.stats()["size"] == 1
+
+    del model
+    gc.collect()
+    assert cache.stats()["size"] == 0
+
+
+def test_rebuilt_models_are_regenerated():
+    class Node(BaseModel):
+        value: int
+        child: Optional["Child"] = None
+
+    class Child(BaseModel):
+        label: str
+
+    Node.model_rebuild(_types_namespace={"Child": Child}, force=True)
+    cache = SchemaCache()
+    before = cache.get(Node).source
+    Node.model_rebuild(force=True, _types_namespace={"Child": Child})
+
+    assert cache.get(Node).source is not before
+    assert cache.get(Node) == Node.model_json_schema()
+    assert cache.stats()["misses"] == 2
+
+
+def test_entry_keeps_the_core_schema_it_was_built_from():
+    # Holding the core schema means its id cannot be reused by a new one
+    cache = SchemaCache()
+    cache.get(Product)
+    entry = Product.__dict__[cache._attribute]
+
+    assert entry[0] is Product.__dict__["__pydantic_core_schema__"]
+
+
+def test_invalidate():
+    cache = SchemaCache()
+    first = cache.get(Product).source
+    cache.invalidate(Product)
+    assert cache.get(Product).source is not first
+
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_cached_schema_is_encoded_once(name, monkeypatch):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+    schema = CachedJSON(Product.model_json_schema())
+    payload = {"user_prompt": "Extract", "output_schema": schema}
+
+    body = encode_json_body({"json": payload}, codec)["data"]
+    assert json.loads(body) == {
+        "user_prompt": "Extract",
+        "output_schema": Product.model_json_schema(),
+    }
+
+    calls = []
+    original = codec.dumps
+    monkeypatch.setattr(codec, "dumps", lambda obj: calls.append(obj) or original(obj))
+    encode_json_body({"json": payload}, codec)
+    assert all(obj is not schema and obj != dict(schema) for obj in calls)
+
+
+def test_payload_with_only_cached_values():
+    codec = get_codec("json")
+    body = encode_json_body({"json": {"output_schema": CachedJSON({"a": 1})}}, codec)[
+        "data"
+    ]
+    assert json.loads(body) == {"output_schema": {"a": 1}}
+
+
+def test_process_wide_cache_is_shared():
+    invalidate_schema()
+    cached_json_schema(Product)
+    assert schema_cache.stats()["size"] >= 1
@@ -0,0 +1,172 @@
+"""
+Tests for coalescing identical in-flight requests in AsyncClient
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.singleflight import SingleFlight, is_coalescable
+from tests.utils import generate_mock_api_key
+
+BASE = "https://api.scrapegraphai.com/v1"
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+def slow_sender(calls, delay=0.02, error=None):
+    """Replacement for AsyncClient._send_request counting real sends"""
+
+    async def send(method, url, **kwargs):
+        calls.append((method, url, kwargs.get("json")))
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return {"status": "completed", "url": url}
+
+    return send
+
+
+def test_is_coalescable():
+    assert is_coalescable("GET", f"{BASE}/crawl/123")
+    assert is_coalescable("POST", f"{BASE}/smartscraper")
+    assert not is_coalescable("POST", f"{BASE}/scheduled-jobs/1/trigger")
+    assert not is_coalescable("POST", f"{BASE}/feedback")
+    assert not is_coalescable("DELETE", f"{BASE}/smartscraper/1")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_status_polls_share_one_request(mock_api_key):
+    calls = []
+    crawl_id = str(uuid4())
+    client = AsyncClient(api_key=mock_api_key)
+    client._send_request = slow_sender(calls)
+
+    results = await asyncio.gather(*(client.get_crawl(crawl_id) for _ in range(25)))
+
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    assert client.singleflight.stats() == {"in_flight": 0, "calls": 1, "coalesced": 24}
+
+
+@pytest.mark.asyncio
+async def test_followers_get_independent_copies(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    client._send_request = slow_sender([])
+    url = f"{BASE}/crawl/1"
+
+    first, second = await asyncio.gather(
+        client._make_request("GET", url), client._make_request("GET", url)
+    )
+    first["status"] = "changed"
+
+    assert second["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_different_payloads_are_not_coalesced(mock_api_key):
+    calls = []
+    client = AsyncClient(api_key=mock_api_key)
+    client._send_request = slow_sender(calls)
+
+    await asyncio.gather(
+        client.smartscraper(
+            user_prompt="Extract title", website_url="https://example.com"
+        ),
+        client.smartscraper(
+            user_prompt="Extract title", website_url="https://example.com"
+        ),
+        client.smartscraper(
+            user_prompt="Extract links", website_url="https://example.com"
+        ),
+    )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_mutating_requests_are_not_coalesced(mock_api_key):
+    calls = []
+    client = AsyncClient(api_key=mock_api_key)
+    client._send_request = slow_sender(calls)
+
+    await asyncio.gather(
+        client.trigger_scheduled_job("job-1"), client.trigger_scheduled_job("job-1")
+    )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller(mock_api_key):
+    calls = []
+    client = AsyncClient(api_key=mock_api_key)
+    client._send_request = slow_sender(calls, error=APIError("boom", status_code=500))
+    url = f"{BASE}/crawl/1"
+
+    results = await asyncio.gather(
+        *(client._make_request("GET", url) for _ in range(3)), return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, APIError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalescing_can_be_disabled(mock_api_key):
+    calls = []
+    client = AsyncClient(api_key=mock_api_key, coalesce_requests=False)
+    client._send_request = slow_sender(calls)
+    url = f"{BASE}/crawl/1"
+
+    await asyncio.gather(
+        client._make_request("GET", url), client._make_request("GET", url)
+    )
+
+    assert client.singleflight is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("key", fetch))
+    follower = asyncio.ensure_future(flight.do("key", fetch))
+    await started.wait()
+    leader.cancel()
+
+    assert await follower == "done"
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_last_waiter_cancelling_cancels_call():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def fetch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    assert len(flight) == 0
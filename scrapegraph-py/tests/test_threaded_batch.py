@@ -0,0 +1,207 @@
+"""
+Tests for thread-pool batch execution on the synchronous Client
+"""
+
+import threading
+import time
+
+import pytest
+
+from scrapegraph_py.client import Client
+from tests.utils import generate_mock_api_key, serve_http
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def slow_server():
+    def respond(request):
+        time.sleep(0.05)
+        return 200, b'{"status": "ok"}'
+
+    with serve_http(respond) as base_url:
+        yield f"{base_url}/v1/healthz"
+
+
+def test_map_returns_results_in_input_order(mock_api_key):
+    client = Client(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=lambda method, url, kwargs: {
+            "prompt": kwargs["json"]["user_prompt"]
+        },
+    )
+    urls = [f"https://example.com/{i}" for i in range(20)]
+
+    results = client.map(
+        client.smartscraper, urls, max_workers=5, user_prompt="Extract title"
+    )
+
+    assert [item.index for item in results] == list(range(20))
+    assert [item.input for item in results] == urls
+    assert all(
+        item.ok and item.result == {"prompt": "Extract title"} for item in results
+    )
+    client.close()
+
+
+def test_errors_are_reported_per_item(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+
+    def method(website_url):
+        if website_url.endswith("bad"):
+            raise ValueError("invalid page")
+        return website_url
+
+    results = client.map(
+        method, ["https://a", "https://bad", {"website_url": "https://c"}]
+    )
+
+    assert [item.ok for item in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].result == "https://c"
+
+
+def test_calls_run_concurrently(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def method(website_url):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    results = list(
+        client.imap_unordered(method, range(24), max_workers=6, input_key="website_url")
+    )
+
+    assert len(results) == 24
+    assert peak == 6
+
+
+def test_inputs_are_consumed_lazily(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+    pulled = 0
+
+    def inputs():
+        nonlocal pulled
+        for i in range(1000):
+            pulled += 1
+            yield i
+
+    iterator = client.imap_unordered(
+        lambda website_url: website_url, inputs(), max_workers=4
+    )
+    next(iterator)
+    iterator.close()
+
+    assert pulled <= 4 + 1
+
+
+def test_pool_grows_to_match_workers(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True, pool_size=4)
+    client.map(lambda website_url: None, range(3), max_workers=16)
+
+    assert client.session.get_adapter("https://")._pool_maxsize == 16
+    assert client.pool_stats()["limit"] == 16
+
+    client.close()
+    assert client._executor is None
+
+
+def test_growing_the_pool_keeps_running_batches_alive(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True, pool_size=2)
+    small_started = threading.Event()
+    big_done = threading.Event()
+    results = {}
+
+    def slow(website_url):
+        small_started.set()
+        big_done.wait(5)
+        return website_url
+
+    def small_batch():
+        results["small"] = client.map(slow, range(6), max_workers=2)
+
+    runner = threading.Thread(target=small_batch)
+    runner.start()
+    assert small_started.wait(5)
+    old_executor = client._executor
+
+    # A bigger batch replaces the pool while the small one still submits to it
+    results["big"] = client.map(
+        lambda website_url: website_url, range(20), max_workers=8
+    )
+    assert client._executor is not old_executor
+    big_done.set()
+    runner.join(5)
+
+    assert all(item.ok for item in results["small"] + results["big"])
+    assert [item.result for item in results["small"]] == list(range(6))
+    # The replaced pool is shut down once its last batch is done
+    assert old_executor._shutdown and not client._executor._shutdown
+    assert client._executor_leases == {}
+    client.close()
+
+
+def test_close_during_a_batch_does_not_deadlock(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+    worker_started = threading.Event()
+    closing = threading.Event()
+
+    def hedged(website_url):
+        worker_started.set()
+        closing.wait(5)
+        time.sleep(0.05)
+        # Hedged status requests reach for the hedge pool mid-close
+        client._get_hedge_executor()
+        return website_url
+
+    batch = threading.Thread(
+        target=lambda: client.map(hedged, range(2), max_workers=2), daemon=True
+    )
+    batch.start()
+    assert worker_started.wait(5)
+
+    closer = threading.Thread(target=client.close, daemon=True)
+    closing.set()
+    closer.start()
+    closer.join(5)
+    batch.join(5)
+
+    assert not closer.is_alive()
+    assert client._hedge_executor is None
+
+
+def test_invalid_max_workers(mock_api_key):
+    client = Client(api_key=mock_api_key, mock=True)
+    with pytest.raises(ValueError):
+        client.map(lambda website_url: None, [1], max_workers=0)
+
+
+def test_threads_share_pooled_connections(mock_api_key, slow_server):
+    client = Client(api_key=mock_api_key, pool_size=2)
+
+    start = time.perf_counter()
+    results = client.map(
+        lambda website_url: client._make_request("GET", slow_server),
+        range(32),
+        max_workers=8,
+    )
+    elapsed = time.perf_counter() - start
+    stats = client.pool_stats()
+    client.close()
+
+    assert all(item.ok for item in results)
+    assert elapsed < 32 * 0.05 / 2
+    assert stats["created"] <= 8
+    assert stats["reused"] >= 32 - 8
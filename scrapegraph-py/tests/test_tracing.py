@@ -0,0 +1,198 @@
+"""
+Tests for request lifecycle tracing
+"""
+
+from uuid import uuid4
+
+import pytest
+from aiohttp import web
+
+from scrapegraph_py.async_client import AsyncClient
+from scrapegraph_py.client import Client
+from scrapegraph_py.exceptions import APIError
+from scrapegraph_py.utils.retry import RetryPolicy
+from scrapegraph_py.utils.tracing import (
+    HAS_OPENTELEMETRY,
+    OpenTelemetrySpans,
+    RequestTracer,
+    TraceEvent,
+)
+from tests.utils import generate_mock_api_key, serve_aiohttp, serve_http
+
+BODY = b'{"request_id": "1234", "status": "completed"}'
+FAST_RETRY = RetryPolicy(max_retries=1, base_delay=0.01, max_delay=0.01)
+
+
+@pytest.fixture
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def tracer(events):
+    return RequestTracer([events.append])
+
+
+@pytest.fixture
+def flaky_server():
+    """Server failing the first request with a 503"""
+    hits = []
+
+    def respond(request):
+        hits.append(request.path)
+        return (503, b'{"error": "busy"}') if len(hits) == 1 else (200, BODY)
+
+    with serve_http(respond, host="localhost") as base_url:
+        yield f"{base_url}/v1/smartscraper/1234"
+
+
+def names(events):
+    return [event.name for event in events]
+
+
+def test_sync_client_reports_phases_and_retries(
+    mock_api_key, flaky_server, tracer, events
+):
+    with Client(api_key=mock_api_key, retry_policy=FAST_RETRY, tracer=tracer) as client:
+        assert client._make_request("GET", flaky_server)["status"] == "completed"
+
+    assert names(events) == [
+        "queued",
+        "connect",
+        "first_byte",
+        "completed",
+        "retry",
+        "queued",
+        "first_byte",
+        "completed",
+    ]
+    failed, retry, done = events[3], events[4], events[-1]
+    assert failed.status == 503 and isinstance(failed.error, APIError)
+    assert retry.attempt == 0 and 0 <= retry.duration <= 0.01
+    assert done.attempt == 1 and done.status == 200 and done.error is None
+    assert [phase.name for phase in done.details["phases"]] == ["queued", "first_byte"]
+    assert done.details["body"] >= 0
+    assert {event.trace_id for event in events[5:]} == {done.trace_id}
+    assert all(event.duration >= 0 and event.url == flaky_server for event in events)
+
+
+def test_sync_client_without_tracer_uses_plain_adapter(mock_api_key):
+    from requests.adapters import HTTPAdapter
+
+    with Client(api_key=mock_api_key) as client:
+        assert type(client._adapter) is HTTPAdapter
+
+
+def test_callback_errors_are_ignored(mock_api_key, flaky_server, events):
+    def broken(event):
+        raise RuntimeError("boom")
+
+    tracer = RequestTracer([broken, events.append])
+    with Client(api_key=mock_api_key, retry_policy=FAST_RETRY, tracer=tracer) as client:
+        client._make_request("GET", flaky_server)
+
+    assert names(events)[-1] == "completed"
+    tracer.remove_callback(broken)
+    tracer.emit(TraceEvent(name="poll", method="GET", url=""))
+    assert len(events) == 9
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_phases(mock_api_key, tracer, events):
+    hits = []
+
+    async def status(request):
+        hits.append(request.path)
+        if len(hits) == 1:
+            return web.json_response({"error": "busy"}, status=503)
+        return web.json_response({"request_id": "1234", "status": "completed"})
+
+    routes = [web.get("/v1/smartscraper/1234", status)]
+    async with serve_aiohttp(routes, host="localhost") as base_url:
+        async with AsyncClient(
+            api_key=mock_api_key, retry_policy=FAST_RETRY, tracer=tracer
+        ) as client:
+            result = await client._make_request(
+                "GET", f"{base_url}/v1/smartscraper/1234"
+            )
+
+    assert result["status"] == "completed"
+    first_attempt = names(events)[: names(events).index("completed")]
+    assert {"dns", "connect", "first_byte"} <= set(first_attempt)
+    assert names(events).count("retry") == 1
+    done = events[-1]
+    assert done.name == "completed" and done.status == 200 and done.attempt == 1
+    # The second attempt reuses the pooled connection
+    assert "connect" not in [phase.name for phase in done.details["phases"]]
+
+
+def test_poll_events(mock_api_key, tracer, events):
+    request_id = str(uuid4())
+    polls = []
+
+    def handler(method, url, kwargs):
+        polls.append(url)
+        return {"status": "completed" if len(polls) == 2 else "processing"}
+
+    client = Client(
+        api_key=mock_api_key, mock=True, mock_handler=handler, tracer=tracer
+    )
+    client.wait_for(request_id, initial_interval=0.01, max_interval=0.01)
+
+    assert names(events) == ["poll", "poll"]
+    assert [event.details["job_status"] for event in events] == [
+        "processing",
+        "completed",
+    ]
+    assert events[0].details["request_id"] == request_id
+    assert events[0].details["service"] == "smartscraper"
+
+
+@pytest.mark.asyncio
+async def test_async_poll_events(mock_api_key, tracer, events):
+    client = AsyncClient(
+        api_key=mock_api_key,
+        mock=True,
+        mock_handler=lambda method, url, kwargs: {"status": "completed"},
+        tracer=tracer,
+    )
+    await client.wait_for(str(uuid4()), service="crawl", initial_interval=0.01)
+
+    assert names(events) == ["poll"]
+    assert events[0].details["service"] == "crawl"
+
+
+def test_open_telemetry_spans_require_the_api():
+    if HAS_OPENTELEMETRY:
+        pytest.skip("opentelemetry is installed")
+    with pytest.raises(ImportError, match="tracing"):
+        OpenTelemetrySpans()
+
+
+def test_open_telemetry_spans(mock_api_key, flaky_server):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = RequestTracer([OpenTelemetrySpans(provider.get_tracer("test"))])
+
+    with Client(api_key=mock_api_key, retry_policy=FAST_RETRY, tracer=tracer) as client:
+        client._make_request("GET", flaky_server)
+
+    spans = exporter.get_finished_spans()
+    assert [span.attributes["http.response.status_code"] for span in spans] == [
+        503,
+        200,
+    ]
+    assert [event.name for event in spans[1].events] == ["queued", "first_byte"]
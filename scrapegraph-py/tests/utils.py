@@ -1,11 +1,95 @@
 """
 Utility functions for tests
 """
+import threading
 import uuid
+from contextlib import asynccontextmanager, contextmanager
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+from aiohttp import web
 
 
 def generate_mock_api_key() -> str:
     """Generate a mock API key for testing purposes"""
     # Generate a realistic looking API key format: sgai-{uuid}
     mock_uuid = str(uuid.uuid4()).replace('-', '')
-    return f"sgai-{mock_uuid}"
\ No newline at end of file
+    return f"sgai-{mock_uuid}"
+
+
+class StubRequest(NamedTuple):
+    """A request received by :func:`serve_http`"""
+
+    method: str
+    path: str
+    headers: Message
+    body: bytes
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    respond = None
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = StubRequest(
+            self.command, self.path, self.headers, self.rfile.read(length)
+        )
+        status, body, *extra = self.respond(request)
+        headers = {"Content-Type": "application/json", **(extra[0] if extra else {})}
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if isinstance(body, bytes):
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in body:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def serve_http(respond, host="127.0.0.1"):
+    """
+    Serve HTTP on a local port for tests that need a real socket
+
+    ``respond`` is called with a :class:`StubRequest` and returns
+    ``(status, body)`` or ``(status, body, headers)``. A bytes body is sent
+    with a Content-Length, any other iterable of chunks with chunked
+    transfer encoding. Yields the base URL, spelled with ``host``.
+    """
+    handler = type("Handler", (_StubHandler,), {"respond": staticmethod(respond)})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@asynccontextmanager
+async def serve_aiohttp(routes, host="127.0.0.1", **runner_options):
+    """Serve aiohttp ``routes`` on a local port and yield the base URL"""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app, **runner_options)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield f"http://{host}:{runner.addresses[0][1]}"
+    finally:
+        await runner.cleanup()